@@ -0,0 +1,12 @@
+'''
+Benchmarks of nextfempy against the local mock server (nextfempy.mockserver).
+
+    python -m benchmarks.suite --help
+    python -m benchmarks.bench_session
+    python -m benchmarks.bench_bulk
+    python -m benchmarks.bench_deferred
+    python -m benchmarks.bench_import
+
+Run them from the repository root, as modules, so that nextfempy is imported
+from the source tree. The package is not installed with nextfempy.
+'''
@@ -0,0 +1,50 @@
+'''
+Throughput of bulk creation (addNodes, addQuads) compared with one call per
+node or element (addNode, addQuad), for a square slab mesh.
+
+    python -m benchmarks.bench_bulk [divisions]
+'''
+
+import sys, time
+import numpy as np
+from nextfempy import NextFEMrest
+from nextfempy import mockserver
+
+def mesh(n):
+    # nodes and quads of a n x n slab
+    x, y = np.meshgrid(np.arange(n + 1, dtype=float), np.arange(n + 1, dtype=float))
+    coords = np.column_stack([x.ravel(), y.ravel(), np.zeros((n + 1) ** 2)])
+    i, j = np.meshgrid(np.arange(n), np.arange(n))
+    n1 = (j * (n + 1) + i).ravel() + 1
+    quads = np.column_stack([n1, n1 + 1, n1 + n + 2, n1 + n + 1])
+    return coords, quads
+
+def rate(count, seconds):
+    return "{:>10.0f} items/s".format(count / seconds)
+
+def run(n):
+    coords, quads = mesh(n)
+    print("nodes: " + str(len(coords)) + ", quads: " + str(len(quads)))
+    for bulk in (True, False):
+        server, url = mockserver.start(bulk=bulk)
+        nf = NextFEMrest(url, _msg=False)
+        label = "bulk endpoint" if bulk else "mergeModelData"
+        t = time.perf_counter(); nf.addNodes(coords); tn = time.perf_counter() - t
+        t = time.perf_counter(); nf.addQuads(quads, 1, 1); tq = time.perf_counter() - t
+        print("addNodes ({}): {}".format(label, rate(len(coords), tn)))
+        print("addQuads ({}): {}".format(label, rate(len(quads), tq)))
+        nf.close(); server.shutdown()
+    server, url = mockserver.start()
+    nf = NextFEMrest(url, _msg=False)
+    t = time.perf_counter()
+    for c in coords: nf.addNode(*c)
+    tn = time.perf_counter() - t
+    t = time.perf_counter()
+    for q in quads: nf.addQuad(*q, 1, 1)
+    tq = time.perf_counter() - t
+    print("addNode  (one call each):   " + rate(len(coords), tn))
+    print("addQuad  (one call each):   " + rate(len(quads), tq))
+    nf.close(); server.shutdown()
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 40)
@@ -0,0 +1,43 @@
+'''
+Model building with one request per call, compared with deferred calls sent
+in batches (/op/batch) or pipelined on one connection, against the local mock
+server (nextfempy.mockserver) with the given latency per request.
+
+The mock adds its latency to every request it handles, batches included, so
+pipelining gains only the client and connection time here; on a real network
+it also saves the round trip of each call.
+
+    python -m benchmarks.bench_deferred [calls] [latency]
+'''
+
+import sys, time
+from nextfempy import NextFEMrest
+from nextfempy import mockserver
+
+def build(nf, calls):
+    nf.newModel()
+    for i in range(calls):
+        nf.addNode(i, 0, 0)
+    for i in range(1, calls + 1):
+        nf.setBC(i, True, True, True, False, False, False)
+
+def run(calls, latency):
+    rates = []
+    for label, bulk, mode in (("one request each", True, None), ("deferred, batches", True, True), ("deferred, pipelined", False, True)):
+        server, url = mockserver.start(latency=latency, bulk=bulk)
+        nf = NextFEMrest(url, _msg=False)
+        t = time.perf_counter()
+        if mode is None:
+            build(nf, calls)
+        else:
+            with nf.deferred(pipeline=mode):
+                build(nf, calls)
+        rates.append((label, 2 * calls / (time.perf_counter() - t)))
+        nf.close()
+        server.shutdown()
+    print("calls:               " + str(2 * calls) + ", latency " + str(latency) + " s")
+    for label, rate in rates:
+        print("{:20s} {:8.0f} calls/s   x{:.1f}".format(label + ":", rate, rate / rates[0][1]))
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000, float(sys.argv[2]) if len(sys.argv) > 2 else 0.001)
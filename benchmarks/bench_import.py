@@ -0,0 +1,58 @@
+'''
+Import time of nextfempy, and the time to the first request, each timed in a
+new interpreter after its start-up.
+
+The methods of NextFEMrest are loaded by domain on first use, and numpy and
+requests with the first helper or request needing them; "everything" loads
+all of them up front, as importing nextfempy used to do. With --detail, the
+slowest modules of a plain import are listed from python -X importtime.
+
+    python -m benchmarks.bench_import [runs] [--detail]
+'''
+
+import os, subprocess, sys
+from nextfempy import mockserver
+
+CASES = [
+    ("import nextfempy", "import nextfempy"),
+    ("+ NextFEMrest()", "import nextfempy; nf = nextfempy.NextFEMrest(URL, _msg=False)"),
+    ("+ first request", "import nextfempy; nf = nextfempy.NextFEMrest(URL, _msg=False); nf.getNodeCoordinates(1)"),
+    ("+ bulk helper", "import nextfempy; nf = nextfempy.NextFEMrest(URL, _msg=False); nf.addNodes([[0, 0, 0]])"),
+    ("everything", "import nextfempy; nextfempy.NextFEMrest.loadAll(); [getattr(nextfempy, n) for n in nextfempy._LAZY]"),
+]
+
+# timed inside the new interpreter, so that its start-up is not measured and nothing is subtracted
+_TIMED = "import time\nURL = {url!r}\nt = time.perf_counter()\n{code}\nprint(time.perf_counter() - t)"
+
+def _run(code, url, args=()):
+    # run code in a new interpreter: seconds taken by code, and stderr
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    out = subprocess.run([sys.executable] + list(args) + ["-c", _TIMED.format(url=url, code=code)], env=env, capture_output=True, text=True, check=True)
+    return float(out.stdout.split()[-1]), out.stderr
+
+def detail(url, count=10):
+    ''' Slowest modules of import nextfempy, by self time in us '''
+    err = _run("import nextfempy", url, ["-X", "importtime"])[1]
+    rows = []
+    for line in err.splitlines():
+        if line.startswith("import time:"):
+            own, total, name = [p.strip() for p in line[len("import time:"):].split("|")]
+            if own.isdigit(): rows.append((int(own), int(total), name))
+    return sorted(rows, reverse=True)[0:count]
+
+def run(runs, showDetail=False):
+    server, url = mockserver.start()
+    print("median of {} new interpreters for each case, timed from after start-up".format(runs))
+    for label, code in CASES:
+        t = sorted(_run(code, url)[0] for i in range(runs))[runs // 2]
+        print("{:18s} {:8.1f} ms".format(label, 1000 * t))
+    if showDetail:
+        print("slowest modules of import nextfempy (self us, cumulative us):")
+        for own, total, name in detail(url):
+            print("  {:8d} {:8d}  {}".format(own, total, name))
+    server.shutdown()
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    run(int(args[0]) if args else 7, "--detail" in sys.argv)
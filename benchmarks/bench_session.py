@@ -0,0 +1,37 @@
+'''
+Calls/second of NextFEMrest with the pooled session, compared with the previous
+one-connection-per-call behaviour (module-level requests.get).
+
+The local mock server (nextfempy.mockserver) answers from memory, so that the figure
+measures only the client and the connection setup.
+
+    python -m benchmarks.bench_session [calls]
+'''
+
+import sys, time
+import requests
+from nextfempy import NextFEMrest
+from nextfempy import mockserver
+
+def run(calls):
+    server, url = mockserver.start()
+    nf = NextFEMrest(url, _msg=False)
+    # previous behaviour: a new connection for each call
+    t = time.perf_counter()
+    for i in range(calls):
+        requests.get(url=url + '/bc/set/' + str(i) + '/True/True/True/True/True/True', headers=nf.headers, verify=False)
+    unpooled = calls / (time.perf_counter() - t)
+    # pooled session
+    t = time.perf_counter()
+    for i in range(calls):
+        nf.setBC(i, True, True, True, True, True, True)
+    pooled = calls / (time.perf_counter() - t)
+    nf.close()
+    server.shutdown()
+    print("calls:          " + str(calls))
+    print("unpooled:       {:.0f} calls/s".format(unpooled))
+    print("pooled session: {:.0f} calls/s".format(pooled))
+    print("speed-up:       {:.1f}x".format(pooled / unpooled))
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
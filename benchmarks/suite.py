@@ -0,0 +1,91 @@
+'''
+End-to-end benchmark suite: model build, run and post-processing of the
+workloads in workloads.py, against the local mock server (nextfempy.mockserver).
+
+For each workload, size and mode (one call per item, or bulk helpers) the
+suite reports, per phase, wall time, calls, calls/s, request and response
+body bytes and peak Python memory, and can write them as JSON for regression
+tracking:
+
+    python -m benchmarks.suite --sizes 1 2 --modes calls bulk --latency 0.001 --json bench.json
+
+Run from the repository root.
+'''
+
+import argparse, contextlib, json, platform, sys, time, tracemalloc
+from nextfempy import NextFEMrest, mockserver
+from benchmarks.workloads import WORKLOADS
+
+def _totals(metrics):
+    calls = sent = received = 0
+    for ep in metrics.endpoints.values():
+        calls += ep.count
+        sent += ep.requestBytes
+        received += ep.responseBytes
+    return calls, sent, received
+
+def runWorkload(name, size=1, bulk=False, latency=0.0, memory=True)->dict:
+    ''' Run a workload against a new mock server, return its figures by phase '''
+    server, url = mockserver.start(latency=latency, runTime=0.0)
+    nf = NextFEMrest(url, _msg=False)
+    metrics = nf.enableMetrics()
+    phases = []
+
+    @contextlib.contextmanager
+    def phase(label):
+        calls, sent, received = _totals(metrics)
+        if memory: tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0] if memory else 0
+        t0 = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - t0
+        peak = tracemalloc.get_traced_memory()[1] - base if memory else 0
+        c, s, r = _totals(metrics)
+        phases.append({"phase": label, "seconds": seconds, "calls": c - calls, "callsPerSecond": (c - calls) / seconds if seconds > 0 else 0.0,
+                       "bytesSent": s - sent, "bytesReceived": r - received, "peakMemory": peak})
+
+    try:
+        if memory: tracemalloc.start()
+        t0 = time.perf_counter()
+        counts = WORKLOADS[name](nf, phase, size, bulk)
+        seconds = time.perf_counter() - t0
+    finally:
+        if memory: tracemalloc.stop()
+        nf.close()
+        server.shutdown()
+    calls, sent, received = _totals(metrics)
+    return {"workload": name, "size": size, "mode": "bulk" if bulk else "calls", "latency": latency, "seconds": seconds,
+            "calls": calls, "bytesSent": sent, "bytesReceived": received, "model": counts, "phases": phases}
+
+def table(results)->str:
+    ''' Text table of the results, one line per phase '''
+    rows = [("workload", "size", "mode", "phase", "wall s", "calls", "calls/s", "sent kB", "recv kB", "peak MB")]
+    for r in results:
+        for p in r["phases"] + [dict(r, phase="total", callsPerSecond=r["calls"] / r["seconds"], peakMemory=max([p["peakMemory"] for p in r["phases"]] or [0]))]:
+            rows.append((r["workload"], str(r["size"]), r["mode"], p["phase"], format(p["seconds"], ".3f"), str(p["calls"]), format(p["callsPerSecond"], ".0f"),
+                         format(p["bytesSent"] / 1e3, ".1f"), format(p["bytesReceived"] / 1e3, ".1f"), format(p["peakMemory"] / 1e6, ".2f")))
+    widths = [max(len(r[i]) for r in rows) for i in range(len(rows[0]))]
+    return "\n".join("  ".join(c.ljust(w) if i in (0, 2, 3) else c.rjust(w) for i, (c, w) in enumerate(zip(r, widths))).rstrip() for r in rows)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description="End-to-end benchmarks of nextfempy against the mock server")
+    parser.add_argument("--workloads", nargs="*", default=list(WORKLOADS), choices=list(WORKLOADS))
+    parser.add_argument("--sizes", nargs="*", type=int, default=[1])
+    parser.add_argument("--modes", nargs="*", default=["calls", "bulk"], choices=["calls", "bulk"])
+    parser.add_argument("--latency", type=float, default=0.0, help="delay added by the server to every request, in seconds")
+    parser.add_argument("--no-memory", action="store_true", help="do not trace memory, which slows down the client")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args(argv)
+    results = []
+    for name in args.workloads:
+        for size in args.sizes:
+            for mode in args.modes:
+                results.append(runWorkload(name, size, mode == "bulk", args.latency, not args.no_memory))
+    print(table(results))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"python": sys.version.split()[0], "platform": platform.platform(), "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                       "results": results}, f, indent=1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+'''
+Workloads of the benchmark suite, modeled on the samples and scaled by size.
+
+Each workload takes a NextFEMrest instance, a phase(name) context manager
+timing its phases, the size and the bulk flag: with bulk=False the model is
+built with one call per item, as in the samples; with bulk=True with the
+bulk helpers (addNodes, addBeams, setBCs, ...).
+'''
+
+import numpy as np
+from nextfempy import envelope
+
+def _grid(nx, ny, dx=1.0, dy=1.0, z=0.0):
+    # nodes and quads of a nx x ny grid, node numbers from 1
+    x, y = np.meshgrid(np.arange(nx + 1) * dx, np.arange(ny + 1) * dy)
+    coords = np.column_stack([x.ravel(), y.ravel(), np.full((nx + 1) * (ny + 1), z)])
+    i, j = np.meshgrid(np.arange(nx), np.arange(ny))
+    n1 = (j * (nx + 1) + i).ravel() + 1
+    quads = np.column_stack([n1, n1 + 1, n1 + nx + 2, n1 + nx + 1])
+    return coords, quads
+
+def _addNodes(nf, coords, bulk):
+    if bulk: return nf.addNodes(coords)
+    return np.array([int(nf.addNode(*c)) for c in coords.tolist()], dtype=np.int64)
+
+def _addBeams(nf, conn, sect, mat, bulk):
+    if bulk: return nf.addBeams(conn, sect, mat)
+    return np.array([int(nf.addBeam(int(a), int(b), sect, mat)) for a, b in conn], dtype=np.int64)
+
+def _addQuads(nf, conn, sect, mat, bulk):
+    if bulk: return nf.addQuads(conn, sect, mat)
+    return np.array([int(nf.addQuad(*[int(n) for n in c], sect, mat)) for c in conn], dtype=np.int64)
+
+def _setBCs(nf, nodes, mask, bulk):
+    if bulk: return nf.setBCs(nodes, mask)
+    for n in nodes: nf.setBC(int(n), *mask)
+
+def _addLoads(nf, nodes, values, loadcase, bulk):
+    if bulk: return nf.addNodalLoads(nodes, values, loadcase)
+    for n in nodes:
+        for d, v in enumerate(values):
+            if v: nf.addNodalLoad(int(n), v, d + 1, loadcase)
+
+def building(nf, phase, size=1, bulk=False):
+    ''' n-storey building: columns, beams along x and y, slab panels, base restraints, modal and gravity loadcases '''
+    nlx, nly, nlz = 3 * size, 2 * size, 4 * size
+    with phase("build"):
+        nf.newModel()
+        nf.setUnits('m', 'kN')
+        mat = nf.addMatFromLib('C25/30')
+        col = nf.addRectSection(0.30, 0.30)
+        beam = nf.addRectSection(0.20, 0.50)
+        slab = nf.addPlanarSection(t=0.20)
+        plan, panels = _grid(nlx, nly, 5.0, 6.0)
+        per = len(plan)
+        coords = np.vstack([plan + [0, 0, 3.0 * k] for k in range(nlz + 1)])
+        ids = _addNodes(nf, coords, bulk)
+        node = lambda k, i: ids[k * per + i - 1]
+        cols = [(node(k, i), node(k + 1, i)) for k in range(nlz) for i in range(1, per + 1)]
+        xb = [(node(k, j * (nlx + 1) + i + 1), node(k, j * (nlx + 1) + i + 2)) for k in range(1, nlz + 1) for j in range(nly + 1) for i in range(nlx)]
+        yb = [(node(k, j * (nlx + 1) + i + 1), node(k, (j + 1) * (nlx + 1) + i + 1)) for k in range(1, nlz + 1) for j in range(nly) for i in range(nlx + 1)]
+        _addBeams(nf, np.array(cols), col, mat, bulk)
+        _addBeams(nf, np.array(xb + yb), beam, mat, bulk)
+        quads = np.vstack([ids[panels - 1 + k * per] for k in range(1, nlz + 1)])
+        _addQuads(nf, quads, slab, mat, bulk)
+    with phase("restraints"):
+        _setBCs(nf, ids[0:per], [True] * 6, bulk)
+    with phase("loads"):
+        for lc in ['pp', 'modal', 'wind']:
+            nf.addLoadCase(lc)
+        nf.setSelfWeight('pp')
+        _addLoads(nf, ids[per:], [10.0, 0, 0, 0, 0, 0], 'wind', bulk)
+    with phase("run"):
+        nf.RunModel()
+    with phase("post"):
+        res = nf.resultsData()
+        disp, nodes = nf.getNodalDispArray('wind', results=res)
+        forces = nf.getBeamForcesArray(loadcases=['pp', 'wind'], results=res)
+        envelope(forces, "loadcases")
+    return {"nodes": len(coords), "elements": len(cols) + len(xb) + len(yb) + len(quads)}
+
+def slabOnBeams(nf, phase, size=1, bulk=False):
+    ''' Slab meshed in quads on perimeter beams, restrained beam nodes, surface loads on each panel in separate loadcases '''
+    n = 12 * size
+    with phase("build"):
+        nf.newModel()
+        nf.setUnits('m', 'kN')
+        mat = nf.addIsoMaterial(name='betao', E=30e6, ni=0.20, Wden=25)
+        beam = nf.addRectSection(0.30, 0.5)
+        slab = nf.addPlanarSection(t=0.23)
+        coords, quads = _grid(n, n, 12.0 / n, 12.0 / n)
+        ids = _addNodes(nf, coords, bulk)
+        quadIDs = _addQuads(nf, ids[quads - 1], slab, mat, bulk)
+        edge = [i for i in range(n)]
+        conn = ([(ids[i], ids[i + 1]) for i in edge] + [(ids[n * (n + 1) + i], ids[n * (n + 1) + i + 1]) for i in edge] +
+                [(ids[i * (n + 1)], ids[(i + 1) * (n + 1)]) for i in edge] + [(ids[i * (n + 1) + n], ids[(i + 1) * (n + 1) + n]) for i in edge])
+        _addBeams(nf, np.array(conn), beam, mat, bulk)
+    with phase("restraints"):
+        onEdge = np.unique(np.array(conn).ravel())
+        _setBCs(nf, onEdge, [True, True, True, False, False, False], bulk)
+    with phase("loads"):
+        nf.addLoadCase('pp')
+        nf.setSelfWeight('pp')
+        half = len(quadIDs) // 2
+        for lc, elems in (('scA', quadIDs[0:half]), ('scB', quadIDs[half:])):
+            nf.addLoadCase(lc)
+            for e in elems.tolist():
+                nf.addSurfaceLoad(elem=e, values=[-2.0], direction=3, loadcase=lc, local=False)
+        for lc in ('scA', 'scB'):
+            nf.addLoadCase('uls_' + lc)
+            nf.setCombination('uls_' + lc, 'pp', 1.35)
+            nf.setCombination('uls_' + lc, lc, 1.50)
+    with phase("run"):
+        nf.RunModel()
+    with phase("post"):
+        maxUz = 0.0
+        for lc, time, quantity, items, values in nf.iterResults(quantities=["disp"]):
+            maxUz = max(maxUz, float(np.abs(values[:, 2]).max()))
+    return {"nodes": len(coords), "elements": len(quads) + len(conn)}
+
+def pileOnSprings(nf, phase, size=1, bulk=False):
+    ''' Pile divided in beams, soil as nodal springs on every node, horizontal force and moment at the top '''
+    n = 10 * size
+    with phase("build"):
+        nf.newModel()
+        nf.setUnits('m', 'kN')
+        mat = nf.addIsoMaterial(name='betao', E=31e6, ni=0.20, Wden=25)
+        sec = nf.addCircSection(1.5)
+        coords = np.column_stack([np.zeros(n + 1), np.zeros(n + 1), np.linspace(0.0, 20.0, n + 1)])
+        ids = _addNodes(nf, coords, bulk)
+        _addBeams(nf, np.column_stack([ids[0:-1], ids[1:]]), sec, mat, bulk)
+        nf.addSpringProperty(name='soil', Kx=9e3 * 20.0 / n, Ky=0, Kz=0, Krx=0, Kry=0, Krz=0, local=False)
+        if bulk:
+            nf.addNodalSprings(ids, 'soil')
+        else:
+            for node in ids.tolist(): nf.addNodalSpring(node, propName='soil')
+    with phase("restraints"):
+        _setBCs(nf, ids[[0, -1]], [False, True, True, True, False, True], bulk)
+    with phase("loads"):
+        nf.addLoadCase('top')
+        _addLoads(nf, ids[-1:], [100.0, 0, 0, 0, 100.0, 0], 'top', bulk)
+    with phase("run"):
+        nf.RunModel()
+    with phase("post"):
+        disp, nodes = nf.getNodalDispArray('top', nodes=ids, results={})
+        hist, times = nf.getResultHistories('top', ids, 1, 1)
+    return {"nodes": len(coords), "elements": 2 * n + 1}
+
+def planeStrain(nf, phase, size=1, bulk=False):
+    ''' Plane strain block meshed in quads, restrained base, pressure on the top nodes, nodal queries on all the nodes '''
+    nx, ny = 20 * size, 10 * size
+    with phase("build"):
+        nf.newModel()
+        nf.setUnits('m', 'kN')
+        mat = nf.addIsoMaterial(name='soil', E=50e3, ni=0.30, Wden=18)
+        sect = nf.addPlanarSection(t=1.0)
+        coords, quads = _grid(nx, ny, 0.5, 0.5)
+        coords = coords[:, [0, 2, 1]]
+        ids = _addNodes(nf, coords, bulk)
+        _addQuads(nf, ids[quads - 1], sect, mat, bulk)
+    with phase("restraints"):
+        _setBCs(nf, ids[0:nx + 1], [True] * 6, bulk)
+        _setBCs(nf, ids[nx + 1:], [False, True, False, True, False, True], bulk)
+    with phase("loads"):
+        nf.addLoadCase('pressure')
+        _addLoads(nf, ids[-(nx + 1):], [0, 0, -10.0, 0, 0, 0], 'pressure', bulk)
+    with phase("run"):
+        nf.RunModel()
+    with phase("post"):
+        nf.map("getNodalDisp", [(n, 'pressure', 1, 3) for n in ids.tolist()], workers=8)
+    return {"nodes": len(coords), "elements": len(quads)}
+
+WORKLOADS = {"building": building, "slabOnBeams": slabOnBeams, "pileOnSprings": pileOnSprings, "planeStrain": planeStrain}
@@ -1 +1,43 @@
-from .nextfempy import *
\ No newline at end of file
+import importlib
+from .nextfempy import NextFEMrest, vert3
+from .common import sbool, qt, des
+
+# names of the other modules, imported when first used since most of them need numpy
+_LAZY = {
+    "AsyncNextFEMrest": ".asyncrest",
+    "BulkMixin": ".bulk", "BatchResult": ".bulk",
+    "ResultArraysMixin": ".resultarrays", "ResultArray": ".resultarrays",
+    "CacheMixin": ".cache", "ModelCache": ".cache", "isMutating": ".cache", "install": ".cache",
+    "FanOutMixin": ".fanout", "MapStats": ".fanout",
+    "MetricsMixin": ".metrics", "Metrics": ".metrics",
+    "LoadCombinations": ".combinations", "psiCoefficients": ".combinations",
+    "envelope": ".envelopes", "concurrentEnvelope": ".envelopes", "maxMinBy": ".envelopes", "validateEnvelope": ".envelopes",
+    "ModelMirror": ".mirror",
+    "SpatialIndex": ".spatial",
+    "ModelSync": ".sync", "SyncReport": ".sync",
+    "ResultStore": ".store", "StoredResults": ".store",
+    "ParametricRunner": ".parametric", "Variant": ".parametric",
+    "Job": ".jobs", "JobScheduler": ".jobs",
+    "Deferred": ".deferred", "DeferredCall": ".deferred", "DeferredMixin": ".deferred",
+    "Recorder": ".recorder", "ReplayTransport": ".recorder", "readLog": ".recorder", "summarize": ".recorder",
+}
+
+# modules available as attributes before the split by domain, imported when first used
+_MODULES = ("requests", "json", "urllib", "os", "urllib3")
+
+# "from nextfempy import *" imports only the names loaded with the package; the others are imported by name
+__all__ = ["NextFEMrest", "vert3", "sbool", "qt", "des"]
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if name in _MODULES:
+        value = importlib.import_module(name)
+    elif module is None:
+        raise AttributeError("module '" + __name__ + "' has no attribute '" + name + "'")
+    else:
+        value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_MODULES))
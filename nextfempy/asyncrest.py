@@ -0,0 +1,162 @@
+'''
+Asyncio client for NextFEM Designer and NextFEM Server.
+
+AsyncNextFEMrest exposes every method of NextFEMrest as a coroutine, with the
+same arguments, endpoints and conversions. Requests go through aiohttp
+(pip install nextfempy[async]); a semaphore bounds the requests in flight.
+
+    import asyncio
+    from nextfempy import AsyncNextFEMrest
+
+    async def main():
+        async with AsyncNextFEMrest() as nf:
+            disp = await asyncio.gather(*[nf.getNodalDisp(n, "sw", 1, 3) for n in range(1, 1001)])
+    asyncio.run(main())
+'''
+
+import asyncio, functools, json, os, time
+from .nextfempy import NextFEMrest
+from . import domains
+from .calls import Answer, replay
+from .metrics import MetricsMixin
+
+class AsyncNextFEMrest(MetricsMixin):
+
+    def __init__(self,_baseUrl=None,_user="",_msg=False,_maxConcurrency=100,_poolMaxSize=100,_keepAlive=True,_timeout=None):
+        self.headers = {}
+        if _baseUrl is None:
+            self.baseUrl="http://localhost:5151"
+        else:
+            self.baseUrl=str(_baseUrl)
+        self.user=_user
+        self.msg=_msg
+        if self.user != "": self.headers["user"]=self.user
+        self.maxConcurrency=_maxConcurrency
+        self.poolMaxSize=_poolMaxSize
+        self.keepAlive=_keepAlive
+        self.timeout=_timeout
+        self.session=None
+        self._semaphore=None
+
+    def setHeaders(self, headersDict):
+        ''' Set headers for the requests '''
+        if not(headersDict is None):
+            for dd in headersDict:
+                self.headers[dd]=headersDict[dd]
+
+    def _open(self):
+        # session and semaphore are bound to the running loop, create them on first use
+        import aiohttp
+        timeout=self.timeout
+        if isinstance(timeout, tuple): timeout=aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+        elif not(timeout is None): timeout=aiohttp.ClientTimeout(total=timeout)
+        else: timeout=aiohttp.ClientTimeout(total=None)
+        connector=aiohttp.TCPConnector(limit=self.poolMaxSize, ssl=False, force_close=not self.keepAlive)
+        self.session=aiohttp.ClientSession(connector=connector, timeout=timeout)
+        self._semaphore=asyncio.Semaphore(self.maxConcurrency)
+
+    async def aclose(self):
+        ''' Close all the pooled connections '''
+        if not(self.session is None):
+            await self.session.close()
+            self.session=None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def _send(self, method, command, body=None, heads=None)->Answer:
+        if self.session is None: self._open()
+        hds=dict(self.headers)
+        if not(heads is None):
+            for dd in heads:
+                hds[dd]=str(heads[dd])
+        async with self._semaphore:
+            t0 = time.perf_counter()
+            async with self.session.request(method, self.baseUrl + command, headers=hds, json=body) as response:
+                answer=Answer(await response.read(), response.status, response.charset)
+        if not(self.metrics is None) or self.msg:
+            sent = 0 if body is None else len(json.dumps(body))
+            self._observe(method, command, time.perf_counter() - t0, sent, len(answer.content), answer.status_code)
+        return answer
+
+    async def nfrest(self, method, command, body=None, heads=None)->str:
+        return (await self._send(method, command, body, heads)).text
+
+    async def nfrestB(self, method, command, body=None, heads=None)->bytes:
+        return (await self._send(method, command, body, heads)).content
+
+    async def _call(self, fn, args, kwargs):
+        # run a NextFEMrest method body, sending each of its requests asynchronously
+        steps=replay(fn, self, args, kwargs)
+        try:
+            request=next(steps)
+            while True:
+                request=steps.send(await self._send(request.method, request.command, request.body, request.heads))
+        except StopIteration as stop:
+            return stop.value
+
+    def __getattr__(self, name):
+        # coroutines of the NextFEMrest methods are made when first used
+        fn = _source(name)
+        if fn is None:
+            raise AttributeError("'" + type(self).__name__ + "' object has no attribute '" + name + "'")
+        setattr(AsyncNextFEMrest, name, _coroutine(fn))
+        return object.__getattribute__(self, name)
+
+    def __dir__(self):
+        return sorted(set(object.__dir__(self)) | {name for name in domains.INDEX if not(_source(name) is None)})
+
+    async def getProperty(self, name):
+        ''' Get a property of NextFEMrest, e.g. await nf.getProperty("modeldata") '''
+        return await self._call(getattr(NextFEMrest, name).fget, (), None)
+
+    async def setProperty(self, name, value):
+        ''' Set a property of NextFEMrest, e.g. await nf.setProperty("autoMassInX", False) '''
+        return await self._call(getattr(NextFEMrest, name).fset, (value,), None)
+
+    async def sendFile(self,localPath,remoteFolder=None):
+        ''' Send file to server, return string
+        
+        Args:
+            localPath: Path of the file to send
+            remoteFolder: Optional. Folder on server where to save the file. If not set, the file will be saved in the default folder.
+        
+        Returns:
+            String
+        '''
+        import aiohttp
+        if self.session is None: self._open()
+        headers = self.headers.copy()
+        if not(remoteFolder is None): headers['path'] = remoteFolder
+        try:
+            with open(localPath, 'rb') as f:
+                data = aiohttp.FormData()
+                data.add_field('file', f, filename=os.path.basename(localPath), content_type='application/octet-stream')
+                async with self._semaphore:
+                    async with self.session.post(self.baseUrl + '/op/userfile', headers=headers, data=data) as response:
+                        if self.msg:
+                            print("*** " + self.user + " :: POST /op/userfile", response.status)
+                        return await response.text()
+        except Exception as e:
+            return f"Error in sending file: {str(e)}"
+
+def _coroutine(fn):
+    @functools.wraps(fn)
+    async def method(self, *args, **kwargs):
+        return await self._call(fn, args, kwargs)
+    return method
+
+def _source(name):
+    # NextFEMrest function mirrored by a method: the generated methods and those of NextFEMrest itself, not the helpers
+    if name.startswith('_') or name in ('setPool', 'close', 'nfrestStream', 'loadAll'): return None
+    module = domains.INDEX.get(name)
+    if module is None:
+        fn = vars(NextFEMrest).get(name)
+    elif module.startswith(".domains."):
+        fn = vars(domains.mixin(module)).get(name)
+    else:
+        return None
+    return fn if callable(fn) else None
@@ -0,0 +1,308 @@
+'''
+Bulk creation and assignment for NextFEMrest: many nodes, elements, restraints
+or loads in each request, through bulk endpoints or mergeModelData chunks.
+'''
+
+import json
+import numpy as np
+from .common import qt, des, _chunks
+from . import modeljson
+
+class BatchResult:
+    ''' Outcome of a batch call: one flag per item, with the error message of failed items '''
+    def __init__(self, items):
+        self.items = list(items)
+        self.ok = np.zeros(len(self.items), dtype=bool)
+        self.errors = {}
+
+    def __bool__(self):
+        return bool(self.ok.all())
+
+    def __len__(self):
+        return len(self.items)
+
+    @property
+    def failed(self)->list:
+        ''' Items that were not applied '''
+        return [self.items[i] for i in np.flatnonzero(~self.ok)]
+
+    def __repr__(self):
+        return "BatchResult(" + str(int(self.ok.sum())) + "/" + str(len(self.items)) + " ok)"
+
+class BulkMixin:
+
+    def _bulk(self, command, body):
+        # POST a chunk to a bulk endpoint, return the decoded list or None if the server lacks the endpoint
+        if command in self._noBulk: return None
+        response = self._send('POST', command, body)
+        out = des(response.text) if response.status_code < 400 else None
+        if not isinstance(out, list):
+            self._noBulk.add(command)
+            return None
+        return out
+    def _mergeChunk(self, nodes=None, elems=None)->bool:
+        # fallback for bulk endpoints: merge a model fragment
+        return self.mergeModelData(json.dumps(modeljson.fragment(nodes, elems)))
+    def addNodes(self, coords, IDs=None, lcs=None, chunkSize=2000):
+        ''' Add many nodes to the model, in chunks. Existing results will be deleted.
+        
+        Args:
+            coords: Array of size (N,3) with X, Y and Z coordinates, or list of (x,y,z) tuples
+            IDs (optional): Optional. Array of N node IDs, as in addNodeWithID. If not set, IDs are assigned by the model; without the bulk endpoint, they follow the highest node ID (getMaxNodeID) in input order, and gaps in the numbering are not filled
+            lcs (optional): Optional. Nodal local axes, array of size 6 (1st and 2nd vector) applied to all nodes, or of size (N,6)
+            chunkSize (optional): Optional. Number of nodes sent in each request
+
+        Returns:
+            Array of the IDs of the added nodes, in input order. 0 for nodes that were not added
+        '''
+        xyz = np.asarray(coords, dtype=float).reshape(-1, 3)
+        n = len(xyz)
+        rows = xyz
+        if not(lcs is None):
+            rows = np.hstack([xyz, np.broadcast_to(np.asarray(lcs, dtype=float), (n, 6))])
+        ids = None if IDs is None else np.asarray(IDs, dtype=np.int64).reshape(n)
+        out = np.zeros(n, dtype=np.int64)
+        nextID = None
+        for sl in _chunks(n, chunkSize):
+            body = {"coords": rows[sl].tolist()}
+            if not(ids is None): body["ids"] = ids[sl].tolist()
+            added = self._bulk('/node/add/bulk', body)
+            if not(added is None):
+                out[sl] = np.asarray(added, dtype=np.int64)
+                continue
+            # fallback: IDs are assigned here and nodes merged as model data
+            if ids is None:
+                if nextID is None: nextID = int(self.getMaxNodeID()) + 1
+                chunkIDs = np.arange(nextID + sl.start, nextID + sl.stop, dtype=np.int64)
+            else:
+                chunkIDs = ids[sl]
+            nodes = [modeljson.nodeItem(i, *r[0:3], lcs=r[3:9] if len(r) > 3 else None) for i, r in zip(chunkIDs, rows[sl])]
+            for ms in modeljson.mergeChunks(modeljson.NODES, nodes, self.mergeMaxLength):
+                if self._mergeChunk(nodes=nodes[ms]):
+                    out[sl][ms] = chunkIDs[ms]
+        return out
+    def _addElements(self, kind, type_, conn, IDs, chunkSize, **props):
+        # chunked creation of elements of one kind; props are broadcast to one value per element
+        # lists may be ragged (solids) and hold NumPy IDs, e.g. from addNodes
+        rows = np.asarray(conn).tolist() if not isinstance(conn, list) else [np.asarray(c).tolist() for c in conn]
+        n = len(rows)
+        cols = dict((k, np.broadcast_to(np.asarray(v), (n,)).tolist()) for k, v in props.items())
+        ids = None if IDs is None else np.asarray(IDs, dtype=np.int64).reshape(n)
+        out = np.zeros(n, dtype=np.int64)
+        nextID = None
+        for sl in _chunks(n, chunkSize):
+            body = {"conn": rows[sl]}
+            for k in cols: body[k] = cols[k][sl]
+            if not(ids is None): body["ids"] = ids[sl].tolist()
+            added = self._bulk('/element/add/bulk/' + kind, body)
+            if not(added is None):
+                out[sl] = np.asarray(added, dtype=np.int64)
+                continue
+            # fallback: IDs are assigned here and elements merged as model data
+            if ids is None:
+                if nextID is None: nextID = int(self.getMaxElementID()) + 1
+                chunkIDs = np.arange(nextID + sl.start, nextID + sl.stop, dtype=np.int64)
+            else:
+                chunkIDs = ids[sl]
+            elems = []
+            for j in range(sl.start, sl.stop):
+                c = rows[j]
+                t = modeljson.SOLID_TYPES.get(len(c), 0) if type_ is None else type_
+                elems.append(modeljson.elemItem(chunkIDs[j - sl.start], t, c, **dict((k, cols[k][j]) for k in cols)))
+            for ms in modeljson.mergeChunks(modeljson.ELEMS, elems, self.mergeMaxLength):
+                if self._mergeChunk(elems=elems[ms]):
+                    out[sl][ms] = chunkIDs[ms]
+        return out
+    def addBeams(self, conn, sect=0, mat=0, sect2=0, IDs=None, chunkSize=2000):
+        ''' Add many beams to the model, in chunks. Existing results will be deleted.
+        
+        Args:
+            conn: Array of size (N,2) with first and second node ID of each beam
+            sect (optional): Optional section ID, a single value for all beams or an array of size N
+            mat (optional): Optional material ID, a single value for all beams or an array of size N
+            sect2 (optional): Optional section ID of the section at the end of the beams, single value or array of size N
+            IDs (optional): Optional. Array of N element IDs, as in addBeamWithID. If not set, IDs are assigned by the model; without the bulk endpoint, they follow the highest element ID (getMaxElementID) in input order, and gaps in the numbering are not filled
+            chunkSize (optional): Optional. Number of elements sent in each request
+
+        Returns:
+            Array of the IDs of the added elements, in input order. 0 for elements that were not added
+        '''
+        return self._addElements('beam', modeljson.LINE, conn, IDs, chunkSize, sect=sect, mat=mat, sect2=sect2)
+    def addTrusses(self, conn, sect=0, mat=0, IDs=None, chunkSize=2000):
+        ''' Add many trusses to the model, in chunks. Existing results will be deleted.
+        
+        Args:
+            conn: Array of size (N,2) with first and second node ID of each truss
+            sect (optional): Optional section ID, a single value for all trusses or an array of size N
+            mat (optional): Optional material ID, a single value for all trusses or an array of size N
+            IDs (optional): Optional. Array of N element IDs, as in addTrussWithID. If not set, IDs are assigned by the model; without the bulk endpoint, they follow the highest element ID (getMaxElementID) in input order, and gaps in the numbering are not filled
+            chunkSize (optional): Optional. Number of elements sent in each request
+
+        Returns:
+            Array of the IDs of the added elements, in input order. 0 for elements that were not added
+        '''
+        return self._addElements('truss', modeljson.LINE, conn, IDs, chunkSize, sect=sect, mat=mat, truss=True)
+    def addQuads(self, conn, sect=0, mat=0, IDs=None, chunkSize=2000):
+        ''' Add many quad planar elements to the model, in chunks
+        
+        Args:
+            conn: Array of size (N,4) with the connected nodes of each quad
+            sect (optional): Optional section ID, a single value for all quads or an array of size N
+            mat (optional): Optional material ID, a single value for all quads or an array of size N
+            IDs (optional): Optional. Array of N element IDs, as in addQuadWithID. If not set, IDs are assigned by the model; without the bulk endpoint, they follow the highest element ID (getMaxElementID) in input order, and gaps in the numbering are not filled
+            chunkSize (optional): Optional. Number of elements sent in each request
+
+        Returns:
+            Array of the IDs of the added elements, in input order. 0 for elements that were not added
+        '''
+        return self._addElements('quad', modeljson.QUAD, conn, IDs, chunkSize, sect=sect, mat=mat)
+    def addTrias(self, conn, sect=0, mat=0, IDs=None, chunkSize=2000):
+        ''' Add many tria planar elements to the model, in chunks
+        
+        Args:
+            conn: Array of size (N,3) with the connected nodes of each tria
+            sect (optional): Optional section ID, a single value for all trias or an array of size N
+            mat (optional): Optional material ID, a single value for all trias or an array of size N
+            IDs (optional): Optional. Array of N element IDs, as in addTriaWithID. If not set, IDs are assigned by the model; without the bulk endpoint, they follow the highest element ID (getMaxElementID) in input order, and gaps in the numbering are not filled
+            chunkSize (optional): Optional. Number of elements sent in each request
+
+        Returns:
+            Array of the IDs of the added elements, in input order. 0 for elements that were not added
+        '''
+        return self._addElements('tria', modeljson.TRIA, conn, IDs, chunkSize, sect=sect, mat=mat)
+    def addSolids(self, conn, mat=0, IDs=None, chunkSize=2000):
+        ''' Add many solid elements to the model, in chunks. Element type is set on the number of nodes of each element
+        
+        Args:
+            conn: Array of size (N,n) or list of node lists. 4 for tetra, 6 for wedge, 8 for hexa, 10 for tetra10, 15 for wedge15, 20 for hexa20.
+            mat (optional): Optional material ID, a single value for all solids or an array of size N
+            IDs (optional): Optional. Array of N element IDs. If not set, IDs are assigned by the model; without the bulk endpoint, they follow the highest element ID (getMaxElementID) in input order, and gaps in the numbering are not filled
+            chunkSize (optional): Optional. Number of elements sent in each request
+
+        Returns:
+            Array of the IDs of the added elements, in input order. 0 for elements that were not added
+        '''
+        return self._addElements('solid', None, conn, IDs, chunkSize, mat=mat)
+    def addSprings(self, conn, propName, IDs=None, chunkSize=2000):
+        ''' Add many 2-node springs to the model, in chunks. Existing results will be deleted.
+        
+        Args:
+            conn: Array of size (N,2) with first and second node ID of each spring
+            propName: Name of the property of the springs, a single name or an array of size N
+            IDs (optional): Optional. Array of N element IDs, as in addSpringWithID. If not set, IDs are assigned by the model; without the bulk endpoint, they follow the highest element ID (getMaxElementID) in input order, and gaps in the numbering are not filled
+            chunkSize (optional): Optional. Number of elements sent in each request
+
+        Returns:
+            Array of the IDs of the added elements, in input order. 0 for elements that were not added
+        '''
+        return self._addElements('spring', modeljson.SPRING2NODES, conn, IDs, chunkSize, prop=propName)
+    def _batch(self, command, items, columns, single, chunkSize):
+        # apply items through a bulk endpoint, or one call each; failures are recorded, not raised
+        result = BatchResult(items)
+        n = len(result.items)
+        for sl in _chunks(n, chunkSize):
+            body = dict((k, v[sl]) for k, v in columns.items())
+            done = self._bulk(command, body)
+            if not(done is None):
+                result.ok[sl] = [v is True or v == "True" for v in done]
+                for i in range(sl.start, sl.stop):
+                    if not result.ok[i]: result.errors[i] = "rejected by server"
+                continue
+            for i in range(sl.start, sl.stop):
+                try:
+                    result.ok[i] = single(i)
+                    if not result.ok[i]: result.errors[i] = "rejected by server"
+                except Exception as e:
+                    result.errors[i] = str(e)
+        return result
+    def setBCs(self, nodes, mask, chunkSize=2000):
+        ''' Set or change the boundary conditions (restraints) for many nodes
+        
+        Args:
+            nodes: Array of N node IDs
+            mask: Restraints as 6 booleans (x, y, z, rx, ry, rz) applied to all nodes, or array of size (N,6)
+            chunkSize (optional): Optional. Number of nodes sent in each request
+
+        Returns:
+            BatchResult with a flag for each node
+        '''
+        nodes = np.asarray(nodes).reshape(-1).tolist()
+        bc = np.broadcast_to(np.asarray(mask, dtype=bool), (len(nodes), 6)).tolist()
+        return self._batch('/bc/set/bulk', nodes, {"nodes": nodes, "bc": bc}, lambda i: self.setBC(nodes[i], *bc[i]), chunkSize)
+    def removeBCs(self, nodes, chunkSize=2000):
+        ''' Remove boundary conditions for many nodes
+        
+        Args:
+            nodes: Array of node IDs
+            chunkSize (optional): Optional. Number of nodes sent in each request
+
+        Returns:
+            BatchResult with a flag for each node
+        '''
+        nodes = np.asarray(nodes).reshape(-1).tolist()
+        return self._batch('/bc/remove/bulk', nodes, {"nodes": nodes}, lambda i: self.removeBC(nodes[i]), chunkSize)
+    def addNodalLoads(self, nodes, values, loadcase, direction=None, local=False, chunkSize=2000):
+        ''' Add nodal loads to many nodes. Null components are skipped
+        
+        Args:
+            nodes: Array of N node IDs
+            values: Load values for directions 1 to 6 (X, Y, Z, RX, RY, RZ), as an array of size 6 applied to all nodes or of size (N,6). If direction is set, a single value or an array of size N
+            loadcase: Name of the loadcase
+            direction (optional): Optional. Direction of the load: 1=X, 2=Y, 3=Z, 4=RX, 5=RY, 6=RZ
+            local (optional): True if loads have been defined locally
+            chunkSize (optional): Optional. Number of loads sent in each request
+
+        Returns:
+            BatchResult with a flag for each (node, direction) load
+        '''
+        nodes = np.asarray(nodes).reshape(-1)
+        if direction is None:
+            vals = np.broadcast_to(np.asarray(values, dtype=float), (len(nodes), 6))
+        else:
+            vals = np.zeros((len(nodes), 6))
+            vals[:, int(direction) - 1] = np.broadcast_to(np.asarray(values, dtype=float), (len(nodes),))
+        i, d = np.nonzero(vals)
+        items = list(zip(nodes[i].tolist(), (d + 1).tolist()))
+        v = vals[i, d].tolist()
+        columns = {"nodes": nodes[i].tolist(), "directions": (d + 1).tolist(), "values": v}
+        return self._batch('/load/node/add/bulk/' + qt(loadcase) + '/' + str(local), items, columns,
+                           lambda k: self.addNodalLoad(items[k][0], v[k], items[k][1], loadcase, local), chunkSize)
+    def addNodalMasses(self, nodes, masses, chunkSize=2000):
+        ''' Add nodal masses to many nodes
+        
+        Args:
+            nodes: Array of N node IDs
+            masses: Translational masses and rotational inertias (tmx, tmy, tmz, rmx, rmy, rmz), as an array of size 6 applied to all nodes or of size (N,6)
+            chunkSize (optional): Optional. Number of nodes sent in each request
+
+        Returns:
+            BatchResult with a flag for each node
+        '''
+        nodes = np.asarray(nodes).reshape(-1).tolist()
+        m = np.broadcast_to(np.asarray(masses, dtype=float), (len(nodes), 6)).tolist()
+        return self._batch('/mass/add/bulk', nodes, {"nodes": nodes, "masses": m}, lambda i: self.addNodalMass(nodes[i], *m[i]), chunkSize)
+    def addNodalSprings(self, nodes, propName, chunkSize=2000):
+        ''' Add springs connected to the ground on many nodes. Existing results will be deleted.
+        
+        Args:
+            nodes: Array of N node IDs
+            propName: Name of the property of the springs, a single name or an array of size N
+            chunkSize (optional): Optional. Number of springs sent in each request
+
+        Returns:
+            Array of the IDs of the added springs, in input order. 0 for springs that were not added
+        '''
+        nodes = np.asarray(nodes).reshape(-1).tolist()
+        props = np.broadcast_to(np.asarray(propName), (len(nodes),)).tolist()
+        out = np.zeros(len(nodes), dtype=np.int64)
+        for sl in _chunks(len(nodes), chunkSize):
+            added = self._bulk('/element/add/nodalspring/bulk', {"nodes": nodes[sl], "prop": props[sl]})
+            if not(added is None):
+                out[sl] = np.asarray(added, dtype=np.int64)
+                continue
+            for i in range(sl.start, sl.stop):
+                try:
+                    out[i] = int(self.addNodalSpring(nodes[i], props[i]))
+                except Exception:
+                    pass
+        return out
@@ -0,0 +1,208 @@
+'''
+Write-through model cache for NextFEMrest.
+
+NextFEMrest methods are classified as read-only or mutating by name. With
+nf.enableCache(), repeated node, element, section and material queries are
+answered from memory; every successful mutating call updates the cache in
+place (e.g. addNode, setNodeCoordinates) or drops the affected entities
+(e.g. removeNode, setSectionProperty on that section), and calls that may
+change anything (newModel, openModel, renumberNodes, mergeOverlappedNodes,
+imports, undo, setting modeldata or modelresults) clear it.
+'''
+
+import functools
+
+# classification by name: prefixes of read-only methods, then exceptions
+_READ = ("get", "is", "has", "check", "export", "save", "list", "valueFrom", "seriesFrom", "vertexFrom", "convertValue",
+         "compileDocX", "create", "append", "delete", "customCheck", "userCheck", "userFile", "LangTrasl", "elementAvailableFlags",
+         "elementFlagList", "activeBars", "activeHoops", "areRebarsInside", "showViewport", "refreshDesignerView", "colorizeModel",
+         "defaultColors", "clearSelection", "clearStoredDomains", "openIDEAcodeCheck", "Run", "Launch", "AnalyzeFireElement",
+         "readBeamForces", "is64bit", "CustomLicense", "saveUser", "userFiles", "sendFile", "resultsData", "iter")
+_MUTATING = ("deleteGroup", "deleteResults")
+# client-side methods, neither read-only nor mutating
+_CLIENT = ("setHeaders", "setPool", "close", "nfrest", "nfrestB", "nfrestStream", "enableCache", "disableCache", "clearCache", "map", "enableMetrics", "disableMetrics", "loadAll", "deferred")
+# mutating calls after which nothing cached can be trusted
+_CLEAR = ("new", "open", "import", "renumber", "merge", "divide", "mesh", "unDo", "reDo", "requestDesignerUndo", "quad2tria",
+          "convertUnits", "setUnits", "generateFrame", "ModelToSection", "SectionToModel", "splitElements", "removeFreeNodes",
+          "addSpringsOnOverlapped", "removeOverlapped", "convertToMeshedSection", "alignShellXaxis")
+
+def isMutating(name)->bool:
+    ''' True if the NextFEMrest method of the given name may change the model '''
+    if name in _MUTATING: return True
+    if name.startswith("_") or name in _CLIENT: return False
+    return not name.startswith(_READ)
+
+# cached reads: method -> (store, number of key arguments)
+_CACHED = {"getNodeCoordinates": ("nodes", 1), "getElementConnectivity": ("elems", 1), "getElementType": ("elems", 1),
+           "getElementProperty": ("elems", 2), "getSectionProperty": ("sections", 2), "getSectionProperties": ("sections", 1),
+           "getMaterialProperty": ("materials", 3)}
+
+# mutating methods whose first argument is an element, handled before the material and section names they contain
+_ASSIGN = ("assignMaterialToElement", "assignSectionToElement", "setElementSection")
+# mutating methods whose first argument is a section or a material, without it in their name
+_SECTION = ("setShearReinfRCdata",)
+_MATERIAL = ("setConcretePropertiesNTC",)
+
+class ModelCache:
+    ''' Cached query results, by kind of entity and entity ID '''
+    def __init__(self):
+        self.stores = {"nodes": {}, "elems": {}, "sections": {}, "materials": {}}
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return "ModelCache(" + ", ".join(k + "=" + str(len(v)) for k, v in self.stores.items()) + ", hits=" + str(self.hits) + ", misses=" + str(self.misses) + ")"
+
+    def clear(self, kind=None):
+        ''' Drop all the entries, or all the entries of a kind of entity '''
+        for k in (self.stores if kind is None else (kind,)):
+            self.stores[k].clear()
+
+    def drop(self, kind, ID):
+        ''' Drop all the entries of an entity '''
+        self.stores[kind].pop(str(ID), None)
+
+    def get(self, kind, ID, key):
+        entity = self.stores[kind].get(str(ID))
+        if entity is None or not key in entity:
+            self.misses += 1
+            return None, False
+        self.hits += 1
+        return entity[key], True
+
+    def put(self, kind, ID, key, value):
+        self.stores[kind].setdefault(str(ID), {})[key] = value
+
+    def load(self, mirror):
+        ''' Fill node coordinates, element connectivity and types from a ModelMirror '''
+        for n, xyz in zip(mirror.nodeIDs, mirror.coords.tolist()):
+            self.put("nodes", n, ("getNodeCoordinates",), xyz)
+        for e, t in zip(mirror.elemIDs, mirror.elemType):
+            self.put("elems", e, ("getElementType",), str(t))
+            self.put("elems", e, ("getElementConnectivity",), [str(n) for n in mirror.elemNodes(e)])
+        return self
+
+    def update(self, name, bound, result):
+        ''' Apply the effects of a successful mutating call, bound as a dictionary argument name -> value '''
+        args = list(bound.values())
+        first = args[0] if args else None
+        if name == "addNode":
+            if result != "": self.put("nodes", result, ("getNodeCoordinates",), [float(bound["x"]), float(bound["y"]), float(bound["z"])])
+        elif name == "addNodeWithID":
+            self.put("nodes", bound["ID"], ("getNodeCoordinates",), [float(bound["x"]), float(bound["y"]), float(bound["z"])])
+        elif name == "setNodeCoordinates":
+            self.put("nodes", first, ("getNodeCoordinates",), [float(v) for v in bound["coords"]])
+        elif name == "addNodes":
+            import numpy as np
+            for n, xyz in zip(np.ravel(result), np.asarray(bound["coords"], dtype=float).reshape(-1, 3).tolist()):
+                if n != 0: self.put("nodes", n, ("getNodeCoordinates",), xyz)
+        elif name.startswith(_CLEAR):
+            self.clear()
+        elif name == "removeNode":
+            self.drop("nodes", first)
+            self.clear("elems")
+        elif name in ("moveNodes", "rotateNodes", "scaleNodes"):
+            for n in first: self.drop("nodes", n)
+        elif "Node" in name and not name.startswith("add"):
+            self.clear("nodes")
+        elif name in _ASSIGN:
+            # assign*ToElement change the element, not the material or section assigned
+            self.clear("elems") if isinstance(first, list) else self.drop("elems", first)
+        elif name == "setSectionRebarsToElements":
+            self.clear("elems")
+        elif "sectionID" in bound:
+            # add*InSection, addSectionCover, removeSectionFigure, renameSection...
+            self.drop("sections", bound["sectionID"])
+        elif name.startswith(("setCompositeBeam", "setCompositeColumn", "removeCompositeFlags")):
+            self.clear("sections")
+        elif "Section" in name and not name.startswith(("add", "duplicate")) or name in _SECTION:
+            # add*Section, addSectFromLib, duplicateSection... create a new section
+            self.drop("sections", first)
+        elif "Material" in name and not name.startswith("add") or name in ("addOrChangeMaterialProperty", "addOrChangeDesMaterialProperty") + _MATERIAL:
+            self.drop("materials", first)
+        elif ("Element" in name or name in ("setBeamAngle", "setElemAsJoint", "setEndRelease", "setShellEndRelease")) and not name.startswith("add"):
+            self.clear("elems") if isinstance(first, list) else self.drop("elems", first)
+
+_signatures = {}
+
+def updateCache(owner, name, fn, args, kwargs, result):
+    ''' Apply the result of a mutating call of fn to the cache of owner (NextFEMrest), if enabled '''
+    cache = getattr(owner, "cache", None)
+    if cache is None or result is False: return
+    if fn not in _signatures:
+        import inspect
+        _signatures[fn] = inspect.signature(fn)
+    bound = _signatures[fn].bind(owner, *args, **kwargs)
+    bound.apply_defaults()
+    values = dict(bound.arguments)
+    values.pop("self", None)
+    cache.update(name, values, result)
+
+def _mutating(name, fn):
+    @functools.wraps(fn)
+    def method(self, *args, **kwargs):
+        deferred = getattr(self, "_deferred", None)
+        if deferred is None:
+            result = fn(self, *args, **kwargs)
+        elif deferred.accepts(name):
+            return deferred.add(name, fn, args, kwargs)
+        else:
+            with deferred.direct():
+                result = fn(self, *args, **kwargs)
+        updateCache(self, name, fn, args, kwargs, result)
+        return result
+    return method
+
+def _cached(name, fn):
+    kind, nkey = _CACHED[name]
+    @functools.wraps(fn)
+    def method(self, *args, **kwargs):
+        cache = getattr(self, "cache", None)
+        # queued calls may change the entry
+        if not(getattr(self, "_deferred", None) is None): self._deferred.flush()
+        if cache is None or kwargs or len(args) < 1:
+            return fn(self, *args, **kwargs)
+        key = (name,) + tuple(str(a) for a in args[1:nkey])
+        value, found = cache.get(kind, args[0], key)
+        if found: return list(value) if isinstance(value, list) else value
+        value = fn(self, *args, **kwargs)
+        cache.put(kind, args[0], key, value)
+        return value
+    return method
+
+def install(cls, names=None):
+    ''' Wrap the cached read methods and all the mutating methods of a NextFEMrest class, or only the given ones '''
+    # type.__dir__ lists the methods already loaded, without loading the others (see NextFEMrest.__dir__)
+    for name in (type.__dir__(cls) if names is None else names):
+        fn = getattr(cls, name)
+        if not callable(fn) or isinstance(vars(cls).get(name), property) or hasattr(fn, "__wrapped__"): continue
+        if name in _CACHED:
+            setattr(cls, name, _cached(name, fn))
+        elif isMutating(name):
+            setattr(cls, name, _mutating(name, fn))
+    return cls
+
+class CacheMixin:
+
+    def enableCache(self, preload=False):
+        ''' Enable the write-through cache of node, element, section and material queries
+        
+        Args:
+            preload (optional): Optional. If True, fill node coordinates and element connectivity from one modeldata download
+
+        Returns:
+            The ModelCache
+        '''
+        self.cache = ModelCache()
+        if preload:
+            from .mirror import ModelMirror
+            self.cache.load(ModelMirror(self))
+        return self.cache
+
+    def disableCache(self):
+        ''' Disable and drop the write-through cache '''
+        self.cache = None
+
+    def clearCache(self):
+        ''' Drop all the cached entries, keeping the cache enabled. To be called after changing the model other than through NextFEMrest methods '''
+        if not(getattr(self, "cache", None) is None): self.cache.clear()
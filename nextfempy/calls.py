@@ -0,0 +1,64 @@
+'''
+Capture and replay of the REST requests issued by NextFEMrest methods.
+
+Every wrapped method builds its request, calls nfrest/nfrestB and converts the
+answer. Running a method against a stand-in client that raises PendingRequest
+instead of sending gives the request to be sent elsewhere (async transport,
+deferred batches); running it again with the collected answers gives the
+converted result, without duplicating any method body.
+'''
+
+class PendingRequest(BaseException):
+    ''' Raised in place of sending a request. Derives from BaseException so that methods catching Exception do not swallow it '''
+    def __init__(self, method, command, body=None, heads=None, binary=False):
+        self.method = method
+        self.command = command
+        self.body = body
+        self.heads = heads
+        self.binary = binary
+
+class Answer:
+    ''' Answer to a captured request '''
+    def __init__(self, content:bytes, status=200, encoding="utf-8"):
+        self.content = content
+        self.status_code = status
+        self.encoding = encoding
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+class _Replayer:
+    # stand-in for the client: answers from the collected list, then raises PendingRequest
+    def __init__(self, owner, answers):
+        self._owner = owner
+        self._answers = answers
+        self._i = 0
+
+    def __getattr__(self, name):
+        return getattr(self._owner, name)
+
+    def _next(self, method, command, body, heads, binary):
+        if self._i < len(self._answers):
+            answer = self._answers[self._i]
+            self._i += 1
+            return answer.content if binary else answer.text
+        raise PendingRequest(method, command, body, heads, binary)
+
+    def nfrest(self, method, command, body=None, heads=None)->str:
+        return self._next(method, command, body, heads, False)
+
+    def nfrestB(self, method, command, body=None, heads=None)->bytes:
+        return self._next(method, command, body, heads, True)
+
+def replay(fn, owner, args=(), kwargs=None):
+    ''' Generator running fn(owner, *args, **kwargs) one request at a time.
+    
+    Yields each PendingRequest and expects the corresponding Answer through send(). The converted result of fn is returned with StopIteration.
+    '''
+    answers = []
+    while True:
+        try:
+            return fn(_Replayer(owner, answers), *args, **(kwargs or {}))
+        except PendingRequest as p:
+            answers.append((yield p))
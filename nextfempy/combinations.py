@@ -0,0 +1,169 @@
+'''
+Client-side linear load combinations.
+
+Linear results superpose, so the results of any combination are the factored
+sum of the loadcase results. LoadCombinations holds a factor table
+(combinations x loadcases), read from the model or built locally, and
+evaluates it on result arrays fetched once, without running the solver again.
+Besides linear add combinations, SRSS and absolute sum combinations are
+evaluated too; envelopes are not, and are skipped when read from a table.
+
+    res = nf.resultsData()
+    forces = nf.getBeamForcesArray(results=res)
+    combos = LoadCombinations.fromModel(nf)
+    envelope = combos.combine(forces)       # loadcases axis becomes combinations
+'''
+
+import warnings
+import numpy as np
+
+# table columns holding combination data other than loadcase factors
+_LABELS = ("type", "combination type", "design type", "servtype", "service type", "description", "phase")
+
+# kinds of combination evaluated, and words telling them in the label cells of a table
+KINDS = ("linear", "srss", "absolute")
+_KEYWORDS = (("srss", "srss"), ("abs", "absolute"), ("env", "envelope"), ("lin", "linear"), ("add", "linear"))
+
+def _kind(cells)->str:
+    # kind of combination named in the label cells of a row, linear if none
+    for c in cells:
+        for word, kind in _KEYWORDS:
+            if word in c.lower(): return kind
+    return "linear"
+
+def _number(s):
+    try:
+        return float(str(s).strip().replace(",", "."))
+    except ValueError:
+        return None
+
+class LoadCombinations:
+
+    def __init__(self, loadcases=None):
+        self.loadcases = list(loadcases or [])
+        self.names = []
+        self.kinds = []
+        self.factors = np.zeros((0, len(self.loadcases)))
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return "LoadCombinations(" + str(len(self.names)) + " combinations of " + str(len(self.loadcases)) + " loadcases)"
+
+    def add(self, name, factors:dict, kind="linear"):
+        ''' Add or replace a combination
+        
+        Args:
+            name: Name of the combination
+            factors: Dictionary loadcase -> factor. Loadcases not yet in the table are added
+            kind (optional): Optional. "linear" (factored sum), "srss" (square root of the sum of the squared factored results) or "absolute" (sum of their absolute values)
+        '''
+        if not kind in KINDS: raise ValueError("Combinations of kind " + str(kind) + " are not evaluated, only " + ", ".join(KINDS))
+        for lc in factors:
+            if not lc in self.loadcases:
+                self.loadcases.append(lc)
+                self.factors = np.hstack([self.factors, np.zeros((len(self.names), 1))])
+        row = np.array([float(factors.get(lc, 0.0)) for lc in self.loadcases])
+        if name in self.names:
+            self.factors[self.names.index(name)] = row
+            self.kinds[self.names.index(name)] = kind
+        else:
+            self.names.append(name)
+            self.kinds.append(kind)
+            self.factors = np.vstack([self.factors, row])
+        return self
+
+    def factor(self, name, loadcase)->float:
+        ''' Factor of a loadcase in a combination '''
+        return float(self.factors[self.names.index(name), self.loadcases.index(loadcase)])
+
+    @classmethod
+    def fromTable(cls, table, separator=None):
+        ''' Build the combinations from a table as returned by getLoadCombinationsTable
+        
+        Args:
+            table: List of rows, as strings or lists of cells. The first row holds the loadcase names, the first column the combination names.
+                The kind of combination is read from the label columns (e.g. "Linear add", "SRSS", "Envelope"); envelopes and other kinds not evaluated are skipped with a warning
+            separator (optional): Optional. Cell separator for rows given as strings, guessed if not set
+
+        Returns:
+            LoadCombinations
+        '''
+        rows = []
+        for row in table:
+            if isinstance(row, str):
+                sep = separator
+                if sep is None:
+                    sep = next((s for s in (";", "\t", ",") if s in row), ";")
+                row = row.split(sep)
+            rows.append([str(c).strip() for c in row])
+        combos = cls()
+        if len(rows) < 2: return combos
+        header = rows[0]
+        # keep only numeric columns: others are labels or combination types
+        columns = [k for k in range(1, len(header)) if header[k].lower() not in _LABELS and any(_number(r[k]) is not None for r in rows[1:] if k < len(r))]
+        skipped = []
+        for r in rows[1:]:
+            if not r or r[0] == "": continue
+            kind = _kind(r[k] for k in range(1, len(r)) if not k in columns)
+            if not kind in KINDS:
+                skipped.append(r[0])
+                continue
+            combos.add(r[0], dict((header[k], _number(r[k]) or 0.0) for k in columns if k < len(r)), kind)
+        if skipped: warnings.warn("Combinations not evaluated locally, skipped: " + ", ".join(skipped))
+        return combos
+
+    @classmethod
+    def fromModel(cls, nf, includeEnvelopes=False):
+        ''' Read the combinations table of the model connected to nf (NextFEMrest) '''
+        table = nf.getLoadCombinationsTable(includeEnvelopes)
+        if not isinstance(table, list): return cls()
+        return cls.fromTable(table, nf.tableSeparator or None)
+
+    def combine(self, results, axis=None):
+        ''' Evaluate all the combinations on loadcase results
+        
+        Args:
+            results: ResultArray with a "loadcases" axis, dictionary loadcase -> array, or array with loadcases along the given axis in the order of self.loadcases
+            axis (optional): Optional. Loadcase axis of an array, default is 0
+
+        Returns:
+            Same kind of input with combinations in place of loadcases: ResultArray with a "combinations" axis, dictionary combination -> array, or array
+        '''
+        if hasattr(results, "axes") and "loadcases" in results.axes:
+            from .resultarrays import ResultArray
+            k = results.axes.index("loadcases")
+            values = self._apply(np.asarray(results.values), k, [str(lc) for lc in results.labels["loadcases"]])
+            axes = list(results.axes); axes[k] = "combinations"
+            labels = dict(results.labels); labels.pop("loadcases"); labels["combinations"] = self.names
+            return ResultArray(values, axes, labels)
+        if isinstance(results, dict):
+            names = list(results.keys())
+            values = self._apply(np.stack([np.asarray(results[lc], dtype=float) for lc in names]), 0, [str(lc) for lc in names])
+            return dict(zip(self.names, values))
+        return self._apply(np.asarray(results, dtype=float), axis or 0, [str(lc) for lc in self.loadcases])
+
+    def _apply(self, values, axis, available):
+        # combinations along axis, by kind; loadcases with non-zero factors must be available
+        pos = []
+        for j, lc in enumerate(self.loadcases):
+            if str(lc) in available:
+                pos.append(available.index(str(lc)))
+            elif self.factors[:, j].any():
+                raise KeyError("No results for loadcase " + str(lc))
+            else:
+                pos.append(-1)
+        used = [j for j in range(len(pos)) if pos[j] >= 0]
+        f = self.factors[:, used]
+        v = np.moveaxis(np.take(values, [pos[j] for j in used], axis=axis), axis, 0)
+        out = np.tensordot(f, v, axes=([1], [0]))
+        for i, kind in enumerate(self.kinds):
+            if kind == "linear": continue
+            terms = f[i].reshape((-1,) + (1,) * (v.ndim - 1)) * v
+            out[i] = np.sqrt((terms ** 2).sum(axis=0)) if kind == "srss" else np.abs(terms).sum(axis=0)
+        return np.moveaxis(out, 0, axis)
+
+def psiCoefficients(nf)->np.ndarray:
+    ''' Psi combination coefficients of the model connected to nf (NextFEMrest), as a 3x3 array [subscript, type-1]: psi0, psi1, psi2 for variable, wind and snow loading '''
+    return np.array([[nf.getCombinationCoeffPsi(i, t) for t in (1, 2, 3)] for i in (0, 1, 2)])
@@ -0,0 +1,24 @@
+import json, urllib.parse
+
+def sbool(arg)->bool:
+    if arg=="True":
+        return True
+    else:
+        return False
+
+def qt(s)->str:
+    try:
+        return str(urllib.parse.quote(s, safe=''))
+    except:
+        return str(s)
+    
+def des(s):
+    try:
+        return json.loads(s)
+    except:
+        return str(s)
+
+def _chunks(n, size):
+    # slices splitting n items in chunks of the given size
+    for i in range(0, n, max(1, int(size))):
+        yield slice(i, min(i + int(size), n))
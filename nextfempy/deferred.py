@@ -0,0 +1,320 @@
+'''
+Deferred mode of NextFEMrest: mutating calls are queued and sent in batches.
+
+Most model-building calls (addNode, setBC, addBeamLoad, assignToGroup, ...)
+answer only an ID or a flag that scripts ignore. Within nf.deferred(), the
+mutating methods return a DeferredCall at once and their requests are queued;
+the queue is flushed, in order, when it reaches batchSize, before any other
+request (so that reads see every queued change) and at the end of the block:
+
+    with nf.deferred():
+        for i in range(1000): nf.addNode(i, 0, 0)
+        last = nf.addNode(1000, 0, 0)
+        nf.setBC(1, True, True, True, True, True, True)
+    print(last.result())
+
+A flush sends the queued requests in one POST to /op/batch, which applies them
+in order. Servers without it get them pipelined on one HTTP/1.1 connection:
+written back to back while the answers are read in order, so that a flush costs
+about one round trip instead of one per call. The answers are converted by the
+methods themselves (see calls.replay) and the cache is updated as for direct
+calls.
+'''
+
+import contextlib, http.client, io, json, socket, threading, time, urllib.parse
+from .calls import Answer, replay
+from .cache import updateCache
+from .common import des
+from . import domains
+
+class DeferredCall:
+    ''' Result of a deferred call, available once the queue is flushed '''
+    def __init__(self, deferred, name, args):
+        self.name = name
+        self.args = args
+        self.error = None
+        self._value = None
+        self._done = False
+        self._deferred = deferred
+
+    def __repr__(self):
+        state = "pending" if not self._done else "ok" if self.error is None else repr(self.error)
+        return "DeferredCall(" + self.name + ", " + state + ")"
+
+    def done(self)->bool:
+        ''' True if the call was sent and its answer converted '''
+        return self._done
+
+    @property
+    def ok(self)->bool:
+        ''' True if the call was sent and its answer converted without errors '''
+        return self._done and self.error is None
+
+    def result(self):
+        ''' Value returned by the method, flushing the queue if the call is pending. Raises the error of a failed call '''
+        if not self._done: self._deferred.flush()
+        if not(self.error is None): raise self.error
+        return self._value
+
+    def _resolve(self, value=None, error=None):
+        self._value = value
+        self.error = error
+        self._done = True
+
+class _Reader(io.BufferedReader):
+    # buffered socket reader shared by the pipelined answers: http.client closes it after each one
+    def close(self):
+        pass
+
+class _Connection:
+    # socket stand-in for http.client.HTTPResponse, giving it the shared reader
+    def __init__(self, reader):
+        self.reader = reader
+
+    def makefile(self, *args, **kwargs):
+        return self.reader
+
+def _notAnswered(request, reason):
+    # error of a call whose request was sent, or may have been, without an answer
+    return ConnectionError(request.method + " " + request.command + " not answered, the call may have been applied: " + str(reason))
+
+def _value(arg):
+    # argument of a deferred call, with the results of the DeferredCall it refers to, also within lists, tuples, sets,
+    # dictionary values and NumPy object arrays, at any depth. Containers without any are returned as they are
+    if isinstance(arg, DeferredCall): return arg.result()
+    if isinstance(arg, dict):
+        values = dict((k, _value(v)) for k, v in arg.items())
+        return arg if all(values[k] is v for k, v in arg.items()) else type(arg)(values)
+    if isinstance(arg, (list, tuple, set, frozenset)):
+        values = [_value(a) for a in arg]
+        if all(v is a for v, a in zip(values, arg)): return arg
+        return type(arg)(*values) if hasattr(arg, "_fields") else type(arg)(values)
+    if getattr(getattr(arg, "dtype", None), "hasobject", False) and hasattr(arg, "flat"):
+        values = arg.copy()
+        for i, a in enumerate(arg.flat): values.flat[i] = _value(a)
+        return values
+    return arg
+
+def _encoding(contentType):
+    # encoding of an answer, as chosen by requests
+    for param in contentType.split(";")[1:]:
+        key, sep, value = param.strip().partition("=")
+        if key.lower() == "charset": return value.strip("'\"")
+    if "text" in contentType: return "ISO-8859-1"
+    if "application/json" in contentType: return "utf-8"
+    return None
+
+class Deferred:
+
+    def __init__(self, nf, batchSize=1000, pipeline=True):
+        ''' Queue of deferred calls of nf (NextFEMrest), active within a with block. See NextFEMrest.deferred '''
+        self.nf = nf
+        self.batchSize = batchSize
+        self.pipeline = pipeline
+        # calls sent, flushes and time spent flushing
+        self.calls = 0
+        self.flushes = 0
+        self.seconds = 0.0
+        self._queue = []
+        self._lock = threading.RLock()
+        self._flushing = False
+        self._direct = 0
+        self._previous = None
+
+    def __repr__(self):
+        return "Deferred(" + str(len(self._queue)) + " pending, " + str(self.calls) + " calls sent in " + str(self.flushes) + " flushes)"
+
+    def __enter__(self):
+        # calls queued by an enclosing block go first
+        if not(self.nf._deferred is None): self.nf._deferred.flush()
+        self._previous = self.nf._deferred
+        self.nf._deferred = self
+        return self
+
+    def __exit__(self, *args):
+        try:
+            self.flush()
+        finally:
+            self.nf._deferred = self._previous
+
+    @property
+    def pending(self)->int:
+        ''' Number of queued calls '''
+        return len(self._queue)
+
+    def accepts(self, name)->bool:
+        ''' True if a mutating method is queued: generated methods, not called by a helper being run '''
+        return self._direct == 0 and not self._flushing and domains.INDEX.get(name, "").startswith(".domains.")
+
+    @contextlib.contextmanager
+    def direct(self):
+        ''' Run a call at once, after the queued ones, as well as the calls it makes '''
+        self.flush()
+        with self._lock:
+            self._direct += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._direct -= 1
+
+    def add(self, name, fn, args, kwargs)->DeferredCall:
+        ''' Queue a call of fn, the function of a mutating method. Returns its DeferredCall
+
+        Arguments that are DeferredCall are replaced by their result, flushing the queue if needed
+        '''
+        args = tuple(_value(a) for a in args)
+        kwargs = dict((k, _value(v)) for k, v in kwargs.items())
+        call = DeferredCall(self, name, args)
+        steps = replay(fn, self.nf, args, kwargs)
+        try:
+            request = next(steps)
+        except StopIteration as stop:
+            # nothing to send
+            call._resolve(stop.value)
+            updateCache(self.nf, name, fn, args, kwargs, stop.value)
+            return call
+        with self._lock:
+            self._queue.append((call, fn, args, kwargs, steps, request))
+            full = len(self._queue) >= self.batchSize
+        if full: self.flush()
+        return call
+
+    def flush(self)->int:
+        ''' Send the queued calls, in order, and resolve their DeferredCall. Returns the number of calls sent '''
+        with self._lock:
+            if self._flushing or not self._queue: return 0
+            self._flushing = True
+            try:
+                t0 = time.perf_counter()
+                queue, self._queue = self._queue, []
+                try:
+                    answers = self._sendAll([q[5] for q in queue])
+                except Exception as e:
+                    answers = [_notAnswered(q[5], repr(e)) for q in queue]
+                for (call, fn, args, kwargs, steps, request), answer in zip(queue, answers):
+                    self._resolve(call, fn, args, kwargs, steps, answer)
+                self.calls += len(queue)
+                self.flushes += 1
+                self.seconds += time.perf_counter() - t0
+                return len(queue)
+            finally:
+                self._flushing = False
+
+    def _resolve(self, call, fn, args, kwargs, steps, answer):
+        # convert an answer through the method, and apply it to the cache
+        if isinstance(answer, Exception):
+            call._resolve(error=answer)
+            return
+        try:
+            while True:
+                request = steps.send(answer)
+                # methods sending more than one request: the others are sent at once
+                answer = self.nf._send(request.method, request.command, request.body, request.heads)
+        except StopIteration as stop:
+            call._resolve(stop.value)
+            updateCache(self.nf, call.name, fn, args, kwargs, stop.value)
+        except Exception as e:
+            call._resolve(error=e)
+
+    def _sendAll(self, requests)->list:
+        # answers of the requests, in order: batch endpoint, else pipelining, else one request each
+        nf = self.nf
+        if not("/op/batch" in nf._noBulk):
+            answers = self._batch(requests)
+            if not(answers is None): return answers
+        # sessions recorded or replayed (see recorder) keep their transport
+        if self.pipeline and not("_send" in vars(nf)) and nf.baseUrl.startswith(("http://", "https://")):
+            return self._pipelined(requests)
+        answers = []
+        for r in requests:
+            try:
+                answers.append(nf._send(r.method, r.command, r.body, r.heads))
+            except Exception as e:
+                answers.append(e)
+        return answers
+
+    def _batch(self, requests):
+        # one POST with all the requests, or None if the server lacks the endpoint
+        body = {"requests": [{"method": r.method, "path": r.command, "body": r.body,
+                              "headers": None if r.heads is None else dict((k, str(v)) for k, v in r.heads.items())} for r in requests]}
+        try:
+            response = self.nf._send('POST', '/op/batch', body)
+        except Exception as e:
+            return [_notAnswered(r, repr(e)) for r in requests]
+        out = des(response.text) if response.status_code < 400 else None
+        if isinstance(out, list) and len(out) == len(requests):
+            return [Answer(str(a.get("body", "")).encode(), int(a.get("status", 200))) for a in out]
+        if response.status_code < 400 or response.status_code in (404, 405, 501):
+            # not a batch endpoint: nothing was applied
+            self.nf._noBulk.add("/op/batch")
+            return None
+        return [_notAnswered(r, "status " + str(response.status_code) + " of the batch") for r in requests]
+
+    def _pipelined(self, requests)->list:
+        # HTTP/1.1 pipelining on a new connection: a thread writes the requests while the answers are read in order
+        nf = self.nf
+        url = urllib.parse.urlsplit(nf.baseUrl)
+        https = url.scheme == "https"
+        timeout = nf.timeout[1] if isinstance(nf.timeout, tuple) else nf.timeout
+        sock = socket.create_connection((url.hostname, url.port or (443 if https else 80)), timeout=timeout)
+        if https:
+            import ssl
+            sock = ssl._create_unverified_context().wrap_socket(sock, server_hostname=url.hostname)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        data, sizes = [], []
+        for r in requests:
+            hds = dict(nf.headers)
+            if not(r.heads is None): hds.update(r.heads)
+            body = b"" if r.body is None else json.dumps(r.body).encode()
+            path = urllib.parse.quote(url.path.rstrip("/") + r.command, safe="!#$%&'()*+,/:;=?@[]~")
+            lines = [r.method + " " + path + " HTTP/1.1", "Host: " + url.netloc]
+            lines += [k + ": " + str(v) for k, v in hds.items()]
+            if body: lines.append("Content-Type: application/json")
+            if body or r.method in ("POST", "PUT"): lines.append("Content-Length: " + str(len(body)))
+            data.append(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+            sizes.append(len(body))
+        def write():
+            try:
+                for d in data: sock.sendall(d)
+            except OSError:
+                pass
+        writer = threading.Thread(target=write, daemon=True)
+        writer.start()
+        connection = _Connection(_Reader(socket.SocketIO(sock, "rb")))
+        answers = []
+        t0 = time.perf_counter()
+        try:
+            for r, size in zip(requests, sizes):
+                response = http.client.HTTPResponse(connection, method=r.method)
+                response.begin()
+                answer = Answer(response.read(), response.status, _encoding(response.getheader("Content-Type", "")))
+                answers.append(answer)
+                if not(nf.metrics is None) or nf.msg:
+                    nf._observe(r.method, r.command, time.perf_counter() - t0, size, len(answer.content), answer.status_code)
+        except (OSError, http.client.HTTPException) as e:
+            # the connection was lost: the calls not answered may or may not have been applied
+            answers += [_notAnswered(r, repr(e)) for r in requests[len(answers):]]
+        finally:
+            # unblock the writer if the server stopped reading
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+            writer.join(5.0)
+        return answers
+
+class DeferredMixin:
+
+    def deferred(self, batchSize=1000, pipeline=True):
+        ''' Queue the mutating calls made in a with block, and send them in batches. Any other request, DeferredCall.result() and the end of the block send the queued calls first
+
+        Args:
+            batchSize (optional): Optional. Number of queued calls sent in each batch
+            pipeline (optional): Optional. On servers without batches, if True the queued requests are pipelined on one connection, otherwise sent one by one through the pooled session
+
+        Returns:
+            Deferred, to be used in a with statement. Within it, mutating methods return a DeferredCall
+        '''
+        return Deferred(self, batchSize, pipeline)
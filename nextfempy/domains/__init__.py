@@ -0,0 +1,152 @@
+'''
+Methods of NextFEMrest, split by domain and loaded on first use.
+
+The generated methods calling the REST endpoints are in the modules of this
+package, a mixin class for each domain (nodes, elements, sections, materials,
+loads, results, checks, docx, io, mesh, model); the helpers built on them are
+in bulk, resultarrays, fanout and deferred. MIXINS tells which module has each
+public method: NextFEMrest imports a module and adds its methods to the class
+when one of them is first used, so importing nextfempy does not load the whole
+API nor numpy and requests.
+'''
+
+import importlib, threading
+
+# module -> (mixin class, public methods). The domain entries are generated with their modules
+MIXINS = {
+    ".domains.nodes": ("NodesMixin", (
+        "addNode", "addNodeWithID", "getAreaByNodes", "getBC", "getConnectedElements", "getControlNode", "getCornerNodes", "getFreeNodeID",
+        "getMaxNodeID", "getNodeCoordinates", "getNodeInfo", "getNodePosition", "getNodeProperty", "isRestrained", "removeBC",
+        "removeNode", "removeNodeCS", "setBC", "setNodeAsJoint", "setNodeCoordinates", "setNodeCS", "setNodePosition", "vertexFromNode")),
+    ".domains.elements": ("ElementsMixin", (
+        "activeBarsDiameters", "activeHoopsDiameters", "addBeam", "addBeamWithID", "addLongitRebar", "addMember", "addNodalSpring",
+        "addNormalhinge", "addNVMhinge", "addOrChangeElementFlag", "addQuad", "addQuadWithID", "addRebarPattern", "addSolid", "addSpring",
+        "addSpringNLProperty", "addSpringProperty", "addSpringsOnOverlappedNodes", "addSpringWithID", "addStirrupBars",
+        "addSubsoilNodalSpringsOnElements", "addSubsoilZProperty", "addTria", "addTriaWithID", "addTruss", "addTrussWithID",
+        "alignShellXaxis", "assignHinge", "assignSubsoilProperty", "changeElementProperty", "changeSpringNLProperty",
+        "changeSpringNLPropertyDof", "changeSpringProperty", "clearElementCustomProperties", "clearElementRebar", "elementAvailableFlags",
+        "elementFlagList", "exportRCmemberDXF", "getElementArea", "getElementCentroid", "getElementConnectivity",
+        "getElementCustomProperty", "getElementInfo", "getElementOffset", "getElementProperty", "getElementRebarCoords",
+        "getElementRebarSize", "getElementType", "getElementVolume", "getEndRelease", "getExtrudedBeamPoints", "getFreeElementID",
+        "getLocalAxes", "getLocalAxesArray", "getMacroelement", "getMaxElementID", "getMemberElements", "getMemberLength", "getMembers",
+        "getRigidOffsets", "getShellEndRelease", "getSpringLocalAxes", "getSpringProperties", "getSubsoilElements", "getWallGroups",
+        "getWallHeight", "getWalls", "getWallSection", "isColumn", "refreshHinges", "removeElement", "removeElementsFromMember",
+        "removeHinges", "removeHingeType", "removeMember", "removeSpringProperty", "setBeamAngle", "setElemAsJoint",
+        "setElementCustomProperty", "setElementOffset", "setEndRelease", "setMacroelement", "setPlaneStrainElement",
+        "setPlaneStressElement", "setRigidOffsets", "setShellEndRelease", "setSpringLocalAxes", "setWall")),
+    ".domains.sections": ("SectionsMixin", (
+        "addBoxSection", "addCircleInSection", "addCircSection", "addCSection", "addDCSection", "addDLSection", "addDTSection",
+        "addFillInSection", "addHoleInSection", "addLayeredPlanarSection", "addLongitRebarInSection", "addLSection", "addOmegaSection",
+        "addPipeSection", "addPlanarSection", "addRebarPatternInSection", "addRebarRowInSection", "addRectangleInSection",
+        "addRectSection", "addSectFromLib", "addSectionByPoints", "addSectionCover", "addSectionFromDXF", "addStirrupBarsInSection",
+        "addTSection", "areRebarsInsideSection", "assignSectionToElement", "changeOrAddSectionPoint", "clearSectionRebar",
+        "duplicateSection", "exportSectionDXF", "getDefinedSections", "getElementRebarSegments", "getFireSectionImage",
+        "getLastBilinearMomentCurvature", "getLastMomentCurvatureData", "getSectionColor", "getSectionFigure", "getSectionImage",
+        "getSectionLibNames", "getSectionOffset", "getSectionProperties", "getSectionProperty", "getSectionRebarCoords",
+        "getSectionRebarSize", "getSectionResMoments", "getSectionResMoments2", "getSectionResMoments3", "getSectionResShear",
+        "getSectionResShearDict", "getSectionsLibrary", "getSectionsLibraryF", "getSectMomentCurvature", "getShearResFromDict",
+        "ModelToSection", "recalculateSection", "removeCompositeFlags", "removeSection", "removeSectionCover", "removeSectionFigure",
+        "removeSectionProperty", "renameSection", "saveSectionImage", "saveSectionImageWithBars", "SectionToModel", "setAluSection",
+        "setCompositeBeam", "setCompositeColumn", "setElementSection", "setFiberSection", "setSectionAngle", "setSectionColor",
+        "setSectionMaterial", "setSectionOffset", "setSectionProperty", "setSectionRebarsToElements", "setShearReinfRCdata",
+        "setSteelSection", "splitElementsByRebarSegments")),
+    ".domains.materials": ("MaterialsMixin", (
+        "addDesignMatFromLib", "addDesMaterial", "addIsoMaterial", "addMatFromLib", "addOrChangeDesMaterialProperty",
+        "addOrChangeMaterialProperty", "assignMaterialToElement", "getDefinedDesignMaterials", "getDefinedMaterials",
+        "getDesignMaterialProperty", "getDesignMaterialsLibrary", "getDesignMaterialsLibraryF", "getDesMaterialLibNames",
+        "getMaterialLibNames", "getMaterialProperty", "getMaterialsLibrary", "getMaterialsLibraryF", "getReinfPropertiesNTC",
+        "listDesignMaterialCustomProperty", "listMaterialCustomProperty", "removeDesMaterialProperty", "removeMaterial",
+        "removeMaterialProperty", "setConcretePropertiesNTC")),
+    ".domains.loads": ("LoadsMixin", (
+        "addBeamLoad", "addBeamLoadA", "addBeamLoadU", "addEC8spectrum", "addEdgeLoad", "addFloorPlane", "addLoadCase",
+        "addLoadCaseToCombination", "addLoadCaseToTimeHistoryAnalysis", "addNodalDisp", "addNodalLoad", "addNodalMass", "addNTCspectrum",
+        "addOrChangeLoadCombinationsTable", "addSeriesFunction", "addSineFunction", "addSurfaceLoad", "addThermalDistLoad",
+        "addVolumeLoad", "applyEC8lateralForces", "changeLoadValue", "functionFromFile", "generateLoadCombinations",
+        "getCombinationCoeffPsi", "getCombinationDesignType", "getCombinationsByDesignType", "getDataPlot", "getEnvelopeCombination",
+        "getFloorLoadType", "getFloorPlanes", "getFunctionGeneralData", "getFunctionName", "getFunctionPlot", "getFunctions",
+        "getFunctionUnits", "getLinearAddCombination", "getLoad", "getLoadA", "getLoadcaseFactor", "getLoadCaseFunction", "getLoadCases",
+        "getLoadCaseType", "getLoadCombinations", "getLoadCombinationsTable", "getLoadDurationClass", "getLoadsForElement",
+        "getLoadsForNode", "getLoadsInLoadcase", "getMultiplePlots", "getStaticLoadCases", "isNodeLoaded", "LoadCaseFromCombo",
+        "removeAllLoads", "removeAllLoadsForLoadcase", "removeFloorLoad", "removeFloorPlane", "removeLoad", "removeLoadCase",
+        "removeLoadCaseFromCombination", "removeLoadCaseToTimeHistoryAnalysis", "removeNodalMass", "seriesFromFunction",
+        "setAnalysisSequence", "setBucklingAnalysis", "setCombination", "setCombinationCoeffPsi", "setCombinationFactors", "setEnvelope",
+        "setFirePoint", "setFloorLoad", "setFunctionGeneralData", "setLoadA", "setLoadcaseFactor", "setLoadCasePhaseInCombination",
+        "setLoadCaseType", "setLoadDurationClass", "setLoadsToMass", "setModalAnalysis", "setNLDanalysis", "setNLSanalysis",
+        "setPDeltaAnalysis", "setResponseSpectrumAnalysis", "setSeismicFloorEccentricity", "setSeismicLoadcaseForCombos", "setSelfWeight",
+        "setSelfWeightDirection", "setSRSScombination", "valueFromFunction")),
+    ".domains.results": ("ResultsMixin", (
+        "applyButterworthFilter", "deleteResults", "getBeamDeflection", "getBeamDeflections", "getBeamForce", "getBeamForce2",
+        "getBeamForces", "getBeamForcesAtNode", "getBeamForcesDiagram", "getBeamForcesEnvelopeTable", "getFirstMode", "getLastRunLog",
+        "getMaxMinBeamForces", "getMaxMinNodeDispl", "getMaxMinWoodArmerMoments", "getModalPeriod", "getModes", "getNodalDisp",
+        "getNodalReact", "getNodalShellForce", "getNodalStress", "getParticipatingMassesRatios", "getParticipationFactors",
+        "getResultHistory", "getSectionCutForce", "getSoilPressureAtNode", "getTimePeriods", "hasResults", "LaunchLoadCase", "LaunchModel",
+        "mergeModelResults", "RunLoadCase", "RunModel")),
+    ".domains.checks": ("ChecksMixin", (
+        "AnalyzeFireElement", "checkElement", "checkElementRatio", "checkElements", "checkElementsRatio", "checkElementStation",
+        "checkModel", "checkNode", "checkNodes", "clearStoredDomains", "customCheck", "deleteChecks", "getBeamResMoments",
+        "getBeamResShear", "getBuiltInChecking", "getCheckLogName", "getCheckNameByMaterial", "getElementChecks", "getElementsChecks",
+        "getElementsChecksByMat", "getHTMLlogCheck", "getItemDataResults", "getLastSectionRes3DDomainPoints",
+        "getLastSectionResDomainPoints", "getNodeChecks", "getNodesChecks", "getSectionResDomainPoints", "readBeamForces",
+        "setElementChecks", "setNodeChecks", "userCheck")),
+    ".domains.docx": ("DocxMixin", (
+        "appendDocXformula", "appendDocXimage", "appendDocXimageB", "appendDocXtext", "compileDocX", "createDocX",
+        "deleteDocXheadingByTitle", "deleteDocXheadings", "getDocXheadings", "saveDocX", "saveDocXbytes", "saveDocXtoHTML")),
+    ".domains.io": ("IOMixin", (
+        "exportDXF", "exportElevationGroupToDXF", "exportGLTF", "exportGroupToDXF", "exportIFC", "exportIOM", "exportMidas",
+        "exportOpenSees", "exportRCbeamsDXF", "exportSAF", "exportSAP2000", "exportSpreadsheet", "exportWexBIM", "exportXMLresults",
+        "getDXFentities", "getOSprocedureName", "importAbaqusCalculix", "importDolmen", "importDXF", "importGMesh", "importIFC",
+        "importMesh", "importMidas", "importMidasResults", "importMidasResultsAPI", "importNodeElemFiles", "importOBJ", "importOpenSees",
+        "importOpenSeesRecorder", "importSAF", "importSAP2000", "importSeismoStruct", "importSismicad", "importSismicadSects_Combo",
+        "importSofistik", "importSR3", "importSR4", "importSTL", "importStraus7", "importStrausResults", "importWinStrand", "importZeusNL",
+        "importZeusNLresults", "openIDEAcodeCheck", "valueFromString")),
+    ".domains.mesh": ("MeshMixin", (
+        "addMeshedWall", "checkConnectivity", "checkFreeNodes", "checkLineElements", "checkOverlappedElements", "convertToMeshedSection",
+        "divideHexa", "divideLine", "divideLineByNodes", "divideQuad", "divideWedge", "generateFrame", "getAlignedNodes",
+        "getNodesFromCoords", "getNodesOnSides", "getRigidDiaphragms", "mergeImportedLines", "mergeLines", "mergeOverlappedNodes",
+        "meshAreaTria", "meshAreaTriaMulti", "meshQuad2Wall", "moveNodes", "quad2tria", "removeFreeNodes", "removeLink",
+        "removeOverlappedElements", "removeRigidDiaphragms", "renumberElements", "renumberElementsByCoordinates", "renumberNodes",
+        "renumberNodesByCoordinates", "rotateNodes", "scaleNodes", "setConstraint", "setRigidDiaphragms", "setRigidLink")),
+    ".domains.model": ("ModelMixin", (
+        "addCustomTranslations", "addDrawing", "addGroup", "addObject", "addOrModifyCustomData", "assignToGroup", "changeDefSolverType",
+        "changeSolver", "clearSelection", "colorizeModel", "convertUnits", "convertValue", "convertValueAuto", "CustomLicense",
+        "defaultColors", "deleteGroup", "getBillOfMaterials", "getCenterOfMass", "getCustomData", "getDrawing", "getElementsFromGroup",
+        "getForceUnit", "getGreekLetter", "getGroups", "getLanguage", "getLenUnit", "getLoadingData", "getNodesFromGroup", "getSeparator",
+        "getStoreyStiffnessTable", "getTotalMass", "getUserViews", "getVersion", "is64bit", "LangTrasl", "mergeModelData", "newModel",
+        "openModel", "reDo", "refreshDesignerView", "removeCustomData", "removeDrawing", "requestDesignerUndo", "saveForUndo", "saveModel",
+        "saveOptions", "setLanguage", "setUnits", "showViewport", "unDo")),
+    # helpers
+    ".bulk": ("BulkMixin", (
+        "addNodes", "addBeams", "addTrusses", "addQuads", "addTrias", "addSolids", "addSprings", "setBCs", "removeBCs", "addNodalLoads",
+        "addNodalMasses", "addNodalSprings")),
+    ".resultarrays": ("ResultArraysMixin", (
+        "resultsData", "iterResults", "iterModelData", "getNodalDispArray", "getNodalReactArray", "getResultHistories", "getBeamForcesArray")),
+    ".fanout": ("FanOutMixin", (
+        "map", "mapStats")),
+    ".deferred": ("DeferredMixin", (
+        "deferred",)),
+}
+
+# method -> module
+INDEX = {name: module for module, (mixinName, names) in MIXINS.items() for name in names}
+
+_lock = threading.RLock()
+
+def mixin(module):
+    ''' Mixin class of a module of MIXINS '''
+    return getattr(importlib.import_module(module, "nextfempy"), MIXINS[module][0])
+
+def load(cls, module)->list:
+    ''' Add the methods of a module of MIXINS to cls (NextFEMrest), with their cache hooks. Returns the names added '''
+    from ..cache import install
+    with _lock:
+        added = []
+        for name, value in vars(mixin(module)).items():
+            if name.startswith("__") or name in vars(cls) or INDEX.get(name, module) != module: continue
+            setattr(cls, name, value)
+            added.append(name)
+        install(cls, added)
+        return added
+
+def loadAll(cls):
+    ''' Add the methods of all the modules of MIXINS to cls '''
+    for module in MIXINS: load(cls, module)
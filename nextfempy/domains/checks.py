@@ -0,0 +1,413 @@
+'''
+NextFEMrest methods for checks and their results.
+'''
+
+import json
+from ..common import sbool, qt, des
+
+class ChecksMixin:
+
+    def AnalyzeFireElement(self, elem, endTime, beamExposure=2, columnExposure=3, checkCombo='', selectForcesCrit=2, fireCurve=0, outOfProc=False, noWindow=False, customFireCurve=0):
+        ''' Write and run a new model for non-linear thermal analysis of an element section.
+        
+        Args:
+            elem: ID of the element
+            endTime: Final time in minutes (e.g. 90)
+            beamExposure (optional): Beam edges exposed to fire: 0 bottom, 1 lateral edges, 2 lateral edges+bottom, 3 all edges, 4 bottom+left, 5 bottom+right
+            columnExposure (optional): Column edges exposed to fire: 0 single edge, 1 two edges, 2 three edges, 3 all edges
+            checkCombo (optional): Optional. Input a loadcase name to check section against its forces
+            selectForcesCrit (optional): Criterion for selecting forces in section: 0 max My, - 1 max Mz - 2 max for both My and Mz
+            fireCurve (optional): Optional. Fire curve: 0 ISO 834, 1 external, 2 hydrocarbon
+            outOfProc (optional): If true, run the model out of process
+            noWindow (optional): If true, hide the solver window or its output lines from console. Applicable only if out of process is active
+            customFireCurve (optional): Optional, ID of the custom fire curve to be used
+
+        Returns:
+            The path of the newly created model or, if checking is required, an array containing "Element-Station", "N", "Vy", "Vz", "Myy", "Mzz", "Ratio-NMM", "Ratio-V", path
+        '''
+        return des(self.nfrest('GET', '/res/check/analyzefire/'+qt(elem)+'/'+str(endTime)+'/'+str(beamExposure)+'/'+str(columnExposure)+'/'+qt(checkCombo)+'/'+str(selectForcesCrit)+'/'+str(fireCurve)+'/'+str(outOfProc)+'/'+str(noWindow)+'/'+str(customFireCurve)+'', None, None))
+    def checkElement(self, elem, lc, t, stationType, verName, savelog=False, messages=False, defaultParams:list=None, logPath=None):
+        ''' Check a single element in a model against results.
+        
+        Args:
+            elem: ID of the element to be checked
+            lc: Loadcase containing results
+            t: Reference time for results. For linear analyses, use "1".
+            stationType: 0 for 5 stations, 1 for 3 stations, 2 for I and J, 3 for I only, 4 for J only, 5 for M only, 6 for 1/4, 7 for 3/4, 8 for M and 1/4 and 3/4, 9 for 1/4 and 3/4
+            verName: Name of the checking to be used. E.g. "Steel EC3" or "EC2_Concrete". NVV files have underscore.
+            savelog (optional): Optionally, log file is written
+            messages (optional): Optionally, messages from checking engine are shown
+            defaultParams (optional): Optionally, parameters for checking
+            logPath (optional): Optionally, returns path of the checking log file
+
+        Returns:
+            True if checking is satisfied, False in any other case
+        '''
+        return sbool(self.nfrest('GET', '/res/check/element/'+qt(elem)+'/'+qt(lc)+'/'+qt(t)+'/'+str(stationType)+'/'+qt(verName)+'/'+str(savelog)+'/'+str(messages)+'', None, dict([("defaultParams",json.dumps(defaultParams)),("logPath",logPath)])))
+    def checkElementRatio(self, elem, lc, t, stationType, verName, savelog=False, messages=False, defaultParams:list=None, logPath=None):
+        ''' Check a single element in a model against results.
+        
+        Args:
+            elem: ID of the element to be checked
+            lc: Loadcase containing results
+            t: Reference time for results. For linear analyses, use "1".
+            stationType: 0 for 5 stations, 1 for 3 stations, 2 for I and J, 3 for I only, 4 for J only, 5 for M only, 6 for 1/4, 7 for 3/4, 8 for M and 1/4 and 3/4, 9 for 1/4 and 3/4
+            verName: Name of the checking to be used. E.g. "Steel EC3" or "EC2_Concrete". NVV files have underscore.
+            savelog (optional): Optionally, log file is written
+            messages (optional): Optionally, messages from checking engine are shown
+            defaultParams (optional): Optionally, parameters for checking
+            logPath (optional): Optionally, returns path of the checking log file
+
+        Returns:
+            A value less than 1 if the element satisfies checking. 100 is returned in case of error
+        '''
+        return float(self.nfrest('GET', '/res/check/elementRatio/'+qt(elem)+'/'+qt(lc)+'/'+qt(t)+'/'+str(stationType)+'/'+qt(verName)+'/'+str(savelog)+'/'+str(messages)+'', None, dict([("defaultParams",json.dumps(defaultParams)),("logPath",logPath)])))
+    def checkElements(self, elems:list, lc, ts, stationType, verName, savelog=False, messages=False, defaultParams:list=None):
+        ''' Check the specified elements in a model against results.
+        
+        Args:
+            elems: IDs of the elements to be checked
+            lc: Loadcase containing results
+            ts: Reference time for results. For linear analyses, use "1".
+            stationType: 0 for 5 stations, 1 for 3 stations, 2 for I and J, 3 for I only, 4 for J only, 5 for M only, 6 for 1/4, 7 for 3/4, 8 for M and 1/4 and 3/4, 9 for 1/4 and 3/4
+            verName: Name of the checking to be used. E.g. "Steel EC3" or "EC2_Concrete". NVV files have underscore.
+            savelog (optional): Optionally, log file is written
+            messages (optional): Optionally, messages from checking engine are shown
+            defaultParams (optional): Optionally, parameters for checking
+
+        Returns:
+            True if all elements satisfy checking
+        '''
+        return sbool(self.nfrest('GET', '/res/check/elements/'+qt(lc)+'/'+qt(ts)+'/'+str(stationType)+'/'+qt(verName)+'/'+str(savelog)+'/'+str(messages)+'', None, dict([("defaultParams",json.dumps(defaultParams)),("elems",json.dumps(elems))])))
+    def checkElementsRatio(self, elems:list, lc, ts, stationType, verName, savelog=False, messages=False, defaultParams:list=None):
+        ''' Check the specified elements in a model against results.
+        
+        Args:
+            elems: IDs of the elements to be checked
+            lc: Loadcase containing results
+            ts: Reference time for results. For linear analyses, use "1".
+            stationType: 0 for 5 stations, 1 for 3 stations, 2 for I and J, 3 for I only, 4 for J only, 5 for M only, 6 for 1/4, 7 for 3/4, 8 for M and 1/4 and 3/4, 9 for 1/4 and 3/4
+            verName: Name of the checking to be used. E.g. "Steel EC3" or "EC2_Concrete". NVV files have underscore.
+            savelog (optional): Optionally, log file is written
+            messages (optional): Optionally, messages from checking engine are shown
+            defaultParams (optional): Optionally, parameters for checking
+
+        Returns:
+            A value less than 1 if all elements satisfy checking. 100 is returned in case of error
+        '''
+        return float(self.nfrest('GET', '/res/check/elementsRatio/'+qt(lc)+'/'+qt(ts)+'/'+str(stationType)+'/'+qt(verName)+'/'+str(savelog)+'/'+str(messages)+'', None, dict([("defaultParams",json.dumps(defaultParams)),("elems",json.dumps(elems))])))
+    def checkElementStation(self, elem, lc, t, stationAbsissa, verName, defaultParams:list=None, logPath=None, messages=False):
+        ''' Check a single station in a model against results.
+        
+        Args:
+            elem: ID of the element to be checked
+            lc: Loadcase containing results
+            t: Reference time for results. For linear analyses, use "1".
+            stationAbsissa: Absissa of the section to check for the element
+            verName: Name of the checking to be used. E.g. "Steel EC3" or "EC2_Concrete". NVV files have underscore.
+            defaultParams (optional): Optionally, parameters for checking
+            logPath (optional): Path for logging. If empty (default), actual path is returned. If "no", no log is written
+            messages (optional): Optional, default is false. If true, activates message dialogs from the checking engine
+
+        Returns:
+            A dictionary of string and decimal containing all the values used for checking and results
+        '''
+        return des(self.nfrest('GET', '/res/check/station/'+qt(elem)+'/'+qt(lc)+'/'+qt(t)+'/'+str(stationAbsissa)+'/'+qt(verName)+'/'+str(messages)+'', None, dict([("defaultParams",json.dumps(defaultParams)),("logPath",logPath)])))
+    def checkModel(self, lc, ts, stationType, verName, savelog=False, messages=False, defaultParams:list=None):
+        ''' Check the entire model model with results.
+        
+        Args:
+            lc: Loadcase containing results
+            ts: Reference time for results. For linear analyses, use "1".
+            stationType: 0 for 5 stations, 1 for 3 stations, 2 for I and J, 3 for I only, 4 for J only, 5 for M only, 6 for 1/4, 7 for 3/4, 8 for M and 1/4 and 3/4, 9 for 1/4 and 3/4
+            verName: Name of the checking to be used. E.g. "Steel EC3" or "EC2_Concrete". NVV files have underscore, no file extension.
+            savelog (optional): Optionally, log file is written
+            messages (optional): Optionally, messages from checking engine are shown
+            defaultParams (optional): Optionally, parameters for checking
+
+        Returns:
+            True if checking is satisfied, False in any other case
+        '''
+        return sbool(self.nfrest('GET', '/res/check/model/'+qt(lc)+'/'+qt(ts)+'/'+str(stationType)+'/'+qt(verName)+'/'+str(savelog)+'/'+str(messages)+'', None, dict([("defaultParams",json.dumps(defaultParams))])))
+    def checkNode(self, node, lc, ts, verName, savelog=False, messages=False, defaultParams:list=None, logPath=None):
+        ''' Check a single node in a model against results.
+        
+        Args:
+            node: ID of the node to be checked
+            lc: Loadcase containing results
+            ts: Reference time for results. For linear analyses, use "1".
+            verName: Name of the checking to be used. E.g. "Steel EC3" or "EC2_Concrete". NVV files have underscore.
+            savelog (optional): Optionally, log file is written
+            messages (optional): Optionally, messages from checking engine are shown
+            defaultParams (optional): Optionally, parameters for checking
+            logPath (optional): Optionally, returns path of the checking log file
+
+        Returns:
+            True if node satisfies checking, False otherwise
+        '''
+        return sbool(self.nfrest('GET', '/res/check/node/'+qt(node)+'/'+qt(lc)+'/'+qt(ts)+'/'+qt(verName)+'/'+str(savelog)+'/'+str(messages)+'', None, dict([("defaultParams",json.dumps(defaultParams)),("logPath",logPath)])))
+    def checkNodes(self, nodes:list, lc, ts, verName, savelog=False, messages=False, defaultParams:list=None):
+        ''' Check specified nodes in a model against results.
+        
+        Args:
+            nodes: ID of the nodes to be checked
+            lc: Loadcase containing results
+            ts: Reference time for results. For linear analyses, use "1".
+            verName: Name of the checking to be used. E.g. "Steel EC3" or "EC2_Concrete". NVV files have underscore.
+            savelog (optional): Optionally, log file is written
+            messages (optional): Optionally, messages from checking engine are shown
+            defaultParams (optional): Optional. Parameters for checking
+
+        Returns:
+            True if nodes satisfy checking, False otherwise
+        '''
+        return sbool(self.nfrest('GET', '/res/check/nodes/'+qt(lc)+'/'+qt(ts)+'/'+qt(verName)+'/'+str(savelog)+'/'+str(messages)+'', None, dict([("defaultParams",json.dumps(defaultParams)),("nodes",json.dumps(nodes))])))
+    def clearStoredDomains(self):
+        ''' Clear stored resisting domains
+        
+        
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/res/check/cleardomains', None, None))
+    def customCheck(self, formulae:list):
+        ''' Run checking on user formulae. No node or element quantities are given. See also getItemDataResults method.
+        
+        Args:
+            formulae: Dictionary of string and decimal containing formulae (see NextFEM Scripting language reference)
+
+        Returns:
+            A dictionary of string and decimal containing all the checking results
+        '''
+        return des(self.nfrest('POST', '/res/check/item', formulae, None))
+    def deleteChecks(self):
+        ''' Delete the stored checks.
+        
+        
+        Returns:
+            True if operations goes fine.
+        '''
+        return sbool(self.nfrest('GET', '/res/delchecks', None, None))
+    def getBeamResMoments(self, elemID):
+        ''' Get the beam resisting moments for each direction of a beam
+        
+        Args:
+            elemID: ID of the selected element
+
+        Returns:
+            An array containing a list of {abscissa,Mrzmax,Mrzmin,Mrymax,Mrymin}
+        '''
+        return des(self.nfrest('GET', '/res/check/beammoments/'+qt(elemID)+'', None, None))
+    def getBeamResShear(self, elemID, loadcase='', time='1'):
+        ''' Get the beam resisting shear for each direction of a beam.   WARNING: This is possible only against results of a given loadcase for the element, otherwise a set of zero forces are given and results would not be accurate
+        
+        Args:
+            elemID: ID of the selected element
+            loadcase (optional): Optional. Loadcase for results
+            time (optional): Optional. Time for results
+
+        Returns:
+            An array containing a list of {abscissa,Vry,-Vry,Vrz,-Vrz}
+        '''
+        return des(self.nfrest('GET', '/res/check/beamshearres/'+qt(elemID)+'/'+qt(loadcase)+'/'+qt(time)+'', None, None))
+    def getBuiltInChecking(self):
+        ''' Get available checking scripts.
+        
+        
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/res/check/sets', None, None))
+    def getCheckLogName(self, ID, lc, t, station=''):
+        ''' Get the log entry name for a specific node/element check.
+        
+        Args:
+            ID: ID of the node/element that has been checked
+            lc: Loadcase containing results
+            t: Reference time for results. For linear analyses, use "1".
+            station (optional): 1 for I, 2 for ¼, 3 for M, 4 for ¾, 5 for J. Parameter is passed as string in order to account special cases. Empty (or 6) for node checking
+
+        Returns:
+            The log entry name that should be in program cache if the node/element has already been checked
+        '''
+        return self.nfrest('GET', '/res/check/logname/'+qt(ID)+'/'+qt(lc)+'/'+qt(t)+'/'+qt(station)+'', None, None)
+    def getCheckNameByMaterial(self, ID):
+        ''' Get checking-set name from the built-in list
+        
+        Args:
+            ID: ID of the material
+
+        Returns:
+            String
+        '''
+        return self.nfrest('GET', '/res/check/checkbymat/'+qt(ID)+'', None, None)
+    def getElementChecks(self, ID, lc, time):
+        ''' Get the checks stored in the model for the specified element
+        
+        Args:
+            ID: ID of the element
+            lc: Name of the loadcase
+            time: Time
+
+        Returns:
+            Null if no checking are available
+        '''
+        return self.nfrest('GET', '/res/check/elementA/'+qt(ID)+'/'+qt(lc)+'/'+qt(time)+'', None, None)
+    def getElementsChecks(self, lc, time):
+        ''' Get the checks stored in the model for elements
+        
+        Args:
+            lc: Name of the loadcase
+            time: Time
+
+        Returns:
+            Null if no checking are available
+        '''
+        return des(self.nfrest('GET', '/res/check/elementsA/'+qt(lc)+'/'+qt(time)+'', None, None))
+    def getElementsChecksByMat(self, mat):
+        ''' Get the checks stored in the model for the selected material type
+        
+        Args:
+            mat: Material type: Steel = 1, Aluminium = 2, Concrete = 3, Timber = 4, Masonry = 5, TensionFragile = 6, Fire Resistant = 7
+
+        Returns:
+            Null if no checking are available
+        '''
+        return des(self.nfrest('GET', '/res/check/elementsM/'+str(mat)+'', None, None))
+    def getHTMLlogCheck(self, logName):
+        ''' Get the HTML log of the last checking run. Use getCheckLogName to get the name of a specific check.
+        
+        Args:
+            logName: Name of the log to retrieve
+
+        Returns:
+            The HTML log as a string
+        '''
+        return self.nfrest('POST', '/res/check/htmllog', logName, None)
+    def getItemDataResults(self, item, lc, t, station=0):
+        ''' Get properties and results for the selected node or element
+        
+        Args:
+            item: ID of the item (node or element) to be checked. If item is an element, specify a non-zero station
+            lc: Loadcase containing results
+            t: Reference time for results. For linear analyses, use "1".
+            station (optional): Optional, default 0. Use: 1 fo I, 2 for 1/4, 3 for M, 4 for 3/4, 5 for J. For elements other than lines, use 1
+
+        Returns:
+            A dictionary of string and decimal containing all the values used for checking and results
+        '''
+        return des(self.nfrest('GET', '/res/check/data/'+qt(item)+'/'+qt(lc)+'/'+qt(t)+'/'+str(station)+'', None, None))
+    def getLastSectionRes3DDomainPoints(self, conn=None):
+        ''' Get list of 3D points for plotting 3D resisting domain of the last computed section
+        
+        Args:
+            conn (optional): Optional. Connectivity dictionary for 3D points passed by reference
+
+        Returns:
+            A list of vert3 containing 3D points of the domain boundary
+        '''
+        return des(self.nfrest('GET', '/res/check/plot3dsectiondomain'+str(conn)+'', None, None))
+    def getLastSectionResDomainPoints(self, domainType, cleanResponseTolerance=0):
+        ''' Get list of points for plotting resisting domain of the last computed sections
+        
+        Args:
+            domainType: 0 for Myy vs. Mzz, 1 for N vs. Myy, 2 for N vs. Mzz
+            cleanResponseTolerance (optional): Optional, default is 0. Clean points given in N-Mxx domains, to be used only if wrong plot is obtained (e.g. set to 1e-8)
+
+        Returns:
+            A list of array of double values, each of size 2 (X,Y)
+        '''
+        return des(self.nfrest('GET', '/res/check/lastplotsectiondomain/'+str(domainType)+'/'+str(cleanResponseTolerance)+'', None, None))
+    def getNodeChecks(self, ID, lc, time):
+        ''' Get the checks stored in the model for the specified node
+        
+        Args:
+            ID: ID of the element
+            lc: Name of the loadcase
+            time: Time
+
+        Returns:
+            Null if no checking are available
+        '''
+        return self.nfrest('GET', '/res/check/nodsA/'+qt(ID)+'/'+qt(lc)+'/'+qt(time)+'', None, None)
+    def getNodesChecks(self, lc, time):
+        ''' Get the checks stored in the model for nodes
+        
+        Args:
+            lc: Name of the loadcase
+            time: Time
+
+        Returns:
+            Null if no checking are available
+        '''
+        return des(self.nfrest('GET', '/res/check/nodesA/'+qt(lc)+'/'+qt(time)+'', None, None))
+    def getSectionResDomainPoints(self, domainIndex, domainType, cleanResponseTolerance=0):
+        ''' Get list of points for plotting resisting domain of already computed sections
+        
+        Args:
+            domainIndex: Index of the domain, base 0, returned by getSectionResMoments2, getSectionResMoments3, getSectionResMoments4
+            domainType: 0 for Myy vs. Mzz, 1 for N vs. Myy, 2 for N vs. Mzz
+            cleanResponseTolerance (optional): Optional, default is 0. Clean points given in N-Mxx domains, to be used only if wrong plot is obtained (e.g. set to 1e-8)
+
+        Returns:
+            A list of array of double values, each of size 2 (X,Y)
+        '''
+        return des(self.nfrest('GET', '/res/check/plotsectiondomain/'+str(domainIndex)+'/'+str(domainType)+'/'+str(cleanResponseTolerance)+'', None, None))
+    def readBeamForces(self, num, loadcase, time, N, Vy, Vz, Mt, Myy, Mzz, pos):
+        ''' Add a beam forces set to results.
+        
+        Args:
+            num: ID of the beam element
+            loadcase: Loadcase to filled
+            time: Time. For linear analyses, use 1.
+            N: Axial force
+            Vy: Shear force in y local axis
+            Vz: Shear force in z local axis
+            Mt: Twisting moment
+            Myy: Bending moment around y axis
+            Mzz: Bending moment around z axis
+            pos: Distance from the beginning of the beam to the station specified
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/res/import/beamforces/'+qt(num)+'/'+qt(loadcase)+'/'+qt(time)+'/'+str(N)+'/'+str(Vy)+'/'+str(Vz)+'/'+str(Mt)+'/'+str(Myy)+'/'+str(Mzz)+'/'+str(pos)+'', None, None))
+    def setElementChecks(self, ID, lc, time, data, setContour=False):
+        ''' Import a set of checks for the specified element. If already existing, the set is overwritten.
+        
+        Args:
+            ID: ID of the element
+            lc: Loadcase name
+            time: Time
+            data: A "API.check" instance containing check names and values
+            setContour (optional): Optional. Activate contour in view instead of default capacity/demand ratios. Default is false
+
+        Returns:
+            True if imported successfully
+        '''
+        return sbool(self.nfrest('GET', '/res/import/elementcheck/'+qt(ID)+'/'+qt(lc)+'/'+qt(time)+'/'+str(setContour)+'', None, dict([("data",data)])))
+    def setNodeChecks(self, ID, lc, time, data, setContour=False):
+        ''' Import a set of checks for the specified node. If already existing, the set is overwritten.
+        
+        Args:
+            ID: ID of the node
+            lc: Loadcase name
+            time: Time
+            data: A "API.check" instance containing check names and values
+            setContour (optional): Optional. Activate contour in view instead of default capacity/demand ratios. Default is false
+
+        Returns:
+            True if imported successfully
+        '''
+        return sbool(self.nfrest('GET', '/res/import/nodecheck/'+qt(ID)+'/'+qt(lc)+'/'+qt(time)+'/'+str(setContour)+'', None, dict([("data",data)])))
+    def userCheck(self, verName, overrideValues:list=None):
+        ''' Run checking on user script. No node or element quantities are given. See also getItemDataResults method.
+        
+        Args:
+            verName: Name of the checking to be used
+            overrideValues (optional): Optional dictionary of {string, double} containing overrides for checking
+
+        Returns:
+            
+        '''
+        return des(self.nfrest('POST', '/res/check/user'+qt(verName)+'', overrideValues, None))
@@ -0,0 +1,140 @@
+'''
+NextFEMrest methods for Word reports.
+'''
+
+import json
+from ..common import sbool, des
+
+class DocxMixin:
+
+    def appendDocXformula(self, formula, alignment=0):
+        ''' Append and render a formula in Ascii syntax to an already opened DocX document. By default, this is aligned to center.
+        
+        Args:
+            formula: Ascii formula text
+            alignment (optional): Optional, default is 1. 0=left, 1=center, 2=right, 3=justified
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('POST', '/op/docx/appendformula/'+str(alignment)+'', formula, None))
+    def appendDocXimage(self, imagePath, ratio=1, alignment=0):
+        ''' Append image to an already opened DocX document. By default, this is aligned to center.
+        
+        Args:
+            imagePath: Path of the picture
+            ratio (optional): Size ratio of the picture
+            alignment (optional): Optional, default is 1. 0=left, 1=center, 2=right, 3=justified
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/docx/appendimage/'+str(ratio)+'/'+str(alignment)+'', None, dict([("path",imagePath)])))
+    def appendDocXimageB(self, image, ratio=1, alignment=0):
+        ''' Append image, in PNG bytes, to an already opened DocX document. By default, this is aligned to center.
+        
+        Args:
+            image: Image bytes as string in Base64
+            ratio (optional): Size ratio of the picture
+            alignment (optional): Optional, default is 1. 0=left, 1=center, 2=right, 3=justified
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('POST', '/op/docx/appendimageb/'+str(ratio)+'/'+str(alignment)+'', image, None))
+    def appendDocXtext(self, text:list, alignment=0, color=0, bold=False, italic=False, underline=False):
+        ''' Append text to an already opened DocX document
+        
+        Args:
+            text: 
+            alignment (optional): Optional, default is 0. 0=left, 1=center, 2=right, 3=justified
+            color (optional): Optional, default is 0. RGB integer value for color
+            bold (optional): Optional, default is false. True for bold
+            italic (optional): Optional, default is false. True for italic
+            underline (optional): Optional, default is false. True for underlined text
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/op/docx/appendtext/'+str(alignment)+'/'+str(color)+'/'+str(bold)+'/'+str(italic)+'/'+str(underline)+'', text, None))
+    def compileDocX(self, dict_:list, tableDict:list=None, twoPasses=False):
+        ''' Compile the open document for keyword substitution
+        
+        Args:
+            dict_: Dictionary of the keywords to be replaced by its values
+            tableDict (optional): Dictionary of keywords to be replaced by a table, described by a list of string() - each item of the list represents the single row as an array of string
+            twoPasses (optional): Enable double pass for the document
+
+        Returns:
+            True
+        '''
+        return sbool(self.nfrest('POST', '/op/docx/compile/'+str(twoPasses)+'', tableDict, dict([("dict",json.dumps(dict_))])))
+    def createDocX(self, path, text:list, template=''):
+        ''' Create a DocX file with the desired text
+        
+        Args:
+            path: Path of the DocX document, consistent with the system conventions, on existing folders
+            text: Text to be written in the document
+            template (optional): Optional. Path of a DocX template to be used in document generation
+
+        Returns:
+            Always true
+        '''
+        return sbool(self.nfrest('POST', '/op/docx/create', text, dict([("path",path),("template",template)])))
+    def deleteDocXheadingByTitle(self, titles:list, useLast=False):
+        ''' Remove the paragraphs contained in the specified titles
+        
+        Args:
+            titles: Array of paragraph titles to be deleted
+            useLast (optional): If true, in case of multiple paragraphs with the same title, only the last one is deleted. Default is false, the first paragraph with the specified titles is deleted
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/op/docx/delheadingsbytitle/'+str(useLast)+'', titles, None))
+    def deleteDocXheadings(self, headingsIDtoDelete:list):
+        ''' Remove the paragraphs contained in the specified titles
+        
+        Args:
+            headingsIDtoDelete: Array of paragraph IDs to be deleted
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/op/docx/delheadings', headingsIDtoDelete, None))
+    def getDocXheadings(self):
+        ''' Get a list of headings contained in the current DocX document.
+        
+        
+        Returns:
+            List of array of strings as (ID, level, title)
+        '''
+        return des(self.nfrest('GET', '/op/docx/headings', None, None))
+    def saveDocX(self):
+        ''' Save the current DocX document to a file. After saving, the document cannot be modified, nor saved again.
+        
+        
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/docx/save', None, None))
+    def saveDocXbytes(self, readOnlyPassword=''):
+        ''' Save the current DocX document to an array of bytes. After saving, the document cannot be modified, nor saved again.
+        
+        Args:
+            readOnlyPassword (optional): Set a read-only password for the document. If the password start with 'u_', unlocking is not possible
+
+        Returns:
+            Array of bytes
+        '''
+        return self.nfrestB('POST', '/op/docx/bytes', readOnlyPassword, None)
+    def saveDocXtoHTML(self, pageTitle):
+        ''' Save the current DocX document to HTML format and return it as a string. After saving, the document cannot be modified, nor saved again.
+        
+        Args:
+            pageTitle: Title of the resulting HTML page
+
+        Returns:
+            HTML code as string
+        '''
+        return self.nfrest('POST', '/op/docx/html', pageTitle, None)
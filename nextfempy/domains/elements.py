@@ -0,0 +1,1009 @@
+'''
+NextFEMrest methods for elements, element properties, hinges and springs.
+'''
+
+import json
+from ..common import sbool, qt, des
+
+class ElementsMixin:
+
+    def activeBarsDiameters(self):
+        ''' Get a list of active rebar diameters in the model
+        
+        
+        Returns:
+            Array of Int32
+        '''
+        return des(self.nfrest('GET', '/element/rebar/barsdiam', None, None))
+    def activeHoopsDiameters(self):
+        ''' Get a list of active bar diameters for hoops/stirrups
+        
+        
+        Returns:
+            Array of Int32
+        '''
+        return des(self.nfrest('GET', '/element/rebar/hoopsdiam', None, None))
+    def addBeam(self, n1, n2, sect=0, mat=0, sect2=0):
+        ''' Add a new beam to the model. Existing results will be deleted.
+        
+        Args:
+            n1: First node ID
+            n2: Second node ID
+            sect (optional): Optional section ID
+            mat (optional): Optional material ID
+            sect2 (optional): Optional section ID of the section at the end of the beam
+
+        Returns:
+            The ID of the added elem
+        '''
+        return self.nfrest('GET', '/element/add/beam/'+qt(n1)+'/'+qt(n2)+'/'+str(sect)+'/'+str(mat)+'/'+str(sect2)+'', None, None)
+    def addBeamWithID(self, n1, n2, ID, sect=0, mat=0, sect2=0):
+        ''' Add a new beam to the model with the desired ID. Existing results will be deleted.
+        
+        Args:
+            n1: First node ID
+            n2: Second node ID
+            ID: Element ID
+            sect (optional): Optional section ID
+            mat (optional): Optional material ID
+            sect2 (optional): Optional section ID of the section at the end of the beam
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/element/add/beamwithid/'+qt(n1)+'/'+qt(n2)+'/'+qt(ID)+'/'+str(sect)+'/'+str(mat)+'/'+str(sect2)+'', None, None))
+    def addLongitRebar(self, elem, X, Y, area, matID, Linit, Lfin, rectBase=0, strandTens=0):
+        ''' Add a longitudinal rebar to a member (beam, column or wall)
+        
+        Args:
+            elem: ID of the element
+            X: X coordinate in transversal section
+            Y: Y coordinate in transversal section
+            area: Area of the rebar
+            matID: ID of the associated design material
+            Linit: Initial abscissa from 0 to 1
+            Lfin: Final abscissa from 0 to 1
+            rectBase (optional): Optional. Rectangular width if layer is added instead of bar
+            strandTens (optional): Optional. Tension for strand
+
+        Returns:
+            True is successful
+        '''
+        return sbool(self.nfrest('GET', '/element/rebar/long/'+qt(elem)+'/'+str(X)+'/'+str(Y)+'/'+str(area)+'/'+str(matID)+'/'+str(Linit)+'/'+str(Lfin)+'/'+str(rectBase)+'/'+str(strandTens)+'', None, None))
+    def addMember(self, elems:list):
+        ''' Add a member in the model
+        
+        Args:
+            elems: Array of beam IDs to be added. The first entry will be the member name
+
+        Returns:
+            True if successful, False otherwise. Beams are ordered
+        '''
+        return sbool(self.nfrest('GET', '/model/member/add', None, dict([("elems",json.dumps(elems))])))
+    def addNodalSpring(self, n1, propName):
+        ''' Add a spring connected to the ground. Existing results will be deleted.
+        
+        Args:
+            n1: Selected node
+            propName: Name of the property of the spring
+
+        Returns:
+            The ID of the added elem
+        '''
+        return self.nfrest('GET', '/element/add/nodalspring/'+qt(n1)+'/'+qt(propName)+'', None, None)
+    def addNormalhinge(self, name, checkType, position, includeShear=False, includeTorsion=False, cKpl=0.001, FresRatio=0.2):
+        ''' Add a beam hinge without NVM interaction, ready to be assigned to elements. To be used typically for beams in rigid floors
+        
+        Args:
+            name: Name of the hinge
+            checkType: Name of the check to be applied - use "Concrete_EC" or "Concrete_NTC" for concrete beams, "Steel_Hinge_EC3" for steel, "Aluminium_Hinge_EC9" for aluminium alloy, or national/custom rules
+            position: Position in percentage of beam length (0 or 100)
+            includeShear (optional): True to include shear DoFs
+            includeTorsion (optional): True to include torsion as hinge DoF
+            cKpl (optional): Ratio for plastic branch stiffness over elastic stiffness
+            FresRatio (optional): Residual force after failure, ratio with yielding
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/hinge/add/simple/'+qt(name)+'/'+qt(checkType)+'/'+str(position)+'/'+str(includeShear)+'/'+str(includeTorsion)+'/'+str(cKpl)+'/'+str(FresRatio)+'', None, None))
+    def addNVMhinge(self, name, checkType, position, includeShear=False, includeTorsion=False, cKpl=0.001, FresRatio=0.2, stopResidualBranch=False):
+        ''' Add a beam hinge with NVM interaction, ready to be assigned to elements. Typically, this is the hinge for columns.
+        
+        Args:
+            name: Name of the hinge
+            checkType: Name of the check to be applied - use "Concrete_EC" or "Concrete_NTC" for concrete beams, "Steel_Hinge_EC3" for steel, "Aluminium_Hinge_EC9" for aluminium alloy, or national/custom rules
+            position: Position in percentage of beam length (0 or 100)
+            includeShear (optional): True to include shear as interaction DoFs
+            includeTorsion (optional): True to include torsion as hinge DoF
+            cKpl (optional): Ratio for plastic branch stiffness over elastic stiffness
+            FresRatio (optional): Residual force after failure, ratio with yielding
+            stopResidualBranch (optional): Optional, default is false. If true, hinge exhibits a residual branch with its own ultimate deformation
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/hinge/add/nvm/'+qt(name)+'/'+qt(checkType)+'/'+str(position)+'/'+str(includeShear)+'/'+str(includeTorsion)+'/'+str(cKpl)+'/'+str(FresRatio)+'/'+str(stopResidualBranch)+'', None, None))
+    def addOrChangeElementFlag(self, ID, flag, value):
+        ''' Add or change a flag for the element. Flags are custom properties that can be used for any purpose (see elementAvailableFlags)
+        
+        Args:
+            ID: ID of the element
+            flag: Name of the flag
+            value: Value of the flag
+
+        Returns:
+            True if the flag was added or updated successfully
+        '''
+        return sbool(self.nfrest('', ''+qt(ID)+'/'+qt(flag)+'/'+qt(value)+'', None, None))
+    def addQuad(self, n1, n2, n3, n4, sect=0, mat=0):
+        ''' Add a quad planar element to the model
+        
+        Args:
+            n1: Connected node 1
+            n2: Connected node 2
+            n3: Connected node 3
+            n4: Connected node 4
+            sect (optional): Optional section ID
+            mat (optional): Optional material ID
+
+        Returns:
+            The ID of the added elem
+        '''
+        return self.nfrest('GET', '/element/add/quad/'+qt(n1)+'/'+qt(n2)+'/'+qt(n3)+'/'+qt(n4)+'/'+str(sect)+'/'+str(mat)+'', None, None)
+    def addQuadWithID(self, n1, n2, n3, n4, ID, sect=0, mat=0):
+        ''' Add a quad planar element to the model with the desired ID
+        
+        Args:
+            n1: Connected node 1
+            n2: Connected node 2
+            n3: Connected node 3
+            n4: Connected node 4
+            ID: Element ID
+            sect (optional): Optional section ID
+            mat (optional): Optional material ID
+
+        Returns:
+            The ID of the added elem
+        '''
+        return sbool(self.nfrest('GET', '/element/add/quadwithid/'+qt(n1)+'/'+qt(n2)+'/'+qt(n3)+'/'+qt(n4)+'/'+qt(ID)+'/'+str(sect)+'/'+str(mat)+'', None, None))
+    def addRebarPattern(self, elem, pattern, Linit, Lfin, numBars, rebCover, matID, area, netSpacing=0):
+        ''' Adds rebars by pattern in the selected element.
+        
+        Args:
+            elem: ID of the element
+            pattern: Top=0, Bottom=1, Equal spacing=2, Wall=3, Lateral=4, Left=5, Right=6, Intermediate=7
+            Linit: Initial abscissa in percentage of length
+            Lfin: Final abscissa in percentage of length
+            numBars: Number of bars to be placed
+            rebCover: Rebar cover from the centre of the first bar to the border of the section. It applies in both directions
+            matID: ID of the associated design material
+            area: Area of each single rebar rebar
+            netSpacing (optional): Spacing of net in walls. Effective only if pattern is 3.
+
+        Returns:
+            True is successful
+        '''
+        return sbool(self.nfrest('GET', '/element/rebar/pattern/'+qt(elem)+'/'+str(pattern)+'/'+str(Linit)+'/'+str(Lfin)+'/'+str(numBars)+'/'+str(rebCover)+'/'+str(matID)+'/'+str(area)+'/'+str(netSpacing)+'', None, None))
+    def addSolid(self, nodes:list, mat=0):
+        ''' Add a solid element to the model. Element type is set on the size of the number of nodes
+        
+        Args:
+            nodes: Array of nodes. 4 for tetra, 6 for wedge, 8 for hexa, 10 for tetra10, 15 for wedge15, 20 for hexa20.
+            mat (optional): Optional material ID
+
+        Returns:
+            The ID of the added elem
+        '''
+        return self.nfrest('GET', '/element/add/solid/'+str(mat)+'', None, dict([("nodes",json.dumps(nodes))]))
+    def addSpring(self, n1, n2, propName):
+        ''' Add a new 2-node spring to the model. Existing results will be deleted.
+        
+        Args:
+            n1: First node ID
+            n2: Second node ID
+            propName: Name of the property of the spring
+
+        Returns:
+            The ID of the added elem
+        '''
+        return self.nfrest('GET', '/element/add/spring/'+qt(n1)+'/'+qt(n2)+'/'+qt(propName)+'', None, None)
+    def addSpringNLProperty(self, name, NLdofs:list, NLprops:list, local=False):
+        ''' Add a non-linear spring property to the model
+        
+        Args:
+            name: Name of the property, must be unique
+            NLdofs: Array of integers from 0 to 15 to associate a non-linear behaviour to each DoF. Use -1 to leave the DoF inactive
+            NLprops: Array containing 6 arrays of numerical properties for the each selected non-linear behaviour
+            local (optional): True if properties are referred to local axes of the spring element
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/springproperty/nl/add/'+qt(name)+'/'+json.dumps(NLdofs)+'/'+str(local)+'', NLprops, None))
+    def addSpringProperty(self, name, Kx, Ky, Kz, Krx, Kry, Krz, local=False):
+        ''' Add a spring property to the model
+        
+        Args:
+            name: Name of the property, must be unique
+            Kx: Stiffness in X direction
+            Ky: Stiffness in Y direction
+            Kz: Stiffness in Z direction
+            Krx: Stiffness in RX direction
+            Kry: Stiffness in RY direction
+            Krz: Stiffness in RZ direction
+            local (optional): True if properties are referred to local axes of the spring element
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/springproperty/simple/add/'+qt(name)+'/'+str(Kx)+'/'+str(Ky)+'/'+str(Kz)+'/'+str(Krx)+'/'+str(Kry)+'/'+str(Krz)+'/'+str(local)+'', None, None))
+    def addSpringsOnOverlappedNodes(self, n:list, propName):
+        ''' Add springs on selected overlapped nodes.
+        
+        Args:
+            n: Array of nodes
+            propName: Name of the property of the springs
+
+        Returns:
+            
+        '''
+        return des(self.nfrest('POST', '/element/add/springsonnodes/'+qt(propName)+'', n, None))
+    def addSpringWithID(self, n1, n2, ID, propName):
+        ''' Add a new 2-node spring to the model with the desired ID. Existing results will be deleted.
+        
+        Args:
+            n1: First node ID
+            n2: Second node ID
+            ID: Element ID
+            propName: Name of the property of the spring
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/element/add/springwithid/'+qt(n1)+'/'+qt(n2)+'/'+qt(ID)+'/'+qt(propName)+'', None, None))
+    def addStirrupBars(self, elem, LnumY, LnumZ, area, spacing, matID, Linit, Lfin):
+        ''' Add stirrup bars to a member (beam, column or wall)
+        
+        Args:
+            elem: ID of the element
+            LnumY: Legs in Y dir.
+            LnumZ: Legs in Z dir.
+            area: Area of the rebar
+            spacing: Stirrups spacing
+            matID: ID of the associated design material
+            Linit: Initial abscissa from 0 to 1
+            Lfin: Final abscissa from 0 to 1
+
+        Returns:
+            True is successful
+        '''
+        return sbool(self.nfrest('GET', '/element/rebar/stirrup/'+qt(elem)+'/'+str(LnumY)+'/'+str(LnumZ)+'/'+str(area)+'/'+str(spacing)+'/'+str(matID)+'/'+str(Linit)+'/'+str(Lfin)+'', None, None))
+    def addSubsoilNodalSpringsOnElements(self, n:list, propName):
+        ''' Add nodal subsoil springs in nodes of chosen planar elements.
+        
+        Args:
+            n: Array of planar element IDs
+            propName: Name of the property of the springs
+
+        Returns:
+            True if successful, False if the reference property is defined in local coordinates
+        '''
+        return sbool(self.nfrest('POST', '/element/add/soilsprings/'+qt(propName)+'', n, None))
+    def addSubsoilZProperty(self, width, Rmodulus):
+        ''' Add a subsoil distributed spring in Z direction of the model
+        
+        Args:
+            width: Width of the bottom side of element
+            Rmodulus: Reaction modulus
+
+        Returns:
+            The name of the property added, empty string in case of error
+        '''
+        return self.nfrest('GET', '/springproperty/subsoil/add/'+str(width)+'/'+str(Rmodulus)+'', None, None)
+    def addTria(self, n1, n2, n3, sect=0, mat=0):
+        ''' Add a tria planar element to the model
+        
+        Args:
+            n1: Connected node 1
+            n2: Connected node 2
+            n3: Connected node 3
+            sect (optional): Optional section ID
+            mat (optional): Optional material ID
+
+        Returns:
+            The ID of the added elem
+        '''
+        return self.nfrest('GET', '/element/add/tria/'+qt(n1)+'/'+qt(n2)+'/'+qt(n3)+'/'+str(sect)+'/'+str(mat)+'', None, None)
+    def addTriaWithID(self, n1, n2, n3, ID, sect=0, mat=0):
+        ''' Add a tria planar element to the model with the desired ID
+        
+        Args:
+            n1: Connected node 1
+            n2: Connected node 2
+            n3: Connected node 3
+            ID: Element ID
+            sect (optional): Optional section ID
+            mat (optional): Optional material ID
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/element/add/triawithid/'+qt(n1)+'/'+qt(n2)+'/'+qt(n3)+'/'+qt(ID)+'/'+str(sect)+'/'+str(mat)+'', None, None))
+    def addTruss(self, n1, n2, sect=0, mat=0):
+        ''' Add a new truss to the model. Existing results will be deleted.
+        
+        Args:
+            n1: First node ID
+            n2: Second node ID
+            sect (optional): Optional section ID
+            mat (optional): Optional material ID
+
+        Returns:
+            The ID of the added elem
+        '''
+        return self.nfrest('GET', '/element/add/truss/'+qt(n1)+'/'+qt(n2)+'/'+str(sect)+'/'+str(mat)+'', None, None)
+    def addTrussWithID(self, n1, n2, ID, sect=0, mat=0):
+        ''' Add a new truss to the model with the desired ID. Existing results will be deleted.
+        
+        Args:
+            n1: First node ID
+            n2: Second node ID
+            ID: Element ID
+            sect (optional): Optional section ID
+            mat (optional): Optional material ID
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/element/add/trusswithid/'+qt(n1)+'/'+qt(n2)+'/'+qt(ID)+'/'+str(sect)+'/'+str(mat)+'', None, None))
+    def alignShellXaxis(self, num, x, y, z):
+        ''' Align the x local axis of the selected shell element to the given vector
+        
+        Args:
+            num: Number of the element
+            x: x component of 1st local axis
+            y: y component of 1st local axis
+            z: z component of 1st local axis
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/element/shellxaxis/'+qt(num)+'/'+str(x)+'/'+str(y)+'/'+str(z)+'', None, None))
+    def assignHinge(self, beamID, hingeName):
+        ''' Assign a plastic hinge to a beam
+        
+        Args:
+            beamID: ID of the beam element hosting the hinge
+            hingeName: Name of the hinge property to assign
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/hinge/assign/'+qt(beamID)+'/'+qt(hingeName)+'', None, None))
+    def assignSubsoilProperty(self, element, prop):
+        ''' Assign a subsoil property to the selected element
+        
+        Args:
+            element: ID of the element
+            prop: Name of the property to assign
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('GET', '/springproperty/subsoil/assign/'+qt(element)+'/'+qt(prop)+'', None, None))
+    def changeElementProperty(self, ID, prop, value):
+        ''' Change element property
+        
+        Args:
+            ID: ID of the element
+            prop: Name of the property to change
+            value: New value of property
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('POST', '/element/prop/'+qt(ID)+'/'+qt(prop)+'/'+qt(value)+'', None, None))
+    def changeSpringNLProperty(self, name, NLdofs:list, NLprops:list):
+        ''' Change a non-linear spring property already defined in the model
+        
+        Args:
+            name: Name of the property, must be unique
+            NLdofs: Array of integers from 0 to 15 to associate a non-linear behaviour to each DoF. Use -1 to leave the DoF inactive
+            NLprops: Array containing 6 arrays of numerical properties for the each selected non-linear behaviour
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/springproperty/nl/change/'+qt(name)+'/'+json.dumps(NLdofs)+'', NLprops, None))
+    def changeSpringNLPropertyDof(self, name, DoF, NLtype, NLprops:list):
+        ''' Change a non-linear spring property already defined in the model
+        
+        Args:
+            name: Name of the property, must be unique
+            DoF: Dof of the property from 1 to 6
+            NLtype: Integer value from 0 to 15 to associate a non-linear behaviour to each DoF. Use -1 to leave the DoF inactive
+            NLprops: Array of numerical properties for the selected non-linear behaviour
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/springproperty/nl/change/'+qt(name)+'/'+str(DoF)+'/'+str(NLtype)+'', NLprops, None))
+    def changeSpringProperty(self, name, Kx, Ky, Kz, Krx, Kry, Krz):
+        ''' Change a spring property in the model
+        
+        Args:
+            name: Name of the property, must be unique
+            Kx: Stiffness in X direction
+            Ky: Stiffness in Y direction
+            Kz: Stiffness in Z direction
+            Krx: Stiffness in RX direction
+            Kry: Stiffness in RY direction
+            Krz: Stiffness in RZ direction
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/springproperty/simple/change/'+qt(name)+'/'+str(Kx)+'/'+str(Ky)+'/'+str(Kz)+'/'+str(Krx)+'/'+str(Kry)+'/'+str(Krz)+'', None, None))
+    def clearElementCustomProperties(self, elem):
+        ''' Clear element custom properties
+        
+        Args:
+            elem: 
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('DELETE', '/element/customprop/'+qt(elem)+'', None, None))
+    def clearElementRebar(self, elem):
+        ''' Clear all element rebar
+        
+        Args:
+            elem: ID of the element or Wall group name
+
+        Returns:
+            True is successful
+        '''
+        return sbool(self.nfrest('GET', '/element/rebar/clear/'+qt(elem)+'', None, None))
+    def elementAvailableFlags(self):
+        ''' Return a dictionary of all flags that can be defined for an element, with their description
+        
+        
+        Returns:
+            Dictionary of flags and their descriptions
+        '''
+        return des(self.nfrest('', '', None, None))
+    def elementFlagList(self, ID):
+        ''' Return a dictionary of all flags defined for the element, with their value
+        
+        Args:
+            ID: ID of the element
+
+        Returns:
+            Dictionary of flags and their values
+        '''
+        return des(self.nfrest('', ''+qt(ID)+'', None, None))
+    def exportRCmemberDXF(self, path, member):
+        ''' Export the selected RC member to DXF or DWG format. Rebars and hoops will be inserted in the drawing, if present
+        
+        Args:
+            path: Path of the resulting DXF or DWG file
+            member: Member name
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/model/member/exportdxf/'+qt(member)+'', None, dict([("path",path)])))
+    def getElementArea(self, ID):
+        ''' Get element area of planar elements or surface for solids
+        
+        Args:
+            ID: 
+
+        Returns:
+            
+        '''
+        return float(self.nfrest('GET', '/element/area/'+qt(ID)+'', None, None))
+    def getElementCentroid(self, ID):
+        ''' Return the coordinates of the centroid of the selected element
+        
+        Args:
+            ID: ID of the element
+
+        Returns:
+            A double array
+        '''
+        return des(self.nfrest('GET', '/element/centroid/'+qt(ID)+'', None, None))
+    def getElementConnectivity(self, ID):
+        ''' Return the connectivity of the specified element.
+        
+        Args:
+            ID: ID of the element
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/element/conn/'+qt(ID)+'', None, None))
+    def getElementCustomProperty(self, elem, propName):
+        ''' Get an already defined element custom property
+        
+        Args:
+            elem: ID of the element
+            propName: Property name
+
+        Returns:
+            Null string if not set
+        '''
+        return self.nfrest('GET', '/element/customprop/'+qt(elem)+'/'+qt(propName)+'', None, None)
+    def getElementInfo(self, element):
+        ''' Get text with element properties
+        
+        Args:
+            element: 
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/element/info/'+qt(element)+'', None, None))
+    def getElementOffset(self, elem):
+        ''' Get the element offset for selected beam element
+        
+        Args:
+            elem: ID of the beam element
+
+        Returns:
+            An array of size 2 with offset in z and offset in y local directions. Return null array even if the element is not found
+        '''
+        return des(self.nfrest('GET', '/element/beamoffset/'+qt(elem)+'', None, None))
+    def getElementProperty(self, ID, name):
+        ''' Return selected property of element
+        
+        Args:
+            ID: ID of the element
+            name: Name of the property: num, angle, groupE, isJoint, isTruss, isPlaneStress, lun, mat, member, offsetI, offsetJ, sect, set2, sprProp, type
+
+        Returns:
+            The requested value as string. Empty in case of error
+        '''
+        return self.nfrest('GET', '/element/prop/'+qt(ID)+'/'+qt(name)+'', None, None)
+    def getElementRebarCoords(self, elem, progr):
+        ''' Get rebar coordinates from selected element
+        
+        Args:
+            elem: ID of the element or group name
+            progr: Progressive abscissa (relative value from 0 to 1)
+
+        Returns:
+            Array of X,Y coordinates of size (rebarNumber,2). Coordinates are always referred to the center of reinforcement
+        '''
+        return des(self.nfrest('GET', '/element/rebar/coords/'+qt(elem)+'/'+str(progr)+'', None, None))
+    def getElementRebarSize(self, elem, progr):
+        ''' Get rebar dimensions from selected element
+        
+        Args:
+            elem: ID of the element or group name
+            progr: Progressive abscissa (relative value from 0 to 1)
+
+        Returns:
+            
+        '''
+        return des(self.nfrest('GET', '/element/rebar/size/'+qt(elem)+'/'+str(progr)+'', None, None))
+    def getElementType(self, ID):
+        ''' Get element type: unk = 0,line = 1,tria = 2,quad = 3,hexa = 4,wedge = 5,tetra = 6,user = 10,line3 = 20,quad8 = 21,hexa16 = 22,hexa20 = 23,tetra10 = 24,tria6 = 25,wedge15 = 26,spring2nodes = 40
+        
+        Args:
+            ID: ID of the element
+
+        Returns:
+            A string describing the element type
+        '''
+        return self.nfrest('GET', '/element/type/'+qt(ID)+'', None, None)
+    def getElementVolume(self, ID):
+        ''' Get element volume for solids
+        
+        Args:
+            ID: 
+
+        Returns:
+            
+        '''
+        return float(self.nfrest('GET', '/element/volume/'+qt(ID)+'', None, None))
+    def getEndRelease(self, beamID):
+        ''' Give beam releases ratios. If 0, the dof is completely released.
+        
+        Args:
+            beamID: ID of the beam
+
+        Returns:
+            Matrix of double of size [2,6], 6 for end I and 6 for end J. -1 means the DoF is not released
+        '''
+        return des(self.nfrest('GET', '/element/beamendrelease/'+qt(beamID)+'', None, None))
+    def getExtrudedBeamPoints(self, elemID):
+        ''' Get points from the extruded beam section in 3D space
+        
+        Args:
+            elemID: ID of the beam element
+
+        Returns:
+            Array of vert3 instances
+        '''
+        return des(self.nfrest('GET', '/element/extrudedbeam/'+qt(elemID)+'', None, None))
+    def getFreeElementID(self):
+        ''' Get the next free element ID
+        
+        
+        Returns:
+            Int64 value
+        '''
+        return self.nfrest('GET', '/op/freeelementid', None, None)
+    def getLocalAxes(self, ID):
+        ''' Return local axes of an element as API.vert3
+        
+        Args:
+            ID: 
+
+        Returns:
+            
+        '''
+        return des(self.nfrest('GET', '/element/lcs/'+qt(ID)+'', None, None))
+    def getLocalAxesArray(self, ID):
+        ''' Return local axes of an element as array of double {x1,x2,x3,y1,y2,y3,z1,z2,z3}
+        
+        Args:
+            ID: 
+
+        Returns:
+            Array of double
+        '''
+        return des(self.nfrest('GET', '/element/lcsA/'+qt(ID)+'', None, None))
+    def getMacroelement(self, elemID):
+        ''' Get the macroelement type assigned to the selected element
+        
+        Args:
+            elemID: Selected element ID
+
+        Returns:
+            Line=0, Line3=1, Quad1=2, Quad2=3, Quad3=4, masonryWall=5, rigidWall=6, -1 if not assigned
+        '''
+        return int(self.nfrest('GET', '/element/macro/'+qt(elemID)+'', None, None))
+    def getMaxElementID(self):
+        ''' Get the max free element ID
+        
+        
+        Returns:
+            Int64 value
+        '''
+        return self.nfrest('GET', '/op/maxelementid', None, None)
+    def getMemberElements(self, member):
+        ''' Get the IDs of beam elements grouped in a member.
+        
+        Args:
+            member: Member ID
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/model/member/elems/'+qt(member)+'', None, None))
+    def getMemberLength(self, member):
+        ''' Get member length
+        
+        Args:
+            member: Member ID
+
+        Returns:
+            Double
+        '''
+        return float(self.nfrest('GET', '/model/member/leng/'+qt(member)+'', None, None))
+    def getMembers(self):
+        ''' Get a list of members defined in the model
+        
+        
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/model/member/all', None, None))
+    def getRigidOffsets(self, beamID):
+        ''' Get beam end offset length ratios, or and array of 0 if no end offset is present
+        
+        Args:
+            beamID: ID of the beam element
+
+        Returns:
+            Return an array of size 2 with the relative length of the rigid offset for ends I and J, respectively
+        '''
+        return des(self.nfrest('GET', '/element/beamendoffset/'+qt(beamID)+'', None, None))
+    def getShellEndRelease(self, ID):
+        ''' Give shell releases
+        
+        Args:
+            ID: ID of the shell. Tria and Quad only
+
+        Returns:
+            Matrix of boolean of size [n,6], where n is the number of nodes. 6 boolean values for each node (fx, fy, fz, mx, my, drilling)
+        '''
+        return des(self.nfrest('GET', '/element/shellendrelease/'+qt(ID)+'', None, None))
+    def getSpringLocalAxes(self, elem):
+        ''' Get local axes of a spring element
+        
+        Args:
+            elem: Spring element number
+
+        Returns:
+            Array of double of size 9, empty if error occurs
+        '''
+        return des(self.nfrest('GET', '/springproperty/axes/'+qt(elem)+'', None, None))
+    def getSpringProperties(self):
+        ''' Get a list of spring properties defined in the model
+        
+        
+        Returns:
+            Array of spring properties. For each line: ID kX kY kZ krX krY krZ Elastic_soil Winkler_modulus
+        '''
+        return des(self.nfrest('GET', '/springproperty/list', None, None))
+    def getSubsoilElements(self):
+        ''' Get a list of elements having subsoil springs
+        
+        
+        Returns:
+            An array of element IDs
+        '''
+        return des(self.nfrest('GET', '/element/add/subsoil', None, None))
+    def getWallGroups(self):
+        ''' Return all the groups than can be associated to a wall
+        
+        
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/element/walls/list', None, None))
+    def getWallHeight(self, grpName):
+        ''' Gives the height of a specified wall
+        
+        Args:
+            grpName: Name of wall group
+
+        Returns:
+            Double value
+        '''
+        return float(self.nfrest('GET', '/element/walls/height/'+qt(grpName)+'', None, None))
+    def getWalls(self):
+        ''' Return all the wall elements by their number
+        
+        
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/element/walls/elems', None, None))
+    def getWallSection(self, grpName):
+        ''' Gives the dimensions (thickness and width) of a specified wall
+        
+        Args:
+            grpName: Name of wall group
+
+        Returns:
+            Array of float with thickness and width
+        '''
+        return des(self.nfrest('GET', '/element/walls/section/'+qt(grpName)+'', None, None))
+    def isColumn(self, beamID):
+        ''' Check if a beam element is vertical or not
+        
+        Args:
+            beamID: ID of the beam element to check
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/element/iscolumn/'+qt(beamID)+'', None, None))
+    def refreshHinges(self):
+        ''' Recalculate all hinges assigned in the model. Useful after modification of material or section.
+        
+        
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('GET', '/hinge/refresh', None, None))
+    def removeElement(self, ID):
+        ''' Remove the specified element from the model
+        
+        Args:
+            ID: ID of the element to be removed
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('DELETE', '/element/'+qt(ID)+'', None, None))
+    def removeElementsFromMember(self, member, elems:list):
+        ''' Remove the specified elements from a member
+        
+        Args:
+            member: Member ID
+            elems: IDs of elements to be removed
+
+        Returns:
+            True if successful, False otherwise
+        '''
+        return sbool(self.nfrest('DELETE', '/model/member/elems/'+qt(member)+'', None, dict([("elems",json.dumps(elems))])))
+    def removeHinges(self, beamID):
+        ''' Remove all hinges from a beam element
+        
+        Args:
+            beamID: ID of the beam element
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/hinge/remove/'+qt(beamID)+'', None, None))
+    def removeHingeType(self, name):
+        ''' Remove hinge property
+        
+        Args:
+            name: Name of the hinge property
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('DELETE', '/hinge/removetype/'+qt(name)+'', None, None))
+    def removeMember(self, member):
+        ''' Remove a member from the model
+        
+        Args:
+            member: Member ID
+
+        Returns:
+            True if successful, False otherwise
+        '''
+        return sbool(self.nfrest('GET', '/model/member/remove/'+qt(member)+'', None, None))
+    def removeSpringProperty(self, name):
+        ''' Remove a linear or non-linear spring property
+        
+        Args:
+            name: Name of the property set
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('DELETE', '/springproperty/'+qt(name)+'', None, None))
+    def setBeamAngle(self, num, angle):
+        ''' Set the rotation angle of the specified beam.
+        
+        Args:
+            num: Number of the element
+            angle: Angle in degrees
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/element/beamangle/'+qt(num)+'/'+str(angle)+'', None, None))
+    def setElemAsJoint(self, num, status):
+        ''' Set the Joint property of the specified element.
+        
+        Args:
+            num: Number of the element
+            status: True or False to activate or deactivate the IsJoint flag
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/element/setjoint/'+qt(num)+'/'+str(status)+'', None, None))
+    def setElementCustomProperty(self, elem, propName, propValue):
+        ''' Set or change an element custom property
+        
+        Args:
+            elem: ID of the element
+            propName: Property name
+            propValue: Property value
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/element/customprop/'+qt(elem)+'/'+qt(propName)+'/'+qt(propValue)+'', None, None))
+    def setElementOffset(self, elem, offsetZ, offsetY):
+        ''' Set element line offset for the selected beam element
+        
+        Args:
+            elem: ID of the beam element
+            offsetZ: Offset in local z direction
+            offsetY: Offset in local y direction
+
+        Returns:
+            True if successful, False otherwise
+        '''
+        return sbool(self.nfrest('POST', '/element/beamoffset/'+qt(elem)+'/'+str(offsetZ)+'/'+str(offsetY)+'', None, None))
+    def setEndRelease(self, beamID, node, DOFmask:list, useStiffness=False):
+        ''' Assign an end release to a beam element by specifying its force percentage or joint stiffness.
+        
+        Args:
+            beamID: ID of the beam element
+            node: Node of the beam element to which assign release
+            DOFmask: Array of 6 percentages (0=free, 1=fully connected) or stiffnesses if useStiffness is True
+            useStiffness (optional): Set to true to specify stiffnesses into DOFmask
+
+        Returns:
+            True if successful, False if the cannot be assigned. End releases cannot be assigned to beams with flexural hinges.
+        '''
+        return sbool(self.nfrest('POST', '/element/beamendrelease/'+qt(beamID)+'/'+qt(node)+'/'+str(useStiffness)+'', None, dict([("DOFmask",json.dumps(DOFmask))])))
+    def setMacroelement(self, elemID, macroType):
+        ''' Assign macroelement type to the selected element
+        
+        Args:
+            elemID: Selected element ID
+            macroType: Line=0, Line3=1, Quad1=2, Quad2=3, Quad3=4, masonryWall=5, rigidWall=6. Use -1 to remove assignation
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('POST', '/element/macro/'+qt(elemID)+'/'+str(macroType)+'', None, None))
+    def setPlaneStrainElement(self, id_, isPlaneStrain):
+        ''' Set plane strain condition to a planar element. This method has effect only on planar elements and it is ignored for other types of elements.
+        
+        Args:
+            id_: 
+            isPlaneStrain: 
+
+        Returns:
+            
+        '''
+        return sbool(self.nfrest('GET', '/element/planestrain/'+qt(id_)+'/'+str(isPlaneStrain)+'', None, None))
+    def setPlaneStressElement(self, id_, isPlaneStress):
+        ''' Set plane stress condition to a planar element. This method has effect only on planar elements and it is ignored for other types of elements.
+        
+        Args:
+            id_: 
+            isPlaneStress: 
+
+        Returns:
+            
+        '''
+        return sbool(self.nfrest('GET', '/element/planestress/'+qt(id_)+'/'+str(isPlaneStress)+'', None, None))
+    def setRigidOffsets(self, beamID, values:list, isAbsLength=False):
+        ''' Assign rigid offsets to beam.
+        
+        Args:
+            beamID: ID of the beam element
+            values: Array of size 2 containing length ratio for each end (I, J)
+            isAbsLength (optional): True to use absolute length instead of ratio
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/element/beamendoffset/'+qt(beamID)+'/'+str(isAbsLength)+'', None, dict([("values",json.dumps(values))])))
+    def setShellEndRelease(self, ID, node, DOFmask:list):
+        ''' Set end release for shell element
+        
+        Args:
+            ID: ID of the shell element. Must be Tria or Quad
+            node: ID of the shell node to release
+            DOFmask: Array of 6 boolean values (fx, fy, fz, mx, my, drilling)
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/element/shellendrelease/'+qt(ID)+'/'+qt(node)+'', None, dict([("DOFmask",json.dumps(DOFmask))])))
+    def setSpringLocalAxes(self, name, x1, y1, z1, x2, y2, z2):
+        ''' Set local axes in the selected spring property
+        
+        Args:
+            name: Name of the spring property
+            x1: Local axis 1 - x
+            y1: Local axis 1 - y
+            z1: Local axis 1 - z
+            x2: Local axis 2 - x
+            y2: Local axis 2 - y
+            z2: Local axis 2 - z
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/springproperty/axes/'+qt(name)+'/'+str(x1)+'/'+str(y1)+'/'+str(z1)+'/'+str(x2)+'/'+str(y2)+'/'+str(z2)+'', None, None))
+    def setWall(self, elems:list, rotate90=False, isSlab=False):
+        ''' Create a wall for design, including 3 section cuts, from the selected planar elements
+        
+        Args:
+            elems: Array of elements forming the wall
+            rotate90 (optional): Optional. To create vertical section cuts, set to true
+            isSlab (optional): Optional. If set to true, no section cuts are created
+
+        Returns:
+            Name of the newly created wall group
+        '''
+        return self.nfrest('GET', '/element/walls/set/'+str(rotate90)+'/'+str(isSlab)+'', None, dict([("elems",json.dumps(elems))]))
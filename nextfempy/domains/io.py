@@ -0,0 +1,524 @@
+'''
+NextFEMrest methods for import and export of models, results and drawings.
+'''
+
+import json
+from ..common import sbool, qt
+
+class IOMixin:
+
+    def exportDXF(self, path, extruded, selectedElems:list=None):
+        ''' Export DXF or DWG of the model
+        
+        Args:
+            path: Path of the DXF or DWG file to be saved
+            extruded: True if extruded model, false for wireframe
+            selectedElems (optional): List of string with selected elements ID. If null (default), entire model is drawed.
+
+        Returns:
+            
+        '''
+        return sbool(self.nfrest('POST', '/op/export/dxf/'+str(extruded)+'', selectedElems, dict([("path",path)])))
+    def exportElevationGroupToDXF(self, path, groupName, YZplane=False):
+        ''' Export the elevation view of selected group of elements to DXF or DWG format. Top rebars will be shown in plan, if present
+        
+        Args:
+            path: Path of the resulting DXF or DWG file
+            groupName: Name of the group containing the elments to include in the elevation view
+            YZplane (optional): Optional parameter to specify if the elevation view should be in the YZ plane
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/model/group/exportelevdxf/'+qt(groupName)+'/'+str(YZplane)+'', None, dict([("path",path)])))
+    def exportGLTF(self, path, saveIFC=False):
+        ''' Export the model to glTF format for web sharing.
+        
+        Args:
+            path: Path of the file to be saved
+            saveIFC (optional): Optional parameter to save IFC to the same folder. Default is false
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/export/gltf/'+str(saveIFC)+'', None, dict([("path",path)])))
+    def exportGroupToDXF(self, path, groupName):
+        ''' Export the plan view of selected group of elements to DXF or DWG format. Top rebars will be shown in plan, if present
+        
+        Args:
+            path: Path of the resulting DXF or DWG file
+            groupName: Name of the group containing the elments to include in the plan view
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/model/group/exportdxf/'+qt(groupName)+'', None, dict([("path",path)])))
+    def exportIFC(self, path, saveAsXML=False):
+        ''' Export IFC file
+        
+        Args:
+            path: Path of the file to be saved
+            saveAsXML (optional): False is default. True to save in XML format.
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/export/ifc/'+str(saveAsXML)+'', None, dict([("path",path)])))
+    def exportIOM(self, filename):
+        ''' Export model to IDEA StatiCa Open Model format. It generates filename.xml and filename.xmlR for results, if any.
+        
+        Args:
+            filename: Full path for the output model in XML format.
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/export/idea', None, dict([("path",filename)])))
+    def exportMidas(self, path):
+        ''' Export model in MGT format for Midas GEN
+        
+        Args:
+            path: Full path of saved file
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/export/midas', None, dict([("path",path)])))
+    def exportOpenSees(self, path, loadcase):
+        ''' Export model in OpenSees TCL format for a chosen loadcase
+        
+        Args:
+            path: Full path of TCL file
+            loadcase: Load case to be exported
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/export/opensees/'+qt(loadcase)+'', None, dict([("path",path)])))
+    def exportRCbeamsDXF(self, path, elements:list):
+        ''' Export the selected RC beam to DXF or DWG format. Rebars and hoops will be inserted in the drawing, if present
+        
+        Args:
+            path: Path of the resulting DXF or DWG file
+            elements: Array of elements to include in DXF
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/element/exportdxf', None, dict([("path",path),("elements",json.dumps(elements))])))
+    def exportSAF(self, path):
+        ''' Export structural model in SAF file
+        
+        Args:
+            path: Full path of SAF .xlsx file
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/export/saf', None, dict([("path",path)])))
+    def exportSAP2000(self, path):
+        ''' Export model in S2K format for SAP2000
+        
+        Args:
+            path: Full path of saved file
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/export/sap2000', None, dict([("path",path)])))
+    def exportSpreadsheet(self, filename, table:list):
+        ''' Export results in spreadsheet format (csv or xlsx)
+        
+        Args:
+            filename: Path of the file to save
+            table: List of array of strings, containing each row of the table
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/op/export/table', table, dict([("path",filename)])))
+    def exportWexBIM(self, path, saveIFC=False, copyViewer=True):
+        ''' Export the model to WexBIM format for web sharing.
+        
+        Args:
+            path: Path of the file to be saved
+            saveIFC (optional): Optional parameter to save IFC to the same folder. Default is false
+            copyViewer (optional): Optional parameter to copy viewer engine files to the same folder. Default is true
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/export/wexbim/'+str(saveIFC)+'/'+str(copyViewer)+'', None, dict([("path",path)])))
+    def exportXMLresults(self, filename):
+        ''' Export results in XML format
+        
+        Args:
+            filename: Path of the file to save
+
+        Returns:
+            
+        '''
+        return sbool(self.nfrest('GET', '/op/export/xmlres', None, dict([("path",filename)])))
+    def getDXFentities(self, buffer:list):
+        ''' Get drawing entities in the loaded DXF serialized in JSON format
+        
+        Args:
+            buffer: Byte array to be imported
+
+        Returns:
+            String in JSON format
+        '''
+        return self.nfrest('POST', '/op/import/dxfentities', buffer, None)
+    def getOSprocedureName(self):
+        ''' Return the NextFEM procedure file for OpenSees, without .tcl extension
+        
+        
+        Returns:
+            String
+        '''
+        return self.nfrest('GET', '/op/export/osproc', None, None)
+    def importAbaqusCalculix(self, path):
+        ''' Import ABAQUS/CalculiX model
+        
+        Args:
+            path: Full path of INP file
+
+        Returns:
+            Always true
+        '''
+        return sbool(self.nfrest('GET', '/op/import/abaqus', None, dict([("path",path)])))
+    def importDolmen(self, path):
+        ''' Import a CDM Dolmen model
+        
+        Args:
+            path: Full path of STR file
+
+        Returns:
+            True if results have been read, only if .bin results are in the same folder
+        '''
+        return sbool(self.nfrest('GET', '/op/import/dolmen', None, dict([("path",path)])))
+    def importDXF(self, path):
+        ''' Import DXF file
+        
+        Args:
+            path: Path of DXF file to be imported
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/import/dxf', None, dict([("path",path)])))
+    def importDXF(self, buffer:list):
+        ''' Import DXF from bytes
+        
+        Args:
+            buffer: Byte array to be imported
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('POST', '/op/import/dxfstream', buffer, None))
+    def importGMesh(self, path):
+        ''' Import a text GMesh v2 file
+        
+        Args:
+            path: Full path of GMesh file
+
+        Returns:
+            False in case of error or GeneralDesign license missing
+        '''
+        return sbool(self.nfrest('GET', '/op/import/gmesh', None, dict([("path",path)])))
+    def importIFC(self, path, includeRigidLinks=False):
+        ''' Import IFC file
+        
+        Args:
+            path: Full path of the IFC file
+            includeRigidLinks (optional): False is default. True to read rigid links from structural models
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/import/ifc/'+str(includeRigidLinks)+'', None, dict([("path",path)])))
+    def importMesh(self, path):
+        ''' Import a text Mesh file from off2msh format (MeshVersionFormatted 1) or neutral
+        
+        Args:
+            path: Full path of Mesh file
+
+        Returns:
+            False in case of error or GeneralDesign license missing
+        '''
+        return sbool(self.nfrest('GET', '/op/import/mesh', None, dict([("path",path)])))
+    def importMidas(self, path):
+        ''' Import a Midas GEN/Civil model in text format
+        
+        Args:
+            path: Full path of MGT/MCT file
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/import/midasfile', None, dict([("path",path)])))
+    def importMidas(self, model:list):
+        ''' Import a Midas GEN/Civil model in text format
+        
+        Args:
+            model: Array of model lines
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('POST', '/op/import/midastext', model, None))
+    def importMidasResults(self, path):
+        ''' Read results from Midas GEN/Civil tables, copied to a text file
+        
+        Args:
+            path: Full path of results file
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/import/midasresult', None, dict([("path",path)])))
+    def importMidasResults(self, text:list):
+        ''' Read results from Midas GEN/Civil tables, copied to a text file
+        
+        Args:
+            text: Array of strings
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('POST', '/op/import/midasresulttext', text, None))
+    def importMidasResultsAPI(self, MAPIkey, resultsToImport:list):
+        ''' Import Midas results from Midas GEN NX/Civil NX API
+        
+        Args:
+            MAPIkey: Required, get it from your running Midas program
+            resultsToImport: Array of boolean to select results to import: ["Beam forces", "Truss forces", "Displacements", "RS forces", "Wall forces", "Elastic link forces", "Plate local forces"]
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/op/import/midasresultapi', resultsToImport, dict([("mapi",MAPIkey)])))
+    def importNodeElemFiles(self, path):
+        ''' Import a node/elem set of file
+        
+        Args:
+            path: Path of .node or .elem file
+
+        Returns:
+            
+        '''
+        return sbool(self.nfrest('GET', '/op/import/nodeelem', None, dict([("path",path)])))
+    def importOBJ(self, path):
+        ''' Import text OBJ file
+        
+        Args:
+            path: Full path of OBJ file
+
+        Returns:
+            
+        '''
+        return sbool(self.nfrest('GET', '/op/import/obj', None, dict([("path",path)])))
+    def importOpenSees(self, path):
+        ''' Import OpenSees model in TCL format
+        
+        Args:
+            path: Full path of TCL file
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/import/opensees', None, dict([("path",path)])))
+    def importOpenSeesRecorder(self, path, type_, useTimeFlag=True):
+        ''' Import an OpenSees recorder text file. XML is also supported.
+        
+        Args:
+            path: Full path of results file
+            type_: Type of result: 1-displacements 2-reactions 3-eigenvectors 4-accelerations 5-forces
+            useTimeFlag (optional): Set to true if -time flag has been used in the recorder setting
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/import/recorder/'+str(type_)+'/'+str(useTimeFlag)+'', None, dict([("path",path)])))
+    def importSAF(self, path):
+        ''' Import structural model in SAF file
+        
+        Args:
+            path: Full path of SAF .xlsx file
+
+        Returns:
+            True if results have been read
+        '''
+        return sbool(self.nfrest('GET', '/op/import/saf', None, dict([("path",path)])))
+    def importSAP2000(self, path):
+        ''' Import a SAP2000 model in text format
+        
+        Args:
+            path: Full path of S2K file
+
+        Returns:
+            True if results are present
+        '''
+        return sbool(self.nfrest('GET', '/op/import/sap2000', None, dict([("path",path)])))
+    def importSeismoStruct(self, path):
+        ''' Import a SeismoStruct XML model
+        
+        Args:
+            path: Full path of XML file
+
+        Returns:
+            True if results have been read, only if .out file is in the same folder
+        '''
+        return sbool(self.nfrest('GET', '/op/import/seismostruct', None, dict([("path",path)])))
+    def importSismicad(self, path, lenUnit='cm', forceUnit='daN'):
+        ''' Import a Sismicad model. Consider to call importSismicadSects_Combo to read sections and combinations before calling this function.
+        
+        Args:
+            path: Full path of Sismicad 90static.F3F/F2F file
+            lenUnit (optional): Optional length units to be provided, default is cm
+            forceUnit (optional): Optional force unit to be provided, default is daN
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/import/sismicad'+qt(lenUnit)+'/'+qt(forceUnit)+'', None, dict([("path",path)])))
+    def importSismicadSects_Combo(self, path):
+        ''' Read section definitions and combinations from Sismicad tables, in TXT format
+        
+        Args:
+            path: Full path of TXT file
+
+        Returns:
+            Always true
+        '''
+        return sbool(self.nfrest('GET', '/op/import/sismicadset', None, dict([("path",path)])))
+    def importSismicadSects_Combo(self, text:list):
+        ''' Read section definitions and combinations from Sismicad tables, in TXT format
+        
+        Args:
+            text: Array of strings
+
+        Returns:
+            True if at least one loadcase or combination is read
+        '''
+        return sbool(self.nfrest('POST', '/op/import/sismicadsettext', text, None))
+    def importSofistik(self, path):
+        ''' Import a Sofistik model from database
+        
+        Args:
+            path: Full path of CDB file
+
+        Returns:
+            True if results have been read
+        '''
+        return sbool(self.nfrest('GET', '/op/import/sofistik', None, dict([("path",path)])))
+    def importSR3(self, path):
+        ''' Import a OpenSargon model in binary format
+        
+        Args:
+            path: Full path of OpenSargon SR3 file
+
+        Returns:
+            True if results have been read, only if .sdb file is in the same folder
+        '''
+        return sbool(self.nfrest('GET', '/op/import/sr3', None, dict([("path",path)])))
+    def importSR4(self, path):
+        ''' Import a OpenSargon model in text format
+        
+        Args:
+            path: Full path of OpenSargon SR4 file
+
+        Returns:
+            True if results have been read
+        '''
+        return sbool(self.nfrest('GET', '/op/import/sr4', None, dict([("path",path)])))
+    def importSTL(self, path):
+        ''' Import text or binary STL file
+        
+        Args:
+            path: Full path of STL file
+
+        Returns:
+            
+        '''
+        return sbool(self.nfrest('GET', '/op/import/stl', None, dict([("path",path)])))
+    def importStraus7(self, path):
+        ''' Import a Straus7 model in text format
+        
+        Args:
+            path: Full path of Straus7 TXT file
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/import/straus7', None, dict([("path",path)])))
+    def importStrausResults(self, path):
+        ''' Read results from Straus7 tables, copied to a text file
+        
+        Args:
+            path: Full path of results file
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/import/straus7result', None, dict([("path",path)])))
+    def importStrausResults(self, text:list):
+        ''' Read results from Straus7 tables, copied to a text file
+        
+        Args:
+            text: Array of strings
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('POST', '/op/import/straus7resulttext', text, None))
+    def importWinStrand(self, path):
+        ''' Import a EnExSys WinStrand model in XML format
+        
+        Args:
+            path: Full path of XML file
+
+        Returns:
+            True if results have been read
+        '''
+        return sbool(self.nfrest('GET', '/op/import/winstrand', None, dict([("path",path)])))
+    def importZeusNL(self, path):
+        ''' Import a Zeus-NL/ADAPTIC model
+        
+        Args:
+            path: Full path of Zeus-NL/ADAPTIC model file
+
+        Returns:
+            
+        '''
+        return sbool(self.nfrest('GET', '/op/import/zeusnl', None, dict([("path",path)])))
+    def importZeusNLresults(self, path):
+        ''' Import results from Zeus-NL/ADAPTIC .num file
+        
+        Args:
+            path: Full path of Zeus-NL/ADAPTIC .num file
+
+        Returns:
+            
+        '''
+        return sbool(self.nfrest('GET', '/op/import/zeusnlres', None, dict([("path",path)])))
+    def openIDEAcodeCheck(self):
+        ''' Open IDEA CheckBot, if installed. Only for local instances of NextFEM Designer
+        
+        
+        Returns:
+            
+        '''
+        return self.nfrest('GET', '/op/export/ccm', None, None)
+    def valueFromString(self, text, valueName):
+        ''' Get value from a string containing key=value
+        
+        Args:
+            text: String to be processed
+            valueName: Key name
+
+        Returns:
+            
+        '''
+        return self.nfrest('POST', '/op/import/valfromstring/'+qt(valueName)+'', text, None)
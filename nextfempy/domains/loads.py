@@ -0,0 +1,1066 @@
+'''
+NextFEMrest methods for loads, masses, loadcases, combinations and functions.
+'''
+
+import json
+from ..common import sbool, qt, des
+
+class LoadsMixin:
+
+    def addBeamLoad(self, elem, value1, value2, position1, position2, direction, loadcase, local=False):
+        ''' Add a distributed load on the specified beam
+        
+        Args:
+            elem: Beam element retaining the load
+            value1: Initial value
+            value2: Final value
+            position1: Initial position
+            position2: Final position
+            direction: Direction of the load: 1=X, 2=Y, 3=Z, 4=RX, 5=RY, 6=RZ
+            loadcase: Name of the loadcase
+            local (optional): Optional, default is false. True if load has been defined locally
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/load/element/beamadd/'+qt(elem)+'/'+str(value1)+'/'+str(value2)+'/'+str(position1)+'/'+str(position2)+'/'+str(direction)+'/'+qt(loadcase)+'/'+str(local)+'', None, None))
+    def addBeamLoadA(self, elem, values:list, positions:list, direction, loadcase, local=False):
+        ''' Add a distributed load on the specified beam
+        
+        Args:
+            elem: Beam element retaining the load
+            values: Array of load values
+            positions: Array of load positions
+            direction: Direction of the load: 1=X, 2=Y, 3=Z, 4=RX, 5=RY, 6=RZ
+            loadcase: Name of the loadcase
+            local (optional): Optional, default is false. True if load has been defined locally
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/load/element/beamaddA/'+qt(elem)+'/'+str(direction)+'/'+qt(loadcase)+'/'+str(local)+'', None, dict([("values",json.dumps(values)),("positions",json.dumps(positions))])))
+    def addBeamLoadU(self, elem, value, direction, loadcase, local=False):
+        ''' Add a uniformly distributed load on the specified beam
+        
+        Args:
+            elem: Beam element retaining the load
+            value: Load value
+            direction: Direction of the load: 1=X, 2=Y, 3=Z, 4=RX, 5=RY, 6=RZ
+            loadcase: Name of the loadcase
+            local (optional): Optional, default is false. True if load has been defined locally
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/load/element/beamaddU/'+qt(elem)+'/'+str(value)+'/'+str(direction)+'/'+qt(loadcase)+'/'+str(local)+'', None, None))
+    def addEC8spectrum(self, ag, q, LS, damping=0.05, soilType='A', type1=True):
+        ''' Add a EC8 spectrum function from given paramters.
+        
+        Args:
+            ag: Spectral acceleration for T=0
+            q: Behaviour factor
+            LS: Limit State (OLS,DLS,LLS or CLS)
+            damping (optional): Damping ratio for the spectrum. Eg. 0.05
+            soilType (optional): Soil category, letters A,B,C,D,E
+            type1 (optional): Flag. If true, Type 1 spectrum is returned, Type 2 otherwise.
+
+        Returns:
+            The ID of the added spectral function
+        '''
+        return int(self.nfrest('GET', '/function/ec8spectrum/'+str(ag)+'/'+str(q)+'/'+qt(LS)+'/'+str(damping)+'/'+qt(soilType)+'/'+str(type1)+'', None, None))
+    def addEdgeLoad(self, elem, values:list, edge, direction, loadcase, local=False):
+        ''' Add a uniform or linear distributed load on the specified edge of planar element.
+        
+        Args:
+            elem: Planar element retaining the load
+            values: Array of nodal values. Use one value if constant.
+            edge: Index of the edge to be loaded. It starts from 1.
+            direction: Direction of the load: 1=X, 2=Y, 3=Z, 4=RX, 5=RY, 6=RZ
+            loadcase: Name of the loadcase
+            local (optional): Optional. True if load has been defined locally. False by default
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/load/element/edgeadd/'+qt(elem)+'/'+str(edge)+'/'+str(direction)+'/'+qt(loadcase)+'/'+str(local)+'', values, None))
+    def addFloorPlane(self, name, type_, n1, n2, n3, n4=''):
+        ''' Add a floor plane load to the model
+        
+        Args:
+            name: Name of the floor load to be used
+            type_: Distribution of the floor load: 1 triangular - 2 quadrangular-centroid - 3 oriented quadrangular - 4 two-way quadrangular
+            n1: 1st node
+            n2: 2nd node
+            n3: 3rd node
+            n4 (optional): 4th node required only if quadrangular distribution is set
+
+        Returns:
+            True if successful, False if not or if nodes don't form a plane or beam elements don't cover the entire perimeter
+        '''
+        return sbool(self.nfrest('GET', '/load/floor/planeadd/'+qt(name)+'/'+str(type_)+'/'+qt(n1)+'/'+qt(n2)+'/'+qt(n3)+'/'+qt(n4)+'', None, None))
+    def addLoadCase(self, name):
+        ''' Add a loacase of a given name to the model
+        
+        Args:
+            name: Name of the loadcase
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/add/'+qt(name)+'', None, None))
+    def addLoadCaseToCombination(self, name, loadcase, factor):
+        ''' Add a loadcase and a factor to an already existing combination, buckling or PDelta analysis
+        
+        Args:
+            name: Name of the combination or buckling analysis
+            loadcase: Name of the loadcase to add to the combination
+            factor: Factor for the loadcase to add to the combination
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/combo/add/'+qt(name)+'/'+qt(loadcase)+'/'+str(factor)+'', None, None))
+    def addLoadCaseToTimeHistoryAnalysis(self, name, loadcase, factor, THid=-1):
+        ''' Add a loadcase and a factor to an already existing time-history analysis (static or dynamic)
+        
+        Args:
+            name: Name of the existing time-history analysis
+            loadcase: Name of the loadcase to add
+            factor: Factor for the loadcase to add
+            THid (optional): Optional. The ID of the time series to associate with load, default is -1 for ramp
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/combo/addth/'+qt(name)+'/'+qt(loadcase)+'/'+str(factor)+'/'+str(THid)+'', None, None))
+    def addNodalDisp(self, node, disp, direction, loadcase):
+        ''' Add an imposed displacement to the selected node
+        
+        Args:
+            node: Node retaining the load
+            disp: Imposed displacement value
+            direction: Direction of the load: 1=X, 2=Y, 3=Z, 4=RX, 5=RY, 6=RZ
+            loadcase: Name of the loadcase
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/load/node/disp/'+qt(node)+'/'+str(disp)+'/'+str(direction)+'/'+qt(loadcase)+'', None, None))
+    def addNodalLoad(self, node, value, direction, loadcase, local=False):
+        ''' Add a nodal load to the model
+        
+        Args:
+            node: Node retaining the load
+            value: Load value
+            direction: Direction of the load: 1=X, 2=Y, 3=Z, 4=RX, 5=RY, 6=RZ
+            loadcase: Name of the loadcase
+            local (optional): True if load has been defined locally
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/load/node/add/'+qt(node)+'/'+str(value)+'/'+str(direction)+'/'+qt(loadcase)+'/'+str(local)+'', None, None))
+    def addNodalMass(self, ID, tmx, tmy, tmz, rmx, rmy, rmz):
+        ''' Add a nodal mass
+        
+        Args:
+            ID: ID of the node hosting the mass
+            tmx: Translational mass in X
+            tmy: Translational mass in Y
+            tmz: Translational mass in Z
+            rmx: Rotational inertia around X
+            rmy: Rotational inertia around Y
+            rmz: Rotational inertia around Z
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/mass/add/'+qt(ID)+'/'+str(tmx)+'/'+str(tmy)+'/'+str(tmz)+'/'+str(rmx)+'/'+str(rmy)+'/'+str(rmz)+'', None, None))
+    def addNTCspectrum(self, lat, lon, LS, soil, Vr, St, hh=1, q0=1, isHregular=False, damping=0.05, customAg=0, VerticalComponent=False):
+        ''' Add a NTC 2018 spectrum from given parameters.
+        
+        Args:
+            lat: Latitude in WGS84. Location must be in Italy.
+            lon: Longitude in WGS84. Location must be in Italy.
+            LS: Limit State for spectrum: SLO, SLD, SLV or SLC
+            soil: Soil category, letters A,B,C,D,E
+            Vr: Reference life as per NTC 2018, in years
+            St: Topographic coefficient for the site
+            hh (optional): h/H ratio of building site, maximum is 1
+            q0 (optional): Behaviour factor, default is 1.0 (elastic spectrum)
+            isHregular (optional): True for regular shaped buildings over height
+            damping (optional): Damping ratio for the spectrum. Eg. 0.05
+            customAg (optional): Optional. Spectral acceleration for T=0
+            VerticalComponent (optional): True if spectrum is for vertical component. Deafult is false.
+
+        Returns:
+            The ID of the added spectral function
+        '''
+        return int(self.nfrest('GET', '/function/ntcspectrum/'+str(lat)+'/'+str(lon)+'/'+qt(LS)+'/'+qt(soil)+'/'+str(Vr)+'/'+str(St)+'/'+str(hh)+'/'+str(q0)+'/'+str(isHregular)+'/'+str(damping)+'/'+str(customAg)+'/'+str(VerticalComponent)+'', None, None))
+    def addOrChangeLoadCombinationsTable(self, table:list):
+        ''' Add or change the load combinations table set in the model. Function needs General Design license.
+        
+        Args:
+            table
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/loadcases/combostable', table, None))
+    def addSeriesFunction(self, Xlist:list, Ylist:list, type_, units=''):
+        ''' Add a time series function to the model
+        
+        Args:
+            Xlist: Array of times/periods
+            Ylist: Array of values, same size of Xlist
+            type_: 0 displacement TH, 1 velocity TH, 2 acceleration TH, 3 acceleration spectrum, 4 displacement spectrum
+            units (optional): Units of measure for data in ordinate (Y)
+
+        Returns:
+            The ID of the time series, -1 in case of errors
+        '''
+        return int(self.nfrest('GET', '/function/add/'+str(type_)+'', None, dict([("x",json.dumps(Xlist)),("y",json.dumps(Ylist)),("units",units)])))
+    def addSineFunction(self, frequency, phase, stp, duration, maxAmplitude, isGrowing=False, type_=0, units=''):
+        ''' Add a sine function to the model. It can be growing or not.
+        
+        Args:
+            frequency: Frequency of sine function, in Hz
+            phase: Phase angle, in radians
+            stp: Number of step per cycle
+            duration: Duration of the function
+            maxAmplitude: Amplitude of the function
+            isGrowing (optional): Optional: True if growing sine function. Default: false.
+            type_ (optional): Optional: 0 displacement TH, 1 velocity TH, 2 acceleration TH, 3 acceleration spectrum, 4 displacement spectrum
+            units (optional): Optional: Units of measure for data in ordinate (Y)
+
+        Returns:
+            The ID of the time series
+        '''
+        return int(self.nfrest('GET', '/function/sine/'+str(frequency)+'/'+str(phase)+'/'+str(stp)+'/'+str(duration)+'/'+str(maxAmplitude)+'/'+str(isGrowing)+'/'+str(type_)+'', None, dict([("units",units)])))
+    def addSurfaceLoad(self, elem, values:list, direction, loadcase, local=False):
+        ''' Add a uniformly distributed or bi-linear load on the specified face of planar element.
+        
+        Args:
+            elem: Planar element retaining the load
+            values: Array of nodal values. Use one value if constant.
+            direction: Direction of the load: 1=X, 2=Y, 3=Z, 4=RX, 5=RY, 6=RZ
+            loadcase: Name of the loadcase
+            local (optional): Optional. True if load has been defined locally. False by default
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/load/element/surfaceadd/'+qt(elem)+'/'+str(direction)+'/'+qt(loadcase)+'/'+str(local)+'', values, None))
+    def addThermalDistLoad(self, elem, values:list, loadcase):
+        ''' Add thermal loads for strain-only loading in beams and shells
+        
+        Args:
+            elem: ID of the element
+            values: Array of double of length 3: 0 = uniform temperature, 1 = gradient in local z, 2 = gradient in local y
+            loadcase: Name of the loadcase
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/load/element/tempdistadd/'+qt(elem)+'/'+qt(loadcase)+'', values, None))
+    def addVolumeLoad(self, elem, value, direction, loadcase):
+        ''' Add volume loading for solids
+        
+        Args:
+            elem: Selected solid element
+            value: Value
+            direction: Direction of load
+            loadcase: Name of the loadcase
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/load/element/volumeadd/'+qt(elem)+'/'+str(value)+'/'+str(direction)+'/'+qt(loadcase)+'', None, None))
+    def applyEC8lateralForces(self, thID, loadCaseX, loadCaseY, propMasses=False, T1=0, ct=0.05, lam=1):
+        ''' Apply lateral forces to the master nodes of the model. Rigid diaphragms and masses are required.
+        
+        Args:
+            thID: ID of the spectrum function to be used as reference for total base shear
+            loadCaseX: Loadcase name in X dir. in which lateral forces are stored.
+            loadCaseY: Loadcase name in Y dir. in which lateral forces are stored.
+            propMasses (optional): Flag (true or false). If true lateral forces follow height distribution, if false lateral forces are proportional to floor masses.
+            T1 (optional): Fundamental period of the structure. If not estimated (0), specify ct and lam
+            ct (optional): Optional, default 0.05. Coefficient for estimation of fundamental period from EC8 4.6: T1=ct*H^(3/4)
+            lam (optional): Optional, default 1. Coefficient for estimation of base shear as per EC8 4.5: Fb=Sd(T1)*m*lam
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/load/lateralforces/'+str(thID)+'/'+qt(loadCaseX)+'/'+qt(loadCaseY)+'/'+str(propMasses)+'/'+str(T1)+'/'+str(ct)+'/'+str(lam)+'', None, None))
+    def changeLoadValue(self, i, loadValue):
+        ''' Change the load value of i-th load entity
+        
+        Args:
+            i: Number of the load, get via getLoadsForNode or getLoadsForElement
+            loadValue: New loading value
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/load/change/'+str(i)+'/'+str(loadValue)+'', None, None))
+    def functionFromFile(self, filename, type_=9, units=''):
+        ''' Load a function from text file.
+        
+        Args:
+            filename: Path of the text file containing function to load
+            type_ (optional): 0 displacement TH, 1 velocity TH, 2 acceleration TH, 3 acceleration spectrum, 4 displacement spectrum
+            units (optional): Units of measure for data in ordinate (Y)
+
+        Returns:
+            The ID of the time series, -1 in case of errors
+        '''
+        return int(self.nfrest('GET', '/function/fromfile/'+str(type_)+'', None, dict([("units",units),("path",filename)])))
+    def generateLoadCombinations(self, type_, comboPrefix=''):
+        ''' Generate load combinations as per EC1. General Design license is needed to run.
+        
+        Args:
+            type_: Combinations set type: Fundamental 0, Characteristic 1, Frequent 2, Quasi_permanent 3, Serviceability 4, Seismic 5, All 6
+            comboPrefix (optional): Optional prefix for generated combinations
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/generate/'+str(type_)+'/'+qt(comboPrefix)+'', None, None))
+    def getCombinationCoeffPsi(self, subscript, type_):
+        ''' Get the current psi combination coefficient
+        
+        Args:
+            subscript: 0 for psi0, 1 for psi1, 2 for psi2
+            type_: 1 for variable loading, 2 for wind loads, 3 for snow loading
+
+        Returns:
+            Double value
+        '''
+        return float(self.nfrest('GET', '/loadcase/getpsi/'+str(subscript)+'/'+str(type_)+'', None, None))
+    def getCombinationDesignType(self, name):
+        ''' Returns an integer representing the combination type
+        
+        Args:
+            name: Name of the combination
+
+        Returns:
+            -1 if not defined, 0 Ultimate Limit State, 1 Seismic combination, 2 Serviceability, 3 Serviceability-Characteristic, 4 Serviceability-Frequent, 5 Serviceability-QuasiPermanent
+        '''
+        return int(self.nfrest('GET', '/loadcase/combo/designtype/'+qt(name)+'', None, None))
+    def getCombinationsByDesignType(self, type_, servType=0):
+        ''' Get an array of linear add combinations of the selected design type
+        
+        Args:
+            type_: The combination type for checking: 0 (default) unknown, 1 ultimate, 2 serviceability, 3 seismic
+            servType (optional): The serviceability combination type for checking: 0 (default) unknown, 1 characteristic, 2 frequent, 3 quasi-permanent
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/loadcases/descombos/designtype/'+str(type_)+'/'+str(servType)+'', None, None))
+    def getDataPlot(self, xseries:list, yseries:list, transparent, name='', Xunits='', Yunits='', color=0, useDots=True):
+        ''' Get plot of the given user data in a PNG image
+        
+        Args:
+            xseries: X series of user data
+            yseries: Y series of user data
+            transparent: If true, set transparent background
+            name (optional): Optional. Title of the plot
+            Xunits (optional): Optional. Units for x axis
+            Yunits (optional): Optional. Units for y axis
+            color (optional): Optional. Default is 0 (black)
+            useDots (optional): Optional. Default is false
+
+        Returns:
+            Array of bytes
+        '''
+        return self.nfrestB('GET', '/function/plotdata/'+str(transparent)+'/'+qt(name)+'/'+str(color)+'/'+str(useDots)+'', None, dict([("xseries",json.dumps(xseries)),("yseries",json.dumps(yseries)),("Xunits",Xunits),("Yunits",Yunits)]))
+    def getEnvelopeCombination(self, name):
+        ''' Return a check object with loadcases and corresponding factors for desired envelope load combination.
+        
+        Args:
+            name: Name of load combination
+
+        Returns:
+            A check object
+        '''
+        return self.nfrest('GET', '/loadcase/combo/getenv/'+qt(name)+'', None, None)
+    def getFloorLoadType(self, name):
+        ''' Get a string describing the selected floor load type
+        
+        Args:
+            name: Name of the floor load type
+
+        Returns:
+            String
+        '''
+        return self.nfrest('GET', '/load/floor/planetype/'+qt(name)+'', None, None)
+    def getFloorPlanes(self):
+        ''' Return a list of defined floor planes
+        
+        
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/load/floor/planesget', None, None))
+    def getFunctionGeneralData(self, funcID):
+        ''' Get custom data stored in the selected function
+        
+        Args:
+            funcID: ID of the function
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/function/gendata/'+str(funcID)+'', None, None))
+    def getFunctionName(self, funcID):
+        ''' Get name of the selected function
+        
+        Args:
+            funcID: ID of the function
+
+        Returns:
+            String
+        '''
+        return self.nfrest('GET', '/function/name/'+str(funcID)+'', None, None)
+    def getFunctionPlot(self, funcID, imagePath):
+        ''' Get plot of the selected function
+        
+        Args:
+            funcID: ID of the function
+            imagePath: Path of the PNG image to be written
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/function/plot/'+str(funcID)+'', None, dict([("path",imagePath)])))
+    def getFunctions(self):
+        ''' Get a list of IDs of already defined functions
+        
+        
+        Returns:
+            Array of Int32
+        '''
+        return des(self.nfrest('GET', '/functions', None, None))
+    def getFunctionUnits(self, funcID):
+        ''' Get units of the selected function (Y values)
+        
+        Args:
+            funcID: ID of the function
+
+        Returns:
+            String
+        '''
+        return self.nfrest('GET', '/function/units/'+str(funcID)+'', None, None)
+    def getLinearAddCombination(self, name):
+        ''' Return a check object with loadcases and corresponding factors for desired load combination.
+        
+        Args:
+            name: Name of load combination
+
+        Returns:
+            A check object
+        '''
+        return self.nfrest('GET', '/loadcase/combo/get/'+qt(name)+'', None, None)
+    def getLoad(self, i):
+        ''' Returns a string describing of the i-th load in the model. Use valueFromString to extract data from line (except for Data, which reports one value per line)
+        
+        Args:
+            i: ID of the load, starting from 0.
+
+        Returns:
+            Returns a description of the i-th load in the model. Empty string if not found
+        '''
+        return self.nfrest('GET', '/load/'+str(i)+'', None, None)
+    def getLoadA(self, i):
+        ''' Returns an array of strings describing of the i-th load in the model (ID,Node,Element,Direction,Load value,Load case)
+        
+        Args:
+            i: ID of the load, starting from 0.
+
+        Returns:
+            Returns a description of the i-th load in the model. Empty string if not found
+        '''
+        return des(self.nfrest('GET', '/load/getA/'+str(i)+'', None, None))
+    def getLoadcaseFactor(self, loadcase):
+        ''' Get load factor for the function associated to the selected loadcase
+        
+        Args:
+            loadcase: Name of the loadcase
+
+        Returns:
+            Double value
+        '''
+        return float(self.nfrest('GET', '/loadcase/getfactor/'+qt(loadcase)+'', None, None))
+    def getLoadCaseFunction(self, loadcase):
+        ''' Get the function associated to the selected loadcase
+        
+        Args:
+            loadcase: Name of the loadcase
+
+        Returns:
+            0 if not function is associates, the ID of the function otherwise
+        '''
+        return int(self.nfrest('GET', '/loadcase/getfunc/'+qt(loadcase)+'', None, None))
+    def getLoadCases(self):
+        ''' Get the names of loadcases set in the model.
+        
+        
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/loadcases', None, None))
+    def getLoadCaseType(self, name):
+        ''' Get loadcase type
+        
+        Args:
+            name: Name of the loadcase
+
+        Returns:
+            Integer type: 0 Dead, 1 Live, 2 Wind, 3 Snow, 4 User, 5 Quake, 6 unknown, 7 Thermal, 8 Prestress
+        '''
+        return int(self.nfrest('GET', '/loadcase/gettype/'+qt(name)+'', None, None))
+    def getLoadCombinations(self, includeEnvelopes=True):
+        ''' Get the names of load combinations set in the model.
+        
+        Args:
+            includeEnvelopes (optional): Optional. False to exclude envelopes
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/loadcases/combos/'+str(includeEnvelopes)+'', None, None))
+    def getLoadCombinationsTable(self, includeEnvelopes=True):
+        ''' Get the load combinations table set in the model.
+        
+        Args:
+            includeEnvelopes (optional): Optional. False to exclude envelopes
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/loadcases/combostable/'+str(includeEnvelopes)+'', None, None))
+    def getLoadDurationClass(self, loadcase):
+        ''' Returns the load duration class for the requested loadcase
+        
+        Args:
+            loadcase: Name of the loadcase
+
+        Returns:
+            0 Permanent, 1 Long term, 2 Medium term, 3 Short term, 4 Istantaneous. If not defined yet, return 0 (permanent)
+        '''
+        return int(self.nfrest('GET', '/load/getduration/'+qt(loadcase)+'', None, None))
+    def getLoadsForElement(self, element):
+        ''' Produces a list of load IDs for a single element.
+        
+        Args:
+            element: ID of the element
+
+        Returns:
+            Produces as list of load IDs for a single element.
+        '''
+        return des(self.nfrest('GET', '/load/element/get/'+qt(element)+'', None, None))
+    def getLoadsForNode(self, node):
+        ''' Produces a list of load IDs for a single node.
+        
+        Args:
+            node: ID of the node
+
+        Returns:
+            Produces as list of load IDs for a single node.
+        '''
+        return des(self.nfrest('GET', '/load/node/get/'+qt(node)+'', None, None))
+    def getLoadsInLoadcase(self, loadcase):
+        ''' Produces a list of load IDs for a single loadcase.
+        
+        Args:
+            loadcase: Loadcase name
+
+        Returns:
+            Array of Int32
+        '''
+        return des(self.nfrest('GET', '/load/inloadcase/'+qt(loadcase)+'', None, None))
+    def getMultiplePlots(self, plotList:list, transparent=False, names:list=None, Xunits='', Yunits='', colors:list=None, useDots:list=None, showLegend=False):
+        ''' Get plots of multiple series in a single PNG image
+        
+        Args:
+            plotList: List of list of double[2] arrays
+            transparent (optional): If true, set transparent background
+            names (optional): Optional. Titles of the plots
+            Xunits (optional): Optional. Units for x axis
+            Yunits (optional): Optional. Units for y axis
+            colors (optional): Optional. Array of plot colors
+            useDots (optional): Optional. Array of boolean values for using dots in each plot
+            showLegend (optional): Optional. True to enable graph legend
+
+        Returns:
+            List of arrays of bytes
+        '''
+        return self.nfrestB('POST', '/function/plotmultipledata/'+str(transparent)+'/'+json.dumps(names)+'/'+qt(Xunits)+'/'+qt(Yunits)+'/'+str(showLegend)+'', plotList, dict([("colors",json.dumps(colors)),("useDots",json.dumps(useDots))]))
+    def getStaticLoadCases(self):
+        ''' Get the names of static analysis loadcases set in the model.
+        
+        
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/loadcases/static', None, None))
+    def isNodeLoaded(self, node):
+        ''' Tell if the node is loaded or not
+        
+        Args:
+            node: ID of the node
+
+        Returns:
+            True if almost one nodal load has been found
+        '''
+        return sbool(self.nfrest('GET', '/load/node/isloaded/'+qt(node)+'', None, None))
+    def LoadCaseFromCombo(self, comboName):
+        ''' Generates a load-case from a linear add combination.
+        
+        Args:
+            comboName: 
+
+        Returns:
+            The name of the new loadcase created
+        '''
+        return self.nfrest('GET', '/loadcase/fromcombo/'+qt(comboName)+'', None, None)
+    def removeAllLoads(self):
+        ''' Removes all the loads in the model
+        
+        
+        Returns:
+            True if successful, False otherwise
+        '''
+        return sbool(self.nfrest('DELETE', '/load/all', None, None))
+    def removeAllLoadsForLoadcase(self, lc):
+        ''' Removes all the loads in the model for the selected loadcase
+        
+        Args:
+            lc: Name of the loadcase
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('DELETE', '/load/alllc/'+qt(lc)+'', None, None))
+    def removeFloorLoad(self, name):
+        ''' Remove the specified floor load type
+        
+        Args:
+            name: 
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('GET', '/load/floor/remove/'+qt(name)+'', None, None))
+    def removeFloorPlane(self, name):
+        ''' Remove a floor plane specified by its name
+        
+        Args:
+            name: 
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('GET', '/load/floor/planeremove/'+qt(name)+'', None, None))
+    def removeLoad(self, ID):
+        ''' Removes the specified load.
+        
+        Args:
+            ID: ID of the load to be removed, starting from 0.
+
+        Returns:
+            True if successful, False otherwise
+        '''
+        return sbool(self.nfrest('DELETE', '/load/'+str(ID)+'', None, None))
+    def removeLoadCase(self, name):
+        ''' Remove the specified loacase
+        
+        Args:
+            name: Name of the loadcase
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('DELETE', '/loadcase/'+qt(name)+'', None, None))
+    def removeLoadCaseFromCombination(self, name, loadcase):
+        ''' Remove loadcase and factor from an already existing combination, buckling or PDelta analysis
+        
+        Args:
+            name: Name of the combination or buckling analysis
+            loadcase: Name of the loadcase to be removed
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/combo/remove/'+qt(name)+'/'+qt(loadcase)+'', None, None))
+    def removeLoadCaseToTimeHistoryAnalysis(self, name, loadcase):
+        ''' Remove loadcase and factor to an already existing time-history analysis
+        
+        Args:
+            name: Name of the time-history analysis
+            loadcase: Name of the loadcase to be removed
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/combo/removeth/'+qt(name)+'/'+qt(loadcase)+'', None, None))
+    def removeNodalMass(self, ID):
+        ''' Remove all masses defined in a node
+        
+        Args:
+            ID: ID of the node hosting the masses
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/mass/remove/'+qt(ID)+'', None, None))
+    def seriesFromFunction(self, funcID):
+        ''' Get the series of the selected function
+        
+        Args:
+            funcID: ID of the function
+
+        Returns:
+            An array of double (2 columns)
+        '''
+        return des(self.nfrest('GET', '/function/series/'+str(funcID)+'', None, None))
+    def setAnalysisSequence(self, name, previousCase):
+        ''' Set the loadcases calculation order by specifying the preceding case.
+        
+        Args:
+            name: Name of the present loadcase to modify.
+            previousCase: Name of the loadcase to be calculated before the present loadcase.
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/sequence/'+qt(name)+'/'+qt(previousCase)+'', None, None))
+    def setBucklingAnalysis(self, name, Nmodes, tol=0.0001):
+        ''' Set a buckling analysis from an existing loadcase, if it doesn't contain loads, use addLoadCaseToCombination to add the load contained in other loadcases.
+        
+        Args:
+            name: Name of the loadcase
+            Nmodes: Number of requested buckling modes
+            tol (optional): Tolerance
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/setbuck/'+qt(name)+'/'+str(Nmodes)+'/'+str(tol)+'', None, None))
+    def setCombination(self, name, loadcase, factor, type_=0, servType=0):
+        ''' Set a linear add combination from an existing loadcase. It can be called multiple times. If the loadcase is already in combination, change its factor.
+        
+        Args:
+            name: Name of the loadcase to transform into a combination, or target combination
+            loadcase: Name of the loadcase to add to the combination
+            factor: Factor for the loadcase to add to the combination
+            type_ (optional): Set the combination type for checking: 0 (default) unknown, 1 ultimate, 2 serviceability, 3 seismic
+            servType (optional): Set the combination type for checking: 0 (default) unknown, 1 characteristic, 2 frequent, 3 quasi-permanent
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/combo/set/'+qt(name)+'/'+qt(loadcase)+'/'+str(factor)+'/'+str(type_)+'/'+str(servType)+'', None, None))
+    def setCombinationCoeffPsi(self, subscript, type_, value):
+        ''' Set the psi combination coefficient to the desired value
+        
+        Args:
+            subscript: 0 for psi0, 1 for psi1, 2 for psi2
+            type_: 1 for variable loading, 2 for wind loads, 3 for snow loading
+            value: Desired psi value
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/setpsi/'+str(subscript)+'/'+str(type_)+'/'+str(value)+'', None, None))
+    def setCombinationFactors(self, gG, gQ, psiVar:list=None, psiWind:list=None, psiSnow:list=None, gSW=0):
+        ''' Set or change combination factors
+        
+        Args:
+            gG: Combination factor for permanent loading (default 1.4)
+            gQ: Combination factor for variable loading (default 1.5)
+            psiVar (optional): Optional array of size 3. Partial factors for variable loading (0.7,0.5,0.3)
+            psiWind (optional): Optional array of size 3. Partial factors for wind loading (0.6,0.2,0.0)
+            psiSnow (optional): Optional array of size 3. Partial factors for snow loading (0.5,0.2,0.0)
+            gSW (optional): Optional override factor for self-weight (e.g. use 1.3 is as per NTC and set gG to 1.5)
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/setcfactors/'+str(gG)+'/'+str(gQ)+'/'+str(gSW)+'', None, dict([("psiVar",json.dumps(psiVar)),("psiWind",json.dumps(psiWind)),("psiSnow",json.dumps(psiSnow))])))
+    def setEnvelope(self, name, loadcase, factor, type_=0, servType=0):
+        ''' Set an envelope combination from an existing loadcase. It can be called multiple times. If the loadcase is already in combination, change its factor.
+        
+        Args:
+            name: Name of the loadcase to transform into a combination, or target combination
+            loadcase: Name of the loadcase to add to the combination
+            factor: Factor for the loadcase to add to the combination
+            type_ (optional): Set the combination type for checking: 0 (default) unknown, 1 ultimate, 2 serviceability, 3 seismic
+            servType (optional): Set the serviceability combination type for checking: 0 (default) unknown, 1 characteristic, 2 frequent, 3 quasi-permanent
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/combo/setenv/'+qt(name)+'/'+qt(loadcase)+'/'+str(factor)+'/'+str(type_)+'/'+str(servType)+'', None, None))
+    def setFirePoint(self, loadcase, fireNode, targetTemp, gradientY=0, gradientZ=0, tempAtten=20, dontLoadUnder=50, normalize=False, cylindricalXY=False):
+        ''' Set the point of fire used to set temperatures of all the elements in the model
+        
+        Args:
+            loadcase: Loadcase
+            fireNode: ID of the node setting the fire position
+            targetTemp: Final target temperature, in °C
+            gradientY (optional): Fixed gradient (local y) to be applied. Optional, default is 0
+            gradientZ (optional): Fixed gradient (local z) to be applied. Optional, default is 0
+            tempAtten (optional): Temperature attenuation. Optional, default is 20°C/m
+            dontLoadUnder (optional): Don't apply load under this temperature. Optional, default is 50°C
+            normalize (optional): Applied temperatures normalized with respect to target temp.
+            cylindricalXY (optional): Use cylindrical XY attenuation. Optional, default is False
+
+        Returns:
+            A list of loaded elements
+        '''
+        return des(self.nfrest('GET', '/load/firepoint/'+qt(loadcase)+'/'+qt(fireNode)+'/'+str(targetTemp)+'/'+str(gradientY)+'/'+str(gradientZ)+'/'+str(tempAtten)+'/'+str(dontLoadUnder)+'/'+str(normalize)+'/'+str(cylindricalXY)+'', None, None))
+    def setFloorLoad(self, name, loadcase, loadvalue, dirX, dirY, dirZ):
+        ''' Add or modify floor load type
+        
+        Args:
+            name: Name of the floor load type
+            loadcase: Name of one of the loadcases composing the floor load
+            loadvalue: Corresponding load value for the loadcase composing the floor load
+            dirX: Vector for loading direction: x component
+            dirY: Vector for loading direction: y component
+            dirZ: Vector for loading direction: z component
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/load/floor/set/'+qt(name)+'/'+qt(loadcase)+'/'+str(loadvalue)+'/'+str(dirX)+'/'+str(dirY)+'/'+str(dirZ)+'', None, None))
+    def setFunctionGeneralData(self, funcID, data:list):
+        ''' Set custom data stored in the selected function
+        
+        Args:
+            funcID: 
+            data: 
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('POST', '/function/gendata/'+str(funcID)+'', None, dict([("data",json.dumps(data))])))
+    def setLoadA(self, load:list):
+        ''' Modify an existing load through an array, conforming to the one got via getLoadA
+        
+        Args:
+            load: Array of strings with: ID,Node,Element,Direction,Load value,Load case
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/load/setA', load, None))
+    def setLoadcaseFactor(self, loadcase, factor):
+        ''' Change load factor for the function associated to the selected loadcase
+        
+        Args:
+            loadcase: Name of the loadcase
+            factor: Factor, cannot be 0
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/setfactor/'+qt(loadcase)+'/'+str(factor)+'', None, None))
+    def setLoadCasePhaseInCombination(self, name, loadcase, phase):
+        ''' Set the phase to a loadcase in an already existing combination, for analysis. Useful in buckling analysis to distinguish constant from variable loading cases
+        
+        Args:
+            name: Name of the combination or buckling analysis
+            loadcase: Name of the loadcase to add to the combination
+            phase: Set phase as integer for the selected loadcase in the combination. 0 for variable load, 1 for constant load
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/combo/setphase/'+qt(name)+'/'+qt(loadcase)+'/'+str(phase)+'', None, None))
+    def setLoadCaseType(self, name, type_):
+        ''' Set loadcase type
+        
+        Args:
+            name: Name of the loadcase
+            type_: Integer type: 0 Dead, 1 Live, 2 Wind, 3 Snow, 4 User, 5 Quake, 6 unknown, 7 Thermal, 8 Prestress
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/settype/'+qt(name)+'/'+str(type_)+'', None, None))
+    def setLoadDurationClass(self, loadcase, durationClass):
+        ''' Set the load duration class for the selected loadcase
+        
+        Args:
+            loadcase: Name of the loadcase
+            durationClass: 0 Permanent, 1 Long term, 2 Medium term, 3 Short term, 4 Istantaneous
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/load/setduration/'+qt(loadcase)+'/'+str(durationClass)+'', None, None))
+    def setLoadsToMass(self, loadcase, factor=1, remove=False):
+        ''' Add, modify or remove a load-to-mass setting.
+        
+        Args:
+            loadcase: Name of the loadcase containing loads
+            factor (optional): Factor for conversion in mass
+            remove (optional): Flag for removing the selected loadcase from setting
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/mass/load2mass/'+qt(loadcase)+'/'+str(factor)+'/'+str(remove)+'', None, None))
+    def setModalAnalysis(self, name, Nmodes, tol=0.0001):
+        ''' Set a modal analysis upon an existing load case
+        
+        Args:
+            name: Name of the loadcase
+            Nmodes: Number of requested modes
+            tol (optional): Tolerance
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/setmodal/'+qt(name)+'/'+str(Nmodes)+'/'+str(tol)+'', None, None))
+    def setNLDanalysis(self, name, tStep, nSteps, tol, iters, seriesID, Xfactor, Yfactor, Zfactor, RXfactor, RYfactor, RZfactor, seriesFactor=1, Mdamp=0, NlGeo=False):
+        ''' Set a non linear dynamic analysis upon an existing load case
+        
+        Args:
+            name: Name of the loadcase
+            tStep: Time step
+            nSteps: Number of steps
+            tol: Tolerance
+            iters: Maximum iterations for each increment
+            seriesID: ID of the series
+            Xfactor: Factor for time series in X direction
+            Yfactor: Factor for time series in Y direction
+            Zfactor: Factor for time series in Z direction
+            RXfactor: Factor for time series in RX direction
+            RYfactor: Factor for time series in RY direction
+            RZfactor: Factor for time series in RZ direction
+            seriesFactor (optional): Factor for the series
+            Mdamp (optional): Mass damping factor
+            NlGeo (optional): Flag for accounting second-order effects
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/setnldyn/'+qt(name)+'/'+str(tStep)+'/'+str(nSteps)+'/'+str(tol)+'/'+str(iters)+'/'+str(seriesID)+'/'+str(Xfactor)+'/'+str(Yfactor)+'/'+str(Zfactor)+'/'+str(RXfactor)+'/'+str(RYfactor)+'/'+str(RZfactor)+'/'+str(seriesFactor)+'/'+str(Mdamp)+'/'+str(NlGeo)+'', None, None))
+    def setNLSanalysis(self, name, tStep, nSteps, tol, iters=10, seriesID=-1, dispControlNode='', dispControlDOF=0, NlGeo=False):
+        ''' Set a non linear static analysis upon an existing load case
+        
+        Args:
+            name: Name of the loadcase
+            tStep: Time step
+            nSteps: Number of steps
+            tol: Tolerance
+            iters (optional): Maximum iterations for each increment
+            seriesID (optional): ID of the series
+            dispControlNode (optional): ID of the node for displacement control
+            dispControlDOF (optional): DOF of the control node for displ. control
+            NlGeo (optional): Flag for accounting second-order effects
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/setnlstatic/'+qt(name)+'/'+str(tStep)+'/'+str(nSteps)+'/'+str(tol)+'/'+str(iters)+'/'+str(seriesID)+'/'+qt(dispControlNode)+'/'+str(dispControlDOF)+'/'+str(NlGeo)+'', None, None))
+    def setPDeltaAnalysis(self, name, tol=0.0001):
+        ''' Set a PDelta analysis from an existing loadcase, if it doesn't contain loads, use addLoadCaseToCombination to add the load contained in other loadcases.
+        
+        Args:
+            name: Name of the loadcase
+            tol (optional): Tolerance
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/setpdelta/'+qt(name)+'/'+str(tol)+'', None, None))
+    def setResponseSpectrumAnalysis(self, direction, loadcase, modesNumber, spectrumFuncID, modalDamping=0.05, factor=1):
+        ''' Set a Response Spectrum analysis on an existing loadcase
+        
+        Args:
+            direction: 1 X, 2 Y, 3 Z
+            loadcase: Name of the seismic loadcase
+            modesNumber: NUmber of modes to be considered
+            spectrumFuncID: ID of the spectral acceleration or displacement function
+            modalDamping (optional): Optional. Modal damping to be assumed. Default is 0.05
+            factor (optional): Optional. Amplification factor. Default is 1
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/setrs/'+str(direction)+'/'+qt(loadcase)+'/'+str(modesNumber)+'/'+str(spectrumFuncID)+'/'+str(modalDamping)+'/'+str(factor)+'', None, None))
+    def setSeismicFloorEccentricity(self, thID, ct=0.05, lam=1):
+        ''' Compute floor torque moments for accounting 5% eccentricity for center of mass of each rigid floor. Rigid diaphragms and masses are required.
+        
+        Args:
+            thID: ID of the spectrum function to be used as reference for total base shear
+            ct (optional): Optional, default 0.05. Coefficient for estimation of fundamental period from EC8 4.6: T1=ct*H^(3/4)
+            lam (optional): Optional, default 1. Coefficient for estimation of base shear as per EC8 4.5: Fb=Sd(T1)*m*lam
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/combo/setseismicecc/'+str(thID)+'/'+str(ct)+'/'+str(lam)+'', None, None))
+    def setSeismicLoadcaseForCombos(self, direction, loadcase, enableFloorEccentricity5=False, seismicCombinationType=0):
+        ''' Set the seismic loadcase for directional combinations (e.g. response spectrum). Repeat the command for other directions.
+        
+        Args:
+            direction: 1 X, 2 Y, 3 Z
+            loadcase: Name of the seismic loadcase
+            enableFloorEccentricity5 (optional): Optional. False as default
+            seismicCombinationType (optional): Optional. 100,30 rule is default (0), use (1) for SRSS rule
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/combo/setseismiclc/'+str(direction)+'/'+qt(loadcase)+'/'+str(enableFloorEccentricity5)+'/'+str(seismicCombinationType)+'', None, None))
+    def setSelfWeight(self, loadcase):
+        ''' Set the loadcase hosting the automatic self-weight
+        
+        Args:
+            loadcase: Name of the loadcase hosting the automatic self-weight
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/load/setsw/'+qt(loadcase)+'', None, None))
+    def setSelfWeightDirection(self, direction):
+        ''' Set the self-weight direction in space
+        
+        Args:
+            direction: Default is -Z=-3. X=1, Y=2, Z=3, -X=-1, -Y=-2, -Z=-3
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/load/setswdir/'+str(direction)+'', None, None))
+    def setSRSScombination(self, name, loadcase, factor, type_=0, servType=0):
+        ''' Set a linear add combination from an existing loadcase. It can be called multiple times.
+        
+        Args:
+            name: Name of the loadcase to transform into a combination, or target combination
+            loadcase: Name of the loadcase to add to the combination
+            factor: Factor for the loadcase to add to the combination
+            type_ (optional): Set the combination type for checking: 0 (default) unknown, 1 ultimate, 2 serviceability, 3 seismic
+            servType (optional): Set the combination type for checking: 0 (default) unknown, 1 characteristic, 2 frequent, 3 quasi-permanent
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/loadcase/combo/setsrss/'+qt(name)+'/'+qt(loadcase)+'/'+str(factor)+'/'+str(type_)+'/'+str(servType)+'', None, None))
+    def valueFromFunction(self, Xval, funcID):
+        ''' Get the value of the selected function corresponding to the desired abscissa
+        
+        Args:
+            Xval: Abscissa
+            funcID: ID of the function
+
+        Returns:
+            The ordinate for the desired abscissa and function.
+        '''
+        return float(self.nfrest('GET', '/function/value/'+str(Xval)+'/'+str(funcID)+'', None, None))
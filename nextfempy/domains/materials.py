@@ -0,0 +1,281 @@
+'''
+NextFEMrest methods for materials and design materials.
+'''
+
+from ..common import sbool, qt, des
+
+class MaterialsMixin:
+
+    def addDesignMatFromLib(self, name):
+        ''' Add a design material from library
+        
+        Args:
+            name: 
+
+        Returns:
+            ID of the added material, 0 if not found
+        '''
+        return int(self.nfrest('POST', '/designmaterial/add/fromlib', name, None))
+    def addDesMaterial(self, name, E, fk, ni=0, type_=0):
+        ''' Add a design material from scratch. Uniaxial type is required (e.g. rebar, FRP, etc.)
+        
+        Args:
+            name: Name of the new design material
+            E: Young's modulus
+            fk: Characteristic strength
+            ni (optional): Optional. Poisson's ratio
+            type_ (optional): Optional. Integer to set materal type for checking: 1 steel, aluminium 2, concrete 3, timber 4, masonry 5, tensionFragile 6
+
+        Returns:
+            ID of the added material
+        '''
+        return int(self.nfrest('GET', '/material/add/des/'+qt(name)+'/'+str(E)+'/'+str(fk)+'/'+str(ni)+'/'+str(type_)+'', None, None))
+    def addIsoMaterial(self, name, E, ni, Wden, fk=0, conductivity=0, specificHeat=0, type_=0):
+        ''' Add an isotropic material from scratch
+        
+        Args:
+            name: Name of the new material
+            E: Young's modulus
+            ni: Poisson's ratio
+            Wden: Weight density
+            fk (optional): Characteristic strength
+            conductivity (optional): Conductivity, for thermal analysis
+            specificHeat (optional): Specific heat, for thermal analysis
+            type_ (optional): Optional. Integer to set materal type for checking: 1 steel, aluminium 2, concrete 3, timber 4, masonry 5, tensionFragile 6
+
+        Returns:
+            ID of the added material
+        '''
+        return int(self.nfrest('GET', '/material/add/iso/'+qt(name)+'/'+str(E)+'/'+str(ni)+'/'+str(Wden)+'/'+str(fk)+'/'+str(conductivity)+'/'+str(specificHeat)+'/'+str(type_)+'', None, None))
+    def addMatFromLib(self, name):
+        ''' Add a material from library
+        
+        Args:
+            name: 
+
+        Returns:
+            ID of the added material, 0 if not found
+        '''
+        return int(self.nfrest('POST', '/material/add/fromlib', name, None))
+    def addOrChangeDesMaterialProperty(self, ID, name, value, units=''):
+        ''' Add or modify a custom property of the selected design material
+        
+        Args:
+            ID: ID of the design material
+            name: Name of the property
+            value: Value of the property as string. Value must use . as decimal separator
+            units (optional): Optional. Units of measure for property value
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/designmaterial/prop/'+str(ID)+'/'+qt(name)+'/'+qt(value)+'/'+qt(units)+'', None, None))
+    def addOrChangeMaterialProperty(self, ID, name, value, units=''):
+        ''' Add or modify a custom property of the selected material
+        
+        Args:
+            ID: ID of the material
+            name: Name of the property
+            value: Value of the property as a string (including name, code, etc.). Value must use . as decimal separator
+            units (optional): Optional. Units of measure for property value
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/material/prop/'+str(ID)+'/'+qt(name)+'/'+qt(value)+'/'+qt(units)+'', None, None))
+    def assignMaterialToElement(self, element, materialID):
+        ''' Assign a selected material to the desired element
+        
+        Args:
+            element: ID of the element
+            materialID: ID of the material
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('GET', '/material/assign/'+qt(element)+'/'+str(materialID)+'', None, None))
+    def getDefinedDesignMaterials(self):
+        ''' Return a list of used design material IDs
+        
+        
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/designmaterials', None, None))
+    def getDefinedMaterials(self):
+        ''' Return a list of used material IDs
+        
+        
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/materials', None, None))
+    def getDesignMaterialProperty(self, ID, name, units=None):
+        ''' Return selected property from a design material
+        
+        Args:
+            ID: Material ID
+            name: Name of the property: alphaT, behaviour, code, E, G, fk, ni, Mden, Wden, type
+            units (optional): String supplied to function to eventually convert units of returned value
+
+        Returns:
+            The requested value as string. Empty in case of error
+        '''
+        return self.nfrest('GET', '/designmaterial/prop/'+qt(ID)+'/'+qt(name)+'', None, dict([("units",units)]))
+    def getDesignMaterialsLibrary(self, filter='', type_=0):
+        ''' Return an array of string containing design material names from built-in library.
+        
+        Args:
+            filter (optional): Optional. String supporting wildcards for material name
+            type_ (optional): Optional. Integer for material type: Steel = 1, Aluminium = 2, Concrete = 3, Timber = 4, Masonry = 5, TensionFragile = 6
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/designmaterials/library/'+qt(filter)+'/'+str(type_)+'', None, None))
+    def getDesignMaterialsLibraryF(self, filename, filter='', type_=0):
+        ''' Return an array of string containing design material names from built-in library.
+        
+        Args:
+            filename: Name of the nfm library, without extension
+            filter (optional): Optional. String supporting wildcards for material name
+            type_ (optional): Optional. Integer for material type: Steel = 1, Aluminium = 2, Concrete = 3, Timber = 4, Masonry = 5, TensionFragile = 6
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/designmaterials/libraryf/'+qt(filename)+'/'+qt(filter)+'/'+str(type_)+'', None, None))
+    def getDesMaterialLibNames(self, subproduct=''):
+        ''' Return an array of string containing design material library names from built-in library.
+        
+        Args:
+            subproduct (optional): Optional. String specifying the subproduct for filtering design material libraries
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/designmaterials/libraries/'+qt(subproduct)+'', None, None))
+    def getMaterialLibNames(self):
+        ''' Return an array of string containing material library names from built-in library.
+        
+        
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/materials/libraries', None, None))
+    def getMaterialProperty(self, ID, name, units=None):
+        ''' Return selected property from a material
+        
+        Args:
+            ID: Material ID
+            name: Name of the property: alphaT, behaviour, code, E, G, fk, ni, Mden, Wden, type
+            units (optional): String supplied to function to eventually convert units of returned value
+
+        Returns:
+            The requested value as string. Empty in case of error
+        '''
+        return self.nfrest('GET', '/material/prop/'+qt(ID)+'/'+qt(name)+'', None, dict([("units",units)]))
+    def getMaterialsLibrary(self, filter='', type_=0):
+        ''' Return an array of string containing material names from built-in library.
+        
+        Args:
+            filter (optional): Optional. String supporting wildcards for material name
+            type_ (optional): Optional. Integer for material type: Steel = 1, Aluminium = 2, Concrete = 3, Timber = 4, Masonry = 5, TensionFragile = 6
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/materials/library/'+qt(filter)+'/'+str(type_)+'', None, None))
+    def getMaterialsLibraryF(self, filename, filter='', type_=0):
+        ''' Return an array of string containing material names from built-in library.
+        
+        Args:
+            filename: Name of the nfm library, without extension
+            filter (optional): Optional. String supporting wildcards for material name
+            type_ (optional): Optional. Integer for material type: Steel = 1, Aluminium = 2, Concrete = 3, Timber = 4, Masonry = 5, TensionFragile = 6
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/materials/libraryf/'+qt(filename)+'/'+qt(filter)+'/'+str(type_)+'', None, None))
+    def getReinfPropertiesNTC(self, matID, secID, CF, betaAng, Hshear, Bshear, outInMPa=False):
+        ''' Get design data for FRP/FRCM strips as per CNR DT 200 Italian code
+        
+        Args:
+            matID: ID of the FRP/FRCM design material
+            secID: ID of the associated section. Must have a material already assigned
+            CF: Confidence factor
+            betaAng: Angle of FRP strips for shear resistance, in degrees
+            Hshear: Height of FRP strips for shear resistance
+            Bshear: Width of FRP strips for shear resistance in section z direction
+            outInMPa (optional): Optional, default is false. Set as true if you want output in MPa
+
+        Returns:
+            A dictionary of string, double values
+        '''
+        return des(self.nfrest('GET', '/material/frpdata/'+str(matID)+'/'+str(secID)+'/'+str(CF)+'/'+str(betaAng)+'/'+str(Hshear)+'/'+str(Bshear)+'/'+str(outInMPa)+'', None, None))
+    def listDesignMaterialCustomProperty(self, ID):
+        ''' Get a list of the custom properties stored in the selected design material
+        
+        Args:
+            ID: ID of the material
+
+        Returns:
+            Array of string with custom properties names. Use getDesignMaterialProperty method to get values.
+        '''
+        return des(self.nfrest('GET', '/designmaterial/proplist/'+str(ID)+'', None, None))
+    def listMaterialCustomProperty(self, ID):
+        ''' Get a list of the custom properties stored in the selected material
+        
+        Args:
+            ID: ID of the material
+
+        Returns:
+            Array of string with custom properties names. Use getMaterialProperty method to get values.
+        '''
+        return des(self.nfrest('GET', '/material/proplist/'+str(ID)+'', None, None))
+    def removeDesMaterialProperty(self, ID, name):
+        ''' Remove a custom property from the selected design material
+        
+        Args:
+            ID: ID of the design material
+            name: Name of the property
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('DELETE', '/designmaterial/prop/'+str(ID)+'/'+qt(name)+'', None, None))
+    def removeMaterial(self, materialID):
+        ''' Remove the selected material
+        
+        Args:
+            materialID: ID of the material
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/material/remove/'+str(materialID)+'', None, None))
+    def removeMaterialProperty(self, ID, name):
+        ''' Remove a custom property from the selected material
+        
+        Args:
+            ID: ID of the material
+            name: Name of the property
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('DELETE', '/material/prop/'+str(ID)+'/'+qt(name)+'', None, None))
+    def setConcretePropertiesNTC(self, matID, fc, isCharacteristic=True, unitsIn='MPa'):
+        ''' Assign a custom compressive strength to a concrete material, recalculating E and ftk as per NTC code
+        
+        Args:
+            matID: ID of the selected material
+            fc: Compressive strength in MPa. If different units are used, specify them in unitsIn
+            isCharacteristic (optional): Optional, default is true. fc is assumed to be a characteristic value. If set to false, it is assumed as an average value
+            unitsIn (optional): Optional, default MPa. String specifying the units of fc
+
+        Returns:
+            The value of the calculated Young's modulus
+        '''
+        return float(self.nfrest('GET', '/material/concretentc/'+str(matID)+'/'+str(fc)+'/'+str(isCharacteristic)+'', None, dict([("unitsIn",unitsIn)])))
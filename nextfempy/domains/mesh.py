@@ -0,0 +1,452 @@
+'''
+NextFEMrest methods for meshing and geometry tools.
+'''
+
+import json
+from ..common import sbool, qt, des
+
+class MeshMixin:
+
+    def addMeshedWall(self, ID, origX, origY, origZ, div1, div2, plan, leng, hei, angle=0, tilt='0', nodeOffset=10000, isHorizontal=False):
+        ''' Add a wall to the model meshed with quad elements
+        
+        Args:
+            ID: ID of the wall
+            origX: X origin coordinate
+            origY: Y origin coordinate
+            origZ: Z origin coordinate
+            div1: Number of division along 1st direction
+            div2: Number of division along 2st direction
+            plan: Plane of the wall, use "XY", "XZ" or "YZ"
+            leng: Lenght of the wall
+            hei: Height of the wall
+            angle (optional): Optional. Angle with respect to the normal of XY plane, or angle with respect to the horizontal for YZ and YZ planes
+            tilt (optional): Optional, default "0". Use "x" or "y" for YZ and YZ planes
+            nodeOffset (optional): Optional, default 10000. Offset for node numbering
+            isHorizontal (optional): Set to true to create vertical section cuts. If omitted or set to false, vertical wall is assumed.
+
+        Returns:
+            A list of nodes for the wall
+        '''
+        return des(self.nfrest('GET', '/op/mesh/addmeshedwall/'+str(ID)+'/'+str(origX)+'/'+str(origY)+'/'+str(origZ)+'/'+str(div1)+'/'+str(div2)+'/'+qt(plan)+'/'+str(leng)+'/'+str(hei)+'/'+str(angle)+'/'+qt(tilt)+'/'+str(nodeOffset)+'/'+str(isHorizontal)+'', None, None))
+    def checkConnectivity(self, notPassedElems=None, overlappedNodes=None):
+        ''' Check overlapped beam nodes and anti-clockwise connectivity for all the other elements. The function always tries to correct incorrect elements, hence subsequent checks could be negative.
+        
+        Args:
+            notPassedElems (optional): Optional. Empty array eventually filled with elements IDs that don't passed the check. Not available in REST API
+            overlappedNodes (optional): Optional. Empty array eventually filled with detected overlapped nodes in Line elements. Not available in REST API
+
+        Returns:
+            True if check has been successful for all elements
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/connectivity'+str(notPassedElems)+'/'+str(overlappedNodes)+'', None, None))
+    def checkFreeNodes(self):
+        ''' Check free nodes in the model
+        
+        
+        Returns:
+            An array of the detected free nodes.
+        '''
+        return des(self.nfrest('GET', '/op/mesh/findfreenodes', None, None))
+    def checkLineElements(self):
+        ''' Check line elements and mesh if necessary.
+        
+        
+        Returns:
+            The number of meshed line elements
+        '''
+        return int(self.nfrest('GET', '/op/mesh/lineelems', None, None))
+    def checkOverlappedElements(self):
+        ''' Check overlapped elements in the model
+        
+        
+        Returns:
+            A list of overlapped elements
+        '''
+        return des(self.nfrest('GET', '/op/mesh/findoverlappedelements', None, None))
+    def convertToMeshedSection(self, sectionID):
+        ''' Convert an existing section to a new tria-meshed section. Remember to re-assign the new section to elements with assignSectionToElement
+        
+        Args:
+            sectionID: ID of the original section
+
+        Returns:
+            The ID of the new meshed section, 0 if errors occur
+        '''
+        return int(self.nfrest('GET', '/op/mesh/meshedsection/'+str(sectionID)+'', None, None))
+    def divideHexa(self, hexaID, divX, divY, divZ):
+        ''' Divide an existing Hexa element
+        
+        Args:
+            hexaID: ID of the existing Hexa
+            divX: Number of divisions in X direction
+            divY: Number of divisions in Y direction
+            divZ: Number of divisions in Z direction
+
+        Returns:
+            An array containing the IDs of newly created Hexa elements
+        '''
+        return des(self.nfrest('GET', '/op/mesh/dividehexa/'+qt(hexaID)+'/'+str(divX)+'/'+str(divY)+'/'+str(divZ)+'', None, None))
+    def divideLine(self, lines:list, fractions:list):
+        ''' Divide existing Line elements
+        
+        Args:
+            lines: Array of Line elements to be divided
+            fractions: Division pattern, normalized to 1
+
+        Returns:
+            An array containing the IDs of newly created Line elements
+        '''
+        return des(self.nfrest('GET', '/op/mesh/divideline', None, dict([("lines",json.dumps(lines)),("fractions",json.dumps(fractions))])))
+    def divideLineByNodes(self, line, nodes:list):
+        ''' Divide existing Line elements by nodes
+        
+        Args:
+            line: Line element ID
+            nodes: Array of nodes ID
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/dividelinebynodes/'+qt(line)+'', None, dict([("nodes",json.dumps(nodes))])))
+    def divideQuad(self, quadID, divX, divY):
+        ''' Divide an existing Quad element
+        
+        Args:
+            quadID: ID of the existing Quad
+            divX: Number of divisions in X direction
+            divY: Number of divisions in Y direction
+
+        Returns:
+            An array containing the IDs of newly created Quad elements
+        '''
+        return des(self.nfrest('GET', '/op/mesh/dividequad/'+qt(quadID)+'/'+str(divX)+'/'+str(divY)+'', None, None))
+    def divideWedge(self, wedgeID, div):
+        ''' Divide an existing Wedge element along its extrusion direction
+        
+        Args:
+            wedgeID: ID of the existing Wedge
+            div: Number of divisions
+
+        Returns:
+            An array containing the IDs of newly created Wedge elements
+        '''
+        return des(self.nfrest('GET', '/op/mesh/dividewedge/'+qt(wedgeID)+'/'+str(div)+'', None, None))
+    def generateFrame(self, baysX, baysY, sn, ddx, ddy, ddz, sx, sy, sz, matx, maty, matz, lc1='', lc2='', lc3='', Lval1=0, Lval2=0, Lval3=0, loadBeamX=False, rigidfloor=False):
+        ''' Generate a spatial frame of desired characteristics
+        
+        Args:
+            baysX: Bays in X direction
+            baysY: Bays in Y direction
+            sn: Number of storey
+            ddx: Bay width along X dir.
+            ddy: Bay width along Y dir.
+            ddz: Storey height
+            sx: Section ID for beams in X
+            sy: Section ID for beams in Y
+            sz: Section ID for columns
+            matx: Material ID for beams in X
+            maty: Material ID for beams in Y
+            matz: Material ID for columns
+            lc1 (optional): Loadcase in which storing loads
+            lc2 (optional): Loadcase in which storing loads
+            lc3 (optional): Loadcase in which storing loads
+            Lval1 (optional): Load value for loadcase 1
+            Lval2 (optional): Load value for loadcase 2
+            Lval3 (optional): Load value for loadcase 3
+            loadBeamX (optional): True for loading beams in X, false for loading beams in Y dir.
+            rigidfloor (optional): True to force rigid floor contraints
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/generateframe/'+str(baysX)+'/'+str(baysY)+'/'+str(sn)+'/'+str(ddx)+'/'+str(ddy)+'/'+str(ddz)+'/'+str(sx)+'/'+str(sy)+'/'+str(sz)+'/'+str(matx)+'/'+str(maty)+'/'+str(matz)+'/'+qt(lc1)+'/'+qt(lc2)+'/'+qt(lc3)+'/'+str(Lval1)+'/'+str(Lval2)+'/'+str(Lval3)+'/'+str(loadBeamX)+'/'+str(rigidfloor)+'', None, None))
+    def getAlignedNodes(self, n1, n2, tol=0):
+        ''' Return nodes aligned with the given two as input
+        
+        Args:
+            n1: 1st node as vert3 structure
+            n2: 2nd node as vert3 structure
+            tol (optional): Optional. Tolerance needed to check alignement. Consider to lower it if n1 and n2 are close.
+
+        Returns:
+            A list of nodal IDs
+        '''
+        return des(self.nfrest('GET', '/op/mesh/alignednodes/'+str(tol)+'', None, dict([("n1",n1),("n2",n2)])))
+    def getNodesFromCoords(self, dir_, coord, tol=1E-06):
+        ''' Get nodes having the specified coordinates
+        
+        Args:
+            dir_: 1 for X, 2 for Y and 3 for Z
+            coord: Values of the selected coordinate
+            tol (optional): Optional. Tolerance, default values is 1.e-6
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/op/mesh/nodesbycoords/'+str(dir_)+'/'+str(coord)+'/'+str(tol)+'', None, None))
+    def getNodesOnSides(self, nodes:list, tol=4.94065645841247E-324):
+        ''' Get nodes on borders of the selected rectangular shell region
+        
+        Args:
+            nodes: Array of nodes
+            tol (optional): Optional. Tolerance
+
+        Returns:
+            Array of size 4 with bottom, right, top and left nodes
+        '''
+        return des(self.nfrest('GET', '/op/mesh/borders/'+str(tol)+'', None, dict([("nodes",json.dumps(nodes))])))
+    def getRigidDiaphragms(self):
+        ''' Gives the list of master nodes in rigid diaphragms
+        
+        
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/op/mesh/rigiddiaph', None, None))
+    def mergeImportedLines(self, lineIDs:list):
+        ''' Merge selected Line elements with imported results
+        
+        Args:
+            lineIDs: Array of Lines to be merged
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/mergeimportedlines', None, dict([("lines",json.dumps(lineIDs))])))
+    def mergeLines(self, lineIDs:list):
+        ''' Merge selected Line elements
+        
+        Args:
+            lineIDs: Array of Lines to be merged
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/mergelines', None, dict([("lines",json.dumps(lineIDs))])))
+    def mergeOverlappedNodes(self):
+        ''' Merge overlapped nodes in the model
+        
+        
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/mergenodes', None, None))
+    def meshAreaTria(self, filledContour:list, emptyContour:list, maxTriaArea, useAllNodes=False, belt=0, useQuad=False, minAngle=20):
+        ''' Mesh a planar area with triangular or quadrilateral elements
+        
+        Args:
+            filledContour: List of nodes defining the filled part
+            emptyContour: List of nodes defining holes
+            maxTriaArea: Maximum area for each triangular element
+            useAllNodes (optional): Optional. Include internal nodes in mesh - only for convex regions
+            belt (optional): Optional. Size of the optional belt, external to the convex polygon
+            useQuad (optional): Optional. Use Quad where possible. Not recommended, as can generate degenerated quad elements
+            minAngle (optional): Optional. Mininum angle in degrees for triangles generation, default is 20°
+
+        Returns:
+            An array containing the IDs of newly created Tria elements
+        '''
+        return des(self.nfrest('GET', '/op/mesh/tria/'+str(maxTriaArea)+'/'+str(useAllNodes)+'/'+str(belt)+'/'+str(useQuad)+'/'+str(minAngle)+'', None, dict([("filled",json.dumps(filledContour)),("empty",json.dumps(emptyContour))])))
+    def meshAreaTriaMulti(self, filledContour:list, emptyContour:list, maxTriaArea, useAllNodes=False, belt=0, useQuad=False, minAngle=20):
+        ''' Mesh planar areas with triangular or quadrilateral elements. This function has to be used when defined more than one hole per meshed region.
+        
+        Args:
+            filledContour: List of array of nodes defining the filled part
+            emptyContour: List of array of nodes defining holes
+            maxTriaArea: Maximum area for each triangular element
+            useAllNodes (optional): Optional. Include internal nodes in mesh - only for convex regions
+            belt (optional): Optional. Size of the optional belt, external to the convex polygon
+            useQuad (optional): Optional. Use Quad where possible. Not recommended, as can generate degenerated quad elements
+            minAngle (optional): Optional. Mininum angle in degrees for triangles generation, default is 20°
+
+        Returns:
+            An array containing the IDs of newly created Tria elements
+        '''
+        return des(self.nfrest('GET', '/op/mesh/triamulti/'+str(maxTriaArea)+'/'+str(useAllNodes)+'/'+str(belt)+'/'+str(useQuad)+'/'+str(minAngle)+'', None, dict([("filled",json.dumps(filledContour)),("empty",json.dumps(emptyContour))])))
+    def meshQuad2Wall(self, quadIDs:list, isHorizontal=False):
+        ''' Mesh and group into wall a single quad element.
+        
+        Args:
+            quadIDs: List of ID of the quads to mesh.
+            isHorizontal (optional): Set to true to create vertical section cuts. If omitted or set to false, vertical wall is assumed.
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/quad2wall/'+str(isHorizontal)+'', None, dict([("quadIDs",json.dumps(quadIDs))])))
+    def moveNodes(self, nodes:list, displX, displY, displZ, absolutePosition=False):
+        ''' Move nodes
+        
+        Args:
+            nodes: Array of nodes ID to be rotated
+            displX: Displacement in X direction
+            displY: Displacement in Y direction
+            displZ: Displacement in Z direction
+            absolutePosition (optional): Optional. True if previous parameters indicate absolute position in space
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/movenodes/'+str(displX)+'/'+str(displY)+'/'+str(displZ)+'/'+str(absolutePosition)+'', None, dict([("nodes",json.dumps(nodes))])))
+    def quad2tria(self, elem):
+        ''' Transform a quad element into 2 tria elements
+        
+        Args:
+            elem: ID of the quad element
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/quad2tria/'+qt(elem)+'', None, None))
+    def removeFreeNodes(self):
+        ''' Find and remove free nodes in the model
+        
+        
+        Returns:
+            True
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/removefreenodes', None, None))
+    def removeLink(self, node):
+        ''' Removes a rigid link from the model.
+        
+        Args:
+            node: ID of the slave node.
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('DELETE', '/op/mesh/constraint/'+qt(node)+'', None, None))
+    def removeOverlappedElements(self, tol=-1):
+        ''' Find and remove overlapped elements in the model, handling members and groups
+        
+        Args:
+            tol (optional): Optional parameter for tolerance
+
+        Returns:
+            True
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/removeoverlappedelements'+str(tol)+'', None, None))
+    def removeRigidDiaphragms(self):
+        ''' Remove all the rigid floor constraints in the model.
+        
+        
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('DELETE', '/op/mesh/rigiddiaph', None, None))
+    def renumberElements(self, initialID, step_):
+        ''' Renumber elements in the model
+        
+        Args:
+            initialID: ID for 1st element, must be > 0
+            step_: Increment in numbering
+
+        Returns:
+            True if renumbering has been applied, false otherwise
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/renumber/elements/'+str(initialID)+'/'+str(step_)+'', None, None))
+    def renumberElementsByCoordinates(self, dir1, dir2):
+        ''' Renumber elements in the model with spatial criteria, using element centroid
+        
+        Args:
+            dir1: Index of first criterium: 1 by X, 2 by Y, 3 by Z
+            dir2: Index of second criterium: 1 by X, 2 by Y, 3 by Z
+
+        Returns:
+            True if renumbering has been applied, false otherwise
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/renumber/elementsbycoords/'+str(dir1)+'/'+str(dir2)+'', None, None))
+    def renumberNodes(self, initialID, step_):
+        ''' Renumber nodes in the model
+        
+        Args:
+            initialID: ID for 1st node, must be > 0
+            step_: Increment in numbering
+
+        Returns:
+            True if renumbering has been applied, false otherwise
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/renumber/nodes/'+str(initialID)+'/'+str(step_)+'', None, None))
+    def renumberNodesByCoordinates(self, dir1, dir2):
+        ''' Renumber nodes in the model with spatial criteria
+        
+        Args:
+            dir1: Index of first criterium: 1 by X, 2 by Y, 3 by Z
+            dir2: Index of second criterium: 1 by X, 2 by Y, 3 by Z
+
+        Returns:
+            True if renumbering has been applied, false otherwise
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/renumber/nodesbycoords/'+str(dir1)+'/'+str(dir2)+'', None, None))
+    def rotateNodes(self, nodes:list, axisX, axisY, axisZ, angle):
+        ''' Rotate nodes by moving them
+        
+        Args:
+            nodes: Array of nodes ID to be rotated
+            axisX: X component of rotation axis
+            axisY: Y component of rotation axis
+            axisZ: Z component of rotation axis
+            angle: Angle of rotation, in degrees
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/rotatenodes/'+str(axisX)+'/'+str(axisY)+'/'+str(axisZ)+'/'+str(angle)+'', None, dict([("nodes",json.dumps(nodes))])))
+    def scaleNodes(self, nodes:list, scaleX, scaleY, scaleZ, scaleCenterX=0, scaleCenterY=0, scaleCenterZ=0):
+        ''' Scale nodes
+        
+        Args:
+            nodes: Array of nodes ID to be scaled
+            scaleX: Scale factor in X direction
+            scaleY: Scale factor in Y direction
+            scaleZ: Scale factor in Z direction
+            scaleCenterX (optional): Scale center - X coordinate, optional, default 0
+            scaleCenterY (optional): Scale center - Y coordinate, optional, default 0
+            scaleCenterZ (optional): Scale center - Z coordinate, optional, default 0
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/scalenodes/'+str(scaleX)+'/'+str(scaleY)+'/'+str(scaleZ)+'/'+str(scaleCenterX)+'/'+str(scaleCenterY)+'/'+str(scaleCenterZ)+'', None, dict([("nodes",json.dumps(nodes))])))
+    def setConstraint(self, n, master, x, y, z, rx, ry, rz):
+        ''' Set a general constraint between 2 nodes
+        
+        Args:
+            n: ID of slave node
+            master: ID of master node
+            x: True to apply constraint to this DoF
+            y: True to apply constraint to this DoF
+            z: True to apply constraint to this DoF
+            rx: True to apply constraint to this DoF
+            ry: True to apply constraint to this DoF
+            rz: True to apply constraint to this DoF
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/mesh/constraint/'+qt(n)+'/'+qt(master)+'/'+str(x)+'/'+str(y)+'/'+str(z)+'/'+str(rx)+'/'+str(ry)+'/'+str(rz)+'', None, None))
+    def setRigidDiaphragms(self, constraintType=0, nodesList:list=None, masterNode='', restrainZMaster=False):
+        ''' Set rigid diaphragms for all model. Floors heigths are taken automatically, restrained floors are skipped.
+        
+        Args:
+            constraintType (optional): 0 for automatic master node, 1 to add a master node, 2 to manually specify master node for a selected group of nodes
+            nodesList (optional): Optional list containing nodes ID for the rigid floor. If not specified, all nodes are taken
+            masterNode (optional): ID of master node, only if constraintType = 2
+            restrainZMaster (optional): Restrain the master node in Z direction, only if constraintType is 1 or 2
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('PUT', '/op/mesh/rigiddiaph/'+str(constraintType)+'/'+qt(masterNode)+'/'+str(restrainZMaster)+'', None, dict([("nodesList",json.dumps(nodesList))])))
+    def setRigidLink(self, n1, n2):
+        ''' Set a rigid link between two nodes.
+        
+        Args:
+            n1: ID of first node (master)
+            n2: ID of second node (slave)
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('PUT', '/op/mesh/rigidlink/'+qt(n1)+'/'+qt(n2)+'', None, None))
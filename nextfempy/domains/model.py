@@ -0,0 +1,515 @@
+'''
+NextFEMrest methods for model files, units, groups, options and views.
+'''
+
+import json
+from ..common import sbool, qt, des
+
+class ModelMixin:
+
+    def addCustomTranslations(self, path):
+        ''' Add custom translations to the model, from a CSV file with ";"-separated entries. The file must be encoded in UTF-8
+        
+        Args:
+            path: 
+
+        Returns:
+            
+        '''
+        return sbool(self.nfrest('POST', '/op/trasl'+qt(path)+'', None, None))
+    def addDrawing(self, name, elems:list, group, plane, scaleDenom, paperX, paperY, asMember=False):
+        ''' Add a drawing export to the model
+        
+        Args:
+            name: Name of the construction drawing
+            elems: List of elements to be rendered. Choose a list of elements or a group
+            group: Name of group to be rendered. Choose a list of elements or a group
+            plane: Plane applicable only when a group is selected. "XY"=0, "XZ"=1, "YZ"=2
+            scaleDenom: 
+            paperX: Size of the paper in cm. It affects layout
+            paperY: Size of the paper in cm. It affects layout
+            asMember (optional): Option applicable only when a group is selected. If active, renders the group as a member (horizontal development)
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/model/drawing/'+qt(name)+'/'+qt(group)+'/'+str(plane)+'/'+str(scaleDenom)+'/'+str(paperX)+'/'+str(paperY)+'/'+str(asMember)+'', elems, None))
+    def addGroup(self, name):
+        ''' Add an empty group to the model
+        
+        Args:
+            name: 
+
+        Returns:
+            False if already existing, True otherwise
+        '''
+        return sbool(self.nfrest('GET', '/group/add/'+qt(name)+'', None, None))
+    def addObject(self, o, other=0):
+        ''' Directly add object to model
+        
+        Args:
+            o: Object to be added
+            other (optional): Flag to distinguish object types
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('POST', '/model/addobject/'+str(other)+'', o, None))
+    def addOrModifyCustomData(self, key, value):
+        ''' Add a data field into the model
+        
+        Args:
+            key: Key, must be unique
+            value: Value to store, in string format, or object already serialize in JSON
+
+        Returns:
+            True
+        '''
+        return sbool(self.nfrest('POST', '/model/customdata/'+qt(key)+'', value, None))
+    def assignToGroup(self, name, nodes:list, elements:list, clear=False):
+        ''' Assign nodes and/or elements to a previously defined group
+        
+        Args:
+            name: Name of the group
+            nodes: Array of nodes
+            elements: Array of elements
+            clear (optional): Optional. Clear assigned nodes and elements
+
+        Returns:
+            False if not existing, True otherwise
+        '''
+        return sbool(self.nfrest('GET', '/group/assign/'+qt(name)+'/'+str(clear)+'', None, dict([("nodes",json.dumps(nodes)),("elements",json.dumps(elements))])))
+    def changeDefSolverType(self, type_):
+        ''' Change the system of equation type in standard solver
+        
+        Args:
+            type_: 0 for default (slow, lability detection), 1 for DSS (fast, less memory consumption), 2 for SPOOLES (fast)
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/opt/changedefsolvertype/'+str(type_)+'', None, None))
+    def changeSolver(self, type_, path=''):
+        ''' Change the default solver
+        
+        Args:
+            type_: 0 for default solver, 1 for OpenSees, 2 for CalculiX
+            path (optional): Optional. Full path to the solver assembly.
+
+        Returns:
+            True if successful, False if path is missing
+        '''
+        return sbool(self.nfrest('GET', '/op/opt/changesolver/'+str(type_)+'', None, dict([("path",path)])))
+    def clearSelection(self):
+        ''' Clear selected items. REST version only against local instance of NextFEM Designer
+        
+        
+        Returns:
+            
+        '''
+        return sbool(self.nfrest('GET', '/op/clearselection', None, None))
+    def colorizeModel(self, criterion, excl:list=None):
+        ''' Colorize with random colors all the elements
+        
+        Args:
+            criterion: 1 by section, 2 by material, 3 by group
+            excl (optional): Array of integer color to be avoided (e.g. selection colors). Optional - if null, selection colors are used
+
+        Returns:
+            
+        '''
+        return self.nfrest('GET', '/model/colors/colorize/'+str(criterion)+'', None, dict([("excl",json.dumps(excl))]))
+    def convertUnits(self, length, force):
+        ''' Convert model and results to the specified new units.
+        
+        Args:
+            length: Units for length (e.g. "m", "in", ...)
+            force: Units for force (e.g. "N", "kipf", ...)
+
+        Returns:
+            
+        '''
+        return self.nfrest('GET', '/units/convertunits/'+qt(length)+'/'+qt(force)+'', None, None)
+    def convertValue(self, value, OldUnits, NewUnits):
+        ''' Convert units of a value.
+        
+        Args:
+            value: Numerical value to convert
+            OldUnits: Old units of the input value. Eg. kN/cm^2
+            NewUnits: Target units for the input value. Eg. N/mm^2
+
+        Returns:
+            Converted value
+        '''
+        return float(self.nfrest('GET', '/units/convert/'+str(value)+'', None, dict([("OldUnits",OldUnits),("NewUnits",NewUnits)])))
+    def convertValueAuto(self, value, OldUnits):
+        ''' Convert units of a value in current model units.
+        
+        Args:
+            value: Numerical value to convert
+            OldUnits: Units of the input value. Eg. kN/cm^2
+
+        Returns:
+            Array of string with converted value and target units
+        '''
+        return des(self.nfrest('GET', '/units/convertauto/'+str(value)+'', None, dict([("OldUnits",OldUnits)])))
+    def CustomLicense(self, lic):
+        ''' Check if a license key is available
+        
+        Args:
+            lic
+
+        Returns:
+            True or False
+        '''
+        return sbool(self.nfrest('GET', '/op/lic', None, dict([("val",lic)])))
+    def defaultColors(self):
+        ''' Revert to default colors
+        
+        
+        Returns:
+            
+        '''
+        return self.nfrest('GET', '/model/colors/default', None, None)
+    def deleteGroup(self, name):
+        ''' Remove the specified group from model
+        
+        Args:
+            name: Name of the group to be removed
+
+        Returns:
+            False if not existing, True otherwise
+        '''
+        return sbool(self.nfrest('GET', '/group/delete/'+qt(name)+'', None, None))
+    def getBillOfMaterials(self, selectedElements:list=None):
+        ''' Get the bill of materials of the current model, or for the selected elements
+        
+        Args:
+            selectedElements (optional): Array of selected element IDs
+
+        Returns:
+            The bill of materials as a list of string
+        '''
+        return des(self.nfrest('POST', '/model/bom', selectedElements, None))
+    def getCenterOfMass(self, selectedNodes:list=None):
+        ''' Return the center of mass of the model, or of the selected nodes
+        
+        Args:
+            selectedNodes (optional): Array of selected node IDs
+
+        Returns:
+            Array in form (x,y,z)
+        '''
+        return des(self.nfrest('POST', '/model/centermass', selectedNodes, None))
+    def getCustomData(self, key):
+        ''' Get custom data stored in the model.
+        
+        Args:
+            key: Key, must be unique
+
+        Returns:
+            False if the key was not found
+        '''
+        return self.nfrest('GET', '/model/customdata/'+qt(key)+'', None, None)
+    def getDrawing(self, name):
+        ''' Get the drawing as bytes to be saved in a DXF file
+        
+        Args:
+            name: Name of the construction drawing
+
+        Returns:
+            Array of bytes representing the DXF file
+        '''
+        return self.nfrestB('GET', '/model/drawing/'+qt(name)+'', None, None)
+    def getElementsFromGroup(self, name):
+        ''' Get elements from group
+        
+        Args:
+            name: Group name
+
+        Returns:
+            
+        '''
+        return des(self.nfrest('GET', '/group/elements/'+qt(name)+'', None, None))
+    def getForceUnit(self):
+        ''' Get the unit for force in the model
+        
+        
+        Returns:
+            The unit for force in the model
+        '''
+        return self.nfrest('GET', '/units/f', None, None)
+    def getGreekLetter(self, input):
+        ''' Return the corresponding letter from Greek alphabet
+        
+        Args:
+            input: Latin letter to convert
+
+        Returns:
+            String
+        '''
+        return self.nfrest('GET', '/op/greek'+qt(input)+'', None, None)
+    def getGroups(self):
+        ''' Get all groups in the model
+        
+        
+        Returns:
+            An array with names of groups
+        '''
+        return des(self.nfrest('GET', '/groups', None, None))
+    def getLanguage(self):
+        ''' Get language code (eg. "en" for English)
+        
+        
+        Returns:
+            String
+        '''
+        return self.nfrest('GET', '/op/opt/lang', None, None)
+    def getLenUnit(self):
+        ''' Get the unit for length in the model
+        
+        
+        Returns:
+            The unit for length in the model
+        '''
+        return self.nfrest('GET', '/units/l', None, None)
+    def getLoadingData(self):
+        ''' Retrieve custom data about wind, snow and other custom loading
+        
+        
+        Returns:
+            String
+        '''
+        return self.nfrest('GET', '/model/loadingdata', None, None)
+    def getNodesFromGroup(self, name):
+        ''' Get nodes from group
+        
+        Args:
+            name: Group name
+
+        Returns:
+            
+        '''
+        return des(self.nfrest('GET', '/group/nodes/'+qt(name)+'', None, None))
+    def getSeparator(self):
+        ''' Returns separator used by the program
+        
+        
+        Returns:
+            String value
+        '''
+        return self.nfrest('GET', '/op/sep', None, None)
+    def getStoreyStiffnessTable(self, lc):
+        ''' Get the storey stiffness table for a given loadcase
+        
+        Args:
+            lc: Name of the loadcase that contains a set of lateral forces, for each storey
+
+        Returns:
+            Storey stiffness table as a list of list of string
+        '''
+        return des(self.nfrest('GET', '/model/storeystiff/'+qt(lc)+'', None, None))
+    def getTotalMass(self, selectedNodes:list=None):
+        ''' Return the total mass of the model, or of the selected nodes
+        
+        Args:
+            selectedNodes (optional): Array of selected node IDs
+
+        Returns:
+            Array in form (Mx,My,Mz,Ix,Iy,Iz)
+        '''
+        return des(self.nfrest('POST', '/model/totalmass', selectedNodes, None))
+    def getUserViews(self):
+        ''' Get a list of names of user-defined model views
+        
+        
+        Returns:
+            An array of strings
+        '''
+        return des(self.nfrest('GET', '/model/userviews', None, None))
+    def getVersion(self):
+        ''' Get API version
+        
+        
+        Returns:
+            A decimal containing the version. Eg. 1.52 stands for v1.5, patch 2
+        '''
+        return float(self.nfrest('GET', '/version', None, None))
+    def is64bit(self):
+        ''' Check if running program is at 64bit
+        
+        
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/op/is64bit', None, None))
+    def LangTrasl(self, input):
+        ''' Return a translation of the input string depending on the current locale.
+        
+        Args:
+            input: 
+
+        Returns:
+            
+        '''
+        return self.nfrest('POST', '/op/trasl', input, None)
+    def mergeModelData(self, modeldata):
+        ''' Merge a new model to the existing one
+        
+        Args:
+            modeldata: Model in JSON format
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('PUT', '/model/data'+qt(modeldata)+'', None, None))
+    def newModel(self):
+        ''' Clear model
+        
+        
+        Returns:
+            
+        '''
+        return self.nfrest('GET', '/op/new', None, None)
+    def openModel(self, filename):
+        ''' Open the specified NXF or XML model
+        
+        Args:
+            filename: Path to the model
+
+        Returns:
+            True if opening has been successful
+        '''
+        return sbool(self.nfrest('GET', '/op/open', None, dict([("path",filename)])))
+    def reDo(self):
+        ''' Redo the last undone operation.
+        
+        
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/redo', None, None))
+    def refreshDesignerView(self, vstate=0, resize=False):
+        ''' Refresh view of the remote connected instance of NextFEM Designer. Valid only after connect() command.
+        
+        Args:
+            vstate (optional): Optional. Int value from ViewState enumerator, default is Reset (0): (0) Reset, (1) NoOperation, 
+ (2) NodesVisible, (3) NodesNumber, (4) ElementsNumber, (5) ExtrudedView, (6) ColorElements_Uniform, (7) ColorElements_BySection, 
+ (8) ColorElements_ByMaterial, (9) ColorElements_ByGroup, (10) ShowLocalAxes, (11) GetScreenshot, (12) ShowAllLoads, 
+ (13) ShowDisplResults, (14) HighlightSelectedNodes, (15) HighlightSelectedElems, (16) ClearNodesHighlight, 
+ (17) ClearElementsHighlight, (18) ShowNodesCheckResults, (19) ShowElementsCheckResults, (20) ShowFrameForcesResults, 
+ (21) ShowFrameForcesResultsN, (22) ShowFrameForcesResultsVy, (23) ShowFrameForcesResultsVz, (24) ShowFrameForcesResultsT, 
+ (25) ShowFrameForcesResultsMy, (26) ShowFrameForcesResultsMz, (27) ShowReactionsResults, (28) ShowReactionsResultsRX, 
+ (29) ShowReactionsResultsRY, (30) ShowReactionsResultsRZ, (31) ShowReactionsResultsRrX, (32) ShowReactionsResultsRrY, 
+ (33) ShowReactionsResultsRrZ, (34) ShowAreaForcesResults, (35) ShowAreaForcesResultsFxx, (36) ShowAreaForcesResultsFyy, 
+ (37) ShowAreaForcesResultsFxy, (38) ShowAreaForcesResultsMxx, (39) ShowAreaForcesResultsMyy, 
+ (40) ShowAreaForcesResultsMxy, (41) ShowAreaForcesResultsQxz, (42) ShowAreaForcesResultsQyz, 
+ (43) ShowAreaForcesResultsMxWAbot, (44) ShowAreaForcesResultsMyWAbot, (45) ShowAreaForcesResultsMxWAtop, 
+ (46) ShowAreaForcesResultsMyWAtop, (47) ShowAreaForcesResultsMxWA, (48) ShowAreaForcesResultsMyWA, 
+ (49) ShowSoilPressure, (50) ApplyColors, (51) ShowSelectionOnly, (52) HideSelection, (53) ShowAll, (54) FitView, 
+ (55) UserView
+            resize (optional): Optional, default to false (no view resize)
+
+        Returns:
+            
+        '''
+        return self.nfrest('GET', '/op/view/'+str(vstate)+'/'+str(resize)+'', None, None)
+    def removeCustomData(self, key):
+        ''' Remove a custom data field from the model
+        
+        Args:
+            key: Key, must be unique
+
+        Returns:
+            True if successful, False is the key was not present
+        '''
+        return sbool(self.nfrest('DELETE', '/model/customdata/'+qt(key)+'', None, None))
+    def removeDrawing(self, name):
+        ''' Remove the selected drawing from the model
+        
+        Args:
+            name: Name of the construction drawing
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('DELETE', '/model/drawing/'+qt(name)+'', None, None))
+    def requestDesignerUndo(self, ustate=0):
+        ''' Request undo to remote connected instance of NextFEM Designer. Valid only after connect() command.
+        
+        Args:
+            ustate (optional): Optional. Int value from UndoOps enumerator, default is Normal (0), NormalDontAsk (1), NoUndo (2).
+
+        Returns:
+            
+        '''
+        return self.nfrest('GET', '/op/undo/'+str(ustate)+'', None, None)
+    def saveForUndo(self, op):
+        ''' Request an undo before to continue
+        
+        Args:
+            op: Description for the operation to be done
+
+        Returns:
+            True
+        '''
+        return sbool(self.nfrest('POST', '/op/saveundo', op, None))
+    def saveModel(self, filename):
+        ''' Save the model and results with desired name
+        
+        Args:
+            filename: 
+
+        Returns:
+            True if the model has been loaded correctly, False otherwise
+        '''
+        return sbool(self.nfrest('GET', '/op/save', None, dict([("path",filename)])))
+    def saveOptions(self):
+        ''' Save program options, including solver preferences, tolerances, etc.
+        
+        
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/opt/saveopts', None, None))
+    def setLanguage(self, code):
+        ''' Set language code
+        
+        Args:
+            code: Supported codes: "en", "it", "es".
+
+        Returns:
+            
+        '''
+        return self.nfrest('POST', '/op/opt/lang/'+qt(code)+'', None, None)
+    def setUnits(self, length, force):
+        ''' Set units in the model
+        
+        Args:
+            length: String with desider unit, eg. "m"
+            force: String with desider unit, eg. "kN"
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('GET', '/units/set/'+qt(length)+'/'+qt(force)+'', None, None))
+    def showViewport(self, path, width=600, height=400):
+        ''' Open the viewport showing the model in path. REST version only against local instance of NextFEM Designer
+        
+        Args:
+            path: 
+            width (optional): 
+            height (optional): 
+
+        Returns:
+            
+        '''
+        return sbool(self.nfrest('GET', '/op/showvieport/'+qt(path)+'/'+str(width)+'/'+str(height)+'', None, None))
+    def unDo(self):
+        ''' Undo the last operation.
+        
+        
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/op/undo', None, None))
@@ -0,0 +1,261 @@
+'''
+NextFEMrest methods for nodes, nodal coordinates and restraints.
+'''
+
+import json
+from ..common import sbool, qt, des
+
+class NodesMixin:
+
+    def addNode(self, x, y, z, lcs1X=0, lcs1Y=0, lcs1Z=0, lcs2X=0, lcs2Y=0, lcs2Z=0):
+        ''' Add a new node to the model. Existing results will be deleted.
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            z: Z coordinate
+            lcs1X (optional): 1st vector of nodal local axis: component x
+            lcs1Y (optional): 1st vector of nodal local axis: component y
+            lcs1Z (optional): 1st vector of nodal local axis: component z
+            lcs2X (optional): 2nd vector of nodal local axis: component x
+            lcs2Y (optional): 2nd vector of nodal local axis: component y
+            lcs2Z (optional): 2nd vector of nodal local axis: component z
+
+        Returns:
+            The ID of the added node, empty string in case of error
+        '''
+        return self.nfrest('GET', '/node/add/'+str(x)+'/'+str(y)+'/'+str(z)+'/'+str(lcs1X)+'/'+str(lcs1Y)+'/'+str(lcs1Z)+'/'+str(lcs2X)+'/'+str(lcs2Y)+'/'+str(lcs2Z)+'', None, None)
+    def addNodeWithID(self, x, y, z, ID):
+        ''' Add a new node with ID
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            z: Z coordinate
+            ID: ID of the node to be added to the model
+
+        Returns:
+            True if successful, False if node is already existing
+        '''
+        return sbool(self.nfrest('GET', '/node/add/'+str(x)+'/'+str(y)+'/'+str(z)+'/'+qt(ID)+'', None, None))
+    def getAreaByNodes(self, nodes:list):
+        ''' Get area from the selected nodes
+        
+        Args:
+            nodes: Array of nodes ID
+
+        Returns:
+            Area inside the polygon described by nodes
+        '''
+        return float(self.nfrest('POST', '/node/area', nodes, None))
+    def getBC(self, node):
+        ''' Get restraints of a single node
+        
+        Args:
+            node: ID of the node
+
+        Returns:
+            Boolean array containing True if DOF is restrained
+        '''
+        return des(self.nfrest('GET', '/bc/get/'+qt(node)+'', None, None))
+    def getConnectedElements(self, node, onlyOfType=-1):
+        ''' Get all the elements connected to the specified node
+        
+        Args:
+            node: Node ID
+            onlyOfType (optional): Optional. Select only elements of type: unk = 0,line = 1,tria = 2,quad = 3,hexa = 4,wedge = 5,tetra = 6,user = 10,line3 = 20,quad8 = 21,hexa16 = 22,hexa20 = 23,tetra10 = 24,tria6 = 25,wedge15 = 26,spring2nodes = 40
+
+        Returns:
+            An array of element IDs
+        '''
+        return des(self.nfrest('GET', '/node/connectedelements/'+qt(node)+'/'+str(onlyOfType)+'', None, None))
+    def getControlNode(self):
+        ''' Return the ID of the higher central node.
+        
+        
+        Returns:
+            ID of node. -1 if not found
+        '''
+        return self.nfrest('GET', '/op/controlnode', None, None)
+    def getCornerNodes(self, nodes:list, lcs:list):
+        ''' Return the corner nodes in a list of nodes
+        
+        Args:
+            nodes: List of node IDs
+            lcs: vert3 structure for defining first and second spatial directions
+
+        Returns:
+            A list of corner nodes, max 4
+        '''
+        return des(self.nfrest('GET', '/op/corners', None, dict([("nodes",json.dumps(nodes)),("lcs",json.dumps(lcs))])))
+    def getFreeNodeID(self):
+        ''' Get the next free node ID
+        
+        
+        Returns:
+            Int64 value
+        '''
+        return self.nfrest('GET', '/op/freenodeid', None, None)
+    def getMaxNodeID(self):
+        ''' Get the max free node ID
+        
+        
+        Returns:
+            Int64 value
+        '''
+        return self.nfrest('GET', '/op/maxnodeid', None, None)
+    def getNodeCoordinates(self, ID):
+        ''' Returns node coordinates as double array
+        
+        Args:
+            ID: ID of the node
+
+        Returns:
+            Array of doubles
+        '''
+        return des(self.nfrest('GET', '/node/'+qt(ID)+'', None, None))
+    def getNodeInfo(self, node):
+        ''' Get text with node properties
+        
+        Args:
+            node: ID of the node
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/node/info/'+qt(node)+'', None, None))
+    def getNodePosition(self, ID):
+        ''' Returns node position as vert3 object
+        
+        Args:
+            ID: ID of the node
+
+        Returns:
+            A vert3 object
+        '''
+        return self.nfrest('GET', '/nodev/'+qt(ID)+'', None, None)
+    def getNodeProperty(self, ID, name):
+        ''' Return selected property of node
+        
+        Args:
+            ID: ID of the node
+            name: Name of the property: num, nonStr, isJoint
+
+        Returns:
+            The requested value as string. Empty in case of error
+        '''
+        return self.nfrest('GET', '/node/prop/'+qt(ID)+'/'+qt(name)+'', None, None)
+    def isRestrained(self, node):
+        ''' Tell if the node is restrained or not
+        
+        Args:
+            node: ID of the node
+
+        Returns:
+            True if almost one dof is restrained
+        '''
+        return sbool(self.nfrest('GET', '/bc/node/'+qt(node)+'', None, None))
+    def removeBC(self, node):
+        ''' Remove boundary condition for a node
+        
+        Args:
+            node: Node ID
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('DELETE', '/bc/'+qt(node)+'', None, None))
+    def removeNode(self, ID):
+        ''' Remove the node with the specified ID from the model
+        
+        Args:
+            ID: ID of the node to be removed
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('DELETE', '/node/'+qt(ID)+'', None, None))
+    def removeNodeCS(self, num):
+        ''' Remove a previously defined Local Coordinate System from a node.
+        
+        Args:
+            num: Node number
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('DELETE', '/node/cs/'+qt(num)+'', None, None))
+    def setBC(self, node, x, y, z, rx, ry, rz):
+        ''' Set or change the boundary conditions (restraints) for a node
+        
+        Args:
+            node: Node to be restrained
+            x: True if restrained
+            y: True if restrained
+            z: True if restrained
+            rx: True if restrained
+            ry: True if restrained
+            rz: True if restrained
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/bc/set/'+qt(node)+'/'+str(x)+'/'+str(y)+'/'+str(z)+'/'+str(rx)+'/'+str(ry)+'/'+str(rz)+'', None, None))
+    def setNodeAsJoint(self, num, status):
+        ''' Set the Joint property of the specified node.
+        
+        Args:
+            num: Number of the node
+            status: True or False to activate or deactivate the IsJoint flag
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/node/setjoint/'+qt(num)+'/'+str(status)+'', None, None))
+    def setNodeCoordinates(self, ID, coords:list):
+        ''' Set or change node coordinates as double array
+        
+        Args:
+            ID: ID of the node
+            coords: Array of size 3 containing nodal coordinates
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('POST', '/node/'+qt(ID)+'', coords, None))
+    def setNodeCS(self, num, x1, y1, z1, x2, y2, z2):
+        ''' Set the Local Coordinate System of a node by specifying the first 2 vectors.
+        
+        Args:
+            num: Number of the node
+            x1: x coord. of 1st vector
+            y1: y coord. of 1st vector
+            z1: z coord. of 1st vector
+            x2: x coord. of 2st vector
+            y2: y coord. of 2st vector
+            z2: z coord. of 2st vector
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/node/cs/'+qt(num)+'/'+str(x1)+'/'+str(y1)+'/'+str(z1)+'/'+str(x2)+'/'+str(y2)+'/'+str(z2)+'', None, None))
+    def setNodePosition(self, node):
+        ''' Set or change node position as vert3 object
+        
+        Args:
+            node: vert3 structure of the node
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('POST', '/nodev', node, None))
+    def vertexFromNode(self, node):
+        ''' Get vertex from node for calculation with vert3 class.
+        
+        Args:
+            node: ID of the node
+
+        Returns:
+            A vert3 object
+        '''
+        return self.nfrest('GET', '/node/vertex/'+qt(node)+'', None, None)
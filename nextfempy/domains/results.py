@@ -0,0 +1,412 @@
+'''
+NextFEMrest methods for analysis runs and results.
+'''
+
+from ..common import sbool, qt, des
+
+class ResultsMixin:
+
+    def applyButterworthFilter(self, values:list, samplingF, cutF, order, lowPass):
+        ''' Apply Butterworth filter to the 2-columns input data
+        
+        Args:
+            values: 2-columns input data (eg. time vs. displacements)
+            samplingF: Sampling frequency
+            cutF: Cut-off frequency
+            order: Order of the filter, an even number greater or equal to 2
+            lowPass: True if low-pass, false if high-pass
+
+        Returns:
+            Array of double
+        '''
+        return des(self.nfrest('POST', '/op/bwfilter/'+str(samplingF)+'/'+str(cutF)+'/'+str(order)+'/'+str(lowPass)+'', values, None))
+    def deleteResults(self):
+        ''' Delete the stored results.
+        
+        
+        Returns:
+            True if operations goes fine.
+        '''
+        return sbool(self.nfrest('GET', '/res/delete', None, None))
+    def getBeamDeflection(self, num, loadcase, time, type_, station):
+        ''' Get beam deflection for the selected element, loadcase, time and station
+        
+        Args:
+            num: element no.
+            loadcase: 
+            time: For linear analysis, set as 1
+            type_: 1=local x, 2=local y, 3=local z, 4=local rx, 5=local ry, 6=local rz
+            station: Usually a beam has 5 stations (1, 2, 3, 4 or 5)
+
+        Returns:
+            The requested value. 0 if something went wrong.
+        '''
+        return float(self.nfrest('GET', '/res/beamdeflection/'+qt(num)+'/'+qt(loadcase)+'/'+qt(time)+'/'+str(type_)+'/'+str(station)+'', None, None))
+    def getBeamDeflections(self, num, loadcase, type_, offsetL=0, numStations=21, time='1'):
+        ''' Get the beam deflections for the selected number of stations along beam
+        
+        Args:
+            num: Element no.
+            loadcase: Loadcase name
+            type_: 1=N, 2=Vy, 3=Vz, 4=Mt, 5=My, 6=Mz
+            offsetL (optional): Optional. Offset to queue output to another beam (length of the preceding beam).
+            numStations (optional): Optional. Number of stations, default is 21.
+            time (optional): Optional. Time for non-linear analysis. Default is 1.
+
+        Returns:
+            A check structure with positions and values
+        '''
+        return self.nfrest('GET', '/res/beamdeflections/'+qt(num)+'/'+qt(loadcase)+'/'+str(type_)+'/'+str(offsetL)+'/'+str(numStations)+'/'+qt(time)+'', None, None)
+    def getBeamForce(self, num, loadcase, time, type_, station):
+        ''' Get beam force for the selected element, loadcase, time and station
+        
+        Args:
+            num: element no.
+            loadcase: loadcase name
+            time: For linear analysis, set as 1
+            type_: 1=N, 2=Vy, 3=Vz, 4=Mt, 5=My, 6=Mz
+            station: Usually a beam has 5 stations (1, 2, 3, 4 or 5)
+
+        Returns:
+            The requested value. 0 if something went wrong.
+        '''
+        return float(self.nfrest('GET', '/res/beamforce/'+qt(num)+'/'+qt(loadcase)+'/'+qt(time)+'/'+str(type_)+'/'+str(station)+'', None, None))
+    def getBeamForce2(self, num, loadcase, time, type_, absissa):
+        ''' Get beam force for the selected element, loadcase, time and absissa
+        
+        Args:
+            num: element no.
+            loadcase: loadcase name
+            time: For linear analysis, set as 1
+            type_: 1=N, 2=Vy, 3=Vz, 4=Mt, 5=My, 6=Mz
+            absissa: Usually a beam has 5 stations (1, 2, 3, 4 or 5)
+
+        Returns:
+            The requested value. 0 if something went wrong.
+        '''
+        return float(self.nfrest('GET', '/res/beamforce2/'+qt(num)+'/'+qt(loadcase)+'/'+qt(time)+'/'+str(type_)+'/'+str(absissa)+'', None, None))
+    def getBeamForces(self, num, loadcase, station, time='1'):
+        ''' Get all the beam forces for the selected element, loadcase, time and station
+        
+        Args:
+            num: Element no.
+            loadcase: Loadcase name
+            station: Usually a beam has 5 stations (1, 2, 3, 4 or 5)
+            time (optional): Optional. Default is 1 = linear analysis
+
+        Returns:
+            A vector of size 6. Null vector if something went wrong
+        '''
+        return des(self.nfrest('GET', '/res/beamforces/'+qt(num)+'/'+qt(loadcase)+'/'+str(station)+'/'+qt(time)+'', None, None))
+    def getBeamForcesAtNode(self, elem, node, loadcase, time='1'):
+        ''' Get all the forces for the selected element at the specified node (beam end), loadcase, time and station
+        
+        Args:
+            elem: Element no.
+            node: Reference node no.
+            loadcase: Loadcase name
+            time (optional): Optional. Default is 1 = linear analysis
+
+        Returns:
+            A vector of size 6. Null vector if something went wrong
+        '''
+        return des(self.nfrest('GET', '/res/beamforcesatnode/'+qt(elem)+'/'+qt(node)+'/'+qt(loadcase)+'/'+qt(time)+'', None, None))
+    def getBeamForcesDiagram(self, num, loadcase, type_, offsetL=0, numStations=21, time='1'):
+        ''' Get the beam diagrams values for the selected number of stations along beam
+        
+        Args:
+            num: Element no.
+            loadcase: Loadcase name
+            type_: 1=N, 2=Vy, 3=Vz, 4=Mt, 5=My, 6=Mz
+            offsetL (optional): Optional. Offset to queue output to another beam (length of the preceding beam).
+            numStations (optional): Optional. Number of stations, default is 21.
+            time (optional): Optional. Time for non-linear analysis. Default is 1.
+
+        Returns:
+            A check structure with positions and values
+        '''
+        return self.nfrest('GET', '/res/beamdiagram/'+qt(num)+'/'+qt(loadcase)+'/'+str(type_)+'/'+str(offsetL)+'/'+str(numStations)+'/'+qt(time)+'', None, None)
+    def getBeamForcesEnvelopeTable(self, num, stationsMode, loadcases:list=None):
+        ''' Get beam forces consistent envelope, as a table. Envelopes are made on specified loadcases, or on all result cases. Suitable for many combinations or for time-history analyses.
+        
+        Args:
+            num: Element no.
+            stationsMode: 0 for 5 stations, 1 for 3 stations, 2 for I and J, 3 for I only, 4 for J only, 5 for M only, 6 for 1/4, 7 for 3/4, 8 for M and 1/4 and 3/4, 9 for 1/4 and 3/4
+            loadcases (optional): Array of reference loadcases.
+
+        Returns:
+            A table as a list of string arrays.
+        '''
+        return des(self.nfrest('POST', '/res/beamforcesenvtable/'+qt(num)+'/'+str(stationsMode)+'', loadcases, None))
+    def getFirstMode(self, ct=0.05, direction=0):
+        ''' Get from results or estimate the fundamental period of the structure. If no results are available, relationship as per EC8 4.6 is used.
+        
+        Args:
+            ct (optional): Optional, default 0.05. Coefficient for estimation of fundamental period from EC8 4.6: T1=ct*H^(3/4)
+            direction (optional): Optional, default 0 (no specific direction). Direction of the seismic action to get proper period
+
+        Returns:
+            The first period of the model
+        '''
+        return float(self.nfrest('GET', '/res/firstmode/'+str(ct)+'/'+str(direction)+'', None, None))
+    def getLastRunLog(self):
+        ''' Get analysis log for the last run
+        
+        
+        Returns:
+            An array of string, empty if not available
+        '''
+        return des(self.nfrest('GET', '/op/runlog', None, None))
+    def getMaxMinBeamForces(self, sectionID, type_):
+        ''' Get maximum and minimum beam forces from elements having the same section, in all loadcases and all stations
+        
+        Args:
+            sectionID: Section ID
+            type_: 1=N, 2=Vy, 3=Vz, 4=Mt, 5=My, 6=Mz
+
+        Returns:
+            An array of length 2 containing max and min force for the desired type
+        '''
+        return des(self.nfrest('GET', '/res/maxminbeamforces/'+str(sectionID)+'/'+str(type_)+'', None, None))
+    def getMaxMinNodeDispl(self, dir_, nodes:list=None):
+        ''' Get maximum and minimum nodal displacement from all nodal results.
+        
+        Args:
+            dir_: Direction: 1 xyz, 2 x, 3 y, 4 z, 5 xy, 6 yz, 7 xz, 8 rxyz (rotations)
+            nodes (optional): 
+
+        Returns:
+            
+        '''
+        return des(self.nfrest('POST', '/res/maxmindispl/'+str(dir_)+'', nodes, None))
+    def getMaxMinWoodArmerMoments(self, elementID):
+        ''' Get maximum and minimun Wood-Armer moments from elements in the same group of the selected element
+        
+        Args:
+            elementID: One element in wall or slab group
+
+        Returns:
+            An array of length 2 containing max and min moments in this order: bottom dir.x, botton dir.y, top dir.x, top dir.y
+        '''
+        return des(self.nfrest('GET', '/res/maxminwoodarmer/'+str(elementID)+'', None, None))
+    def getMaxMinWoodArmerMoments(self, groupName):
+        ''' Get maximum and minimun Wood-Armer moments from elements in the same group of the selected element
+        
+        Args:
+            groupName: Wall or slab group name
+
+        Returns:
+            An array of length 2 containing max and min moments in this order: bottom dir.x, botton dir.y, top dir.x, top dir.y
+        '''
+        return des(self.nfrest('GET', '/res/maxminwoodarmerg/'+qt(groupName)+'', None, None))
+    def getModalPeriod(self, num, loadcase):
+        ''' Get a modal period of the structure or the buckling factor
+        
+        Args:
+            num: Number of the mode
+            loadcase: Name of the loadcase
+
+        Returns:
+            0 if not found or error
+        '''
+        return float(self.nfrest('GET', '/res/period/'+str(num)+'/'+qt(loadcase)+'', None, None))
+    def getModes(self, loadcase=None):
+        ''' Get the number of available modes in results
+        
+        Args:
+            loadcase (optional): Optional. Name of the loadcase, if empty the first avaialble modal o response spectrum data is used
+
+        Returns:
+            loadcase parameters is passed by reference, hence the selected loadcase is returned if loadcase is empty
+        '''
+        return int(self.nfrest('GET', '/res/modes/'+str(loadcase)+'', None, None))
+    def getNodalDisp(self, num, loadcase, time, direction):
+        ''' Get nodal displacement from the selected loadcase and time
+        
+        Args:
+            num: node no.
+            loadcase: loadcase name
+            time: time
+            direction: Global direction: 1=X, 2=Y, 3=Z, 4=RX, 5=RY, 6=RZ
+
+        Returns:
+            The requested value. 0 if something went wrong.
+        '''
+        return float(self.nfrest('GET', '/res/displacement/'+qt(num)+'/'+qt(loadcase)+'/'+qt(time)+'/'+str(direction)+'', None, None))
+    def getNodalReact(self, num, loadcase, time, direction):
+        ''' Get nodal reaction from the selected loadcase and time
+        
+        Args:
+            num: node no.
+            loadcase: loadcase name
+            time: time
+            direction: Global direction: 1=X, 2=Y, 3=Z, 4=RX, 5=RY, 6=RZ
+
+        Returns:
+            The requested value. 0 if something went wrong.
+        '''
+        return float(self.nfrest('GET', '/res/reaction/'+qt(num)+'/'+qt(loadcase)+'/'+qt(time)+'/'+str(direction)+'', None, None))
+    def getNodalShellForce(self, num, loadcase, time, type_):
+        ''' Get nodal shell forces from nodes connected to shell elements
+        
+        Args:
+            num: Node number
+            loadcase: Loadcase name
+            time: Time value in results, for linear analyses is 1
+            type_: Name of the property to get
+
+        Returns:
+            The requested value. 0 if something went wrong.
+        '''
+        return float(self.nfrest('GET', '/res/nodalshellforce/'+qt(num)+'/'+qt(loadcase)+'/'+qt(time)+'/'+qt(type_)+'', None, None))
+    def getNodalStress(self, num, loadcase, time, type_):
+        ''' Get stress from node
+        
+        Args:
+            num: Node number
+            loadcase: Loadcase name
+            time: Time value in results, for linear analyses is 1
+            type_: Name of the property to get
+
+        Returns:
+            The requested value. 0 if something went wrong.
+        '''
+        return float(self.nfrest('GET', '/res/nodalstress/'+qt(num)+'/'+qt(loadcase)+'/'+qt(time)+'/'+qt(type_)+'', None, None))
+    def getParticipatingMassesRatios(self, mode, loadcase):
+        ''' Get ratios of participating masses from modal or response spectrum analysis
+        
+        Args:
+            mode: Mode number
+            loadcase: Name of the loadcase
+
+        Returns:
+            Array of double
+        '''
+        return des(self.nfrest('GET', '/res/partmasses/'+str(mode)+'/'+qt(loadcase)+'', None, None))
+    def getParticipationFactors(self, mode, loadcase):
+        ''' Get participation factors from modal or response spectrum analysis
+        
+        Args:
+            mode: Mode number
+            loadcase: Name of the loadcase
+
+        Returns:
+            Array of double
+        '''
+        return des(self.nfrest('GET', '/res/partfactors/'+str(mode)+'/'+qt(loadcase)+'', None, None))
+    def getResultHistory(self, loadcase, itemID, resultType, resultID1=0, resultID2=0):
+        ''' Get result history for the selected quantity
+        
+        Args:
+            loadcase: Name of the loadcase
+            itemID: Node or element ID
+            resultType: Time=0, nodal displ.=1, nodal velocity=2, nodal acceleration=3, nodal reaction=4, nodal force=5, nodal stress=6, nodal strain=7,
+ beam force=8, beam deflection=9, spring state variable=10, nodal temperture=11
+            resultID1 (optional): Required for all types of data except time and temperature, starts at 1
+            resultID2 (optional): Required for beam data, 1=N/x, 2=Vy/y, 3=Vz/z, 4=Mt/rx, 5=My/ry, 6=Mz/rz
+
+        Returns:
+            Array of double
+        '''
+        return des(self.nfrest('GET', '/res/hist/'+qt(loadcase)+'/'+qt(itemID)+'/'+str(resultType)+'/'+str(resultID1)+'/'+str(resultID2)+'', None, None))
+    def getSectionCutForce(self, groupName, loadcase, time, type_):
+        ''' Get section cut force for the selected section cut, loadcase, time and DoF
+        
+        Args:
+            groupName: Name of section cut group
+            loadcase: Loadcase name
+            time: For linear analysis, set as 1
+            type_: 1=N, 2=Vy, 3=Vz, 4=Mt, 5=My, 6=Mz
+
+        Returns:
+            The requested value. 0 if something went wrong.
+        '''
+        return float(self.nfrest('GET', '/res/sectioncutforce/'+qt(groupName)+'/'+qt(loadcase)+'/'+qt(time)+'/'+str(type_)+'', None, None))
+    def getSoilPressureAtNode(self, node, loadcase, time='1'):
+        ''' Return the soil pressure (positive if compression on soil) in Z global direction
+        
+        Args:
+            node: Reference node
+            loadcase: Name of the loadcase
+            time (optional): Optional, time of result, default is 1
+
+        Returns:
+            Double value
+        '''
+        return float(self.nfrest('GET', '/res/soilpressureatnode/'+qt(node)+'/'+qt(loadcase)+'/'+qt(time)+'', None, None))
+    def getTimePeriods(self, lc):
+        ''' Returns time/period values in results for the desired loadcase
+        
+        Args:
+            lc: The desired loadcase
+
+        Returns:
+            Return nothing if empty results
+        '''
+        return des(self.nfrest('GET', '/res/periods/'+qt(lc)+'', None, None))
+    def hasResults(self, loadcase=''):
+        ''' Flag indicating if model has results
+        
+        Args:
+            loadcase (optional): Optional. Loadcase for results
+
+        Returns:
+            A boolean flag, True if any kind of result is present
+        '''
+        return sbool(self.nfrest('GET', '/res', None, dict([("lc",loadcase)])))
+    def LaunchLoadCase(self, loadcase, outOfProc=False, noWindow=False):
+        ''' Launch a single loadcase calculation, not waiting for finishing
+        
+        Args:
+            loadcase: The loadcase name to run
+            outOfProc (optional): If true, run the model out of process
+            noWindow (optional): If true, hide the solver window or its output lines from console. Applicable only if out of process is active
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('GET', '/op/launchlc/'+qt(loadcase)+'/'+str(outOfProc)+'/'+str(noWindow)+'', None, None))
+    def LaunchModel(self, outOfProc=False, noWindow=False):
+        ''' Launch entire model calculation, not waiting for finishing
+        
+        Args:
+            outOfProc (optional): If true, run the model out of process
+            noWindow (optional): If true, hide the solver window or its output lines from console. Applicable only if out of process is active
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('GET', '/op/launchmodel/'+str(outOfProc)+'/'+str(noWindow)+'', None, None))
+    def mergeModelResults(self, modelresults):
+        ''' Merge a new set of results to the existing ones
+        
+        Args:
+            modelresults: Results in JSON format
+
+        Returns:
+            
+        '''
+        return sbool(self.nfrest('PUT', '/model/results'+qt(modelresults)+'', None, None))
+    def RunLoadCase(self, loadcase, outOfProc=False, noWindow=False):
+        ''' Run a single loadcase
+        
+        Args:
+            loadcase: 
+            outOfProc (optional): If true, run the loadcase out of process
+            noWindow (optional): If true, hide the solver window or its output lines from console. Applicable only if out of process is active
+
+        Returns:
+            The first error encountered in analysis. If successful returns empty string.
+        '''
+        return self.nfrest('GET', '/op/runlc/'+qt(loadcase)+'/'+str(outOfProc)+'/'+str(noWindow)+'', None, None)
+    def RunModel(self, outOfProc=False, noWindow=False):
+        ''' Run entire model
+        
+        Args:
+            outOfProc (optional): If true, run the model out of process
+            noWindow (optional): If true, hide the solver window or its output lines from console. Applicable only if out of process is active
+
+        Returns:
+            The first error encountered in analysis. If successful returns empty string.
+        '''
+        return self.nfrest('GET', '/op/run/'+str(outOfProc)+'/'+str(noWindow)+'', None, None)
@@ -0,0 +1,1071 @@
+'''
+NextFEMrest methods for sections, section rebars and section calculations.
+'''
+
+import json
+from ..common import sbool, qt, des
+
+class SectionsMixin:
+
+    def addBoxSection(self, Lz, Ly, tw, tf1, tf2):
+        ''' Add a new beam box section to the model.
+        
+        Args:
+            Lz: Outer base
+            Ly: Outer height
+            tw: Wall thickness
+            tf1: Top flange thickness
+            tf2: Bottom flange thickness
+
+        Returns:
+            The ID assigned to the section.
+        '''
+        return int(self.nfrest('GET', '/section/add/box/'+str(Lz)+'/'+str(Ly)+'/'+str(tw)+'/'+str(tf1)+'/'+str(tf2)+'', None, None))
+    def addCircleInSection(self, sectionID, diameter, centerX, centerY, isEmpty=False, material=0, doNotCenter=False):
+        ''' Add a circular figure in the selected section
+        
+        Args:
+            sectionID: ID of the section
+            diameter: Diameter
+            centerX: Center X
+            centerY: Center Y
+            isEmpty (optional): Optional, True if figure is a hole
+            material (optional): Optional, ID of the figure material
+            doNotCenter (optional): Optional, avoid section centering
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/add/addcirc/'+str(sectionID)+'/'+str(diameter)+'/'+str(centerX)+'/'+str(centerY)+'/'+str(isEmpty)+'/'+str(material)+'/'+str(doNotCenter)+'', None, None))
+    def addCircSection(self, D):
+        ''' Add a new beam circular section to the model.
+        
+        Args:
+            D: Diameter D
+
+        Returns:
+            The ID assigned to the section.
+        '''
+        return int(self.nfrest('GET', '/section/add/circ/'+str(D)+'', None, None))
+    def addCSection(self, Lz, Ly, tw, tf1, tf2, Lz2=0):
+        ''' Add a new beam C section to the model.
+        
+        Args:
+            Lz: Outer base
+            Ly: Outer height
+            tw: Wall thickness
+            tf1: Top flange thickness
+            tf2: Bottom flange thickness
+            Lz2 (optional): Outer bottom base, if different from top
+
+        Returns:
+            The ID assigned to the section.
+        '''
+        return int(self.nfrest('GET', '/section/add/cshape/'+str(Lz)+'/'+str(Ly)+'/'+str(tw)+'/'+str(tf1)+'/'+str(tf2)+'/'+str(Lz2)+'', None, None))
+    def addDCSection(self, Lz, Ly, tw, tf1, tf2, gap, Lz2=0):
+        ''' Add a new beam double-C section to the model.
+        
+        Args:
+            Lz: Outer base
+            Ly: Outer height
+            tw: Wall thickness
+            tf1: Top flange thickness
+            tf2: Bottom flange thickness
+            gap: Gap between single profiles
+            Lz2 (optional): Outer bottom base, if different from top
+
+        Returns:
+            The ID assigned to the section.
+        '''
+        return int(self.nfrest('GET', '/section/add/doublecshape/'+str(Lz)+'/'+str(Ly)+'/'+str(tw)+'/'+str(tf1)+'/'+str(tf2)+'/'+str(gap)+'/'+str(Lz2)+'', None, None))
+    def addDLSection(self, Lz, Ly, tw, tf1, gap):
+        ''' Add a new beam double L section to the model.
+        
+        Args:
+            Lz: Outer base
+            Ly: Outer height
+            tw: Wall thickness
+            tf1: Bottom flange thickness
+            gap: Gap between single profiles
+
+        Returns:
+            The ID assigned to the section.
+        '''
+        return int(self.nfrest('GET', '/section/add/doublelshape/'+str(Lz)+'/'+str(Ly)+'/'+str(tw)+'/'+str(tf1)+'/'+str(gap)+'', None, None))
+    def addDTSection(self, Lz, Ly, tw, tf1, tf2, Lz2=0):
+        ''' Add a new beam double-T section to the model.
+        
+        Args:
+            Lz: Outer base
+            Ly: Outer height
+            tw: Wall thickness
+            tf1: Top flange thickness
+            tf2: Bottom flange thickness
+            Lz2 (optional): Outer bottom base, if different from top
+
+        Returns:
+            The ID assigned to the section.
+        '''
+        return int(self.nfrest('GET', '/section/add/dtshape/'+str(Lz)+'/'+str(Ly)+'/'+str(tw)+'/'+str(tf1)+'/'+str(tf2)+'/'+str(Lz2)+'', None, None))
+    def addFillInSection(self, sectionID, x:list, y:list, material=0, doNotCenter=False):
+        ''' Add a filled figure in an already defined beam section
+        
+        Args:
+            sectionID: ID of the section
+            x: Array of x coordinates
+            y: Array of y coordinates
+            material (optional): Optional, ID of the figure material
+            doNotCenter (optional): Optional, avoid section centering
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/add/fill/'+str(sectionID)+'/'+str(material)+'/'+str(doNotCenter)+'', None, dict([("x",json.dumps(x)),("y",json.dumps(y))])))
+    def addHoleInSection(self, sectionID, x:list, y:list, material=0, doNotCenter=False):
+        ''' Add and empty figure in an already defined beam section
+        
+        Args:
+            sectionID: ID of the section
+            x: Array of x coordinates
+            y: Array of y coordinates
+            material (optional): Optional, ID of the figure material
+            doNotCenter (optional): Optional, avoid section centering
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/add/hole/'+str(sectionID)+'/'+str(material)+'/'+str(doNotCenter)+'', None, dict([("x",json.dumps(x)),("y",json.dumps(y))])))
+    def addLayeredPlanarSection(self, layerThicknesses:list, layerMaterials:list):
+        ''' Add a new layered planar section to the model
+        
+        Args:
+            layerThicknesses: Array of double with layer thicknesses
+            layerMaterials: Array of integers with layer materials
+
+        Returns:
+            The ID assigned to the section
+        '''
+        return int(self.nfrest('GET', '/section/add/layeredplanar', None, dict([("layerThicknesses",json.dumps(layerThicknesses)),("layerMaterials",json.dumps(layerMaterials))])))
+    def addLongitRebarInSection(self, sectionID, X, Y, area, matID, rectBase=0, strandTens=0):
+        ''' Add a longitudinal bar to a section
+        
+        Args:
+            sectionID: ID of the section
+            X: X coordinate in transversal section
+            Y: Y coordinate in transversal section
+            area: Area of the rebar
+            matID: ID of the associated design material
+            rectBase (optional): Optional. Rectangular width if layer is added instead of bar
+            strandTens (optional): Optional. Tension for strand
+
+        Returns:
+            Bar is added if area is bigger of the eventual bar in the same position. To avoid this, clear rebar prior to use this command
+        '''
+        return sbool(self.nfrest('GET', '/section/rebar/long/'+qt(sectionID)+'/'+str(X)+'/'+str(Y)+'/'+str(area)+'/'+str(matID)+'/'+str(rectBase)+'/'+str(strandTens)+'', None, None))
+    def addLongitRebarInSection(self, sectionID, X, Y, area, matID, rectBase=0, strandTens=0):
+        ''' Add a longitudinal bar to a section
+        
+        Args:
+            sectionID: ID of the section
+            X: X coordinate in transversal section
+            Y: Y coordinate in transversal section
+            area: Area of the rebar
+            matID: ID of the associated design material
+            rectBase (optional): Optional. Rectangular width if layer is added instead of bar
+            strandTens (optional): Optional. Tension for strand
+
+        Returns:
+            Bar is added if area is bigger of the eventual bar in the same position. To avoid this, clear rebar prior to use this command
+        '''
+        return sbool(self.nfrest('GET', '/section/rebar/long/'+str(sectionID)+'/'+str(X)+'/'+str(Y)+'/'+str(area)+'/'+str(matID)+'/'+str(rectBase)+'/'+str(strandTens)+'', None, None))
+    def addLSection(self, Lz, Ly, tw, tf1):
+        ''' Add a new beam L section to the model.
+        
+        Args:
+            Lz: Outer base
+            Ly: Outer height
+            tw: Wall thickness
+            tf1: Bottom flange thickness
+
+        Returns:
+            The ID assigned to the section.
+        '''
+        return int(self.nfrest('GET', '/section/add/lshape/'+str(Lz)+'/'+str(Ly)+'/'+str(tw)+'/'+str(tf1)+'', None, None))
+    def addOmegaSection(self, Lz, Ly, tw, d):
+        ''' Add a new beam omega or cold-formed C section to the model.
+        
+        Args:
+            Lz: Inner base
+            Ly: Outer height
+            tw: Wall thickness
+            d: Outer flange length
+
+        Returns:
+            The ID assigned to the section.
+        '''
+        return int(self.nfrest('GET', '/section/add/omega/'+str(Lz)+'/'+str(Ly)+'/'+str(tw)+'/'+str(d)+'', None, None))
+    def addPipeSection(self, D, t):
+        ''' Add a new beam pipe section to the model.
+        
+        Args:
+            D: Outer diameter D
+            t: Thickness t
+
+        Returns:
+            The ID assigned to the section.
+        '''
+        return int(self.nfrest('GET', '/section/add/pipe/'+str(D)+'/'+str(t)+'', None, None))
+    def addPlanarSection(self, t):
+        ''' Add a new planar section to the model
+        
+        Args:
+            t: Thickness
+
+        Returns:
+            The ID assigned to the section
+        '''
+        return int(self.nfrest('GET', '/section/add/planar/'+str(t)+'', None, None))
+    def addRebarPatternInSection(self, pattern, sectionID, numBars, rebCover, matID, area, netSpacing=0):
+        ''' Adds rebars by pattern in the selected section.
+        
+        Args:
+            pattern: Top=0, Bottom=1, Equal spacing=2, Wall=3, Lateral=4, Left=5, Right=6
+            sectionID: ID of the section
+            numBars: Number of bars to be placed
+            rebCover: Rebar cover from the centre of the first bar to the border of the section. It applies in both directions
+            matID: ID of the associated design material
+            area: Area of each single rebar rebar
+            netSpacing (optional): Spacing of net in walls. Effective only if pattern is 3.
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('GET', '/section/rebar/pattern/'+str(pattern)+'/'+str(sectionID)+'/'+str(numBars)+'/'+str(rebCover)+'/'+str(matID)+'/'+str(area)+'/'+str(netSpacing)+'', None, None))
+    def addRebarRowInSection(self, sectionID, numBars, latCover, hei, matID, Dmm, rebarPreStress=0):
+        ''' Add a rebar layer at a specified height of the section
+        
+        Args:
+            sectionID: ID of the section
+            numBars: Number of bars to be placed
+            latCover: Rebar cover from the centre of the first bar to the lateral side of the section
+            hei: Height of the rebar layer, from the bottom of the section
+            matID: ID of the associated design material
+            Dmm: Diameter of bars in mm
+            rebarPreStress (optional): 0 for steel rebar, otherwise prestress is specified
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/rebar/row/'+str(sectionID)+'/'+str(numBars)+'/'+str(latCover)+'/'+str(hei)+'/'+str(matID)+'/'+str(Dmm)+'/'+str(rebarPreStress)+'', None, None))
+    def addRectangleInSection(self, sectionID, b, h, centerX, centerY, isEmpty=False, material=0, doNotCenter=False):
+        ''' Add a rectangular figure in the selected section
+        
+        Args:
+            sectionID: ID of the section
+            b: Base
+            h: Height
+            centerX: Center X
+            centerY: Center Y
+            isEmpty (optional): Optional, True if figure is a hole
+            material (optional): Optional, ID of the figure material
+            doNotCenter (optional): Optional, avoid section centering
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/add/addrect/'+str(sectionID)+'/'+str(b)+'/'+str(h)+'/'+str(centerX)+'/'+str(centerY)+'/'+str(isEmpty)+'/'+str(material)+'/'+str(doNotCenter)+'', None, None))
+    def addRectSection(self, Lz, Ly):
+        ''' Add a new beam rectangular section to the model.
+        
+        Args:
+            Lz: Base Lz
+            Ly: Height Ly
+
+        Returns:
+            The ID assigned to the section.
+        '''
+        return int(self.nfrest('GET', '/section/add/rect/'+str(Lz)+'/'+str(Ly)+'', None, None))
+    def addSectFromLib(self, name):
+        ''' Add a section from library
+        
+        Args:
+            name: Name of the section
+
+        Returns:
+            ID of the added section, 0 if not found
+        '''
+        return int(self.nfrest('POST', '/section/add/fromlib', name, None))
+    def addSectFromLib(self, name, doNotCenter=False):
+        ''' Add a section from library
+        
+        Args:
+            name: Name of the section
+            doNotCenter (optional): Optional. Do not center the section, useful for sections by points
+
+        Returns:
+            ID of the added section, 0 if not found
+        '''
+        return int(self.nfrest('POST', '/section/add/fromlib/'+str(doNotCenter)+'', name, None))
+    def addSectionByPoints(self, x:list, y:list, CF_tw=0, CF_rc=0, material=0, doNotCenter=False):
+        ''' Add a section by points. x() and y() are the 1st series of points (filled figure). If a cold-formed section is added, specify optional parameters.
+        
+        Args:
+            x: Array of x coordinates
+            y: Array of y coordinates
+            CF_tw (optional): Optional, thickness of a cold-formed section
+            CF_rc (optional): Optional, radius of curvature of a cold-formed section
+            material (optional): Optional, ID of the section material
+            doNotCenter (optional): Optional, avoid section centering
+
+        Returns:
+            The ID assigned to the section.
+        '''
+        return int(self.nfrest('GET', '/section/add/bypoints/'+str(CF_tw)+'/'+str(CF_rc)+'/'+str(material)+'/'+str(doNotCenter)+'', None, dict([("x",json.dumps(x)),("y",json.dumps(y))])))
+    def addSectionCover(self, sectionID, coverMat, coverThickness):
+        ''' Add a section cover, e.g. for fire checking purposes
+        
+        Args:
+            sectionID: ID of the original section
+            coverMat: ID of the material for the cover layer
+            coverThickness: Thickness of the cover layer
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/add/cover/'+str(sectionID)+'/'+str(coverMat)+'/'+str(coverThickness)+'', None, None))
+    def addSectionFromDXF(self, path, CF_tw=0, CF_rc=0, material=0):
+        ''' Add a section from a DXF file containing polylines. If a cold-formed section is added, specify optional parameters.
+        
+        Args:
+            path: Full path of DXF file
+            CF_tw (optional): Optional, thickness of a cold-formed section
+            CF_rc (optional): Optional, radius of curvature of a cold-formed section
+            material (optional): Optional, ID of the section material
+
+        Returns:
+            The ID assigned to the section.
+        '''
+        return int(self.nfrest('GET', '/section/add/fromdxf/'+str(CF_tw)+'/'+str(CF_rc)+'/'+str(material)+'', None, dict([("path",path)])))
+    def addStirrupBarsInSection(self, sectionID, LnumY, LnumZ, area, spacing, matID):
+        ''' Add stirrup bars to a section
+        
+        Args:
+            sectionID: ID of the section
+            LnumY: Legs in Y dir.
+            LnumZ: Legs in Z dir.
+            area: Area of the rebar
+            spacing: Stirrups spacing
+            matID: ID of the associated design material
+
+        Returns:
+            True is successful
+        '''
+        return sbool(self.nfrest('GET', '/section/rebar/stirrup/'+str(sectionID)+'/'+str(LnumY)+'/'+str(LnumZ)+'/'+str(area)+'/'+str(spacing)+'/'+str(matID)+'', None, None))
+    def addTSection(self, Lz, Ly, tw, tf1):
+        ''' Add a new beam T section to the model.
+        
+        Args:
+            Lz: Outer base
+            Ly: Outer height
+            tw: Wall thickness
+            tf1: Top flange thickness
+
+        Returns:
+            The ID assigned to the section.
+        '''
+        return int(self.nfrest('GET', '/section/add/tshape/'+str(Lz)+'/'+str(Ly)+'/'+str(tw)+'/'+str(tf1)+'', None, None))
+    def areRebarsInsideSection(self, ID):
+        ''' Check if all rebars are inside the section. Only the first fill figure is considered.
+        
+        Args:
+            ID: ID of the section
+
+        Returns:
+            Array of integers of the size of the rebars, with: 0 if rebar is outside figure, 1 if it's on a polygon vertex, 2 on border, 3 internal
+        '''
+        return des(self.nfrest('GET', '/section/rebar/inside/'+qt(ID)+'', None, None))
+    def assignSectionToElement(self, element, sectionID):
+        ''' Assign a selected section to the desired element
+        
+        Args:
+            element: ID of the element
+            sectionID: ID of the section
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('GET', '/section/assign/'+qt(element)+'/'+str(sectionID)+'', None, None))
+    def changeOrAddSectionPoint(self, sectionID, seriesID, ptID, x, y):
+        ''' Change or add a point in an already defined section
+        
+        Args:
+            sectionID: ID of the section
+            seriesID: ID of the series, starts at 1
+            ptID: Point index in the series, starts at 1. Use 0 to add a point at the beginning of the series
+            x: New z coordinate
+            y: New y coordinate
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/add/changeaddpt/'+str(sectionID)+'/'+str(seriesID)+'/'+str(ptID)+'/'+str(x)+'/'+str(y)+'', None, None))
+    def clearSectionRebar(self, ID):
+        ''' Clear all section rebar
+        
+        Args:
+            ID: ID of the section
+
+        Returns:
+            True is successful
+        '''
+        return sbool(self.nfrest('GET', '/section/rebar/clear/'+str(ID)+'', None, None))
+    def clearSectionRebar(self, ID):
+        ''' Clear all section rebar
+        
+        Args:
+            ID: ID of the section
+
+        Returns:
+            True is successful
+        '''
+        return sbool(self.nfrest('GET', '/section/rebar/clear/'+qt(ID)+'', None, None))
+    def duplicateSection(self, originalID):
+        ''' Duplicate the selected section
+        
+        Args:
+            originalID: Original ID of the section to be copied
+
+        Returns:
+            The ID of the newly created copy of the section
+        '''
+        return int(self.nfrest('GET', '/section/duplicate/'+str(originalID)+'', None, None))
+    def exportSectionDXF(self, path, sID):
+        ''' Export the selected section to DXF or DWG format. Rebars and hoops are included, if present
+        
+        Args:
+            path: Path of the resulting DXF or DWG file
+            sID: ID of the section
+
+        Returns:
+            Boolean
+        '''
+        return sbool(self.nfrest('GET', '/section/exportdxf/'+str(sID)+'', None, dict([("path",path)])))
+    def getDefinedSections(self):
+        ''' Return a list of used section IDs
+        
+        
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/sections', None, None))
+    def getElementRebarSegments(self, elem):
+        ''' Get rebar segments with their initial and final position, in percentage of element length
+        
+        Args:
+            elem: ID of the element or group name
+
+        Returns:
+            An array of double with {Linital, Lfinal} for each segment. The number of segment is the lenght of the array divided by 2
+        '''
+        return des(self.nfrest('GET', '/section/rebar/segments/'+qt(elem)+'', None, None))
+    def getFireSectionImage(self, elemID, titleX='', titleY='', title='', quoteUnits='', quoteFormat='0.00', showAxes=True, showOrigin=0, transparent=False):
+        ''' Get section plot into an array of Bytes of Png image
+        
+        Args:
+            elemID: ID of the element with the desired section
+            titleX (optional): Optional title for X axis
+            titleY (optional): Optional title for Y axis
+            title (optional): Optional graph title
+            quoteUnits (optional): Optional. Units of quotes, if set display quotes
+            quoteFormat (optional): Optional. Numeric format of quotes
+            showAxes (optional): Optional, default true
+            showOrigin (optional): Optional, default 0. 1 to show Z and Y arrows, 2 for X and Y arrows
+            transparent (optional): Optional, default false. If true, set transparent background
+
+        Returns:
+            Array of bytes
+        '''
+        return self.nfrestB('GET', '/op/sectioncalc/fireimage/'+str(elemID)+'/'+qt(titleX)+'/'+qt(titleY)+'/'+qt(title)+'/'+qt(quoteUnits)+'/'+qt(quoteFormat)+'/'+str(showAxes)+'/'+str(showOrigin)+'/'+str(transparent)+'', None, None)
+    def getLastBilinearMomentCurvature(self):
+        ''' Get bilinearized moment-curvature of the last section calculated in getSectMomentCurvature
+        
+        
+        Returns:
+            A list of arrays of double (size 2)
+        '''
+        return des(self.nfrest('GET', '/op/sectioncalc/bilmomentcurvature', None, None))
+    def getLastMomentCurvatureData(self):
+        ''' Get last moment-curvature extended data for the last section calculated in getSectMomentCurvature
+        
+        
+        Returns:
+            List of array of strings
+        '''
+        return des(self.nfrest('GET', '/op/sectioncalc/momentcurvaturedata', None, None))
+    def getSectionColor(self, ID):
+        ''' Get the color of the selected section in RGB format
+        
+        Args:
+            ID: ID of the section
+
+        Returns:
+            Integer
+        '''
+        return int(self.nfrest('GET', '/section/set/color/'+qt(ID)+'', None, None))
+    def getSectionFigure(self, sectionID, figureID, isHole=False):
+        ''' Get points in Z-Y plane from a section figure. Typically, index 1 contains the first (filled) figure.
+        
+        Args:
+            sectionID: ID of the section
+            figureID: 1-based index of the figure
+            isHole (optional): Default false. True if requested figure is a hole
+
+        Returns:
+            A 2-dimensional array of double
+        '''
+        return des(self.nfrest('GET', '/section/figure/'+str(sectionID)+'/'+str(figureID)+'/'+str(isHole)+'', None, None))
+    def getSectionImage(self, sectionID, titleX='', titleY='', title='', quoteUnits='', quoteFormat='0.00', showAxes=True, showOrigin=0, transparent=False, selectedBar=0):
+        ''' Get section plot into an array of Bytes of Png image
+        
+        Args:
+            sectionID: ID of the section
+            titleX (optional): Optional title for X axis
+            titleY (optional): Optional title for Y axis
+            title (optional): Optional graph title
+            quoteUnits (optional): Optional. Units of quotes, if set display quotes
+            quoteFormat (optional): Optional. Numeric format of quotes
+            showAxes (optional): Optional, default true
+            showOrigin (optional): Optional, default 0. 1 to show Z and Y arrows, 2 for X and Y arrows
+            transparent (optional): Optional, default false. If true, set transparent background
+            selectedBar (optional): Optional, default 0. Index of rebar to highlight, 0 to remove highlightning. Set to -1 to remove bars and show section center
+
+        Returns:
+            Array of bytes
+        '''
+        return self.nfrestB('GET', '/op/sectioncalc/imageB/'+str(sectionID)+'/'+qt(titleX)+'/'+qt(titleY)+'/'+qt(title)+'/'+qt(quoteUnits)+'/'+qt(quoteFormat)+'/'+str(showAxes)+'/'+str(showOrigin)+'/'+str(transparent)+'/'+str(selectedBar)+'', None, None)
+    def getSectionLibNames(self):
+        ''' Return an array of string containing section library names from built-in library.
+        
+        
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/sections/libraries', None, None))
+    def getSectionOffset(self, ID):
+        ''' Get the section offset for selected beam element
+        
+        Args:
+            ID: ID of the beam element
+
+        Returns:
+            An array of size 2 with offset in z and offset in y local directions. Return null array even if the element is not found
+        '''
+        return des(self.nfrest('GET', '/section/set/offset/'+qt(ID)+'', None, None))
+    def getSectionProperties(self, ID):
+        ''' Get all properties of a section
+        
+        Args:
+            ID: ID of the section
+
+        Returns:
+            A string array with all properties
+        '''
+        return des(self.nfrest('GET', '/section/props/'+qt(ID)+'', None, None))
+    def getSectionProperty(self, ID, name):
+        ''' Get selected property of a section
+        
+        Args:
+            ID: ID of the section
+            name: Name of the property: name, code, type, Lx, Ly, b, h, t, etc.
+
+        Returns:
+            A string with the desired property
+        '''
+        return self.nfrest('GET', '/section/prop/'+qt(ID)+'/'+qt(name)+'', None, None)
+    def getSectionRebarCoords(self, ID):
+        ''' Get rebar coordinates from selected section
+        
+        Args:
+            ID: ID of the section
+
+        Returns:
+            Array of X,Y coordinates of size (rebarNumber,2). Coordinates are always referred to the center of reinforcement
+        '''
+        return des(self.nfrest('GET', '/section/rebar/coords/'+qt(ID)+'', None, None))
+    def getSectionRebarSize(self, ID):
+        ''' Get rebar dimensions from selected section
+        
+        Args:
+            ID: ID of the section
+
+        Returns:
+            Array of size of rebar number. All values in mm. Each item starts with Dd with d the diameter for bars, base x height @ rotation for rectangular reinforcements
+        '''
+        return des(self.nfrest('GET', '/section/rebar/size/'+qt(ID)+'', None, None))
+    def getSectionResMoments(self, ID, station, calcType, N, Myy, Mzz):
+        ''' Get flexural strength of a beam station by calculating neutral axis
+        
+        Args:
+            ID: ID of the element
+            station: ID of station, from 1 to 5
+            calcType: 0 plastic, 1 elastic, 2 thermal-plastic, 3 thermal-elastic, 4 elastic limit, 5 thermal-elastic limit
+            N: Axial force. Positive for tension
+            Myy: Moment around vertical section axis
+            Mzz: Moment around horizontal section axis
+
+        Returns:
+            A string with serialized results in JSON format
+        '''
+        return self.nfrest('GET', '/op/sectioncalc/a/'+qt(ID)+'/'+str(station)+'/'+str(calcType)+'/'+str(N)+'/'+str(Myy)+'/'+str(Mzz)+'', None, None)
+    def getSectionResMoments(self, sectionID, materialID, calcType, N, Myy, Mzz):
+        ''' Get flexural strength of a section by calculating neutral axis
+        
+        Args:
+            sectionID: ID of the section
+            materialID: ID of material
+            calcType: 0 plastic, 1 elastic, 2 thermal-plastic, 3 thermal-elastic, 4 elastic limit, 5 thermal-elastic limit
+            N: Axial force. Positive for tension
+            Myy: Moment around vertical section axis
+            Mzz: Moment around horizontal section axis
+
+        Returns:
+            A string in JSON format
+        '''
+        return self.nfrest('GET', '/op/sectioncalc/b/'+qt(sectionID)+'/'+qt(materialID)+'/'+str(calcType)+'/'+str(N)+'/'+str(Myy)+'/'+str(Mzz)+'', None, None)
+    def getSectionResMoments2(self, sectionID, calcType, N, Mzz, Myy, saveImages='', domainTp=0, options=None, Nserv=0, Mzzserv=0, Myyserv=0):
+        ''' Get flexural strength of a section by calculating neutral axis. Material must be set as section property, see setSectionMaterial.
+        
+        Args:
+            sectionID: ID of the section
+            calcType: 0 plastic, 1 elastic, 2 thermal-plastic, 3 thermal-elastic, 4 elastic limit, 5 thermal-elastic limit
+            N: Axial force. Positive for tension
+            Mzz: Moment around vertical section axis
+            Myy: Moment around horizontal section axis
+            saveImages (optional): Path for saving images of calculated section and domain, in PNG format. Only path a filename is required, no extension.
+            domainTp (optional): Optional. Domain type for image: 0 for Myy_Mzz, 1 for N_Myy, 2 for N_Mzz
+            options (optional): Optional. Calculation options
+            Nserv (optional): Optional. Serviceability axial force. Positive for tension
+            Mzzserv (optional): Optional. Serviceability Mzz
+            Myyserv (optional): Optional. Serviceability Myy
+
+        Returns:
+            An array of strings containing calculation results
+        '''
+        return des(self.nfrest('GET', '/op/sectioncalc/c/'+str(sectionID)+'/'+str(calcType)+'/'+str(N)+'/'+str(Mzz)+'/'+str(Myy)+'/'+str(domainTp)+'/'+str(Nserv)+'/'+str(Mzzserv)+'/'+str(Myyserv)+'', None, dict([("saveImages",saveImages),("options",options)])))
+    def getSectionResMoments3(self, sectionID, calcType, N, Mzz, Myy, saveImages='', domainTp=0, options=None, Nserv=0, Mzzserv=0, Myyserv=0):
+        ''' Get flexural strength of a section by calculating neutral axis. Material must be set as section property, see setSectionMaterial.
+        
+        Args:
+            sectionID: ID of the section
+            calcType: 0 plastic, 1 elastic, 2 thermal-plastic, 3 thermal-elastic, 4 elastic limit, 5 thermal-elastic limit
+            N: Axial force. Positive for tension
+            Mzz: Moment around vertical section axis
+            Myy: Moment around horizontal section axis
+            saveImages (optional): Path for saving images of calculated section and domain, in PNG format. Only path a filename is required, no extension.
+            domainTp (optional): Optional. Domain type for image: 0 for Myy_Mzz, 1 for N_Myy, 2 for N_Mzz
+            options (optional): Optional. Calculation options
+            Nserv (optional): Optional. Serviceability axial force. Positive for tension
+            Mzzserv (optional): Optional. Serviceability Mzz
+            Myyserv (optional): Optional. Serviceability Myy
+
+        Returns:
+            A check structure with results
+        '''
+        return self.nfrest('GET', '/op/sectioncalc/d/'+str(sectionID)+'/'+str(calcType)+'/'+str(N)+'/'+str(Mzz)+'/'+str(Myy)+'/'+str(domainTp)+'/'+str(Nserv)+'/'+str(Mzzserv)+'/'+str(Myyserv)+'', None, dict([("saveImages",saveImages),("options",options)]))
+    def getSectionResShear(self, sectionID, N=0, Mzz=0, Myy=0, Vy=0, Vz=0):
+        ''' Get section shear resistance by automatically selecting checking rules for section material
+        
+        Args:
+            sectionID: ID of the section
+            N (optional): Optional. Axial force. Positive for tension
+            Mzz (optional): Optional. Moment around vertical section axis
+            Myy (optional): Optional. Moment around horizontal section axis
+            Vy (optional): Optional. Shear force in y direction
+            Vz (optional): Optional. Shear force in z direction
+
+        Returns:
+            An array of size 2 with VrdY and VrdZ
+        '''
+        return des(self.nfrest('GET', '/op/sectioncalc/shear/'+str(sectionID)+'/'+str(N)+'/'+str(Mzz)+'/'+str(Myy)+'/'+str(Vy)+'/'+str(Vz)+'', None, None))
+    def getSectionResShear(self, sectionID, verName, N=0, Mzz=0, Myy=0, Vy=0, Vz=0):
+        ''' Get section shear resistance
+        
+        Args:
+            sectionID: ID of the section
+            verName: Name of the checking to be used
+            N (optional): Optional. Axial force. Positive for tension
+            Mzz (optional): Optional. Moment around vertical section axis
+            Myy (optional): Optional. Moment around horizontal section axis
+            Vy (optional): Optional. Shear force in y direction
+            Vz (optional): Optional. Shear force in z direction
+
+        Returns:
+            An array of size 2 with VrdY and VrdZ
+        '''
+        return des(self.nfrest('GET', '/op/sectioncalc/shear/'+str(sectionID)+'/'+qt(verName)+'/'+str(N)+'/'+str(Mzz)+'/'+str(Myy)+'/'+str(Vy)+'/'+str(Vz)+'', None, None))
+    def getSectionResShearDict(self, sectionID, verName, N=0, Mzz=0, Myy=0, Vy=0, Vz=0, overrideValues:list=None):
+        ''' Get section shear resistance
+        
+        Args:
+            sectionID: ID of the section
+            verName: Name of the checking to be used. See getCheckNameByMaterial to get it automatically
+            N (optional): Optional. Axial force. Positive for tension
+            Mzz (optional): Optional. Moment around vertical section axis
+            Myy (optional): Optional. Moment around horizontal section axis
+            Vy (optional): Optional. Shear force in y direction
+            Vz (optional): Optional. Shear force in z direction
+            overrideValues (optional): Optional dictionary of {string, double} containing overrides for checking (e.g. ctgtheta = 1 for concrete)
+
+        Returns:
+            A dictionary of {string, double} containing all the results from calculation
+        '''
+        return des(self.nfrest('POST', '/op/sectioncalc/shear2/'+str(sectionID)+'/'+qt(verName)+'/'+str(N)+'/'+str(Mzz)+'/'+str(Myy)+'/'+str(Vy)+'/'+str(Vz)+'', overrideValues, None))
+    def getSectionsLibrary(self, filter=''):
+        ''' Return an array of string containing section names from built-in library.
+        
+        Args:
+            filter (optional): Optional. String supporting wildcards for material name
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/sections/library/'+qt(filter)+'', None, None))
+    def getSectionsLibraryF(self, filename, filter=''):
+        ''' Return an array of string containing section names from built-in library.
+        
+        Args:
+            filename: Name of the nfs library, without extension
+            filter (optional): Optional. String supporting wildcards for material name
+
+        Returns:
+            Array of strings
+        '''
+        return des(self.nfrest('GET', '/sections/libraryf/'+qt(filename)+'/'+qt(filter)+'', None, None))
+    def getSectMomentCurvature(self, sectionID, N, Mzz, Myy, npts=20, Nserv=0, Mzzserv=0, Myyserv=0):
+        ''' Get moment-curvature diagram for the selected section
+        
+        Args:
+            sectionID: ID of the section
+            N: Axial force. Positive for tension
+            Mzz: Moment around vertical section axis
+            Myy: Moment around horizontal section axis
+            npts (optional): Optional. Number of curve points. Default 20
+            Nserv (optional): Optional. Serviceability axial force. Positive for tension
+            Mzzserv (optional): Optional. Serviceability Mzz
+            Myyserv (optional): Optional. Serviceability Myy
+
+        Returns:
+            A list of arrays of double (size 2) with resisting moment vs. curvature (1/units of length)
+        '''
+        return des(self.nfrest('GET', '/op/sectioncalc/momentcurvature/'+str(sectionID)+'/'+str(N)+'/'+str(Mzz)+'/'+str(Myy)+'/'+str(npts)+'/'+str(Nserv)+'/'+str(Mzzserv)+'/'+str(Myyserv)+'', None, None))
+    def getShearResFromDict(self, dict_:list):
+        ''' Get section shear resistance from an already performed checking given in a dictionary of string, double
+        
+        Args:
+            dict_: Dictionary of string, double of an already performed checking
+
+        Returns:
+            An array of size 2 with VrdY and VrdZ
+        '''
+        return des(self.nfrest('POST', '/op/sectioncalc/shearres', dict, None))
+    def getShearResFromDict(self, dict_:list):
+        ''' Get section shear resistance from an already performed checking given in a dictionary of string, double
+        
+        Args:
+            dict_: Dictionary of string, double of an already performed checking
+
+        Returns:
+            An array of size 2 with VrdY and VrdZ
+        '''
+        return des(self.nfrest('POST', '/op/sectioncalc/shearres', dict, None))
+    def ModelToSection(self, openModelPath=''):
+        ''' Write a section from a thermal model made with planar elements
+        
+        Args:
+            openModelPath (optional): Optional. Path of the model to read, otherwise the current model is used
+
+        Returns:
+            ID of the newly added section
+        '''
+        return self.nfrest('GET', '/model/model2section', None, dict([("path",openModelPath)]))
+    def recalculateSection(self, ID):
+        ''' Recalculate section properties, if needed
+        
+        Args:
+            ID: ID of the section
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/recalc/'+str(ID)+'', None, None))
+    def removeCompositeFlags(self, ID):
+        ''' Remove flags for composite section
+        
+        Args:
+            ID: ID of the section
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/set/removecomposite/'+str(ID)+'', None, None))
+    def removeSection(self, sectionID):
+        ''' Remove the selected section
+        
+        Args:
+            sectionID: ID of the section
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/remove/'+str(sectionID)+'', None, None))
+    def removeSectionCover(self, sectionID):
+        ''' Remove section cover
+        
+        Args:
+            sectionID: ID of the section
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('DELETE', '/section/add/cover/'+str(sectionID)+'', None, None))
+    def removeSectionFigure(self, sectionID, figureID, isEmpty=False):
+        ''' Remove a figure from the selected section
+        
+        Args:
+            sectionID: ID of the section
+            figureID: 1-based index of the figure to remove
+            isEmpty (optional): Optional, True if the figure is a hole
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/add/removefigure/'+str(sectionID)+'/'+str(figureID)+'/'+str(isEmpty)+'', None, None))
+    def removeSectionProperty(self, ID, name):
+        ''' Revert a previously custom section property to automatic evaluation
+        
+        Args:
+            ID: ID of the section
+            name: Name of the native property: Area, Jxc, Jyc, Jxyc, Jt, Iw, shAreaX, shAreaY, or custom value to be removed
+
+        Returns:
+            True if property has been reverted to automatic evaluation or custom prop. has been removed
+        '''
+        return sbool(self.nfrest('DELETE', '/section/prop/'+qt(ID)+'/'+qt(name)+'', None, None))
+    def renameSection(self, sectionID, name, code=''):
+        ''' Assign name to an already defined section
+        
+        Args:
+            sectionID: ID of the section
+            name: Name of the section
+            code (optional): Reference code
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('GET', '/section/rename/'+str(sectionID)+'/'+qt(name)+'/'+qt(code)+'', None, None))
+    def saveSectionImage(self, sectionID, path):
+        ''' Save section plot into a Png image
+        
+        Args:
+            sectionID: ID of the section
+            path: Path for saving image, in PNG format. Only path and filename are required, no extension.
+
+        Returns:
+            True if successed
+        '''
+        return sbool(self.nfrest('GET', '/op/sectioncalc/image/'+str(sectionID)+'', None, dict([("path",path)])))
+    def saveSectionImageWithBars(self, elemID, progr, path):
+        ''' Save a plot of an element section with rebar, if any, into a Png image
+        
+        Args:
+            elemID: ID of the element
+            progr: Progressive on element, from 0 to 100
+            path: Path for saving image, in PNG format. Only path and filename are required, no extension.
+
+        Returns:
+            True if successed
+        '''
+        return sbool(self.nfrest('GET', '/op/sectioncalc/imagewithbars/'+qt(elemID)+'/'+str(progr)+'', None, dict([("path",path)])))
+    def SectionToModel(self, sectionID, saveModelPath=''):
+        ''' Write model of a section, meshed with Tria elements, typically for thermal analysis
+        
+        Args:
+            sectionID: ID of the section
+            saveModelPath (optional): Optional. Path to the model to write, otherwise current is used
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/model/section2model/'+qt(sectionID)+'', None, dict([("path",saveModelPath)])))
+    def setAluSection(self, ID, SectionClass=3, Jw=0):
+        ''' Set aluminium checking parameters for section
+        
+        Args:
+            ID: ID of the section
+            SectionClass (optional): Steel class section
+            Jw (optional): Warping constant
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/set/alu/'+str(ID)+'/'+str(SectionClass)+'/'+str(Jw)+'', None, None))
+    def setCompositeBeam(self, ID, MposFactor=-1, MnegFactor=-1):
+        ''' Set composite section beam properties
+        
+        Args:
+            ID: ID of the section
+            MposFactor (optional): Inertia weight factor for positive moment, default is 0.6
+            MnegFactor (optional): Inertia weight factor for negative moment, default is 0.4
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/set/compositebeam/'+str(ID)+'/'+str(MposFactor)+'/'+str(MnegFactor)+'', None, None))
+    def setCompositeColumn(self, ID, EcFactor=-1, ReductionFactor=-1):
+        ''' Set composite section column properties
+        
+        Args:
+            ID: ID of the section
+            EcFactor (optional): Reduction factor for concrete modulus, default is 0.5
+            ReductionFactor (optional): Reduction factor for column inertia, default is 0.9
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/set/compositecolumn/'+str(ID)+'/'+str(EcFactor)+'/'+str(ReductionFactor)+'', None, None))
+    def setElementSection(self, elem, sectID):
+        ''' Assign a section to an element. An alternative to assignSectionToElement
+        
+        Args:
+            elem: Beam or planar element ID
+            sectID: ID of the section
+
+        Returns:
+            Boolean value
+        '''
+        return sbool(self.nfrest('GET', '/section/'+qt(elem)+'/'+str(sectID)+'', None, None))
+    def setFiberSection(self, ID, divZ=0, divY=0):
+        ''' Make the selected section a fiber section. Suitable only for OpenSees solver.
+        
+        Args:
+            ID: ID of the section
+            divZ (optional): Division in Z direction
+            divY (optional): Division in Y direction
+
+        Returns:
+            True if successful, False is section type is unknown (then use convertToMeshedSection)
+        '''
+        return sbool(self.nfrest('GET', '/section/set/fibers/'+str(ID)+'/'+str(divZ)+'/'+str(divY)+'', None, None))
+    def setSectionAngle(self, ID, a):
+        ''' Set the rotation angle for a beam section.
+        
+        Args:
+            ID: ID of the section
+            a: Angle in degrees
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/set/angle/'+str(ID)+'/'+str(a)+'', None, None))
+    def setSectionColor(self, ID, Red, Green, Blue):
+        ''' Set the color of the selected section in RGB format
+        
+        Args:
+            ID: ID of the section
+            Red: Red [0,255]
+            Green: Green [0,255]
+            Blue: Blue [0,255]
+
+        Returns:
+            True if successful, False otherwise
+        '''
+        return sbool(self.nfrest('POST', '/section/set/color/'+qt(ID)+'/'+str(Red)+'/'+str(Green)+'/'+str(Blue)+'', None, None))
+    def setSectionMaterial(self, ID, materialID):
+        ''' Set the material as section property
+        
+        Args:
+            ID: ID of the section
+            materialID: ID of the material to associate
+
+        Returns:
+            True
+        '''
+        return sbool(self.nfrest('GET', '/section/set/material/'+str(ID)+'/'+str(materialID)+'', None, None))
+    def setSectionOffset(self, ID, offsetZ, offsetY):
+        ''' Set a section offset for the selected beam section
+        
+        Args:
+            ID: ID of the beam section
+            offsetZ: Offset in local z direction
+            offsetY: Offset in local y direction
+
+        Returns:
+            True if successful, False otherwise
+        '''
+        return sbool(self.nfrest('POST', '/section/set/offset/'+qt(ID)+'/'+str(offsetZ)+'/'+str(offsetY)+'', None, None))
+    def setSectionProperty(self, ID, name, value):
+        ''' Set selected property of a section. To change name or code properties, use renameSection method.
+        
+        Args:
+            ID: ID of the section
+            name: Name of the property: Area, Jxc, Jyc, Jxyc, Jt, Iw, shAreaX, shAreaY, or custom value to be added
+            value: Value to be stored
+
+        Returns:
+            1 if native propery has changes, 2 if custom property is added, 0 in case of error
+        '''
+        return int(self.nfrest('POST', '/section/prop/'+qt(ID)+'/'+qt(name)+'/'+str(value)+'', None, None))
+    def setSectionRebarsToElements(self, ID):
+        ''' Assign section rebars and stirrups in elements having the same section
+        
+        Args:
+            ID: ID of the section
+
+        Returns:
+            True is successful
+        '''
+        return sbool(self.nfrest('GET', '/section/rebar/toelems/'+qt(ID)+'', None, None))
+    def setSectionRebarsToElements(self, ID):
+        ''' Assign section rebars and stirrups in elements having the same section
+        
+        Args:
+            ID: ID of the section
+
+        Returns:
+            True is successful
+        '''
+        return sbool(self.nfrest('GET', '/section/rebar/toelems/'+str(ID)+'', None, None))
+    def setShearReinfRCdata(self, ID, data:list):
+        ''' Set or overwrite material data for shear reinforcement with tension-fragile design material in RC section. Set Shear strip width less than or equal to 0 to remove data
+        
+        Args:
+            ID: ID of the section
+            data: Array containing: Shear strip width, Shear strip spacing, Shear strip angle [°], Shear strip material ID, Shear strip thickness [mm], Shear strip height, Confinement strip spacing (-1 for continuous), Shear strip height along base
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/set/shearreinfrc/'+str(ID)+'', None, dict([("data",json.dumps(data))])))
+    def setSteelSection(self, ID, SectionClass=3, alphaLT=0.76, alphay=0.76, alphaz=0.76, Jw=0):
+        ''' Set steel checking parameters for section
+        
+        Args:
+            ID: ID of the section
+            SectionClass (optional): Steel class section
+            alphaLT (optional): Stability curve factor for lateral-torsional buckling
+            alphay (optional): Stability factor for flexural buckling around y axis
+            alphaz (optional): Stability factor for flexural buckling around z axis
+            Jw (optional): Warping constant
+
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/set/steel/'+str(ID)+'/'+str(SectionClass)+'/'+str(alphaLT)+'/'+str(alphay)+'/'+str(alphaz)+'/'+str(Jw)+'', None, None))
+    def splitElementsByRebarSegments(self):
+        ''' Split element in segments according to rebar distribution. It is necessary to include all rebar segments in fiber analysis.  Effective only on Line elements.
+        
+        
+        Returns:
+            True if successful
+        '''
+        return sbool(self.nfrest('GET', '/section/rebar/splitsegments', None, None))
@@ -0,0 +1,193 @@
+'''
+Client-side envelopes of result arrays.
+
+envelope gives max/min of every value over loadcases (or combinations, time
+steps) with the governing case; concurrentEnvelope gives, for the max and min
+of each component, the whole consistent vector of that case, as in
+getBeamForcesEnvelopeTable. Both work on all the elements at once, and skip
+missing results (NaN).
+
+    forces = nf.getBeamForcesArray(results=nf.resultsData())
+    env = envelope(forces)
+    env.max.sel(components="My"), env.maxCase
+'''
+
+import re
+import numpy as np
+from .resultarrays import ResultArray
+
+def _caseAxis(results, axis):
+    # labelled case axis of a ResultArray, moved first
+    if axis is None:
+        axis = next((a for a in ("loadcases", "combinations", "times") if a in results.axes), results.axes[0])
+    k = results.axes.index(axis)
+    values = np.moveaxis(np.asarray(results.values), k, 0)
+    axes = [a for a in results.axes if a != axis]
+    labels = dict((a, results.labels[a]) for a in axes)
+    return axis, values, axes, labels
+
+def _argmax(values):
+    # index of the max over cases (first axis), skipping missing values (NaN); 0 if all are missing, so that the max is NaN
+    return np.argmax(np.where(np.isnan(values), -np.inf, values), axis=0)
+
+def _argmin(values):
+    return np.argmin(np.where(np.isnan(values), np.inf, values), axis=0)
+
+class Envelope:
+    ''' Max and min over cases, with the index and label of the governing case '''
+    def __init__(self, axis, cases, max, min, maxIndex, minIndex):
+        self.axis = axis
+        self.cases = list(cases)
+        self.max = max
+        self.min = min
+        self.maxIndex = maxIndex
+        self.minIndex = minIndex
+
+    @property
+    def maxCase(self)->np.ndarray:
+        ''' Label of the case giving the max '''
+        return np.asarray(self.cases, dtype=object)[self.maxIndex.values if hasattr(self.maxIndex, "values") else self.maxIndex]
+
+    @property
+    def minCase(self)->np.ndarray:
+        ''' Label of the case giving the min '''
+        return np.asarray(self.cases, dtype=object)[self.minIndex.values if hasattr(self.minIndex, "values") else self.minIndex]
+
+    def __repr__(self):
+        return "Envelope(over " + str(len(self.cases)) + " " + self.axis + ")"
+
+def envelope(results, axis=None)->Envelope:
+    ''' Max and min of each value over the cases
+    
+    Args:
+        results: ResultArray, e.g. from getBeamForcesArray or LoadCombinations.combine
+        axis (optional): Optional. Axis of cases, default is loadcases, combinations or times, whichever is present
+
+    Returns:
+        Envelope with max, min, maxIndex and minIndex as ResultArrays without the case axis
+    '''
+    axis, values, axes, labels = _caseAxis(results, axis)
+    imax = _argmax(values)
+    imin = _argmin(values)
+    vmax = np.take_along_axis(values, imax[None], axis=0)[0]
+    vmin = np.take_along_axis(values, imin[None], axis=0)[0]
+    wrap = lambda v: ResultArray(v, axes, labels)
+    return Envelope(axis, results.labels[axis], wrap(vmax), wrap(vmin), wrap(imax), wrap(imin))
+
+def concurrentEnvelope(results, axis=None, components="components")->Envelope:
+    ''' Consistent envelope: for the max and min of each component, all the components of the governing case
+    
+    Args:
+        results: ResultArray with a components axis, e.g. from getBeamForcesArray
+        axis (optional): Optional. Axis of cases, default is loadcases, combinations or times, whichever is present
+        components (optional): Optional. Name of the components axis
+
+    Returns:
+        Envelope whose max and min have an extra "governing" axis before components: max.sel(governing="My") is the whole force vector where My is max
+    '''
+    axis, values, axes, labels = _caseAxis(results, axis)
+    c = axes.index(components)
+    v = np.moveaxis(values, c + 1, -1)                      # (cases, ..., components)
+    imax = _argmax(v)                                       # (..., governing)
+    imin = _argmin(v)
+    pick = lambda idx: np.take_along_axis(v[..., None, :], idx[None, ..., None], axis=0)[0]
+    vmax, vmin = pick(imax), pick(imin)                     # (..., governing, components)
+    gaxes = [a for a in axes if a != components] + ["governing", components]
+    glabels = dict(labels); glabels["governing"] = labels[components]
+    iaxes = gaxes[:-1]
+    ilabels = dict((a, glabels[a]) for a in iaxes)
+    return Envelope(axis, results.labels[axis], ResultArray(vmax, gaxes, glabels), ResultArray(vmin, gaxes, glabels),
+                    ResultArray(imax, iaxes, ilabels), ResultArray(imin, iaxes, ilabels))
+
+def maxMinBy(results, keys, component, axis="elems")->dict:
+    ''' Max and min of a component among items sharing the same key, in all cases and all other axes, as in getMaxMinBeamForces
+    
+    Args:
+        results: ResultArray, e.g. from getBeamForcesArray
+        keys: Key of each item along axis, e.g. the section ID of each element
+        component: Component label, e.g. "My"
+        axis (optional): Optional. Axis of items
+
+    Returns:
+        Dictionary key -> [max, min]
+    '''
+    v = results.sel(components=component)
+    values = np.moveaxis(np.asarray(v.values), v.axes.index(axis), 0).reshape(len(v.labels[axis]), -1)
+    keys = np.asarray(keys)
+    out = {}
+    for k in np.unique(keys):
+        block = values[keys == k]
+        block = block[~np.isnan(block)]
+        out[k.item() if hasattr(k, "item") else k] = [float(block.max()), float(block.min())] if block.size else [np.nan, np.nan]
+    return out
+
+def _envelopeRows(table, components, separator)->list:
+    # rows of a consistent envelope table as (station, governing component, "max" or "min", component -> value).
+    # The header names the components; the station is in a column named station or position, the governing component and
+    # max or min in a label cell, e.g. "My max"
+    rows = [[str(c).strip() for c in (r if isinstance(r, list) else str(r).split(separator))] for r in (table if isinstance(table, list) else [])]
+    header = next((r for r in rows if any(c in components for c in r)), None)
+    if header is None: return []
+    columns = dict((k, c) for k, c in enumerate(header) if c in components)
+    station = next((k for k, c in enumerate(header) if c.lower().startswith(("station", "stat", "pos"))), None)
+    out = []
+    for r in rows[rows.index(header) + 1:]:
+        values, governing, sense, st = {}, None, None, None
+        for k, cell in enumerate(r):
+            number = _number(cell)
+            if k in columns:
+                if not(number is None): values[columns[k]] = number
+            elif k == station:
+                st = number
+            else:
+                words = re.findall(r"[A-Za-z]+", cell)
+                governing = next((w for w in words if w in components), governing)
+                sense = next((w.lower() for w in words if w.lower() in ("max", "min")), sense)
+        if values and not(governing is None or sense is None or st is None): out.append((st, governing, sense, values))
+    return out
+
+def _number(s):
+    try:
+        return float(str(s).replace(",", "."))
+    except ValueError:
+        return None
+
+def validateEnvelope(nf, results, env:Envelope=None, stationsMode=0, tol=1e-6)->dict:
+    ''' Compare a concurrent envelope of beam forces with getBeamForcesEnvelopeTable from the server
+    
+    Args:
+        nf: NextFEMrest connected to the model
+        results: ResultArray from getBeamForcesArray, with the stations of stationsMode
+        env (optional): Optional. Concurrent envelope of results, computed if not set
+        stationsMode (optional): Optional. Stations of the server table, 0 for 5 stations
+        tol (optional): Optional. Relative tolerance
+
+    Returns:
+        Dictionary element ID -> largest relative difference between the server table and the local envelope, compared by station,
+        governing component, max or min and component. Infinite if no row of the table could be matched
+    '''
+    if env is None: env = concurrentEnvelope(results)
+    cases = [str(c) for c in env.cases]
+    components = [str(c) for c in env.max.labels["components"]]
+    stations = list(env.max.labels["stations"])
+    out = {}
+    for e in env.max.labels["elems"]:
+        rows = _envelopeRows(nf.getBeamForcesEnvelopeTable(e, stationsMode, cases), components, nf.tableSeparator or ";")
+        # stations given by number, or else by position in the order of the table
+        found = []
+        for st, g, sense, values in rows:
+            if not st in found: found.append(st)
+        if all(st in stations for st in found):
+            byOrder = dict((st, stations[stations.index(st)]) for st in found)
+        else:
+            byOrder = dict(zip(found, stations)) if len(found) == len(stations) else {}
+        worst = None
+        for st, g, sense, values in rows:
+            if not st in byOrder: continue
+            local = (env.max if sense == "max" else env.min).sel(elems=e, stations=byOrder[st], governing=g)
+            for c, v in values.items():
+                ref = float(local.values[components.index(c)])
+                d = abs(ref - v) / max(abs(ref), tol)
+                if worst is None or d > worst: worst = d
+        out[e] = float("inf") if worst is None else worst
+    return out
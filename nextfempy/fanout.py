@@ -0,0 +1,92 @@
+'''
+Concurrent fan-out of independent NextFEMrest queries.
+
+    stress = nf.map("getNodalStress", [(n, "sw", "1") for n in nodes], workers=16)
+    print(nf.mapStats)
+
+Calls run on a thread pool sharing the pooled session, results keep the
+order of the arguments, and calls failing with connection errors or
+timeouts are retried with exponential backoff.
+'''
+
+import threading, time
+import numpy as np
+import requests
+from concurrent.futures import ThreadPoolExecutor
+
+# failures worth a retry: the request may not have reached the server, or the server was busy
+TRANSIENT = (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.ChunkedEncodingError)
+_RAISE = object()
+
+class MapStats:
+    ''' Throughput of the last map call '''
+    def __init__(self, latencies, retries, failures, seconds, workers):
+        self.latencies = np.asarray(latencies, dtype=float)
+        self.calls = len(self.latencies)
+        self.retries = retries
+        self.failures = failures
+        self.seconds = seconds
+        self.workers = workers
+
+    @property
+    def callsPerSecond(self)->float:
+        return self.calls / self.seconds if self.seconds > 0 else 0.0
+
+    def percentile(self, q)->float:
+        ''' Latency percentile of single calls, in seconds '''
+        return float(np.percentile(self.latencies, q)) if self.calls else 0.0
+
+    def __repr__(self):
+        return ("MapStats(" + str(self.calls) + " calls in " + format(self.seconds, ".3f") + " s, " + format(self.callsPerSecond, ".1f") +
+                " calls/s, p50 " + format(1000 * self.percentile(50), ".1f") + " ms, p95 " + format(1000 * self.percentile(95), ".1f") +
+                " ms, " + str(self.retries) + " retries, " + str(self.failures) + " failures)")
+
+class FanOutMixin:
+
+    mapStats = None
+
+    def map(self, method, args, workers=8, retries=2, backoff=0.1, default=_RAISE)->list:
+        ''' Call a read-only method for each item of args concurrently, keeping the order of args
+        
+        Args:
+            method: Name of a NextFEMrest method, or any callable
+            args: Iterable of arguments: a tuple is passed as positional arguments, a dict as keyword arguments, anything else as the only argument
+            workers (optional): Optional. Concurrent calls; above the pool size (setPool) connections are not reused
+            retries (optional): Optional. Retries of a call failing with a connection error or timeout
+            backoff (optional): Optional. Wait before the first retry in seconds, doubled at each retry
+            default (optional): Optional. Result of calls still failing after the retries; if not set the error is raised
+
+        Returns:
+            List of results. Throughput is in mapStats
+        '''
+        fn = getattr(self, method) if isinstance(method, str) else method
+        args = list(args)
+        latencies = np.zeros(len(args))
+        counts = {"retries": 0, "failures": 0}
+        lock = threading.Lock()
+        def call(i):
+            a = args[i]
+            wait = backoff
+            for attempt in range(retries + 1):
+                t0 = time.perf_counter()
+                try:
+                    if isinstance(a, tuple): res = fn(*a)
+                    elif isinstance(a, dict): res = fn(**a)
+                    else: res = fn(a)
+                    latencies[i] = time.perf_counter() - t0
+                    return res
+                except TRANSIENT:
+                    latencies[i] = time.perf_counter() - t0
+                    with lock:
+                        counts["failures" if attempt == retries else "retries"] += 1
+                    if attempt == retries:
+                        if default is _RAISE: raise
+                        return default
+                    time.sleep(wait)
+                    wait *= 2
+        t0 = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max(1, int(workers))) as pool:
+                return list(pool.map(call, range(len(args))))
+        finally:
+            self.mapStats = MapStats(latencies, counts["retries"], counts["failures"], time.perf_counter() - t0, workers)
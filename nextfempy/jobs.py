@@ -0,0 +1,211 @@
+'''
+Non-blocking analysis jobs around LaunchModel and LaunchLoadCase.
+
+    job = Job(nf, "eq").start()
+    ...                                  # post-process other results meanwhile
+    if job.wait(600): print(job.log)
+
+A job is polled from a background thread with hasResults, starting every
+minInterval seconds and slowing down by backoff up to maxInterval, so that
+long runs cost few requests. It is finished when the loadcase has results.
+A loadcase (or model) that already has results may be rerun with the same
+results and run log, so it is run instead with the blocking RunLoadCase
+(RunModel) from the background thread, which returns when the run ends.
+With a timeout, a job still running after timeout seconds finishes with an
+error.
+
+JobScheduler launches many loadcases, at most maxConcurrent at a time, and
+reduces each one with a collect callable as soon as it finishes:
+
+    sched = JobScheduler(nf, maxConcurrent=2, collect=lambda nf, lc: nf.getNodalDispArray(lc))
+    results = sched.run(["eqX", "eqY", "wind"])
+'''
+
+import threading, time
+
+class Job:
+
+    def __init__(self, nf, loadcase="", outOfProc=False, noWindow=False, minInterval=0.05, maxInterval=2.0, backoff=1.5, timeout=None):
+        ''' Analysis job of the whole model, or of a loadcase
+        
+        Args:
+            nf: NextFEMrest instance
+            loadcase (optional): Optional. Loadcase to run, the whole model if empty
+            outOfProc (optional): If true, run out of process
+            noWindow (optional): If true, hide the solver window or its output lines from console
+            minInterval (optional): Optional. First polling interval in seconds
+            maxInterval (optional): Optional. Longest polling interval in seconds
+            backoff (optional): Optional. Growth factor of the polling interval
+            timeout (optional): Optional. Longest duration of the job in seconds, after which it finishes with an error. No limit if not set
+        '''
+        self.nf = nf
+        self.loadcase = loadcase
+        self.outOfProc = outOfProc
+        self.noWindow = noWindow
+        self.minInterval = minInterval
+        self.maxInterval = maxInterval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.log = []
+        self.error = ""
+        self.result = None
+        self.polls = 0
+        self.started = None
+        self.seconds = 0.0
+        self._done = threading.Event()
+        self._finished = False
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def __repr__(self):
+        state = "done" if self.done() else ("running" if self.started else "pending")
+        return "Job(" + repr(self.loadcase or "model") + ", " + state + (", " + repr(self.error) if self.error else "") + ")"
+
+    def start(self):
+        ''' Launch the analysis and start polling. Returns the job '''
+        self.started = time.perf_counter()
+        if not(self.timeout is None):
+            self._timer = threading.Timer(self.timeout, self._finish, ("Timed out after " + str(self.timeout) + " s",))
+            self._timer.daemon = True
+            self._timer.start()
+        if self.nf.hasResults(self.loadcase):
+            threading.Thread(target=self._run, daemon=True).start()
+            return self
+        if self.loadcase:
+            launched = self.nf.LaunchLoadCase(self.loadcase, self.outOfProc, self.noWindow)
+        else:
+            launched = self.nf.LaunchModel(self.outOfProc, self.noWindow)
+        if not launched:
+            self._finish("Launch failed")
+        else:
+            threading.Thread(target=self._poll, daemon=True).start()
+        return self
+
+    def _run(self):
+        # rerun: the blocking call returns the first analysis error, empty if successful
+        try:
+            if self.loadcase:
+                out = self.nf.RunLoadCase(self.loadcase, self.outOfProc, self.noWindow)
+            else:
+                out = self.nf.RunModel(self.outOfProc, self.noWindow)
+            self._finish(out if isinstance(out, str) else "", self.nf.getLastRunLog())
+        except Exception as ex:
+            self._finish(repr(ex))
+
+    def _poll(self):
+        wait = self.minInterval
+        try:
+            while not self._finished:
+                time.sleep(wait)
+                self.polls += 1
+                if self.nf.hasResults(self.loadcase):
+                    self._finish("", self.nf.getLastRunLog())
+                    return
+                wait = min(wait * self.backoff, self.maxInterval)
+        except Exception as ex:
+            self._finish(repr(ex))
+
+    def _finish(self, error="", log=None):
+        # only the first call counts (end of the run, failure or timeout). Callbacks (e.g. the collect of JobScheduler)
+        # run before waiting threads are released
+        with self._lock:
+            if self._finished: return
+            self._finished = True
+            self.seconds = time.perf_counter() - self.started
+            self.error = error
+            self.log = log if isinstance(log, list) else []
+            callbacks, self._callbacks = self._callbacks, []
+        if not(self._timer is None): self._timer.cancel()
+        try:
+            for fn in callbacks: fn(self)
+        finally:
+            self._done.set()
+
+    def done(self)->bool:
+        ''' True if the analysis has finished, or failed '''
+        return self._done.is_set()
+
+    @property
+    def ok(self)->bool:
+        return self.done() and self.error == ""
+
+    def wait(self, timeout=None)->bool:
+        ''' Wait for the analysis to finish, for at most timeout seconds. Returns True if finished '''
+        return self._done.wait(timeout)
+
+    def addDoneCallback(self, fn):
+        ''' Call fn(job) when the job finishes, from the polling thread; at once if already finished '''
+        with self._lock:
+            if not self._finished:
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+class JobScheduler:
+
+    def __init__(self, nf, maxConcurrent=2, outOfProc=True, noWindow=True, collect=None, **polling):
+        ''' Scheduler of loadcase jobs on one instance
+        
+        Args:
+            nf: NextFEMrest instance
+            maxConcurrent (optional): Optional. Loadcases running at the same time
+            outOfProc (optional): If true, run out of process, needed to run loadcases side by side
+            noWindow (optional): If true, hide the solver windows or their output lines from console
+            collect (optional): Optional. Callable collect(nf, loadcase) run as soon as a loadcase finishes, its return value is the job result
+            polling (optional): Optional. minInterval, maxInterval, backoff and timeout of the jobs
+        '''
+        self.nf = nf
+        self.maxConcurrent = max(1, int(maxConcurrent))
+        self.outOfProc = outOfProc
+        self.noWindow = noWindow
+        self.collect = collect
+        self.polling = polling
+        self.jobs = []
+        self._queue = []
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def submit(self, loadcase)->Job:
+        ''' Queue a loadcase, launched as soon as a slot is free. Returns its job '''
+        job = Job(self.nf, loadcase, self.outOfProc, self.noWindow, **self.polling)
+        job.addDoneCallback(self._done)
+        with self._lock:
+            self.jobs.append(job)
+            self._queue.append(job)
+        self._launch()
+        return job
+
+    def _launch(self):
+        while True:
+            with self._lock:
+                if not self._queue or self._running >= self.maxConcurrent: return
+                job = self._queue.pop(0)
+                self._running += 1
+            job.start()
+
+    def _done(self, job):
+        if self.collect and not job.error:
+            try:
+                job.result = self.collect(self.nf, job.loadcase)
+            except Exception as ex:
+                job.error = repr(ex)
+        with self._lock:
+            self._running -= 1
+        self._launch()
+
+    def gather(self, timeout=None)->dict:
+        ''' Wait for all the submitted jobs, for at most timeout seconds in total
+        
+        Returns:
+            Dictionary loadcase -> job result, for the finished jobs
+        '''
+        end = None if timeout is None else time.perf_counter() + timeout
+        for job in list(self.jobs):
+            job.wait(None if end is None else max(0.0, end - time.perf_counter()))
+        return dict((job.loadcase, job.result) for job in self.jobs if job.done())
+
+    def run(self, loadcases, timeout=None)->dict:
+        ''' Submit the loadcases and gather their results '''
+        for lc in loadcases: self.submit(lc)
+        return self.gather(timeout)
@@ -0,0 +1,117 @@
+'''
+Streaming JSON reader, for model data and results larger than memory.
+
+The document is walked structurally down to a given depth, and each value
+found there is decoded on its own with json's raw_decode, so that only one
+value at a time (plus one network chunk) is held in memory.
+
+    for path, value in iterItems(nf.nfrestStream('GET', '/model/results'), 4):
+        lc, time, quantity, ID = path
+'''
+
+import codecs, json
+import numpy as np
+
+_decoder = json.JSONDecoder()
+_WS = " \t\n\r"
+
+class _Reader:
+    # text buffer over an iterator of byte chunks
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self)->bool:
+        if self.eof: return False
+        if self.pos > 1 << 20:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        try:
+            self.buf += self._utf8.decode(next(self._chunks))
+        except StopIteration:
+            self.buf += self._utf8.decode(b"", final=True)
+            self.eof = True
+        return True
+
+    def peek(self)->str:
+        # next non-blank character, not consumed; "" at the end
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WS:
+                self.pos += 1
+            if self.pos < len(self.buf): return self.buf[self.pos]
+            if not self.fill(): return ""
+
+    def take(self, expected=None)->str:
+        c = self.peek()
+        if expected is not None and c not in expected:
+            raise ValueError("Unexpected " + repr(c) + " in JSON stream, expected " + repr(expected))
+        self.pos += 1
+        return c
+
+    def value(self):
+        # decode a whole value; numbers and literals need a following character to be complete
+        self.peek()
+        need = 0
+        while True:
+            if len(self.buf) - self.pos > need or self.eof:
+                try:
+                    value, end = _decoder.raw_decode(self.buf, self.pos)
+                    if end < len(self.buf) or self.eof:
+                        self.pos = end
+                        return value
+                except json.JSONDecodeError:
+                    if self.eof: raise
+            need = 2 * (len(self.buf) - self.pos)
+            self.fill()
+
+def _walk(reader, depth, path):
+    c = reader.peek()
+    if depth == 0 or c not in "{[":
+        yield path, reader.value()
+        return
+    reader.take()
+    close = "}" if c == "{" else "]"
+    i = 0
+    if reader.peek() == close:
+        reader.take()
+        return
+    while True:
+        if c == "{":
+            key = reader.value()
+            reader.take(":")
+        else:
+            key = i
+        yield from _walk(reader, depth - 1, path + (key,))
+        i += 1
+        if reader.take("," + close) == close: return
+
+def iterItems(chunks, depth=1):
+    ''' Yield (path, value) for each value at the given depth of a JSON document given as byte chunks.
+    Path is the tuple of keys (objects) and indices (arrays) leading to the value; values shallower than depth are yielded as they are '''
+    yield from _walk(_Reader(chunks), depth, ())
+
+def iterResultBlocks(chunks, blockSize=10000, quantities=None):
+    ''' Yield results as NumPy blocks, from the results JSON (loadcase -> time -> quantity -> item ID -> values) given as byte chunks
+    
+    Args:
+        chunks: Iterator of byte chunks, e.g. NextFEMrest.nfrestStream('GET', '/model/results')
+        blockSize (optional): Optional. Maximum number of items in a block
+        quantities (optional): Optional. Quantities to keep, e.g. ["disp", "react"]; all if not set
+
+    Returns:
+        Iterator of (loadcase, time, quantity, IDs, values): IDs as int64 array of size n, values as float64 array of size (n, ...)
+    '''
+    current, ids, values = None, [], []
+    for path, value in iterItems(chunks, 4):
+        if len(path) < 4: continue
+        key = path[0:3]
+        if not(quantities is None) and not key[2] in quantities: continue
+        if key != current or len(ids) >= blockSize:
+            if ids: yield current + (np.asarray(ids, dtype=np.int64), np.asarray(values, dtype=float))
+            current, ids, values = key, [], []
+        ids.append(int(path[3]))
+        values.append(value)
+    if ids: yield current + (np.asarray(ids, dtype=np.int64), np.asarray(values, dtype=float))
@@ -0,0 +1,157 @@
+'''
+Per-endpoint instrumentation of the requests of NextFEMrest.
+
+    m = nf.enableMetrics()
+    ...
+    print(m.table())                 # or m.toJSON(), m.prometheus()
+
+Requests are grouped by method and templated path, where the arguments of
+the path are replaced by {} (e.g. GET /res/nodalstress/{}/{}/{}/{}), with
+call count, latency histogram, request and response bytes and HTTP status.
+Templates come from the static path prefixes of the package requests, in
+the table of routes.py.
+With metrics disabled and msg False, requests are not timed at all.
+'''
+
+import bisect, json, threading
+from .routes import PREFIXES
+
+# upper bounds of the latency buckets, in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+def template(command)->str:
+    ''' Templated path of a request: the longest known static prefix, then {} for each further segment '''
+    path = command.split("?", 1)[0]
+    cut = len(path)
+    while cut > 0:
+        head, rest = path[0:cut], path[cut:]
+        if head in PREFIXES:
+            if rest == "": return head
+            if not head.endswith("/"): head, rest = head + "/", rest[1:]
+            return head + "/".join(["{}"] * (rest.count("/") + 1))
+        cut = path.rfind("/", 0, cut - 1) + 1
+    return "/" + "/".join(["{}"] * path.count("/"))
+
+class EndpointStats:
+    ''' Counters of one method and templated path '''
+    def __init__(self, method, path):
+        self.method = method
+        self.path = path
+        self.count = 0
+        self.seconds = 0.0
+        self.maxSeconds = 0.0
+        self.buckets = [0] * len(BUCKETS)
+        self.requestBytes = 0
+        self.responseBytes = 0
+        self.status = {}
+
+    @property
+    def meanSeconds(self)->float:
+        return self.seconds / self.count if self.count else 0.0
+
+    def percentile(self, q)->float:
+        ''' Upper bound of the latency bucket holding the q-th percentile, in seconds '''
+        rank = q / 100.0 * self.count
+        seen = 0
+        for bound, n in zip(BUCKETS, self.buckets):
+            seen += n
+            if seen >= rank and n: return min(bound, self.maxSeconds)
+        return self.maxSeconds
+
+    def asDict(self)->dict:
+        return {"method": self.method, "path": self.path, "count": self.count, "seconds": self.seconds, "maxSeconds": self.maxSeconds,
+                "buckets": dict(zip([str(b) for b in BUCKETS], self.buckets)), "requestBytes": self.requestBytes,
+                "responseBytes": self.responseBytes, "status": dict((str(k), v) for k, v in self.status.items())}
+
+class Metrics:
+
+    def __init__(self):
+        self.endpoints = {}
+        self._templates = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self.endpoints = {}
+
+    def record(self, method, command, seconds, bodyBytes, responseBytes, status):
+        ''' Add a request to the counters of its endpoint. The bytes sent are those of the body and of the request line '''
+        path = self._templates.get(command)
+        if path is None:
+            path = template(command)
+            if len(self._templates) > 100000: self._templates = {}
+            self._templates[command] = path
+        key = (method, path)
+        with self._lock:
+            ep = self.endpoints.get(key)
+            if ep is None:
+                ep = self.endpoints[key] = EndpointStats(method, path)
+            ep.count += 1
+            ep.seconds += seconds
+            if seconds > ep.maxSeconds: ep.maxSeconds = seconds
+            ep.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+            # "GET /node/1 HTTP/1.1\r\n": the command is sent URL-encoded as it is
+            ep.requestBytes += len(method) + len(command) + 12 + bodyBytes
+            ep.responseBytes += responseBytes
+            ep.status[status] = ep.status.get(status, 0) + 1
+
+    def sorted(self)->list:
+        ''' Endpoints by total time, longest first '''
+        return sorted(self.endpoints.values(), key=lambda ep: -ep.seconds)
+
+    def table(self, top=None)->str:
+        ''' Text table of the endpoints by total time '''
+        rows = [("method", "path", "calls", "total s", "mean ms", "p95 ms", "sent B", "recv B", "status")]
+        for ep in self.sorted()[0:top]:
+            rows.append((ep.method, ep.path, str(ep.count), format(ep.seconds, ".3f"), format(1000 * ep.meanSeconds, ".2f"),
+                         format(1000 * ep.percentile(95), ".2f"), str(ep.requestBytes), str(ep.responseBytes),
+                         " ".join(str(k) + ":" + str(v) for k, v in sorted(ep.status.items()))))
+        widths = [max(len(r[i]) for r in rows) for i in range(len(rows[0]))]
+        return "\n".join("  ".join(c.ljust(w) if i < 2 else c.rjust(w) for i, (c, w) in enumerate(zip(r, widths))).rstrip() for r in rows)
+
+    def toJSON(self)->str:
+        ''' Endpoints as a JSON array, by total time '''
+        return json.dumps([ep.asDict() for ep in self.sorted()])
+
+    def prometheus(self, prefix="nextfempy")->str:
+        ''' Endpoints in Prometheus text exposition format '''
+        out = ["# TYPE " + prefix + "_request_seconds histogram"]
+        for ep in self.sorted():
+            lbl = 'method="' + ep.method + '",path="' + ep.path + '"'
+            seen = 0
+            for bound, n in zip(BUCKETS, ep.buckets):
+                seen += n
+                out.append(prefix + '_request_seconds_bucket{' + lbl + ',le="' + ("+Inf" if bound == float("inf") else repr(bound)) + '"} ' + str(seen))
+            out.append(prefix + "_request_seconds_sum{" + lbl + "} " + repr(ep.seconds))
+            out.append(prefix + "_request_seconds_count{" + lbl + "} " + str(ep.count))
+        for name, field in (("request_bytes", "requestBytes"), ("response_bytes", "responseBytes")):
+            out.append("# TYPE " + prefix + "_" + name + "_total counter")
+            for ep in self.sorted():
+                out.append(prefix + "_" + name + '_total{method="' + ep.method + '",path="' + ep.path + '"} ' + str(getattr(ep, field)))
+        out.append("# TYPE " + prefix + "_responses_total counter")
+        for ep in self.sorted():
+            for status, n in sorted(ep.status.items()):
+                out.append(prefix + '_responses_total{method="' + ep.method + '",path="' + ep.path + '",status="' + str(status) + '"} ' + str(n))
+        return "\n".join(out) + "\n"
+
+class MetricsMixin:
+
+    metrics = None
+
+    def enableMetrics(self)->Metrics:
+        ''' Start recording per-endpoint call counts, latencies, bytes and status of all the requests
+        
+        Returns:
+            The Metrics, also in the metrics attribute
+        '''
+        if self.metrics is None: self.metrics = Metrics()
+        return self.metrics
+
+    def disableMetrics(self):
+        ''' Stop recording requests '''
+        self.metrics = None
+
+    def _observe(self, method, command, seconds, bodyBytes, responseBytes, status):
+        # sink of timed requests: console line if msg is set, metrics if enabled
+        if self.msg: print("*** " + self.user + " :: " + method, command, status)
+        if not(self.metrics is None): self.metrics.record(method, command, seconds, bodyBytes, responseBytes, status)
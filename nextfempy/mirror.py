@@ -0,0 +1,150 @@
+'''
+Local mirror of the model topology, built from one modeldata download.
+
+ModelMirror keeps nodes, element connectivity (CSR), section and material IDs
+and groups in NumPy arrays, and answers topology queries with the same names
+and return values as NextFEMrest, without round trips:
+
+    m = ModelMirror(nf)
+    for e in m.getConnectedElements(12):
+        print(m.getElementConnectivity(e))
+    m.refresh()      # after the model has changed
+'''
+
+import json
+import numpy as np
+from . import modeljson
+from .spatial import SpatialIndex
+
+class ModelMirror:
+
+    def __init__(self, nf=None, data=None):
+        ''' Mirror of the model of nf (NextFEMrest), or of model data given as a dictionary or JSON string '''
+        self.nf = nf
+        if data is None and not(nf is None):
+            self.refresh()
+        else:
+            self.load(data or {})
+
+    def refresh(self):
+        ''' Download the model again and rebuild the tables '''
+        self.load(self.nf.modeldata)
+        return self
+
+    def load(self, data):
+        ''' Build the tables from model data, as a dictionary or JSON string '''
+        if isinstance(data, (str, bytes)):
+            try:
+                data = json.loads(data)
+            except ValueError:
+                data = {}
+        if not isinstance(data, dict): data = {}
+        nodes = list(modeljson.iterNodes(data))
+        self.nodeIDs = np.array([int(n[0]) for n in nodes], dtype=np.int64)
+        self.coords = np.array([n[1:4] for n in nodes], dtype=float).reshape(-1, 3)
+        self._node = dict((int(n), i) for i, n in enumerate(self.nodeIDs))
+        elems = list(modeljson.iterElems(data))
+        self.elemIDs = np.array([int(e[0]) for e in elems], dtype=np.int64)
+        self.elemType = np.array([e[1] for e in elems], dtype=np.int32)
+        self.sect = np.array([e[3] for e in elems], dtype=np.int64)
+        self.mat = np.array([e[4] for e in elems], dtype=np.int64)
+        self._elem = dict((int(e), i) for i, e in enumerate(self.elemIDs))
+        # element -> node rows, CSR
+        sizes = np.array([len(e[2]) for e in elems], dtype=np.int64)
+        self.connPtr = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+        self.conn = np.array([self._node.get(int(n), -1) for e in elems for n in e[2]], dtype=np.int64)
+        # node -> element rows, CSR
+        owner = np.repeat(np.arange(len(elems), dtype=np.int64), sizes)
+        valid = self.conn >= 0
+        order = np.argsort(self.conn[valid], kind="stable")
+        self.nodeElems = owner[valid][order]
+        self.nodeElemPtr = np.searchsorted(self.conn[valid][order], np.arange(len(self.nodeIDs) + 1)).astype(np.int64)
+        self._spatial = None
+        self.groups = {}
+        for name, gelems, gnodes in modeljson.iterGroups(data):
+            self.groups[name] = {"elems": np.array([int(e) for e in gelems], dtype=np.int64), "nodes": np.array([int(n) for n in gnodes], dtype=np.int64)}
+        return self
+
+    def __repr__(self):
+        return "ModelMirror(" + str(len(self.nodeIDs)) + " nodes, " + str(len(self.elemIDs)) + " elements, " + str(len(self.groups)) + " groups)"
+
+    # array access
+    def nodeIndex(self, IDs)->np.ndarray:
+        ''' Rows of the given node IDs in nodeIDs and coords, -1 if missing '''
+        return np.array([self._node.get(int(n), -1) for n in np.ravel(IDs)], dtype=np.int64)
+
+    def elemIndex(self, IDs)->np.ndarray:
+        ''' Rows of the given element IDs in elemIDs, -1 if missing '''
+        return np.array([self._elem.get(int(e), -1) for e in np.ravel(IDs)], dtype=np.int64)
+
+    def elemNodes(self, ID)->np.ndarray:
+        ''' Node IDs of an element '''
+        i = self._elem[int(ID)]
+        rows = self.conn[self.connPtr[i]:self.connPtr[i + 1]]
+        return self.nodeIDs[rows[rows >= 0]]
+
+    def spatialIndex(self)->SpatialIndex:
+        ''' Spatial index of the nodes, built on first use and kept until the next refresh '''
+        if self._spatial is None: self._spatial = SpatialIndex(self.coords, self.nodeIDs)
+        return self._spatial
+
+    # same queries as NextFEMrest
+    @property
+    def nodesList(self)->list:
+        '''   Get the list of node numbers   '''
+        return [str(n) for n in self.nodeIDs]
+
+    @property
+    def elemsList(self)->list:
+        '''   Get the list of element numbers   '''
+        return [str(e) for e in self.elemIDs]
+
+    def getNodeCoordinates(self, ID):
+        ''' Returns node coordinates as double array, empty if not found '''
+        i = self._node.get(int(ID))
+        return [] if i is None else self.coords[i].tolist()
+
+    def getElementConnectivity(self, ID):
+        ''' Return the connectivity of the specified element, empty if not found '''
+        if not int(ID) in self._elem: return []
+        return [str(n) for n in self.elemNodes(ID)]
+
+    def getConnectedElements(self, node, onlyOfType=-1):
+        ''' Get all the elements connected to the specified node, optionally only of the given type '''
+        i = self._node.get(int(node))
+        if i is None: return []
+        rows = self.nodeElems[self.nodeElemPtr[i]:self.nodeElemPtr[i + 1]]
+        if onlyOfType != -1: rows = rows[self.elemType[rows] == int(onlyOfType)]
+        return [str(e) for e in self.elemIDs[rows]]
+
+    def getElementType(self, ID):
+        ''' Get element type code as a string, "0" if not found '''
+        i = self._elem.get(int(ID))
+        return "0" if i is None else str(self.elemType[i])
+
+    def getElementsFromGroup(self, name):
+        ''' Get elements from group '''
+        g = self.groups.get(name)
+        return [] if g is None else [str(e) for e in g["elems"]]
+
+    def getNodesFromGroup(self, name):
+        ''' Get nodes from group '''
+        g = self.groups.get(name)
+        return [] if g is None else [str(n) for n in g["nodes"]]
+
+    def getGroups(self):
+        ''' Get all groups in the model '''
+        return list(self.groups.keys())
+
+    def getNodesFromCoords(self, dir_, coord, tol=1E-06):
+        ''' Get nodes having the specified coordinates: dir_ is 1 for X, 2 for Y and 3 for Z '''
+        return [str(n) for n in self.spatialIndex().plane(dir_, float(coord), tol)]
+
+    def getAlignedNodes(self, n1, n2, tol=0):
+        ''' Return nodes aligned with the given two, as vert3 structures or coordinates '''
+        p = [[v.X, v.Y, v.Z] if hasattr(v, "X") else v for v in (n1, n2)]
+        return [str(n) for n in self.spatialIndex().aligned(p[0], p[1], tol)]
+
+    def getNodesOnSides(self, nodes:list, tol=4.94065645841247E-324):
+        ''' Get nodes on borders of the selected rectangular shell region, as bottom, right, top and left nodes '''
+        return [[str(n) for n in side] for side in self.spatialIndex().sides(nodes, tol)]
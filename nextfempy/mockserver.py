@@ -0,0 +1,546 @@
+'''
+Local stand-in for the NextFEM REST server, for offline tests and benchmarks.
+
+The mock keeps an in-memory model (nodes, elements, restraints, loads,
+masses, loadcases, groups, section and material IDs) and answers the node,
+element, section, material, bc, load, mass, group, model, res and op routes
+used by NextFEMrest, including the bulk endpoints and the request batches
+of deferred calls. Running the model gives synthetic results in the
+modelresults layout (disp, react, beamforces), with time histories of the
+given length.
+
+    python -m nextfempy.mockserver --port 5151 --latency 0.002
+
+or, from a script:
+
+    server, url = mockserver.start(latency=0.002)
+    nf = NextFEMrest(url, _msg=False)
+    ...
+    server.shutdown()
+
+Routes that are not modelled answer "True", as a successful call would.
+'''
+
+import argparse, json, re, threading, time, urllib.parse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from . import modeljson
+
+_KINDS = {"beam": modeljson.LINE, "truss": modeljson.LINE, "quad": modeljson.QUAD, "tria": modeljson.TRIA, "spring": modeljson.SPRING2NODES}
+
+class MockModel:
+    ''' In-memory model of the mock server '''
+    def __init__(self, steps=10):
+        self.steps = steps
+        self.lock = threading.RLock()
+        self.clear()
+
+    def clear(self):
+        self.nodes = {}
+        self.elems = {}
+        self.bcs = {}
+        self.loads = {}
+        self.masses = {}
+        self.loadcases = []
+        self.groups = {}
+        self.sections = []
+        self.materials = []
+        self.results = {}
+        self.runlog = []
+
+    def addNode(self, x, y, z, ID=None)->int:
+        ID = int(ID) if not(ID is None) else max(self.nodes, default=0) + 1
+        self.nodes[ID] = [float(x), float(y), float(z)]
+        self.results = {}
+        return ID
+
+    def addElem(self, type_, conn, sect=0, mat=0, ID=None, **props)->int:
+        conn = [int(n) for n in conn]
+        if not all(n in self.nodes for n in conn): return 0
+        ID = int(ID) if not(ID is None) else max(self.elems, default=0) + 1
+        self.elems[ID] = dict(props, type=int(type_), conn=conn, sect=int(sect or 0), mat=int(mat or 0))
+        self.results = {}
+        return ID
+
+    def addLoad(self, node, value, direction, loadcase)->bool:
+        if not int(node) in self.nodes or not 1 <= int(direction) <= 6: return False
+        if not loadcase in self.loadcases: self.loadcases.append(loadcase)
+        vec = self.loads.setdefault(loadcase, {}).setdefault(int(node), [0.0] * 6)
+        vec[int(direction) - 1] += float(value)
+        return True
+
+    def data(self)->dict:
+        ''' Model in the modeldata layout '''
+        nodes = [modeljson.nodeItem(n, *c) for n, c in self.nodes.items()]
+        elems = [modeljson.elemItem(e, d["type"], d["conn"], d["sect"], d["mat"]) for e, d in self.elems.items()]
+        data = modeljson.fragment(nodes, elems)
+        if self.groups: data[modeljson.GROUPS] = [{"name": k, "elems": [str(e) for e in g["elems"]], "nodes": [str(n) for n in g["nodes"]]}
+                                                  for k, g in self.groups.items()]
+        return data
+
+    def merge(self, data):
+        for num, x, y, z in modeljson.iterNodes(data):
+            self.nodes[int(num)] = [x, y, z]
+        for num, type_, conn, sect, mat in modeljson.iterElems(data):
+            self.elems[int(num)] = {"type": type_, "conn": [int(n) for n in conn], "sect": sect, "mat": mat}
+        for name, elems, nodes in modeljson.iterGroups(data):
+            self.groups[name] = {"elems": [int(e) for e in elems], "nodes": [int(n) for n in nodes]}
+        self.results = {}
+
+    def run(self, loadcases=None):
+        ''' Synthetic linear results: displacements proportional to the loads plus a term from the coordinates,
+        reactions balancing the loads on restrained nodes, beam forces varying along the stations '''
+        loadcases = loadcases or self.loadcases or ["sw"]
+        restrained = [n for n, bc in self.bcs.items() if any(bc) and n in self.nodes]
+        for k, lc in enumerate(loadcases):
+            loads = self.loads.get(lc, {})
+            f = 1.0 + k
+            disp = {}
+            for n, (x, y, z) in self.nodes.items():
+                p = loads.get(n, [0.0] * 6)
+                bc = self.bcs.get(n, [False] * 6)
+                disp[str(n)] = [0.0 if bc[d] else f * 1e-4 * (x, y, -z - x - y, 0, 0, 0)[d] + 1e-3 * p[d] for d in range(6)]
+            total = [sum(p[d] for p in loads.values()) for d in range(6)]
+            react = dict((str(n), [-t / len(restrained) for t in total]) for n in restrained)
+            beams = {}
+            for e, d in self.elems.items():
+                if d["type"] == modeljson.LINE:
+                    beams[str(e)] = [[f * (1 + 0.1 * s), f * (0.5 - 0.25 * s), 0.0, 0.0, f * (s - 2) ** 2, 0.1 * f] for s in range(5)]
+            self.results[lc] = {"1": {modeljson.DISP: disp, modeljson.REACT: react, modeljson.BEAMFORCES: beams}}
+            if not lc in self.loadcases: self.loadcases.append(lc)
+        self.runlog = ["Analysis of " + ", ".join(loadcases) + " completed", "Run " + str(time.time())]
+        return ""
+
+    def nodal(self, quantity, node, loadcase, direction)->float:
+        block = modeljson.resultBlock(self.results, loadcase, 1, quantity) or {}
+        values = block.get(str(node))
+        return 0.0 if values is None else values[int(direction) - 1]
+
+    def times(self, loadcase)->list:
+        if not loadcase in self.results: return []
+        return [i / float(max(1, self.steps - 1)) for i in range(self.steps)]
+
+    def history(self, loadcase, item, resultType, id1, id2)->list:
+        times = self.times(loadcase)
+        if int(resultType) == 0: return times
+        if int(resultType) == 8:
+            block = modeljson.resultBlock(self.results, loadcase, 1, modeljson.BEAMFORCES) or {}
+            v = block.get(str(item))
+            peak = 0.0 if v is None else v[0][max(1, int(id2)) - 1]
+        else:
+            quantity = modeljson.REACT if int(resultType) == 4 else modeljson.DISP
+            peak = self.nodal(quantity, item, loadcase, max(1, int(id1)))
+        return [peak * t for t in times]
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    # settings, overridden by start()
+    model = None
+    latency = 0.0
+    pad = 0
+    bulk = True
+    runTime = 0.0
+    counts = None
+
+    def _answer(self):
+        size = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(size) if size else b""
+        if self.latency: time.sleep(self.latency)
+        code, out = self._route(self.command, self.path, body)
+        with self.model.lock:
+            self.counts[self.command] = self.counts.get(self.command, 0) + 1
+        data = out.encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _route(self, method, path, body):
+        # status and answer text of a request
+        path = path.split("?", 1)[0]
+        code, out = 200, "True"
+        for m, pattern, fn in _ROUTES:
+            if m == method:
+                match = pattern.match(path)
+                if match:
+                    args = [urllib.parse.unquote(a) if not(a is None) else None for a in match.groups()]
+                    try:
+                        with self.model.lock:
+                            code, out = fn(self, body, *args)
+                    except Exception as e:
+                        # as a server failing on bad arguments
+                        code, out = 500, repr(e)
+                    break
+        if not isinstance(out, str):
+            out = json.dumps(out)
+            if self.pad: out += " " * self.pad
+        return code, out
+
+    do_GET = do_POST = do_PUT = do_DELETE = _answer
+
+    def log_message(self, *args):
+        pass
+
+    # routes: each returns (status, answer); answers other than str are sent as JSON
+    def newModel(self, body):
+        self.model.clear()
+        return 200, ""
+
+    def maxNode(self, body):
+        return 200, str(max(self.model.nodes, default=0))
+
+    def maxElem(self, body):
+        return 200, str(max(self.model.elems, default=0))
+
+    def nodesList(self, body):
+        return 200, [str(n) for n in self.model.nodes]
+
+    def elemsList(self, body):
+        return 200, [str(e) for e in self.model.elems]
+
+    def nodesNumber(self, body):
+        return 200, str(len(self.model.nodes))
+
+    def elemsNumber(self, body):
+        return 200, str(len(self.model.elems))
+
+    def addNode(self, body, rest):
+        v = rest.split("/")
+        if len(v) == 4:
+            # addNodeWithID
+            if int(v[3]) in self.model.nodes: return 200, "False"
+            self.model.addNode(v[0], v[1], v[2], v[3])
+            return 200, "True"
+        return 200, str(self.model.addNode(*v[0:3]))
+
+    def node(self, body, ID):
+        c = self.model.nodes.get(int(ID))
+        return 200, [] if c is None else c
+
+    def setNode(self, body, ID):
+        if not int(ID) in self.model.nodes: return 200, "False"
+        self.model.nodes[int(ID)] = [float(v) for v in json.loads(body)[0:3]]
+        self.model.results = {}
+        return 200, "True"
+
+    def removeNode(self, body, ID):
+        if self.model.nodes.pop(int(ID), None) is None: return 200, "False"
+        self.model.results = {}
+        return 200, "True"
+
+    def connected(self, body, ID, onlyOfType):
+        t = int(onlyOfType)
+        return 200, [str(e) for e, d in self.model.elems.items() if int(ID) in d["conn"] and (t < 0 or d["type"] == t)]
+
+    def addElem(self, body, kind, rest):
+        v = rest.split("/")
+        if kind == "spring":
+            return 200, str(self.model.addElem(modeljson.SPRING2NODES, v[0:2], prop=v[2] if len(v) > 2 else ""))
+        if kind == "nodalspring":
+            return 200, str(self.model.addElem(modeljson.SPRING2NODES, v[0:1], prop=v[1] if len(v) > 1 else ""))
+        if kind in ("beamwithid", "trusswithid"):
+            if int(v[2]) in self.model.elems: return 200, "False"
+            return 200, str(self.model.addElem(modeljson.LINE, v[0:2], v[3], v[4], v[2]) > 0)
+        n = {"beam": 2, "truss": 2, "quad": 4, "tria": 3}.get(kind)
+        if n is None: return 200, "0"
+        return 200, str(self.model.addElem(_KINDS[kind], v[0:n], *v[n:n + 2]))
+
+    def addSection(self, body, rest):
+        self.model.sections.append(rest)
+        return 200, str(len(self.model.sections))
+
+    def addMaterial(self, body, rest):
+        self.model.materials.append(rest)
+        return 200, str(len(self.model.materials))
+
+    def conn(self, body, ID):
+        d = self.model.elems.get(int(ID))
+        return 200, [] if d is None else [str(n) for n in d["conn"]]
+
+    def elemType(self, body, ID):
+        d = self.model.elems.get(int(ID))
+        return 200, "0" if d is None else str(d["type"])
+
+    def removeElem(self, body, ID):
+        if self.model.elems.pop(int(ID), None) is None: return 200, "False"
+        self.model.results = {}
+        return 200, "True"
+
+    def setBC(self, body, node, rest):
+        if not int(node) in self.model.nodes: return 200, "False"
+        self.model.bcs[int(node)] = [v == "True" for v in rest.split("/")[0:6]]
+        return 200, "True"
+
+    def removeBC(self, body, node):
+        return 200, str(self.model.bcs.pop(int(node), None) is not None)
+
+    def isRestrained(self, body, node):
+        return 200, str(any(self.model.bcs.get(int(node), [])))
+
+    def addLoad(self, body, node, value, direction, loadcase, local):
+        return 200, str(self.model.addLoad(node, value, direction, loadcase))
+
+    def addMass(self, body, node, rest):
+        if not int(node) in self.model.nodes: return 200, "False"
+        self.model.masses[int(node)] = [float(v) for v in rest.split("/")[0:6]]
+        return 200, "True"
+
+    def loadcases(self, body):
+        return 200, list(self.model.loadcases)
+
+    def addLoadCase(self, body, name):
+        if name in self.model.loadcases: return 200, "False"
+        self.model.loadcases.append(name)
+        return 200, "True"
+
+    def groups(self, body):
+        return 200, list(self.model.groups)
+
+    def addGroup(self, body, name):
+        if name in self.model.groups: return 200, "False"
+        self.model.groups[name] = {"elems": [], "nodes": []}
+        return 200, "True"
+
+    def groupElems(self, body, name):
+        g = self.model.groups.get(name)
+        return 200, [] if g is None else [str(i) for i in g["elems"]]
+
+    def groupNodes(self, body, name):
+        g = self.model.groups.get(name)
+        return 200, [] if g is None else [str(i) for i in g["nodes"]]
+
+    def getData(self, body):
+        return 200, self.model.data()
+
+    def setData(self, body):
+        # the model JSON comes as a JSON string, as sent by the modeldata setter
+        data = json.loads(body) if body else ""
+        if not isinstance(data, str): return 400, "False"
+        self.model.clear()
+        self.model.merge(json.loads(data or "{}"))
+        return 200, ""
+
+    def mergeData(self, body, data):
+        try:
+            self.model.merge(json.loads(data))
+        except ValueError:
+            return 200, "False"
+        return 200, "True"
+
+    def getResults(self, body):
+        return 200, self.model.results
+
+    def setResults(self, body):
+        self.model.results = json.loads(body or b"{}")
+        return 200, ""
+
+    def hasResults(self, body):
+        lc = self.headers.get("lc", "")
+        return 200, str(lc in self.model.results if lc else bool(self.model.results))
+
+    def deleteResults(self, body):
+        self.model.results = {}
+        return 200, "True"
+
+    def disp(self, body, node, loadcase, t, direction):
+        return 200, repr(self.model.nodal(modeljson.DISP, node, loadcase, direction))
+
+    def react(self, body, node, loadcase, t, direction):
+        return 200, repr(self.model.nodal(modeljson.REACT, node, loadcase, direction))
+
+    def beamForces(self, body, ID, loadcase, station, t):
+        block = modeljson.resultBlock(self.model.results, loadcase, 1, modeljson.BEAMFORCES) or {}
+        v = block.get(str(ID))
+        return 200, [0.0] * 6 if v is None else v[min(max(1, int(station)), len(v)) - 1]
+
+    def periods(self, body, loadcase):
+        return 200, self.model.times(loadcase)
+
+    def history(self, body, loadcase, item, resultType, id1, id2):
+        return 200, self.model.history(loadcase, item, resultType, id1, id2)
+
+    def run(self, body, loadcase=None):
+        return 200, self.model.run([loadcase] if loadcase else None)
+
+    def launch(self, body, loadcase=None):
+        # results appear after runTime seconds
+        def finish():
+            with self.model.lock: self.model.run([loadcase] if loadcase else None)
+        threading.Timer(self.runTime, finish).start()
+        return 200, "True"
+
+    def runlog(self, body):
+        return 200, list(self.model.runlog)
+
+    # bulk endpoints, column-wise bodies as sent by BulkMixin
+    def _disabled(self):
+        return 404, ""
+
+    def bulkNodes(self, body):
+        if not self.bulk: return self._disabled()
+        b = json.loads(body)
+        ids = b.get("ids") or [None] * len(b["coords"])
+        return 200, [self.model.addNode(*c[0:3], ID=i) for c, i in zip(b["coords"], ids)]
+
+    def bulkElems(self, body, kind):
+        if not self.bulk: return self._disabled()
+        b = json.loads(body)
+        n = len(b["conn"])
+        col = lambda k: b.get(k) or [None] * n
+        if kind == "solid":
+            types = [modeljson.SOLID_TYPES.get(len(c), 0) for c in b["conn"]]
+        else:
+            types = [_KINDS.get(kind, 0)] * n
+        return 200, [self.model.addElem(t, c, s or 0, m or 0, ID=i) if t else 0
+                     for t, c, s, m, i in zip(types, b["conn"], col("sect"), col("mat"), col("ids"))]
+
+    def bulkSprings(self, body):
+        if not self.bulk: return self._disabled()
+        b = json.loads(body)
+        return 200, [self.model.addElem(modeljson.SPRING2NODES, [n], prop=p) for n, p in zip(b["nodes"], b["prop"])]
+
+    def bulkBCs(self, body):
+        if not self.bulk: return self._disabled()
+        b = json.loads(body)
+        out = []
+        for n, bc in zip(b["nodes"], b["bc"]):
+            ok = int(n) in self.model.nodes
+            if ok: self.model.bcs[int(n)] = [bool(v) for v in bc]
+            out.append(ok)
+        return 200, out
+
+    def bulkRemoveBCs(self, body):
+        if not self.bulk: return self._disabled()
+        return 200, [self.model.bcs.pop(int(n), None) is not None for n in json.loads(body)["nodes"]]
+
+    def bulkLoads(self, body, loadcase, local):
+        if not self.bulk: return self._disabled()
+        b = json.loads(body)
+        return 200, [self.model.addLoad(n, v, d, loadcase) for n, d, v in zip(b["nodes"], b["directions"], b["values"])]
+
+    def bulkMasses(self, body):
+        if not self.bulk: return self._disabled()
+        b = json.loads(body)
+        out = []
+        for n, m in zip(b["nodes"], b["masses"]):
+            ok = int(n) in self.model.nodes
+            if ok: self.model.masses[int(n)] = [float(v) for v in m]
+            out.append(ok)
+        return 200, out
+
+    def batch(self, body):
+        # requests applied in order, as queued by Deferred
+        if not self.bulk: return self._disabled()
+        out = []
+        for r in json.loads(body)["requests"]:
+            code, text = self._route(r["method"], r["path"], b"" if r.get("body") is None else json.dumps(r["body"]).encode())
+            out.append({"status": code, "body": text})
+        return 200, out
+
+_S = "([^/]*)"
+_ROUTES = [(method, re.compile(pattern + "$"), fn) for method, pattern, fn in [
+    ("POST", "/node/add/bulk", MockHandler.bulkNodes),
+    ("POST", "/element/add/bulk/" + _S, MockHandler.bulkElems),
+    ("POST", "/element/add/nodalspring/bulk", MockHandler.bulkSprings),
+    ("POST", "/bc/set/bulk", MockHandler.bulkBCs),
+    ("POST", "/bc/remove/bulk", MockHandler.bulkRemoveBCs),
+    ("POST", "/load/node/add/bulk/" + _S + "/" + _S, MockHandler.bulkLoads),
+    ("POST", "/mass/add/bulk", MockHandler.bulkMasses),
+    ("POST", "/op/batch", MockHandler.batch),
+    ("GET", "/op/new", MockHandler.newModel),
+    ("GET", "/op/maxnodeid", MockHandler.maxNode),
+    ("GET", "/op/maxelementid", MockHandler.maxElem),
+    ("GET", "/op/run/.*", MockHandler.run),
+    ("GET", "/op/runlc/" + _S + "/.*", MockHandler.run),
+    ("GET", "/op/launchmodel/.*", MockHandler.launch),
+    ("GET", "/op/launchlc/" + _S + "/.*", MockHandler.launch),
+    ("GET", "/op/runlog", MockHandler.runlog),
+    ("GET", "/nodes", MockHandler.nodesList),
+    ("GET", "/nodes/number", MockHandler.nodesNumber),
+    ("GET", "/elements", MockHandler.elemsList),
+    ("GET", "/elements/number", MockHandler.elemsNumber),
+    ("GET", "/node/add/(.*)", MockHandler.addNode),
+    ("GET", "/node/connectedelements/" + _S + "/" + _S, MockHandler.connected),
+    ("GET", "/node/" + _S, MockHandler.node),
+    ("POST", "/node/" + _S, MockHandler.setNode),
+    ("DELETE", "/node/" + _S, MockHandler.removeNode),
+    ("GET", "/element/add/" + _S + "/(.*)", MockHandler.addElem),
+    ("GET", "/element/conn/" + _S, MockHandler.conn),
+    ("GET", "/section/add/(.*)", MockHandler.addSection),
+    ("GET", "/material/add/(.*)", MockHandler.addMaterial),
+    ("POST", "/material/add/(.*)", MockHandler.addMaterial),
+    ("GET", "/element/type/" + _S, MockHandler.elemType),
+    ("DELETE", "/element/" + _S, MockHandler.removeElem),
+    ("GET", "/bc/set/" + _S + "/(.*)", MockHandler.setBC),
+    ("DELETE", "/bc/" + _S, MockHandler.removeBC),
+    ("GET", "/bc/node/" + _S, MockHandler.isRestrained),
+    ("GET", "/load/node/add/" + _S + "/" + _S + "/" + _S + "/" + _S + "/" + _S, MockHandler.addLoad),
+    ("GET", "/mass/add/" + _S + "/(.*)", MockHandler.addMass),
+    ("GET", "/loadcases", MockHandler.loadcases),
+    ("GET", "/loadcase/add/" + _S, MockHandler.addLoadCase),
+    ("GET", "/groups", MockHandler.groups),
+    ("GET", "/group/add/" + _S, MockHandler.addGroup),
+    ("GET", "/group/elements/" + _S, MockHandler.groupElems),
+    ("GET", "/group/nodes/" + _S, MockHandler.groupNodes),
+    ("GET", "/model/data", MockHandler.getData),
+    ("POST", "/model/data", MockHandler.setData),
+    ("PUT", "/model/data(.*)", MockHandler.mergeData),
+    ("GET", "/model/results", MockHandler.getResults),
+    ("POST", "/model/results", MockHandler.setResults),
+    ("GET", "/res", MockHandler.hasResults),
+    ("GET", "/res/delete", MockHandler.deleteResults),
+    ("GET", "/res/displacement/" + _S + "/" + _S + "/" + _S + "/" + _S, MockHandler.disp),
+    ("GET", "/res/reaction/" + _S + "/" + _S + "/" + _S + "/" + _S, MockHandler.react),
+    ("GET", "/res/beamforces/" + _S + "/" + _S + "/" + _S + "/" + _S, MockHandler.beamForces),
+    ("GET", "/res/periods/" + _S, MockHandler.periods),
+    ("GET", "/res/hist/" + _S + "/" + _S + "/" + _S + "/" + _S + "/" + _S, MockHandler.history),
+]]
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+def start(host="127.0.0.1", port=0, latency=0.0, pad=0, steps=10, runTime=0.5, bulk=True, model=None):
+    ''' Start a mock server in a background thread
+
+    Args:
+        host (optional): Optional. Address to listen on
+        port (optional): Optional. Port, a free one if 0
+        latency (optional): Optional. Delay added to every request, in seconds
+        pad (optional): Optional. Blank bytes appended to every JSON answer, to emulate larger payloads
+        steps (optional): Optional. Time steps of the result histories
+        runTime (optional): Optional. Duration of launched analyses (LaunchModel, LaunchLoadCase), in seconds
+        bulk (optional): Optional. If False, bulk endpoints answer 404 as on servers without them
+        model (optional): Optional. MockModel to serve, a new one if not set
+
+    Returns:
+        The server, with the model in its model attribute, and its base URL
+    '''
+    handler = type("MockHandler", (MockHandler,), {"model": model or MockModel(steps), "latency": latency, "pad": pad,
+                                                   "runTime": runTime, "bulk": bulk, "counts": {}})
+    server = MockServer((host, port), handler)
+    server.model = handler.model
+    server.counts = handler.counts
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, "http://" + host + ":" + str(server.server_address[1])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m nextfempy.mockserver", description="Local stand-in for the NextFEM REST server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5151)
+    parser.add_argument("--latency", type=float, default=0.0, help="delay added to every request, in seconds")
+    parser.add_argument("--pad", type=int, default=0, help="blank bytes appended to every JSON answer")
+    parser.add_argument("--steps", type=int, default=10, help="time steps of the result histories")
+    parser.add_argument("--run-time", type=float, default=0.5, help="duration of launched analyses, in seconds")
+    parser.add_argument("--no-bulk", action="store_true", help="answer 404 on bulk endpoints")
+    args = parser.parse_args(argv)
+    server, url = start(args.host, args.port, args.latency, args.pad, args.steps, args.run_time, not args.no_bulk)
+    print("NextFEM mock server on " + url)
+    try:
+        while True: time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+'''
+Layout of the model JSON exchanged through modeldata and mergeModelData.
+
+Nodes follow vert3.to_dict ("num", "X", "Y", "Z"); elements carry their
+connectivity as a list of node IDs in "Conn". All the code reading or writing
+model JSON goes through this module, so that the layout is set in one place.
+'''
+
+import json
+from .common import qt
+
+NODES = "nodes"
+ELEMS = "elems"
+GROUPS = "groups"
+
+# element types, as in getElementType
+LINE = 1
+TRIA = 2
+QUAD = 3
+HEXA = 4
+WEDGE = 5
+TETRA = 6
+HEXA20 = 23
+TETRA10 = 24
+WEDGE15 = 26
+SPRING2NODES = 40
+SOLID_TYPES = {4: TETRA, 6: WEDGE, 8: HEXA, 10: TETRA10, 15: WEDGE15, 20: HEXA20}
+
+def nodeItem(num, x, y, z, lcs=None)->dict:
+    ''' Node entry, with optional local axes as the 6 components of the 1st and 2nd vector '''
+    item = {"num": str(num), "X": float(x), "Y": float(y), "Z": float(z)}
+    if not(lcs is None):
+        item["lcs1"] = [float(v) for v in lcs[0:3]]
+        item["lcs2"] = [float(v) for v in lcs[3:6]]
+    return item
+
+def elemItem(num, type_, conn, sect=0, mat=0, **props)->dict:
+    ''' Element entry. Further properties (e.g. sect2, truss, spring) are added as they are '''
+    item = {"num": str(num), "type": int(type_), "Conn": [str(n) for n in conn], "sect": int(sect), "mat": int(mat)}
+    item.update(props)
+    return item
+
+def fragment(nodes=None, elems=None)->dict:
+    ''' Model fragment to be merged with mergeModelData '''
+    data = {}
+    if nodes: data[NODES] = nodes
+    if elems: data[ELEMS] = elems
+    return data
+
+def mergeChunks(key, items, maxLength):
+    ''' Slices of items such that each fragment {key: items[slice]}, URL-encoded in the query string by mergeModelData, is at most maxLength characters long. An item longer than that is sent alone '''
+    base = len(qt(json.dumps({key: []})))
+    sep = len(qt(", "))
+    start, size = 0, base
+    for i, item in enumerate(items):
+        n = len(qt(json.dumps(item)))
+        if i > start and size + sep + n > maxLength:
+            yield slice(start, i)
+            start, size = i, base
+        size += n if i == start else sep + n
+    if start < len(items): yield slice(start, len(items))
+
+def _items(container):
+    # entries of a list, or of a dictionary keyed by ID
+    if isinstance(container, dict):
+        for k, v in container.items():
+            if isinstance(v, dict) and not "num" in v:
+                v = dict(v); v["num"] = k
+            yield v
+    elif isinstance(container, list):
+        yield from container
+
+def _get(item:dict, *keys, default=None):
+    for k in keys:
+        if k in item: return item[k]
+    return default
+
+def iterNodes(data:dict):
+    ''' Nodes of a model as (num, x, y, z) '''
+    for n in _items(data.get(NODES)):
+        yield str(n["num"]), float(_get(n, "X", "x", default=0)), float(_get(n, "Y", "y", default=0)), float(_get(n, "Z", "z", default=0))
+
+def iterElems(data:dict):
+    ''' Elements of a model as (num, type, conn, sect, mat) '''
+    for e in _items(data.get(ELEMS)):
+        yield (str(e["num"]), int(_get(e, "type", "Type", default=0)), [str(n) for n in _get(e, "Conn", "conn", "nodes", default=[])],
+               int(_get(e, "sect", "Sect", default=0) or 0), int(_get(e, "mat", "Mat", default=0) or 0))
+
+def iterGroups(data:dict):
+    ''' Groups of a model as (name, elems, nodes) '''
+    groups = data.get(GROUPS)
+    if isinstance(groups, dict):
+        groups = [dict(g, name=k) if isinstance(g, dict) else {"name": k, "elems": g} for k, g in groups.items()]
+    for g in groups or []:
+        yield str(_get(g, "name", "Name")), [str(e) for e in _get(g, "elems", "Elems", default=[])], [str(n) for n in _get(g, "nodes", "Nodes", default=[])]
+
+# results JSON (modelresults): loadcase -> time -> quantity -> item ID -> values
+DISP = "disp"
+REACT = "react"
+BEAMFORCES = "beamforces"
+SHELLFORCES = "shellforces"
+STRESS = "stress"
+
+def _timeKey(block:dict, time):
+    # time keys may be written as "1", "1.0" or "1E-02"
+    key = str(time)
+    if key in block: return key
+    for k in block:
+        try:
+            if float(k) == float(time): return k
+        except ValueError:
+            pass
+    return None
+
+def resultBlock(results:dict, loadcase, time, quantity):
+    ''' Dictionary item ID -> values for a quantity at the given loadcase and time, None if not in results '''
+    lc = results.get(str(loadcase)) if isinstance(results, dict) else None
+    if not isinstance(lc, dict): return None
+    key = _timeKey(lc, time)
+    if key is None or not isinstance(lc[key], dict): return None
+    return lc[key].get(quantity)
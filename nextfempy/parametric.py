@@ -0,0 +1,159 @@
+'''
+Parametric studies over a pool of NextFEM Designer or Server instances.
+
+Each variant of a parameter grid is built by a user callable on a free
+instance, run with RunModel, and reduced to the wanted results by a collect
+callable, so variants run in parallel, one per instance:
+
+    def build(nf, span, sect):
+        nf.newModel()
+        ...
+    def collect(nf, params):
+        return nf.getNodalDispArray("sw")[0]
+    runner = ParametricRunner(build, ["http://host1:5151", ("http://host2:5151", "user2")], collect)
+    for v in runner.run(ParametricRunner.grid(span=[4, 5, 6], sect=[1, 2])):
+        print(v.params, v.ok, v.error)
+
+Variants whose instance fails with a connection error or timeout are put
+back in the queue for the other instances; an instance failing repeatedly
+is left out of the pool.
+'''
+
+import itertools, queue, threading, time
+from .common import des
+from .fanout import TRANSIENT
+
+class Variant:
+    ''' A variant of the study: parameters, collected result or error, instance used '''
+    def __init__(self, index, params):
+        self.index = index
+        self.params = dict(params)
+        self.result = None
+        self.error = ""
+        self.endpoint = None
+        self.attempts = 0
+        self.seconds = 0.0
+        self.done = False
+
+    @property
+    def ok(self)->bool:
+        return self.done and self.error == ""
+
+    def __repr__(self):
+        return "Variant(" + str(self.index) + ", " + str(self.params) + ", " + ("ok" if self.ok else repr(self.error)) + ")"
+
+class ParametricRunner:
+
+    def __init__(self, builder, endpoints, collect=None, maxAttempts=3, maxEndpointFailures=2, outOfProc=False):
+        ''' Runner of a model builder over a pool of instances
+        
+        Args:
+            builder: Callable builder(nf, **params) generating the model of a variant on nf (NextFEMrest)
+            endpoints: NextFEMrest instances, base URLs, or (base URL, user) tuples for NextFEM Server
+            collect (optional): Optional. Callable collect(nf, params) returning the results to keep, by default resultsData
+            maxAttempts (optional): Optional. Attempts of a variant failing because of its instance
+            maxEndpointFailures (optional): Optional. Consecutive failures after which an instance is left out
+            outOfProc (optional): Optional. Passed to RunModel
+        '''
+        from .nextfempy import NextFEMrest
+        self.builder = builder
+        self.collect = collect or (lambda nf, params: nf.resultsData())
+        self.maxAttempts = maxAttempts
+        self.maxEndpointFailures = maxEndpointFailures
+        self.outOfProc = outOfProc
+        self.endpoints = []
+        for ep in endpoints:
+            if isinstance(ep, str):
+                ep = NextFEMrest(ep, _msg=False)
+            elif isinstance(ep, tuple):
+                ep = NextFEMrest(ep[0], ep[1], _msg=False)
+            self.endpoints.append(ep)
+        self.retired = []
+
+    @staticmethod
+    def grid(**axes)->list:
+        ''' Cartesian product of parameter values, e.g. grid(span=[4,5], sect=[1,2]) gives 4 dictionaries '''
+        names = list(axes)
+        return [dict(zip(names, values)) for values in itertools.product(*[list(axes[n]) for n in names])]
+
+    def runOne(self, nf, variant):
+        ''' Build, run and collect a variant on an instance. Connection errors are raised, other errors are stored in the variant '''
+        t0 = time.perf_counter()
+        variant.endpoint = nf.baseUrl
+        variant.error = ""
+        try:
+            self.builder(nf, **variant.params)
+            err = des(nf.RunModel(self.outOfProc))
+            if err:
+                variant.error = str(err)
+            else:
+                variant.result = self.collect(nf, variant.params)
+        except TRANSIENT:
+            raise
+        except Exception as ex:
+            variant.error = repr(ex)
+        variant.seconds = time.perf_counter() - t0
+        variant.done = True
+
+    def run(self, params)->list:
+        ''' Run all the variants, as a list of parameter dictionaries or as a dictionary of axes for grid
+        
+        Returns:
+            List of Variant, in the order of params
+        '''
+        if isinstance(params, dict): params = self.grid(**params)
+        variants = [Variant(i, p) for i, p in enumerate(params)]
+        todo = queue.Queue()
+        for v in variants: todo.put(v)
+        state = {"pending": len(variants), "alive": len(self.endpoints)}
+        lock = threading.Lock()
+
+        def finish(v):
+            with lock: state["pending"] -= 1
+
+        def worker(nf):
+            failures = 0
+            while True:
+                with lock:
+                    if state["pending"] == 0: return
+                try:
+                    v = todo.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                v.attempts += 1
+                try:
+                    self.runOne(nf, v)
+                    failures = 0
+                    finish(v)
+                except TRANSIENT as ex:
+                    failures += 1
+                    v.error = repr(ex)
+                    if v.attempts < self.maxAttempts:
+                        todo.put(v)
+                    else:
+                        v.done = True
+                        finish(v)
+                    if failures >= self.maxEndpointFailures:
+                        with lock:
+                            state["alive"] -= 1
+                            self.retired.append(nf)
+                            last = state["alive"] == 0
+                        if last: self._drain(todo, finish)
+                        return
+
+        threads = [threading.Thread(target=worker, args=(nf,), daemon=True) for nf in self.endpoints]
+        for t in threads: t.start()
+        for t in threads: t.join()
+        if state["pending"]: self._drain(todo, finish)
+        return variants
+
+    def _drain(self, todo, finish):
+        # no instance left: the queued variants fail
+        while True:
+            try:
+                v = todo.get_nowait()
+            except queue.Empty:
+                return
+            v.error = v.error or "No instance available"
+            v.done = True
+            finish(v)
@@ -0,0 +1,218 @@
+'''
+Record and replay of the requests of a NextFEMrest session.
+
+Recorder captures every request and its answer (method, path, headers,
+body, status, response, timings) to a compact binary log; ReplayTransport
+serves them back to a client without any server, so that the client side
+of a script can be profiled on its own, and summarize tells which
+endpoints a trace spends its time on:
+
+    with Recorder(nf, "session.nfrl"):
+        run_my_script(nf)
+    print(summarize("session.nfrl").table())
+
+    nf = NextFEMrest(_msg=False)
+    ReplayTransport("session.nfrl").install(nf)
+    run_my_script(nf)                  # answered from the log
+
+The log is a zlib stream of length-prefixed records, after a short header.
+'''
+
+import json, struct, threading, time, zlib
+from .calls import Answer
+from .metrics import Metrics
+
+_MAGIC = b"NFRL\x01"
+_HEAD = struct.Struct("<ddH")
+_LEN = struct.Struct("<I")
+
+class Record:
+    ''' A recorded request and its answer. start is in seconds from the beginning of the recording '''
+    def __init__(self, method, command, headers, body, status, content, encoding, start, seconds):
+        self.method = method
+        self.command = command
+        self.headers = headers
+        self.body = body
+        self.status = status
+        self.content = content
+        self.encoding = encoding
+        self.start = start
+        self.seconds = seconds
+
+    def __repr__(self):
+        return "Record(" + self.method + " " + self.command + ", " + str(self.status) + ", " + format(1000 * self.seconds, ".2f") + " ms)"
+
+    def _pack(self)->bytes:
+        parts = [_HEAD.pack(self.start, self.seconds, self.status)]
+        for field in (self.method.encode(), self.command.encode(), json.dumps(self.headers).encode(), self.body or b"", self.content,
+                      (self.encoding or "").encode()):
+            parts.append(_LEN.pack(len(field)))
+            parts.append(field)
+        return b"".join(parts)
+
+    @staticmethod
+    def _unpack(data):
+        start, seconds, status = _HEAD.unpack_from(data, 0)
+        pos = _HEAD.size
+        fields = []
+        for i in range(6):
+            n = _LEN.unpack_from(data, pos)[0]
+            pos += _LEN.size
+            fields.append(data[pos:pos + n])
+            pos += n
+        method, command, headers, body, content, encoding = fields
+        return Record(method.decode(), command.decode(), json.loads(headers), body, status, content, encoding.decode() or None, start, seconds)
+
+def readLog(path):
+    ''' Iterate the records of a log, in the order they were made '''
+    inflate = zlib.decompressobj()
+    buf = b""
+    with open(path, "rb") as f:
+        if f.read(len(_MAGIC)) != _MAGIC: raise ValueError("Not a NextFEMrest request log: " + str(path))
+        while True:
+            chunk = f.read(1 << 16)
+            buf += inflate.decompress(chunk) if chunk else inflate.flush()
+            pos = 0
+            while len(buf) - pos >= _LEN.size:
+                n = _LEN.unpack_from(buf, pos)[0]
+                if len(buf) - pos < _LEN.size + n: break
+                yield Record._unpack(buf[pos + _LEN.size:pos + _LEN.size + n])
+                pos += _LEN.size + n
+            buf = buf[pos:]
+            if not chunk: return
+
+def summarize(path)->Metrics:
+    ''' Per-endpoint metrics of a log, with the recorded timings '''
+    m = Metrics()
+    for r in readLog(path):
+        m.record(r.method, r.command, r.seconds, len(r.body or b""), len(r.content), r.status)
+    return m
+
+class Recorder:
+
+    def __init__(self, nf, path, level=6):
+        ''' Start recording the requests of nf (NextFEMrest) to a log file, replaced if existing
+
+        Args:
+            nf: NextFEMrest instance
+            path: Log file
+            level (optional): Optional. zlib compression level
+        '''
+        self.nf = nf
+        self.path = path
+        self.count = 0
+        self._file = open(path, "wb")
+        self._file.write(_MAGIC)
+        self._deflate = zlib.compressobj(level)
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+        self._send = nf._send
+        nf._send = self._recordSend
+        nf.nfrestStream = self._recordStream
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _write(self, method, command, response, t0, content):
+        request = response.request
+        rec = Record(method, command, dict(request.headers), request.body if isinstance(request.body, bytes) else (request.body or "").encode(),
+                     response.status_code, content, response.encoding, t0 - self._t0, time.perf_counter() - t0)
+        data = rec._pack()
+        with self._lock:
+            if self._file is None: return
+            self._file.write(self._deflate.compress(_LEN.pack(len(data)) + data))
+            self.count += 1
+
+    def _recordSend(self, method, command, body=None, heads=None):
+        t0 = time.perf_counter()
+        response = self._send(method, command, body, heads)
+        self._write(method, command, response, t0, response.content)
+        return response
+
+    def _recordStream(self, method, command, body=None, heads=None, chunkSize=1<<20):
+        # chunks are yielded as they arrive and recorded as one answer at the end; a reader stopping early records what it read
+        if not(self.nf._deferred is None): self.nf._deferred.flush()
+        t0 = time.perf_counter()
+        hds = dict(self.nf.headers)
+        if not(heads is None): hds.update(heads)
+        content = bytearray()
+        with self.nf.session.request(method, self.nf.baseUrl + command, headers=hds, json=body, timeout=self.nf.timeout, stream=True) as response:
+            try:
+                for chunk in response.iter_content(chunkSize):
+                    content += chunk
+                    yield chunk
+            finally:
+                self._write(method, command, response, t0, bytes(content))
+                if not(self.nf.metrics is None) or self.nf.msg:
+                    self.nf._observe(method, command, time.perf_counter() - t0, len(response.request.body or b""), len(content), response.status_code)
+
+    def close(self):
+        ''' Stop recording and close the log '''
+        with self._lock:
+            if self._file is None: return
+            self._file.write(self._deflate.flush())
+            self._file.close()
+            self._file = None
+        if self.nf._send == self._recordSend: del self.nf._send
+        if self.nf.nfrestStream == self._recordStream: del self.nf.nfrestStream
+
+class ReplayTransport:
+
+    def __init__(self, path, strict=False, delay=False):
+        ''' Answers of a log, served back in place of a server
+
+        Args:
+            path: Log file made by Recorder
+            strict (optional): Optional. If True, requests not in the log raise KeyError; otherwise they are answered with status 404
+            delay (optional): Optional. If True, wait the recorded time of each request before answering
+        '''
+        self.strict = strict
+        self.delay = delay
+        self.misses = []
+        self._answers = {}
+        self._lock = threading.Lock()
+        for r in readLog(path):
+            self._answers.setdefault(self._key(r.method, r.command, r.body), []).append(r)
+
+    @staticmethod
+    def _key(method, command, body):
+        # recorded bodies are the JSON sent, bodies given by the client are Python objects
+        if body == b"": body = None
+        if isinstance(body, bytes):
+            try:
+                body = json.loads(body)
+            except ValueError:
+                body = body.decode("latin-1")
+        return method, command, json.dumps(body, sort_keys=True)
+
+    def answer(self, method, command, body=None, heads=None)->Answer:
+        ''' Answer to a request: recorded answers of the same request are given in order, the last one is repeated '''
+        with self._lock:
+            found = self._answers.get(self._key(method, command, body))
+            if not found:
+                self.misses.append((method, command))
+                if self.strict: raise KeyError(method + " " + command + " is not in the log")
+                return Answer(b"", 404)
+            r = found.pop(0) if len(found) > 1 else found[0]
+        if self.delay: time.sleep(r.seconds)
+        return Answer(r.content, r.status, r.encoding)
+
+    def install(self, nf):
+        ''' Answer the requests of nf (NextFEMrest) from the log. Returns nf '''
+        def send(method, command, body=None, heads=None):
+            if not(nf._deferred is None): nf._deferred.flush()
+            t0 = time.perf_counter()
+            answer = self.answer(method, command, body, heads)
+            if not(nf.metrics is None) or nf.msg:
+                nf._observe(method, command, time.perf_counter() - t0, 0 if body is None else len(json.dumps(body)), len(answer.content), answer.status_code)
+            return answer
+        def stream(method, command, body=None, heads=None, chunkSize=1<<20):
+            content = send(method, command, body, heads).content
+            for i in range(0, len(content), chunkSize):
+                yield content[i:i + chunkSize]
+        nf._send = send
+        nf.nfrestStream = stream
+        return nf
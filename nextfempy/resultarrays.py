@@ -0,0 +1,198 @@
+'''
+Results of NextFEMrest as NumPy arrays, taken from the whole results JSON
+(modelresults) or from concurrent single-value queries.
+'''
+
+import numpy as np
+from .common import des
+from . import modeljson
+from .jsonstream import iterItems, iterResultBlocks
+
+BEAM_COMPONENTS = ("N", "Vy", "Vz", "Mt", "My", "Mz")
+
+class ResultArray:
+    ''' Array of results with a list of labels along each axis '''
+    def __init__(self, values, axes, labels):
+        self.values = values
+        self.axes = tuple(axes)
+        self.labels = dict((a, list(labels[a])) for a in self.axes)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __array__(self, dtype=None, copy=None):
+        return self.values if dtype is None else self.values.astype(dtype)
+
+    def __repr__(self):
+        return "ResultArray(" + ", ".join(a + "=" + str(len(self.labels[a])) for a in self.axes) + ")"
+
+    def index(self, axis, label)->int:
+        ''' Position of a label along an axis '''
+        return [str(v) for v in self.labels[axis]].index(str(label))
+
+    def sel(self, **selection):
+        ''' Select labels along one or more axes, e.g. forces.sel(loadcases=["sw","perm"], components="My").
+        A single label drops the axis, a list keeps it '''
+        values = self.values
+        axes = list(self.axes)
+        labels = dict(self.labels)
+        for axis, wanted in selection.items():
+            k = axes.index(axis)
+            if isinstance(wanted, (list, tuple, np.ndarray)):
+                pos = [self.index(axis, w) for w in wanted]
+                values = np.take(values, pos, axis=k)
+                labels[axis] = [labels[axis][p] for p in pos]
+            else:
+                values = np.take(values, self.index(axis, wanted), axis=k)
+                axes.pop(k)
+                labels.pop(axis)
+        return ResultArray(values, axes, labels)
+
+class ResultArraysMixin:
+
+    def resultsData(self)->dict:
+        ''' Get all the results of the model as a dictionary, to be passed to the *Array methods to avoid downloading them again
+        
+        Returns:
+            Dictionary loadcase -> time -> quantity -> item ID -> values. Empty if results are not available
+        '''
+        data = des(self.modelresults)
+        return data if isinstance(data, dict) else {}
+    def iterResults(self, blockSize=10000, quantities=None):
+        ''' Iterate all the results of the model as NumPy blocks, reading the results JSON as a stream: results larger than memory can be processed
+        
+        Args:
+            blockSize (optional): Optional. Maximum number of items in a block
+            quantities (optional): Optional. Quantities to read, e.g. ["disp", "react", "beamforces"]; all if not set
+
+        Returns:
+            Iterator of (loadcase, time, quantity, IDs, values) with IDs as int64 array of size n and values as float64 array of size (n, ...)
+        '''
+        return iterResultBlocks(self.nfrestStream('GET', '/model/results'), blockSize, quantities)
+    def iterModelData(self, depth=2):
+        ''' Iterate the model JSON as a stream, e.g. with depth 2 each node or element entry as (("nodes", ID or index), entry) '''
+        return iterItems(self.nfrestStream('GET', '/model/data'), depth)
+    def _nodalArray(self, quantity, single, loadcase, time, nodes, results, workers):
+        # (N,6) nodal results from results data if available, from concurrent single-value queries otherwise; NaN for nodes missing from the data
+        if results is None: results = self.resultsData()
+        block = modeljson.resultBlock(results, loadcase, time, quantity)
+        if nodes is None:
+            ids = list(block.keys()) if block else self.nodesList
+        else:
+            ids = np.asarray(nodes).reshape(-1).tolist()
+        out = np.full((len(ids), 6), np.nan)
+        if block:
+            for i, n in enumerate(ids):
+                v = block.get(str(n))
+                if not(v is None): out[i, 0:len(v[0:6])] = v[0:6]
+        else:
+            values = self.map(single, [(n, loadcase, time, d) for n in ids for d in range(1, 7)], workers)
+            out[:] = np.asarray(values, dtype=float).reshape(-1, 6)
+        return out, np.asarray(ids, dtype=np.int64)
+    def getNodalDispArray(self, loadcase, time=1, nodes=None, results=None, workers=8):
+        ''' Get all the nodal displacements from the selected loadcase and time
+        
+        Args:
+            loadcase: loadcase name
+            time (optional): Optional. Default is 1 = linear analysis
+            nodes (optional): Optional. Array of node IDs, all nodes if not set
+            results (optional): Optional. Results from resultsData, downloaded if not set
+            workers (optional): Optional. Concurrent requests, if results are not available as a whole
+
+        Returns:
+            Array of size (N,6) with displacements in global X, Y, Z, RX, RY, RZ, NaN for nodes without results, and array of N node IDs
+        '''
+        return self._nodalArray(modeljson.DISP, self.getNodalDisp, loadcase, time, nodes, results, workers)
+    def getNodalReactArray(self, loadcase, time=1, nodes=None, results=None, workers=8):
+        ''' Get all the nodal reactions from the selected loadcase and time
+        
+        Args:
+            loadcase: loadcase name
+            time (optional): Optional. Default is 1 = linear analysis
+            nodes (optional): Optional. Array of node IDs, all restrained nodes if not set
+            results (optional): Optional. Results from resultsData, downloaded if not set
+            workers (optional): Optional. Concurrent requests, if results are not available as a whole
+
+        Returns:
+            Array of size (N,6) with reactions in global X, Y, Z, RX, RY, RZ, NaN for nodes without results, and array of N node IDs
+        '''
+        if nodes is None and results is None:
+            results = self.resultsData()
+            if not modeljson.resultBlock(results, loadcase, time, modeljson.REACT):
+                nodes = [n for n in self.nodesList if self.isRestrained(n)]
+        return self._nodalArray(modeljson.REACT, self.getNodalReact, loadcase, time, nodes, results, workers)
+    def getResultHistories(self, loadcase, items, resultType, resultID1=0, resultID2=0, decimate=1, workers=8):
+        ''' Get the result histories of many items with concurrent getResultHistory queries, aligned to getTimePeriods
+        
+        Args:
+            loadcase: Name of the loadcase
+            items: Node or element IDs
+            resultType: Type of result, as in getResultHistory
+            resultID1 (optional): Component as in getResultHistory, the same for all items or one per item
+            resultID2 (optional): Beam component as in getResultHistory, the same for all items or one per item
+            decimate (optional): Optional. Keep one time step every decimate in the returned array. It only thins the output: the REST API has no decimated history query, so whole histories are downloaded
+            workers (optional): Optional. Concurrent requests
+
+        Returns:
+            Array of size (items, times) with NaN where a history is missing or shorter, and array of times
+        '''
+        items = np.asarray(items).reshape(-1).tolist()
+        id1 = np.broadcast_to(np.asarray(resultID1), (len(items),)).tolist()
+        id2 = np.broadcast_to(np.asarray(resultID2), (len(items),)).tolist()
+        times = self.getTimePeriods(loadcase)
+        times = np.asarray(times if isinstance(times, list) else [], dtype=float)
+        step = max(1, int(decimate))
+        out = np.full((len(items), len(times[::step])), np.nan)
+        hists = self.map(self.getResultHistory, [(loadcase, items[i], resultType, id1[i], id2[i]) for i in range(len(items))], workers)
+        for i, h in enumerate(hists):
+            if isinstance(h, list) and h:
+                h = np.asarray(h[0:len(times)], dtype=float)[::step]
+                out[i, 0:len(h)] = h
+        return out, times[::step]
+    def getBeamForcesArray(self, elems=None, loadcases=None, stations=(1, 2, 3, 4, 5), time=1, results=None, workers=8):
+        ''' Get beam forces for many elements, loadcases and stations
+        
+        Args:
+            elems (optional): Optional. Array of element IDs, all beams in results if not set
+            loadcases (optional): Optional. Array of loadcase names, all loadcases if not set
+            stations (optional): Optional. Stations, usually a beam has 5 stations (1, 2, 3, 4 or 5)
+            time (optional): Optional. Default is 1 = linear analysis
+            results (optional): Optional. Results from resultsData, downloaded if not set
+            workers (optional): Optional. Concurrent requests, for data not available in results
+
+        Returns:
+            ResultArray of size (E,L,S,6) with axes elems, loadcases, stations and components (N, Vy, Vz, Mt, My, Mz).
+            NaN for elements, stations or loadcases without results, and where the server query failed
+        '''
+        if results is None: results = self.resultsData()
+        if loadcases is None:
+            loadcases = [lc for lc in results] if results else self.getLoadCases()
+        blocks = [modeljson.resultBlock(results, lc, time, modeljson.BEAMFORCES) for lc in loadcases]
+        if elems is None:
+            found = [b for b in blocks if b]
+            if found:
+                elems = list(found[0].keys())
+            else:
+                elist = self.elemsList
+                types = self.map(self.getElementType, elist, workers)
+                elems = [e for e, t in zip(elist, types) if t in ("1", "line")]
+        elems = np.asarray(elems).reshape(-1).tolist()
+        stations = list(stations)
+        out = np.full((len(elems), len(loadcases), len(stations), 6), np.nan)
+        missing = []
+        for j, block in enumerate(blocks):
+            if not block:
+                missing.extend((i, j, k) for i in range(len(elems)) for k in range(len(stations)))
+                continue
+            for i, e in enumerate(elems):
+                v = block.get(str(e))
+                if v is None: continue
+                for k, st in enumerate(stations):
+                    if int(st) <= len(v): out[i, j, k] = v[int(st) - 1][0:6]
+        if missing:
+            values = self.map(self.getBeamForces, [(elems[i], loadcases[j], stations[k], str(time)) for i, j, k in missing], workers)
+            for (i, j, k), v in zip(missing, values):
+                if isinstance(v, list) and len(v) >= 6: out[i, j, k] = v[0:6]
+        return ResultArray(out, ("elems", "loadcases", "stations", "components"),
+                           {"elems": np.asarray(elems, dtype=np.int64), "loadcases": loadcases, "stations": stations, "components": BEAM_COMPONENTS})
@@ -0,0 +1,603 @@
+'''
+Static path prefixes of the requests of NextFEMrest, used by metrics to
+template request paths. Generated from the request calls in the package
+sources; run python -m nextfempy.routes after changing them.
+'''
+
+import os, re
+
+PREFIXES = frozenset((
+    '/bc/',
+    '/bc/get/',
+    '/bc/node/',
+    '/bc/remove/bulk',
+    '/bc/set/',
+    '/bc/set/bulk',
+    '/designmaterial/add/fromlib',
+    '/designmaterial/prop/',
+    '/designmaterial/proplist/',
+    '/designmaterials',
+    '/designmaterials/libraries/',
+    '/designmaterials/library/',
+    '/designmaterials/libraryf/',
+    '/element/',
+    '/element/add/beam/',
+    '/element/add/beamwithid/',
+    '/element/add/bulk/',
+    '/element/add/nodalspring/',
+    '/element/add/nodalspring/bulk',
+    '/element/add/quad/',
+    '/element/add/quadwithid/',
+    '/element/add/soilsprings/',
+    '/element/add/solid/',
+    '/element/add/spring/',
+    '/element/add/springsonnodes/',
+    '/element/add/springwithid/',
+    '/element/add/subsoil',
+    '/element/add/tria/',
+    '/element/add/triawithid/',
+    '/element/add/truss/',
+    '/element/add/trusswithid/',
+    '/element/area/',
+    '/element/beamangle/',
+    '/element/beamendoffset/',
+    '/element/beamendrelease/',
+    '/element/beamoffset/',
+    '/element/centroid/',
+    '/element/conn/',
+    '/element/customprop/',
+    '/element/exportdxf',
+    '/element/extrudedbeam/',
+    '/element/info/',
+    '/element/iscolumn/',
+    '/element/lcs/',
+    '/element/lcsA/',
+    '/element/macro/',
+    '/element/planestrain/',
+    '/element/planestress/',
+    '/element/prop/',
+    '/element/rebar/barsdiam',
+    '/element/rebar/clear/',
+    '/element/rebar/coords/',
+    '/element/rebar/hoopsdiam',
+    '/element/rebar/long/',
+    '/element/rebar/pattern/',
+    '/element/rebar/size/',
+    '/element/rebar/stirrup/',
+    '/element/setjoint/',
+    '/element/shellendrelease/',
+    '/element/shellxaxis/',
+    '/element/type/',
+    '/element/volume/',
+    '/element/walls/elems',
+    '/element/walls/height/',
+    '/element/walls/list',
+    '/element/walls/section/',
+    '/element/walls/set/',
+    '/elements',
+    '/elements/number',
+    '/function/add/',
+    '/function/ec8spectrum/',
+    '/function/fromfile/',
+    '/function/gendata/',
+    '/function/name/',
+    '/function/ntcspectrum/',
+    '/function/plot/',
+    '/function/plotdata/',
+    '/function/plotmultipledata/',
+    '/function/series/',
+    '/function/sine/',
+    '/function/units/',
+    '/function/value/',
+    '/functions',
+    '/group/add/',
+    '/group/assign/',
+    '/group/delete/',
+    '/group/elements/',
+    '/group/nodes/',
+    '/groups',
+    '/hinge/add/nvm/',
+    '/hinge/add/simple/',
+    '/hinge/assign/',
+    '/hinge/refresh',
+    '/hinge/remove/',
+    '/hinge/removetype/',
+    '/load/',
+    '/load/all',
+    '/load/alllc/',
+    '/load/change/',
+    '/load/element/beamadd/',
+    '/load/element/beamaddA/',
+    '/load/element/beamaddU/',
+    '/load/element/edgeadd/',
+    '/load/element/get/',
+    '/load/element/surfaceadd/',
+    '/load/element/tempdistadd/',
+    '/load/element/volumeadd/',
+    '/load/firepoint/',
+    '/load/floor/planeadd/',
+    '/load/floor/planeremove/',
+    '/load/floor/planesget',
+    '/load/floor/planetype/',
+    '/load/floor/remove/',
+    '/load/floor/set/',
+    '/load/getA/',
+    '/load/getduration/',
+    '/load/inloadcase/',
+    '/load/lateralforces/',
+    '/load/node/add/',
+    '/load/node/add/bulk/',
+    '/load/node/disp/',
+    '/load/node/get/',
+    '/load/node/isloaded/',
+    '/load/setA',
+    '/load/setduration/',
+    '/load/setsw/',
+    '/load/setswdir/',
+    '/loadcase/',
+    '/loadcase/add/',
+    '/loadcase/combo/add/',
+    '/loadcase/combo/addth/',
+    '/loadcase/combo/designtype/',
+    '/loadcase/combo/get/',
+    '/loadcase/combo/getenv/',
+    '/loadcase/combo/remove/',
+    '/loadcase/combo/removeth/',
+    '/loadcase/combo/set/',
+    '/loadcase/combo/setenv/',
+    '/loadcase/combo/setphase/',
+    '/loadcase/combo/setseismicecc/',
+    '/loadcase/combo/setseismiclc/',
+    '/loadcase/combo/setsrss/',
+    '/loadcase/fromcombo/',
+    '/loadcase/generate/',
+    '/loadcase/getfactor/',
+    '/loadcase/getfunc/',
+    '/loadcase/getpsi/',
+    '/loadcase/gettype/',
+    '/loadcase/sequence/',
+    '/loadcase/setbuck/',
+    '/loadcase/setcfactors/',
+    '/loadcase/setfactor/',
+    '/loadcase/setmodal/',
+    '/loadcase/setnldyn/',
+    '/loadcase/setnlstatic/',
+    '/loadcase/setpdelta/',
+    '/loadcase/setpsi/',
+    '/loadcase/setrs/',
+    '/loadcase/settype/',
+    '/loadcases',
+    '/loadcases/combos/',
+    '/loadcases/combostable',
+    '/loadcases/combostable/',
+    '/loadcases/descombos/designtype/',
+    '/loadcases/static',
+    '/mass/add/',
+    '/mass/add/bulk',
+    '/mass/autoX',
+    '/mass/autoY',
+    '/mass/autoZ',
+    '/mass/load2mass/',
+    '/mass/remove/',
+    '/material/add/des/',
+    '/material/add/fromlib',
+    '/material/add/iso/',
+    '/material/assign/',
+    '/material/concretentc/',
+    '/material/frpdata/',
+    '/material/prop/',
+    '/material/proplist/',
+    '/material/remove/',
+    '/materials',
+    '/materials/libraries',
+    '/materials/library/',
+    '/materials/libraryf/',
+    '/model',
+    '/model/addobject/',
+    '/model/bom',
+    '/model/centermass',
+    '/model/colors/area',
+    '/model/colors/back',
+    '/model/colors/border',
+    '/model/colors/colorize/',
+    '/model/colors/constraint',
+    '/model/colors/default',
+    '/model/colors/elemtext',
+    '/model/colors/hinge',
+    '/model/colors/line',
+    '/model/colors/mass',
+    '/model/colors/node',
+    '/model/colors/nodetext',
+    '/model/colors/release',
+    '/model/colors/restraint',
+    '/model/colors/rule',
+    '/model/colors/selarea',
+    '/model/colors/selline',
+    '/model/colors/selnode',
+    '/model/colors/selsolid',
+    '/model/colors/solid',
+    '/model/colors/spring',
+    '/model/colors/text',
+    '/model/customdata/',
+    '/model/data',
+    '/model/drawing/',
+    '/model/env',
+    '/model/group/exportdxf/',
+    '/model/group/exportelevdxf/',
+    '/model/loadingdata',
+    '/model/member/add',
+    '/model/member/all',
+    '/model/member/elems/',
+    '/model/member/exportdxf/',
+    '/model/member/leng/',
+    '/model/member/remove/',
+    '/model/model2section',
+    '/model/path',
+    '/model/results',
+    '/model/section2model/',
+    '/model/storeystiff/',
+    '/model/totalmass',
+    '/model/userviews',
+    '/node/',
+    '/node/add/',
+    '/node/add/bulk',
+    '/node/area',
+    '/node/connectedelements/',
+    '/node/cs/',
+    '/node/info/',
+    '/node/prop/',
+    '/node/setjoint/',
+    '/node/vertex/',
+    '/nodes',
+    '/nodes/number',
+    '/nodev',
+    '/nodev/',
+    '/op/batch',
+    '/op/bwfilter/',
+    '/op/clearselection',
+    '/op/controlnode',
+    '/op/corners',
+    '/op/docx/appendformula/',
+    '/op/docx/appendimage/',
+    '/op/docx/appendimageb/',
+    '/op/docx/appendtext/',
+    '/op/docx/bytes',
+    '/op/docx/compile/',
+    '/op/docx/create',
+    '/op/docx/delheadings',
+    '/op/docx/delheadingsbytitle/',
+    '/op/docx/fontsize',
+    '/op/docx/headings',
+    '/op/docx/html',
+    '/op/docx/save',
+    '/op/docx/tablealign',
+    '/op/docx/tableborders',
+    '/op/docx/tablefit',
+    '/op/docx/tablefontsize',
+    '/op/export/ccm',
+    '/op/export/dxf/',
+    '/op/export/gltf/',
+    '/op/export/idea',
+    '/op/export/ifc/',
+    '/op/export/midas',
+    '/op/export/opensees/',
+    '/op/export/osproc',
+    '/op/export/saf',
+    '/op/export/sap2000',
+    '/op/export/table',
+    '/op/export/wexbim/',
+    '/op/export/xmlres',
+    '/op/freeelementid',
+    '/op/freenodeid',
+    '/op/greek',
+    '/op/import/abaqus',
+    '/op/import/dolmen',
+    '/op/import/dxf',
+    '/op/import/dxfentities',
+    '/op/import/dxfstream',
+    '/op/import/gmesh',
+    '/op/import/ifc/',
+    '/op/import/mesh',
+    '/op/import/midasfile',
+    '/op/import/midasresult',
+    '/op/import/midasresultapi',
+    '/op/import/midasresulttext',
+    '/op/import/midastext',
+    '/op/import/nodeelem',
+    '/op/import/obj',
+    '/op/import/opensees',
+    '/op/import/recorder/',
+    '/op/import/saf',
+    '/op/import/sap2000',
+    '/op/import/seismostruct',
+    '/op/import/sismicad',
+    '/op/import/sismicadset',
+    '/op/import/sismicadsettext',
+    '/op/import/sofistik',
+    '/op/import/sr3',
+    '/op/import/sr4',
+    '/op/import/stl',
+    '/op/import/straus7',
+    '/op/import/straus7result',
+    '/op/import/straus7resulttext',
+    '/op/import/valfromstring/',
+    '/op/import/winstrand',
+    '/op/import/zeusnl',
+    '/op/import/zeusnlres',
+    '/op/is64bit',
+    '/op/launchlc/',
+    '/op/launchmodel/',
+    '/op/lic',
+    '/op/maxelementid',
+    '/op/maxnodeid',
+    '/op/mesh/addmeshedwall/',
+    '/op/mesh/alignednodes/',
+    '/op/mesh/borders/',
+    '/op/mesh/connectivity',
+    '/op/mesh/constraint/',
+    '/op/mesh/dividehexa/',
+    '/op/mesh/divideline',
+    '/op/mesh/dividelinebynodes/',
+    '/op/mesh/dividequad/',
+    '/op/mesh/dividewedge/',
+    '/op/mesh/findfreenodes',
+    '/op/mesh/findoverlappedelements',
+    '/op/mesh/generateframe/',
+    '/op/mesh/lineelems',
+    '/op/mesh/mergeimportedlines',
+    '/op/mesh/mergelines',
+    '/op/mesh/mergenodes',
+    '/op/mesh/meshedsection/',
+    '/op/mesh/movenodes/',
+    '/op/mesh/nodesbycoords/',
+    '/op/mesh/quad2tria/',
+    '/op/mesh/quad2wall/',
+    '/op/mesh/removefreenodes',
+    '/op/mesh/removeoverlappedelements',
+    '/op/mesh/renumber/elements/',
+    '/op/mesh/renumber/elementsbycoords/',
+    '/op/mesh/renumber/nodes/',
+    '/op/mesh/renumber/nodesbycoords/',
+    '/op/mesh/rigiddiaph',
+    '/op/mesh/rigiddiaph/',
+    '/op/mesh/rigidlink/',
+    '/op/mesh/rotatenodes/',
+    '/op/mesh/scalenodes/',
+    '/op/mesh/tria/',
+    '/op/mesh/triamulti/',
+    '/op/new',
+    '/op/open',
+    '/op/opt/baseline',
+    '/op/opt/binfolder',
+    '/op/opt/calcaccuracy',
+    '/op/opt/calcrefinement',
+    '/op/opt/calcusefibers',
+    '/op/opt/changedefsolvertype/',
+    '/op/opt/changesolver/',
+    '/op/opt/defsolvertype',
+    '/op/opt/dxfoptions',
+    '/op/opt/ifcanalytical',
+    '/op/opt/ifcformat',
+    '/op/opt/ifcwallmeshsize',
+    '/op/opt/lang',
+    '/op/opt/lang/',
+    '/op/opt/numberformat',
+    '/op/opt/os/beamwithhinges',
+    '/op/opt/os/fasteigen',
+    '/op/opt/os/intpoints',
+    '/op/opt/os/ndfibersects',
+    '/op/opt/os/statevars',
+    '/op/opt/os/tensilesrc',
+    '/op/opt/rescalc/allresjson',
+    '/op/opt/rescalc/cacheenabled',
+    '/op/opt/rescalc/concbeh',
+    '/op/opt/rescalc/domainslices',
+    '/op/opt/rescalc/domcorr',
+    '/op/opt/rescalc/eltoll',
+    '/op/opt/rescalc/homog',
+    '/op/opt/rescalc/kmod',
+    '/op/opt/rescalc/rebhard',
+    '/op/opt/rescalc/steelclass',
+    '/op/opt/rescalc/strhard',
+    '/op/opt/rescalc/tensresp',
+    '/op/opt/saveopts',
+    '/op/opt/separator',
+    '/op/opt/solvertype',
+    '/op/opt/tempfolder',
+    '/op/opt/wallmeshsize',
+    '/op/redo',
+    '/op/run/',
+    '/op/runlc/',
+    '/op/runlog',
+    '/op/save',
+    '/op/saveundo',
+    '/op/saveuser',
+    '/op/sectioncalc/a/',
+    '/op/sectioncalc/b/',
+    '/op/sectioncalc/bilmomentcurvature',
+    '/op/sectioncalc/c/',
+    '/op/sectioncalc/d/',
+    '/op/sectioncalc/fireimage/',
+    '/op/sectioncalc/image/',
+    '/op/sectioncalc/imageB/',
+    '/op/sectioncalc/imagewithbars/',
+    '/op/sectioncalc/momentcurvature/',
+    '/op/sectioncalc/momentcurvaturedata',
+    '/op/sectioncalc/shear/',
+    '/op/sectioncalc/shear2/',
+    '/op/sectioncalc/shearres',
+    '/op/selectedelements',
+    '/op/selectednodes',
+    '/op/sep',
+    '/op/showvieport/',
+    '/op/trasl',
+    '/op/undo',
+    '/op/undo/',
+    '/op/userfile',
+    '/op/userfiles',
+    '/op/view/',
+    '/res',
+    '/res/beamdeflection/',
+    '/res/beamdeflections/',
+    '/res/beamdiagram/',
+    '/res/beamforce/',
+    '/res/beamforce2/',
+    '/res/beamforces/',
+    '/res/beamforcesatnode/',
+    '/res/beamforcesenvtable/',
+    '/res/check/analyzefire/',
+    '/res/check/beammoments/',
+    '/res/check/beamshearres/',
+    '/res/check/checkbymat/',
+    '/res/check/cleardomains',
+    '/res/check/data/',
+    '/res/check/element/',
+    '/res/check/elementA/',
+    '/res/check/elementRatio/',
+    '/res/check/elements/',
+    '/res/check/elementsA/',
+    '/res/check/elementsM/',
+    '/res/check/elementsRatio/',
+    '/res/check/htmllog',
+    '/res/check/item',
+    '/res/check/lastplotsectiondomain/',
+    '/res/check/logname/',
+    '/res/check/model/',
+    '/res/check/node/',
+    '/res/check/nodes/',
+    '/res/check/nodesA/',
+    '/res/check/nodsA/',
+    '/res/check/plot3dsectiondomain',
+    '/res/check/plotsectiondomain/',
+    '/res/check/sets',
+    '/res/check/station/',
+    '/res/check/user',
+    '/res/delchecks',
+    '/res/delete',
+    '/res/displacement/',
+    '/res/donotdelete',
+    '/res/donotdeletechecks',
+    '/res/firstmode/',
+    '/res/hist/',
+    '/res/import/beamforces/',
+    '/res/import/elementcheck/',
+    '/res/import/nodecheck/',
+    '/res/maxminbeamforces/',
+    '/res/maxmindispl/',
+    '/res/maxminwoodarmer/',
+    '/res/maxminwoodarmerg/',
+    '/res/modes/',
+    '/res/nodalshellforce/',
+    '/res/nodalstress/',
+    '/res/partfactors/',
+    '/res/partmasses/',
+    '/res/period/',
+    '/res/periods/',
+    '/res/reaction/',
+    '/res/sectioncutforce/',
+    '/res/soilpressureatnode/',
+    '/section/',
+    '/section/add/addcirc/',
+    '/section/add/addrect/',
+    '/section/add/box/',
+    '/section/add/bypoints/',
+    '/section/add/changeaddpt/',
+    '/section/add/circ/',
+    '/section/add/cover/',
+    '/section/add/cshape/',
+    '/section/add/doublecshape/',
+    '/section/add/doublelshape/',
+    '/section/add/dtshape/',
+    '/section/add/fill/',
+    '/section/add/fromdxf/',
+    '/section/add/fromlib',
+    '/section/add/fromlib/',
+    '/section/add/hole/',
+    '/section/add/layeredplanar',
+    '/section/add/lshape/',
+    '/section/add/omega/',
+    '/section/add/pipe/',
+    '/section/add/planar/',
+    '/section/add/rect/',
+    '/section/add/removefigure/',
+    '/section/add/tshape/',
+    '/section/assign/',
+    '/section/duplicate/',
+    '/section/exportdxf/',
+    '/section/figure/',
+    '/section/prop/',
+    '/section/props/',
+    '/section/rebar/clear/',
+    '/section/rebar/coords/',
+    '/section/rebar/inside/',
+    '/section/rebar/long/',
+    '/section/rebar/pattern/',
+    '/section/rebar/row/',
+    '/section/rebar/segments/',
+    '/section/rebar/size/',
+    '/section/rebar/splitsegments',
+    '/section/rebar/stirrup/',
+    '/section/rebar/toelems/',
+    '/section/recalc/',
+    '/section/remove/',
+    '/section/rename/',
+    '/section/set/alu/',
+    '/section/set/angle/',
+    '/section/set/color/',
+    '/section/set/compositebeam/',
+    '/section/set/compositecolumn/',
+    '/section/set/fibers/',
+    '/section/set/material/',
+    '/section/set/offset/',
+    '/section/set/removecomposite/',
+    '/section/set/shearreinfrc/',
+    '/section/set/steel/',
+    '/sections',
+    '/sections/libraries',
+    '/sections/library/',
+    '/sections/libraryf/',
+    '/springproperty/',
+    '/springproperty/axes/',
+    '/springproperty/list',
+    '/springproperty/nl/add/',
+    '/springproperty/nl/change/',
+    '/springproperty/simple/add/',
+    '/springproperty/simple/change/',
+    '/springproperty/subsoil/add/',
+    '/springproperty/subsoil/assign/',
+    '/units/convert/',
+    '/units/convertauto/',
+    '/units/convertunits/',
+    '/units/f',
+    '/units/l',
+    '/units/set/',
+    '/version',
+))
+
+# first path literal of nfrest, nfrestB, nfrestStream, _send, _bulk and _batch calls, and of URLs built on baseUrl
+_CALL = re.compile(r"(?:\b(?:nfrest\w*|_send|_bulk|_batch)\(\s*(?:'[A-Z]*'\s*,\s*)?|baseUrl\s*\+\s*)'(/[A-Za-z][^'\s]*)'")
+# the table above, from its first line to the closing parentheses
+_TABLE = re.compile(r"^PREFIXES = frozenset\(\($.*?^\)\)$", re.M | re.S)
+
+def scan(folder)->list:
+    ''' Sorted path prefixes of the request calls in the .py files of folder and its subfolders '''
+    found = set()
+    for path, dirs, files in os.walk(folder):
+        for name in files:
+            if name.endswith(".py"):
+                with open(os.path.join(path, name), encoding="utf-8") as f:
+                    found.update(_CALL.findall(f.read()))
+    return sorted(found)
+
+def _write():
+    # rewrite the PREFIXES table of this module
+    here = os.path.abspath(__file__)
+    with open(here, encoding="utf-8") as f:
+        text = f.read()
+    lines = "".join("    " + repr(p) + ",\n" for p in scan(os.path.dirname(here)))
+    text = _TABLE.sub(lambda m: "PREFIXES = frozenset((\n" + lines + "))", text, count=1)
+    with open(here, "w", encoding="utf-8", newline="\n") as f:
+        f.write(text)
+
+if __name__ == "__main__":
+    _write()
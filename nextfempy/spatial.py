@@ -0,0 +1,188 @@
+'''
+Spatial index over node coordinates, for location queries without round trips.
+
+Nodes are hashed on a uniform grid; queries look only at the cells they
+overlap, and plane queries use a sorted copy of each coordinate. IDs are
+returned as int64 arrays.
+
+    idx = ModelMirror(nf).spatialIndex()
+    base = idx.plane(3, 0.0, 1e-6)          # as getNodesFromCoords
+    n = idx.nearest([2.0, 3.0, 4.0])
+    groups = idx.duplicates(1e-4)           # as mergeOverlappedNodes would merge
+'''
+
+import numpy as np
+
+# multipliers for hashing grid cells to int64; collisions only add candidates, checked by distance
+_P = np.array([73856093, 19349663, 83492791], dtype=np.int64)
+
+def _hash(q):
+    return (q[..., 0] * _P[0]) ^ (q[..., 1] * _P[1]) ^ (q[..., 2] * _P[2])
+
+def _expand(left, counts):
+    # positions left[i] .. left[i]+counts[i]-1 for all i, with the owner of each position
+    owner = np.repeat(np.arange(len(left)), counts)
+    start = np.repeat(left - np.concatenate([[0], np.cumsum(counts)[:-1]]), counts)
+    return owner, start + np.arange(owner.size)
+
+class SpatialIndex:
+
+    def __init__(self, coords, IDs=None, cellSize=None):
+        ''' Index of the given (N,3) coordinates; IDs default to 1..N '''
+        self.coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+        n = len(self.coords)
+        self.IDs = np.arange(1, n + 1, dtype=np.int64) if IDs is None else np.asarray(IDs, dtype=np.int64).reshape(n)
+        self.origin = self.coords.min(axis=0) if n else np.zeros(3)
+        extent = self.coords.max(axis=0) - self.origin if n else np.zeros(3)
+        self.scale = float(np.linalg.norm(extent)) or 1.0
+        if cellSize is None:
+            dims = extent[extent > 1e-12 * self.scale]
+            cellSize = (np.prod(dims) / max(n, 1)) ** (1.0 / len(dims)) if len(dims) else 1.0
+        self.cellSize = float(cellSize) or 1.0
+        self._order, self._sorted = self._grid(self.cellSize)
+        # sorted coordinates for plane queries
+        self._axisOrder = [np.argsort(self.coords[:, k], kind="stable") for k in range(3)]
+        self._axisSorted = [self.coords[o, k] for k, o in enumerate(self._axisOrder)]
+
+    def __len__(self):
+        return len(self.IDs)
+
+    def __repr__(self):
+        return "SpatialIndex(" + str(len(self.IDs)) + " nodes, cell " + str(self.cellSize) + ")"
+
+    def _cells(self, xyz, h):
+        return np.floor((np.asarray(xyz, dtype=float) - self.origin) / h).astype(np.int64)
+
+    def _grid(self, h):
+        keys = _hash(self._cells(self.coords, h))
+        order = np.argsort(keys, kind="stable")
+        return order, keys[order]
+
+    def _rowsInCells(self, lo, hi):
+        # rows of the nodes in the cells lo..hi (inclusive), None if there are too many cells
+        span = hi - lo + 1
+        if np.prod(span) > 4 * len(self.IDs) + 64: return None
+        grid = np.stack(np.meshgrid(*[np.arange(lo[k], hi[k] + 1) for k in range(3)], indexing="ij"), axis=-1).reshape(-1, 3)
+        keys = np.unique(_hash(grid))
+        left = np.searchsorted(self._sorted, keys, "left")
+        right = np.searchsorted(self._sorted, keys, "right")
+        owner, pos = _expand(left, right - left)
+        return self._order[pos]
+
+    def box(self, lo, hi)->np.ndarray:
+        ''' IDs of the nodes inside the box lo..hi '''
+        lo = np.asarray(lo, dtype=float); hi = np.asarray(hi, dtype=float)
+        rows = self._rowsInCells(self._cells(lo, self.cellSize), self._cells(hi, self.cellSize))
+        c = self.coords if rows is None else self.coords[rows]
+        inside = np.all((c >= lo) & (c <= hi), axis=1)
+        return self.IDs[np.flatnonzero(inside) if rows is None else np.sort(rows[inside])]
+
+    def plane(self, dir_, coord, tol=1E-06)->np.ndarray:
+        ''' IDs of the nodes having the given coordinate, as getNodesFromCoords
+        
+        Args:
+            dir_: 1 for X, 2 for Y and 3 for Z
+            coord: Value of the selected coordinate
+            tol (optional): Optional. Tolerance
+        '''
+        k = int(dir_) - 1
+        a = np.searchsorted(self._axisSorted[k], coord - tol, "left")
+        b = np.searchsorted(self._axisSorted[k], coord + tol, "right")
+        return self.IDs[np.sort(self._axisOrder[k][a:b])]
+
+    def radius(self, center, r)->np.ndarray:
+        ''' IDs of the nodes within distance r from center, nearest first '''
+        center = np.asarray(center, dtype=float)
+        rows = self._rowsInCells(self._cells(center - r, self.cellSize), self._cells(center + r, self.cellSize))
+        if rows is None: rows = np.arange(len(self.IDs))
+        d = np.linalg.norm(self.coords[rows] - center, axis=1)
+        keep = d <= r
+        rows, d = rows[keep], d[keep]
+        return self.IDs[rows[np.argsort(d, kind="stable")]]
+
+    def nearest(self, point, k=1)->np.ndarray:
+        ''' IDs of the k nodes nearest to point, nearest first '''
+        point = np.asarray(point, dtype=float)
+        k = min(int(k), len(self.IDs))
+        if k == 0: return self.IDs[:0]
+        r = self.cellSize
+        while True:
+            rows = self._rowsInCells(self._cells(point - r, self.cellSize), self._cells(point + r, self.cellSize))
+            if rows is None or len(rows) >= k: break
+            r *= 2
+        if rows is None: rows = np.arange(len(self.IDs))
+        d = np.linalg.norm(self.coords[rows] - point, axis=1)
+        # the k-th distance among the candidates bounds the true neighbours
+        ids = self.radius(point, np.partition(d, k - 1)[k - 1])
+        return ids[:k]
+
+    def aligned(self, p1, p2, tol=0)->np.ndarray:
+        ''' IDs of the nodes on the line through p1 and p2, as getAlignedNodes '''
+        p1 = np.asarray(p1, dtype=float); p2 = np.asarray(p2, dtype=float)
+        tol = tol or 1e-9 * self.scale
+        u = (p2 - p1) / np.linalg.norm(p2 - p1)
+        v = self.coords - p1
+        d = np.linalg.norm(v - np.outer(v @ u, u), axis=1)
+        return self.IDs[d <= tol]
+
+    def sides(self, IDs, tol=1E-06)->list:
+        ''' Nodes on the borders of a rectangular planar region, as getNodesOnSides
+        
+        Returns:
+            List of 4 arrays with bottom, right, top and left nodes
+        '''
+        rows = self.rows(IDs)
+        c = self.coords[rows]
+        extent = c.max(axis=0) - c.min(axis=0)
+        # in-plane axes are the two of largest extent
+        a, b = sorted(np.argsort(extent, kind="stable")[1:3])
+        ids = self.IDs[rows]
+        return [ids[c[:, b] <= c[:, b].min() + tol], ids[c[:, a] >= c[:, a].max() - tol],
+                ids[c[:, b] >= c[:, b].max() - tol], ids[c[:, a] <= c[:, a].min() + tol]]
+
+    def rows(self, IDs)->np.ndarray:
+        ''' Rows of the given IDs in coords '''
+        order = np.argsort(self.IDs)
+        IDs = np.asarray(IDs, dtype=np.int64).reshape(-1)
+        return order[np.searchsorted(self.IDs, IDs, sorter=order)]
+
+    def duplicates(self, tol=1E-06)->list:
+        ''' Groups of nodes closer than tol, as merged by mergeOverlappedNodes
+        
+        Returns:
+            List of arrays of IDs, each sorted with the node to keep first
+        '''
+        n = len(self.IDs)
+        if n < 2: return []
+        q = self._cells(self.coords, tol)
+        keys = _hash(q)
+        order = np.argsort(keys, kind="stable")
+        skeys = keys[order]
+        pi, pj = [], []
+        # half of the 27 neighbouring cells, plus the cell itself
+        offsets = [o for o in np.ndindex(3, 3, 3) if tuple(np.array(o) - 1) >= (0, 0, 0)]
+        for o in offsets:
+            h = _hash(q + (np.array(o) - 1))
+            left = np.searchsorted(skeys, h, "left")
+            counts = np.searchsorted(skeys, h, "right") - left
+            owner, pos = _expand(left, counts)
+            j = order[pos]
+            keep = owner != j
+            pi.append(owner[keep]); pj.append(j[keep])
+        i = np.concatenate(pi); j = np.concatenate(pj)
+        close = np.linalg.norm(self.coords[i] - self.coords[j], axis=1) <= tol
+        i, j = i[close], j[close]
+        if i.size == 0: return []
+        # connected components by label propagation
+        labels = np.arange(n)
+        while True:
+            m = np.minimum(labels[i], labels[j])
+            new = labels.copy()
+            np.minimum.at(new, i, m); np.minimum.at(new, j, m)
+            new = new[new]
+            if np.array_equal(new, labels): break
+            labels = new
+        groups = {}
+        for r in np.unique(np.concatenate([i, j])):
+            groups.setdefault(labels[r], []).append(self.IDs[r])
+        return [np.sort(np.array(g, dtype=np.int64)) for g in groups.values()]
@@ -0,0 +1,234 @@
+'''
+On-disk store of analysis results, as memory-mapped NumPy files.
+
+Results are downloaded once, as a stream, and saved under
+root/<model hash>/<run>/ with one .npy file of IDs and one of values per
+quantity, plus index.json telling where each loadcase and time step lies.
+Later scripts open them with zero-copy views, without calling the server:
+
+    store = ResultStore("results")
+    run = store.fetch(nf)                  # download if not stored yet
+    ids, disp = run.block("sw", "1", "disp")
+    hist = store.addHistories(nf, "eq", storeyNodes, 1, 1)
+'''
+
+import hashlib, json, os
+import numpy as np
+from .common import _chunks
+
+_INDEX = "index.json"
+
+class StoredResults:
+    ''' Results of one run, opened read-only from a ResultStore '''
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, _INDEX)) as f:
+            self.index = json.load(f)
+        self._open = {}
+
+    def _load(self, name):
+        if not name in self._open:
+            self._open[name] = np.load(os.path.join(self.path, name), mmap_mode="r")
+        return self._open[name]
+
+    @property
+    def quantities(self)->list:
+        return list(self.index["quantities"])
+
+    @property
+    def histories(self)->list:
+        return list(self.index["histories"])
+
+    def loadcases(self, quantity=None)->list:
+        ''' Loadcases with results, of all quantities or of the given one '''
+        out = []
+        for q, entry in self.index["quantities"].items():
+            if quantity is None or q == quantity:
+                for lc, time, start, stop in entry["segments"]:
+                    if not lc in out: out.append(lc)
+        return out
+
+    def times(self, loadcase, quantity=None)->list:
+        ''' Time steps stored for the loadcase '''
+        out = []
+        for q, entry in self.index["quantities"].items():
+            if quantity is None or q == quantity:
+                for lc, time, start, stop in entry["segments"]:
+                    if lc == loadcase and not time in out: out.append(time)
+        return out
+
+    def __getitem__(self, quantity):
+        ''' IDs and values of a quantity for all loadcases and times, as memory-mapped arrays '''
+        entry = self.index["quantities"][quantity]
+        return self._load(entry["ids"]), self._load(entry["values"])
+
+    def block(self, loadcase, time, quantity):
+        ''' IDs and values of a quantity for a loadcase and time step, as zero-copy views.
+        Arrays are empty if not stored '''
+        ids, values = self[quantity]
+        for lc, t, start, stop in self.index["quantities"][quantity]["segments"]:
+            if lc == loadcase and str(t) == str(time):
+                return ids[start:stop], values[start:stop]
+        return ids[0:0], values[0:0]
+
+    def history(self, name):
+        ''' Stored histories by name, as (item IDs, times, values of size items x times) '''
+        entry = self.index["histories"][name]
+        return np.asarray(entry["items"], dtype=np.int64), np.asarray(entry["times"], dtype=float), self._load(entry["values"])
+
+class ResultStore:
+
+    def __init__(self, root):
+        ''' Store rooted at the given directory, created if missing '''
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    @staticmethod
+    def modelKey(nf)->str:
+        ''' Hash of the model JSON of nf (NextFEMrest), read as a stream '''
+        h = hashlib.sha1()
+        for chunk in nf.nfrestStream('GET', '/model/data'):
+            h.update(chunk)
+        return h.hexdigest()
+
+    @staticmethod
+    def runKey(nf)->str:
+        ''' Identifier of the last run of nf, from its analysis log '''
+        return hashlib.sha1(json.dumps(nf.getLastRunLog()).encode()).hexdigest()[0:16]
+
+    def path(self, model, run)->str:
+        return os.path.join(self.root, model, str(run))
+
+    def has(self, model, run, quantities=None)->bool:
+        ''' True if the results of the run were downloaded by fetch or populate, of all quantities or of the given ones.
+        Runs with stored histories only are not counted '''
+        fetched = self._readIndex(self.path(model, run)).get("fetched")
+        if fetched is None: return False
+        return fetched is True or not(quantities is None) and set(quantities) <= set(fetched)
+
+    def runs(self, model)->list:
+        ''' Stored runs of a model, with results or histories '''
+        folder = os.path.join(self.root, model)
+        if not os.path.isdir(folder): return []
+        return sorted(r for r in os.listdir(folder) if os.path.isfile(os.path.join(folder, r, _INDEX)))
+
+    def open(self, model, run)->StoredResults:
+        return StoredResults(self.path(model, run))
+
+    def fetch(self, nf, run=None, model=None, blockSize=100000, quantities=None)->StoredResults:
+        ''' Open the results of nf, downloading them first if they are not stored
+        
+        Args:
+            nf: NextFEMrest instance
+            run (optional): Optional. Run identifier, by default taken from the last run log
+            model (optional): Optional. Model key, by default the hash of the model JSON
+            blockSize (optional): Optional. Items read from the stream at a time
+            quantities (optional): Optional. Quantities to store, e.g. ["disp", "react"]; all if not set
+
+        Returns:
+            StoredResults
+        '''
+        model = model or self.modelKey(nf)
+        run = run or self.runKey(nf)
+        if not self.has(model, run, quantities):
+            # quantities fetched before are kept
+            fetched = self._readIndex(self.path(model, run)).get("fetched")
+            if isinstance(fetched, list) and not(quantities is None): quantities = fetched + [q for q in quantities if not q in fetched]
+            self.populate(nf, model, run, blockSize, quantities)
+        return self.open(model, run)
+
+    def populate(self, nf, model, run, blockSize=100000, quantities=None):
+        ''' Download the results of nf as a stream and write them to the store, replacing a stored run '''
+        path = self.path(model, run)
+        os.makedirs(path, exist_ok=True)
+        index = self._readIndex(path)
+        # blocks are appended to raw files first, then copied to .npy once the sizes are known
+        raw = {}
+        for lc, time, quantity, ids, values in nf.iterResults(blockSize, quantities):
+            if not quantity in raw:
+                raw[quantity] = {"ids": open(os.path.join(path, quantity + ".ids.tmp"), "wb"),
+                                 "values": open(os.path.join(path, quantity + ".values.tmp"), "wb"),
+                                 "shape": values.shape[1:], "count": 0, "segments": []}
+            entry = raw[quantity]
+            if values.shape[1:] != entry["shape"]:
+                raise ValueError("Inconsistent shape of " + quantity + " results: " + str(values.shape[1:]))
+            start = entry["count"]
+            segments = entry["segments"]
+            if segments and segments[-1][0:2] == [lc, time] and segments[-1][3] == start:
+                segments[-1][3] += len(ids)
+            else:
+                segments.append([lc, time, start, start + len(ids)])
+            ids.tofile(entry["ids"])
+            values.tofile(entry["values"])
+            entry["count"] += len(ids)
+        index["quantities"] = {}
+        for quantity, entry in raw.items():
+            entry["ids"].close()
+            entry["values"].close()
+            n = entry["count"]
+            self._toNpy(path, quantity + ".ids", np.int64, (n,))
+            self._toNpy(path, quantity + ".values", np.float64, (n,) + entry["shape"])
+            index["quantities"][quantity] = {"ids": quantity + ".ids.npy", "values": quantity + ".values.npy", "segments": entry["segments"]}
+        index["fetched"] = True if quantities is None else list(quantities)
+        self._writeIndex(path, index)
+
+    def addHistories(self, nf, loadcase, items, resultType, resultID1=0, resultID2=0, name=None, run=None, model=None, decimate=1, workers=8)->StoredResults:
+        ''' Store the result histories of some items, as read by getResultHistories
+        
+        Args:
+            nf: NextFEMrest instance
+            loadcase: Name of the loadcase
+            items: Node or element IDs
+            resultType: Type of result, as in getResultHistory
+            resultID1 (optional): Component as in getResultHistory, the same for all items or one per item
+            resultID2 (optional): Beam component as in getResultHistory, the same for all items or one per item
+            name (optional): Optional. Name of the histories in the store, by default made of loadcase and result IDs
+            run (optional): Optional. Run identifier, by default taken from the last run log
+            model (optional): Optional. Model key, by default the hash of the model JSON
+            decimate (optional): Optional. Keep one time step every decimate in the stored array; whole histories are still downloaded
+            workers (optional): Optional. Concurrent requests
+
+        Returns:
+            StoredResults of the run
+        '''
+        model = model or self.modelKey(nf)
+        run = run or self.runKey(nf)
+        name = name or "/".join(str(v) for v in (loadcase, resultType, resultID1, resultID2))
+        path = self.path(model, run)
+        os.makedirs(path, exist_ok=True)
+        index = self._readIndex(path)
+        items = [int(i) for i in items]
+        values, times = nf.getResultHistories(loadcase, items, resultType, resultID1, resultID2, decimate, workers)
+        fileName = "hist" + str(len(index["histories"]) if not name in index["histories"] else list(index["histories"]).index(name)) + ".npy"
+        np.save(os.path.join(path, fileName), values)
+        index["histories"][name] = {"values": fileName, "items": items, "times": times.tolist(), "loadcase": loadcase,
+                                    "resultType": resultType, "resultID1": np.asarray(resultID1).tolist(), "resultID2": np.asarray(resultID2).tolist()}
+        self._writeIndex(path, index)
+        return self.open(model, run)
+
+    def _toNpy(self, path, name, dtype, shape):
+        tmp = os.path.join(path, name + ".tmp")
+        src = np.memmap(tmp, dtype=dtype, mode="r", shape=shape) if shape[0] else np.zeros(shape, dtype=dtype)
+        out = np.lib.format.open_memmap(os.path.join(path, name + ".npy"), mode="w+", dtype=dtype, shape=shape)
+        for s in _chunks(shape[0], 1 << 16):
+            out[s] = src[s]
+        out.flush()
+        del out, src
+        os.remove(tmp)
+
+    def _readIndex(self, path)->dict:
+        try:
+            with open(os.path.join(path, _INDEX)) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        index.setdefault("quantities", {})
+        index.setdefault("histories", {})
+        return index
+
+    def _writeIndex(self, path, index):
+        # replaced in one step, so that a run is either stored or not
+        tmp = os.path.join(path, _INDEX + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp, os.path.join(path, _INDEX))
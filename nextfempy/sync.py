@@ -0,0 +1,220 @@
+'''
+Incremental synchronization of the model JSON.
+
+ModelSync keeps the last model data known to be on the server and a local
+copy to edit. push() sends only the differences, either with the existing
+per-entity calls (addNodeWithID, setNodeCoordinates, removeElement, ...) or
+as mergeModelData fragments, whichever is estimated cheaper; the whole
+modeldata is posted again when that is cheaper still, or when entries were
+removed from a section other than nodes and elements, which neither a merge
+nor a per-entity call can remove.
+
+    sync = ModelSync(nf)
+    sync.local["nodes"]...                  # edit the local copy
+    print(sync.push())                      # SyncReport with calls and bytes saved
+'''
+
+import copy, inspect, json
+from . import modeljson
+from .calls import Answer, replay
+
+# per-entity calls for added elements, by element type: method name and arguments from the element entry
+_ADD = {modeljson.QUAD: "addQuadWithID", modeljson.TRIA: "addTriaWithID", modeljson.SPRING2NODES: "addSpringWithID"}
+
+def _sections(*models)->list:
+    # keys of the models: nodes, elements, then the others in a fixed order
+    keys = set()
+    for m in models: keys.update(m)
+    return [k for k in (modeljson.NODES, modeljson.ELEMS) if k in keys] + sorted(k for k in keys if not k in (modeljson.NODES, modeljson.ELEMS))
+
+def _byID(container)->dict:
+    return dict((str(e["num"]), e) for e in modeljson._items(container))
+
+class SyncReport:
+    ''' Calls and bytes sent by a push, compared with posting the whole model data (bytes) and with one call per changed entity (calls).
+    failed lists the (method, args, error) of the calls that failed; the base is updated only if there are none '''
+    def __init__(self, mode, calls, bytes, fullBytes, changes, failed=None):
+        self.mode = mode
+        self.calls = calls
+        self.bytes = bytes
+        self.fullBytes = fullBytes
+        self.changes = changes
+        self.failed = failed or []
+
+    @property
+    def ok(self)->bool:
+        return not self.failed
+
+    @property
+    def bytesSaved(self)->int:
+        return self.fullBytes - self.bytes
+
+    @property
+    def callsSaved(self)->int:
+        return self.changes - self.calls
+
+    def __repr__(self):
+        return ("SyncReport(" + self.mode + ": " + str(self.changes) + " changes, " + str(self.calls) + " calls, " + str(self.bytes) +
+                " bytes; " + str(self.bytesSaved) + " bytes saved over a full modeldata post, " + str(self.callsSaved) + " calls over one call per change" +
+                ("" if self.ok else "; " + str(len(self.failed)) + " failed") + ")")
+
+class ModelSync:
+
+    def __init__(self, nf, data=None, callCost=2000):
+        ''' Synchronization of the model of nf (NextFEMrest).
+        
+        Args:
+            nf: NextFEMrest connected to the model
+            data (optional): Optional. Model data known to be on the server, as dictionary or JSON. Downloaded if not set
+            callCost (optional): Optional. Cost of one request in bytes-equivalent, used to choose between per-entity calls and merges
+        '''
+        self.nf = nf
+        self.callCost = callCost
+        self.pull(data)
+
+    def pull(self, data=None):
+        ''' Take the model data on the server as the new base, discarding local edits '''
+        if data is None: data = self.nf.modeldata
+        if isinstance(data, (str, bytes)): data = json.loads(data)
+        self.base = data
+        self.local = copy.deepcopy(data)
+        return self
+
+    def diff(self)->dict:
+        ''' Differences between base and local, by section: dictionaries "added", "changed" (ID -> entry) and "removed" (IDs).
+        Other sections are compared by key if they are dictionaries; otherwise they are reported as changed as a whole under the None
+        key, and as removed (None in removed) if the section or some of its list items are gone '''
+        out = {}
+        for key in _sections(self.base, self.local):
+            old, new = self.base.get(key), self.local.get(key)
+            if key in (modeljson.NODES, modeljson.ELEMS):
+                a, b = _byID(old), _byID(new)
+            elif old == new:
+                continue
+            elif isinstance(old, dict) and isinstance(new, dict):
+                a, b = old, new
+            else:
+                gone = new is None or isinstance(old, list) and isinstance(new, list) and any(not v in new for v in old)
+                out[key] = {"added": {}, "changed": {} if new is None else {None: new}, "removed": [None] if gone else []}
+                continue
+            d = {"added": dict((k, v) for k, v in b.items() if not k in a),
+                 "changed": dict((k, v) for k, v in b.items() if k in a and a[k] != v),
+                 "removed": [k for k in a if not k in b]}
+            if d["added"] or d["changed"] or d["removed"]: out[key] = d
+        return out
+
+    def _entityCalls(self, d):
+        # per-entity calls as (method, args), None if some change has no per-entity call. Order: nodes added and changed,
+        # elements added and changed, elements removed, nodes removed
+        if set(d) - {modeljson.NODES, modeljson.ELEMS}: return None
+        old = _byID(self.base.get(modeljson.ELEMS)), _byID(self.base.get(modeljson.NODES))
+        nodes, elems = d.get(modeljson.NODES, _NONE), d.get(modeljson.ELEMS, _NONE)
+        calls = []
+        for k, n in nodes["added"].items():
+            calls.append(("addNodeWithID", (n["X"], n["Y"], n["Z"], k)))
+        for k, n in nodes["changed"].items():
+            if set(n) - {"num", "X", "Y", "Z"} != set(old[1][k]) - {"num", "X", "Y", "Z"}: return None
+            if any(n[c] != old[1][k].get(c) for c in n if not c in ("X", "Y", "Z")): return None
+            calls.append(("setNodeCoordinates", (k, [n["X"], n["Y"], n["Z"]])))
+        for k, e in elems["added"].items():
+            conn, t = e.get("Conn", []), e.get("type")
+            if t == modeljson.LINE and len(conn) == 2 and not e.get("sect2"):
+                calls.append(("addTrussWithID" if e.get("truss") else "addBeamWithID", (conn[0], conn[1], k, e.get("sect", 0), e.get("mat", 0))))
+            elif t == modeljson.SPRING2NODES and "prop" in e:
+                calls.append(("addSpringWithID", (conn[0], conn[1], k, e["prop"])))
+            elif t in _ADD and len(conn) == {modeljson.QUAD: 4, modeljson.TRIA: 3}.get(t, 0):
+                calls.append((_ADD[t], tuple(conn) + (k, e.get("sect", 0), e.get("mat", 0))))
+            else:
+                return None
+        for k, e in elems["changed"].items():
+            o = old[0][k]
+            if set(e) != set(o) or any(e[c] != o[c] for c in e if not c in ("sect", "mat")): return None
+            if e.get("sect") != o.get("sect"): calls.append(("setElementSection", (k, e["sect"])))
+            if e.get("mat") != o.get("mat"): calls.append(("assignMaterialToElement", (k, e["mat"])))
+        calls.extend(("removeElement", (k,)) for k in elems["removed"])
+        calls.extend(("removeNode", (k,)) for k in nodes["removed"])
+        return calls
+
+    def _requestBytes(self, name, args)->int:
+        # size of the request a method would send, captured without sending
+        steps = replay(inspect.unwrap(getattr(self.nf, name).__func__), self.nf, args)
+        size = 0
+        try:
+            request = next(steps)
+            while True:
+                size += len(request.command) + (len(json.dumps(request.body)) if not(request.body is None) else 0)
+                request = steps.send(_OK)
+        except (StopIteration, ValueError):
+            return size
+
+    def _mergeFragments(self, d):
+        # merges and removal calls, in the order of _entityCalls, then merges of the other sections. None if a merge cannot
+        # remove what was removed from the other sections
+        ops, others = [], []
+        for key, ch in d.items():
+            if key in (modeljson.NODES, modeljson.ELEMS):
+                entries = list(ch["added"].values()) + list(ch["changed"].values())
+                for sl in modeljson.mergeChunks(key, entries, self.nf.mergeMaxLength):
+                    ops.append(("mergeModelData", (json.dumps({key: entries[sl]}),)))
+            elif ch["removed"]:
+                return None
+            elif None in ch["changed"]:
+                others.append(("mergeModelData", (json.dumps({key: ch["changed"][None]}),)))
+            else:
+                # all the added and changed entries of the section, by key
+                items = [{k: v} for k, v in list(ch["added"].items()) + list(ch["changed"].items())]
+                for sl in modeljson.mergeChunks(key, items, self.nf.mergeMaxLength):
+                    others.append(("mergeModelData", (json.dumps({key: dict(kv for i in items[sl] for kv in i.items())}),)))
+        ops += [("removeElement", (k,)) for k in d.get(modeljson.ELEMS, _NONE)["removed"]]
+        ops += [("removeNode", (k,)) for k in d.get(modeljson.NODES, _NONE)["removed"]]
+        return ops + others
+
+    def _fullBytes(self)->int:
+        # the model JSON is posted as a JSON string, as by the modeldata setter
+        return len("/model/data") + len(json.dumps(json.dumps(self.local)))
+
+    def plan(self):
+        ''' Planned push: mode ("calls", "merge" or "full"), list of (method, args) calls and estimated calls and bytes '''
+        d = self.diff()
+        if not d: return "calls", [], 0, 0
+        merge = self._mergeFragments(d)
+        calls = self._entityCalls(d)
+        options = [(mode, ops) for mode, ops in (("calls", calls), ("merge", merge)) if not(ops is None)]
+        best = None
+        for mode, ops in options:
+            size = sum(self._requestBytes(name, args) for name, args in ops)
+            cost = size + self.callCost * len(ops)
+            if best is None or cost < best[0]: best = (cost, mode, ops, size)
+        if best is None or self._fullBytes() + self.callCost < best[0]: return "full", [], 1, self._fullBytes()
+        return best[1], best[2], len(best[2]), best[3]
+
+    def push(self)->SyncReport:
+        ''' Send the local edits to the server and make them the new base
+        
+        Returns:
+            SyncReport. Failed calls are listed in it and leave the base unchanged, so that they are sent again at the next push
+        '''
+        mode, ops, calls, size = self.plan()
+        changes = sum(len(ch["added"]) + len(ch["changed"]) + len(ch["removed"]) for ch in self.diff().values())
+        failed = []
+        if mode == "full":
+            # as the modeldata setter, checking the answer
+            try:
+                response = self.nf._send('POST', '/model/data', json.dumps(self.local))
+                if response.status_code >= 400 or response.text == "False": failed.append(("modeldata", (), "status " + str(response.status_code)))
+            except Exception as e:
+                failed.append(("modeldata", (), repr(e)))
+            # the whole model is replaced, even when the answer is an error
+            self.nf.clearCache()
+        for name, args in ops:
+            try:
+                result = getattr(self.nf, name)(*args)
+                if result is False or result == "": failed.append((name, args, "rejected by server"))
+            except Exception as e:
+                failed.append((name, args, repr(e)))
+        if not failed: self.base = copy.deepcopy(self.local)
+        return SyncReport(mode, calls, size, self._fullBytes(), changes, failed)
+
+# neutral answer used while measuring requests
+_OK = Answer(b"True")
+_NONE = {"added": {}, "changed": {}, "removed": []}
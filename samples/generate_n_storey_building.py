@@ -97,9 +97,8 @@ for k in range(nlz):
             n = n + 1
             nf.addQuad(str(n), str(n+1), str(n + nlx + 2), str(n + nlx + 1))
 
-# Boundary conditions
-for n in range(1, (nlx+1)*(nly+1) + 1):
-    nf.setBC(str(n), True, True, True, True, True, True)
+# Boundary conditions, all base nodes fixed in one batch
+nf.setBCs(range(1, (nlx+1)*(nly+1) + 1), [True, True, True, True, True, True])
 
 # Load cases
 for lc in ['pp', 'modal']:
@@ -3,10 +3,14 @@ from setuptools import setup, find_packages
 setup(
     name='nextfempy',
     version='0.4.6',
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*", "tests", "tests.*"]),
     install_requires=[
-            "requests"
+            "requests",
+            "numpy"
     ],
+    extras_require={
+            "async": ["aiohttp"]
+    },
     author='NextFEM',
     author_email='info@nextfem.it',
     description='NextFEM REST API wrapper in pure Python',
@@ -0,0 +1,16 @@
+import pytest
+from nextfempy import NextFEMrest, mockserver
+
+@pytest.fixture
+def server():
+    server, url = mockserver.start(runTime=0.1)
+    yield server, url
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def nf(server):
+    nf = NextFEMrest(server[1], _msg=False)
+    nf.newModel()
+    yield nf
+    nf.close()
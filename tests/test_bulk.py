@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+@pytest.fixture(params=[True, False], ids=["bulk", "fallback"])
+def bnf(request, server, nf):
+    # with the bulk endpoints of the mock, or without them
+    server[0].RequestHandlerClass.bulk = request.param
+    yield nf
+    server[0].RequestHandlerClass.bulk = True
+
+def _usedBulk(server, nf, command):
+    # the bulk endpoint was used if the mock has it, the fallback otherwise
+    return (command in nf._noBulk) != server[0].RequestHandlerClass.bulk
+
+def test_add_nodes(server, bnf):
+    ids = bnf.addNodes(np.array([[0, 0, 0], [3, 0, 0], [0, 0, 3]]), chunkSize=2)
+    assert ids.tolist() == [1, 2, 3]
+    assert bnf.getNodeCoordinates(2) == [3.0, 0.0, 0.0]
+    ids = bnf.addNodes([(1, 1, 1)], IDs=[10])
+    assert ids.tolist() == [10] and bnf.getNodeCoordinates(10) == [1.0, 1.0, 1.0]
+    assert _usedBulk(server, bnf, "/node/add/bulk")
+
+def test_add_elements(server, bnf):
+    n = bnf.addNodes([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    beams = bnf.addBeams([(n[0], n[1]), (n[1], n[2])], sect=[1, 2], mat=1)
+    assert beams.tolist() == [1, 2]
+    assert bnf.getElementConnectivity(2) == ["2", "3"]
+    trusses = bnf.addTrusses([(n[2], n[3])], sect=1, mat=1)
+    quads = bnf.addQuads([n.tolist()], sect=1, mat=1)
+    trias = bnf.addTrias([(n[0], n[1], n[2])], IDs=[20])
+    assert trusses.tolist() == [3] and quads.tolist() == [4] and trias.tolist() == [20]
+    assert bnf.getElementConnectivity(4) == ["1", "2", "3", "4"]
+    assert _usedBulk(server, bnf, "/element/add/bulk/beam")
+
+def test_add_elements_with_missing_nodes(bnf):
+    n = bnf.addNodes([[0, 0, 0], [1, 0, 0]])
+    beams = bnf.addBeams([(n[0], n[1]), (n[0], 99)])
+    assert beams[0] == 1 and bnf.getElementConnectivity(1) == ["1", "2"]
+
+def test_set_bcs(server, bnf):
+    n = bnf.addNodes([[0, 0, 0], [1, 0, 0], [2, 0, 0]])
+    res = bnf.setBCs(n.tolist() + [99], [True, True, True, False, False, False])
+    assert not res and res.ok.tolist() == [True, True, True, False] and res.failed == [99]
+    assert [bnf.isRestrained(i) for i in n] == [True, True, True]
+    assert bnf.removeBCs(n[0:2])
+    assert [bnf.isRestrained(i) for i in n] == [False, False, True]
+    assert _usedBulk(server, bnf, "/bc/set/bulk")
+
+def test_add_nodal_loads(bnf):
+    n = bnf.addNodes([[0, 0, 0], [1, 0, 0]])
+    bnf.addLoadCase("live")
+    res = bnf.addNodalLoads(n, [[0, 0, -10, 0, 0, 0], [5, 0, -10, 0, 0, 0]], "live")
+    assert res and res.items == [(1, 3), (2, 1), (2, 3)]
+    res = bnf.addNodalLoads(n, 2.0, "live", direction=2)
+    assert res.items == [(1, 2), (2, 2)]
+    # the mock balances the loads on the restrained nodes
+    bnf.setBCs([n[0]], [True] * 6)
+    bnf.RunModel()
+    react, restrained = bnf.getNodalReactArray("live")
+    assert restrained.tolist() == [1] and react[0, 0:3].tolist() == [-5.0, -4.0, 20.0]
+
+def test_fallback_request_length(server, nf, monkeypatch):
+    monkeypatch.setattr(server[0].RequestHandlerClass, "bulk", False)
+    commands = []
+    send = nf._send
+    def record(method, command, *args, **kwargs):
+        commands.append(command)
+        return send(method, command, *args, **kwargs)
+    nf._send = record
+    ids = nf.addNodes(np.random.rand(1000, 3))
+    assert ids.tolist() == list(range(1, 1001))
+    merges = [c for c in commands if c.startswith("/model/data")]
+    assert len(merges) > 1 and max(len(c) for c in merges) <= len("/model/data") + nf.mergeMaxLength
+
+def test_fallback_element_numbering(server, nf, monkeypatch):
+    monkeypatch.setattr(server[0].RequestHandlerClass, "bulk", False)
+    nf.addNodes([[0, 0, 0], [1, 0, 0]], IDs=[1, 50])
+    nf.addBeams([(1, 50)], IDs=[30])
+    assert nf.addBeams([(1, 50)]).tolist() == [31]
@@ -0,0 +1,72 @@
+from nextfempy import ModelCache
+
+def _cache():
+    cache = ModelCache()
+    cache.put("elems", 5, ("getElementProperty", "mat"), "1")
+    cache.put("elems", 6, ("getElementProperty", "mat"), "1")
+    cache.put("materials", 5, ("getMaterialProperty", "E", ""), "30000")
+    cache.put("sections", 5, ("getSectionProperty", "Area"), "0.04")
+    return cache
+
+def test_assign_material_to_element():
+    cache = _cache()
+    cache.update("assignMaterialToElement", {"element": 5, "materialID": 2}, True)
+    assert not cache.get("elems", 5, ("getElementProperty", "mat"))[1]
+    assert cache.get("elems", 6, ("getElementProperty", "mat"))[1]
+    assert cache.get("materials", 5, ("getMaterialProperty", "E", ""))[1]
+
+def test_assign_section_to_element():
+    cache = _cache()
+    cache.update("assignSectionToElement", {"element": 5, "sectionID": 2}, True)
+    assert not cache.get("elems", 5, ("getElementProperty", "mat"))[1]
+    assert cache.get("sections", 5, ("getSectionProperty", "Area"))[1]
+
+def test_material_change():
+    cache = _cache()
+    cache.update("addOrChangeMaterialProperty", {"ID": 5, "name": "E", "value": 1}, True)
+    assert not cache.get("materials", 5, ("getMaterialProperty", "E", ""))[1]
+    assert cache.get("elems", 5, ("getElementProperty", "mat"))[1]
+
+def test_write_through(nf):
+    nf.enableCache()
+    n = nf.addNode(1, 2, 3)
+    assert nf.getNodeCoordinates(n) == [1.0, 2.0, 3.0]
+    assert nf.cache.hits == 1 and nf.cache.misses == 0
+    nf.setNodeCoordinates(n, [4, 5, 6])
+    assert nf.getNodeCoordinates(n) == [4.0, 5.0, 6.0]
+    nf.removeNode(n)
+    assert nf.getNodeCoordinates(n) == []
+
+class _Owner:
+    def __init__(self):
+        self.cache = _cache()
+
+def _call(name, *args):
+    from nextfempy import NextFEMrest
+    from nextfempy.cache import updateCache
+    owner = _Owner()
+    updateCache(owner, name, getattr(NextFEMrest, name), args, {}, True)
+    return owner.cache
+
+def test_figure_in_section():
+    for name, args in (("addRectangleInSection", (5, 0.1, 0.2, 0, 0)), ("addCircleInSection", (5, 0.1, 0, 0)), ("addRebarPatternInSection", ("", 5, 4, 0.04, 1, 0.0002))):
+        cache = _call(name, *args)
+        assert not cache.get("sections", 5, ("getSectionProperty", "Area"))[1], name
+        assert cache.get("materials", 5, ("getMaterialProperty", "E", ""))[1], name
+
+def test_new_section():
+    cache = _call("addRectSection", 0.3, 0.5)
+    assert cache.get("sections", 5, ("getSectionProperty", "Area"))[1]
+
+def test_material_without_name():
+    cache = _call("setConcretePropertiesNTC", 5, 30)
+    assert not cache.get("materials", 5, ("getMaterialProperty", "E", ""))[1]
+    assert cache.get("sections", 5, ("getSectionProperty", "Area"))[1]
+
+def test_modeldata_setter(nf):
+    nf.enableCache()
+    n = nf.addNode(1, 2, 3)
+    data = nf.modeldata
+    nf.setNodeCoordinates(n, [4, 5, 6])
+    nf.modeldata = data
+    assert nf.getNodeCoordinates(n) == [1.0, 2.0, 3.0]
@@ -0,0 +1,40 @@
+import warnings
+import numpy as np
+import pytest
+from nextfempy import LoadCombinations
+
+TABLE = ["Name;Type;G;Q;E", "ULS1;Linear add;1.3;1.5;0", "EQ;SRSS;0;0.5;1", "ABS;Absolute;1;-1;0", "ENV;Envelope;1;1;0"]
+
+def test_from_table():
+    with pytest.warns(UserWarning, match="ENV"):
+        combos = LoadCombinations.fromTable(TABLE)
+    assert combos.names == ["ULS1", "EQ", "ABS"]
+    assert combos.kinds == ["linear", "srss", "absolute"]
+    assert combos.loadcases == ["G", "Q", "E"]
+    assert combos.factor("ULS1", "Q") == 1.5
+
+def test_combine_kinds():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        combos = LoadCombinations.fromTable(TABLE)
+    values = np.array([[1.0, -2.0], [2.0, 4.0], [-3.0, 0.0]])
+    out = combos.combine(values)
+    assert np.allclose(out[0], 1.3 * values[0] + 1.5 * values[1])
+    assert np.allclose(out[1], np.sqrt((0.5 * values[1]) ** 2 + values[2] ** 2))
+    assert np.allclose(out[2], np.abs(values[0]) + np.abs(values[1]))
+    d = combos.combine({"G": values[0], "Q": values[1], "E": values[2]})
+    assert np.allclose(d["EQ"], out[1])
+
+def test_linear_table_has_no_warning():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        combos = LoadCombinations.fromTable([["Name", "G", "Q"], ["C1", "1", "2"]])
+    assert np.allclose(combos.combine(np.array([1.0, 1.0])), [3.0])
+
+def test_add():
+    combos = LoadCombinations().add("C1", {"G": 1.0}).add("C2", {"Q": 2.0}, "srss")
+    assert combos.factors.tolist() == [[1.0, 0.0], [0.0, 2.0]]
+    with pytest.raises(ValueError):
+        combos.add("C3", {"G": 1.0}, "envelope")
+    with pytest.raises(KeyError):
+        combos.combine({"G": np.zeros(2)})
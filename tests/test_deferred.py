@@ -0,0 +1,78 @@
+from nextfempy import mockserver
+
+def test_deferred_call_arguments_are_resolved(nf):
+    with nf.deferred() as d:
+        a = nf.addNode(0, 0, 0)
+        b = nf.addNode(1, 0, 0)
+        beam = nf.addBeam(a, b, 1, 1)
+        assert d.pending == 1
+    assert beam.ok
+    assert nf.getElementConnectivity(beam.result()) == [a.result(), b.result()]
+
+def test_nested_deferred_arguments_are_resolved(nf):
+    import numpy as np
+    from nextfempy.deferred import _value
+    with nf.deferred():
+        a = nf.addNode(0, 0, 0)
+        b = nf.addNode(5, 0, 0)
+        nodes = np.array([a, b], dtype=object)
+        moved = nf.setNodeCoordinates(b, coords=[a, 0, 0])
+    assert moved.ok and nf.getNodeCoordinates(b.result()) == [float(a.result()), 0.0, 0.0]
+    assert _value({"n": [a, {"m": (b,)}]}) == {"n": [a.result(), {"m": (b.result(),)}]}
+    assert _value(nodes).tolist() == [a.result(), b.result()] and nodes[0] is a
+    plain = [[1, 2], {"x": 3}]
+    assert _value(plain) is plain
+
+def test_failed_call_does_not_fail_the_batch(nf):
+    with nf.deferred():
+        a = nf.addNode(0, 0, 0)
+        bad = nf.addBeam("x", "y", 1, 1)
+        b = nf.addNode(1, 0, 0)
+    assert a.result() == "1" and b.result() == "2"
+    assert bad.done()
+
+def test_failed_batch_reports_each_call(nf, monkeypatch):
+    routes = [(m, p, (lambda self, body: 1 / 0) if fn is mockserver.MockHandler.batch else fn) for m, p, fn in mockserver._ROUTES]
+    monkeypatch.setattr(mockserver, "_ROUTES", routes)
+    with nf.deferred():
+        a = nf.addNode(0, 0, 0)
+        b = nf.addNode(1, 0, 0)
+    assert not a.ok and not b.ok
+    assert "/node/add/0/" in str(a.error) and "/node/add/1/" in str(b.error)
+    assert "may have been applied" in str(a.error)
+    assert not("/op/batch" in nf._noBulk)
+
+def test_pipelined_without_batches(server):
+    from nextfempy import NextFEMrest
+    server[0].RequestHandlerClass.bulk = False
+    nf = NextFEMrest(server[1], _msg=False)
+    with nf.deferred() as d:
+        ids = [nf.addNode(i, 0, 0) for i in range(50)]
+        nf.setBC(ids[0], True, True, True, True, True, True)
+    assert [i.result() for i in ids] == [str(i) for i in range(1, 51)]
+    assert nf.isRestrained(1) and d.calls == 51
+
+def test_pipelined_writer_does_not_hang():
+    import socket, threading
+    from nextfempy import NextFEMrest
+    # server answering the first request, then neither reading nor answering
+    listener = socket.create_server(("127.0.0.1", 0))
+    conns = []
+    def serve():
+        conn, addr = listener.accept()
+        conns.append(conn)
+        conn.recv(1024)
+        conn.sendall(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+        conn.shutdown(socket.SHUT_WR)
+    threading.Thread(target=serve, daemon=True).start()
+    nf = NextFEMrest("http://127.0.0.1:" + str(listener.getsockname()[1]), _msg=False)
+    nf._noBulk.add("/op/batch")
+    with nf.deferred(batchSize=100000) as d:
+        calls = [nf.addOrModifyCustomData("k" + str(i), "x" * 5000) for i in range(4000)]
+        flusher = threading.Thread(target=d.flush, daemon=True)
+        flusher.start()
+        flusher.join(10)
+        assert not flusher.is_alive()
+    assert calls[0].done() and not calls[-1].ok
+    listener.close()
+    for c in conns: c.close()
@@ -0,0 +1,41 @@
+import subprocess, sys
+from nextfempy import NextFEMrest, domains
+
+def _fresh(code):
+    # run in a new interpreter, where no domain is loaded yet
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split()
+
+def test_import_is_lazy():
+    out = _fresh("import sys, nextfempy; print('requests' in sys.modules, 'numpy' in sys.modules, 'addNode' in vars(nextfempy.NextFEMrest))")
+    assert out == ["False", "False", "False"]
+
+def test_class_access_loads_domain():
+    out = _fresh("import nextfempy; f = nextfempy.NextFEMrest.addNode; print(f.__name__, 'addBeam' in vars(nextfempy.NextFEMrest))")
+    assert out == ["addNode", "False"]
+
+def test_super_in_subclass(nf):
+    class Counting(NextFEMrest):
+        calls = 0
+        def addNode(self, x, y, z, *args):
+            Counting.calls += 1
+            return super().addNode(x, y, z, *args)
+    c = Counting(nf.baseUrl, _msg=False)
+    assert c.addNode(1, 2, 3) == nf.getMaxNodeID()
+    assert Counting.calls == 1 and Counting.getNodeCoordinates
+
+def test_dir_and_help():
+    assert "addNode" in dir(NextFEMrest(_msg=False))
+    out = _fresh("import pydoc, nextfempy; print('addNode(self' in pydoc.plain(pydoc.render_doc(nextfempy.NextFEMrest)))")
+    assert out == ["True"]
+    assert set(domains.INDEX) <= set(dir(NextFEMrest))
+
+def test_instance_access(nf):
+    n = nf.addNode(1, 2, 3)
+    assert nf.getNodeCoordinates(n) == [1.0, 2.0, 3.0]
+    assert not hasattr(nf, "notAMethod") and not hasattr(NextFEMrest, "_private")
+
+def test_star_exports():
+    out = _fresh("import sys; from nextfempy import *; print(NextFEMrest.__name__, callable(sbool), 'numpy' in sys.modules, 'requests' in sys.modules, 'ResultStore' in dir())")
+    assert out == ["NextFEMrest", "True", "False", "False", "False"]
+    out = _fresh("import nextfempy; print(nextfempy.requests.__name__, nextfempy.ResultStore.__name__)")
+    assert out == ["requests", "ResultStore"]
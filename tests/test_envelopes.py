@@ -0,0 +1,63 @@
+import numpy as np
+from nextfempy import ResultArray, envelope, concurrentEnvelope, maxMinBy, validateEnvelope
+from nextfempy.resultarrays import BEAM_COMPONENTS
+
+def _forces():
+    # 2 elements, 3 loadcases, 2 stations
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=(2, 3, 2, 6))
+    return ResultArray(values, ("elems", "loadcases", "stations", "components"),
+                       {"elems": np.array([1, 2]), "loadcases": ["a", "b", "c"], "stations": [1, 2], "components": BEAM_COMPONENTS})
+
+def test_envelope():
+    forces = _forces()
+    env = envelope(forces)
+    assert np.allclose(env.max.values, forces.values.max(axis=1))
+    assert env.maxCase[0, 1, 4] == ["a", "b", "c"][forces.values[0, :, 1, 4].argmax()]
+
+def test_concurrent_envelope():
+    forces = _forces()
+    env = concurrentEnvelope(forces)
+    row = env.max.sel(elems=2, stations=1, governing="My")
+    case = int(np.argmax(forces.values[1, :, 0, 4]))
+    assert np.allclose(row.values, forces.values[1, case, 0])
+
+def test_envelope_skips_missing():
+    forces = _forces()
+    forces.values[0, 0] = np.nan
+    forces.values[1] = np.nan
+    env = envelope(forces)
+    assert np.allclose(env.max.values[0], forces.values[0, 1:].max(axis=0))
+    assert np.isnan(env.max.values[1]).all()
+    assert maxMinBy(forces, [1, 1], "My")[1] == [forces.values[0, 1:, :, 4].max(), forces.values[0, 1:, :, 4].min()]
+
+class _Server:
+    # stand-in for NextFEMrest, answering getBeamForcesEnvelopeTable from a local envelope
+    tableSeparator = ";"
+    def __init__(self, env, shift=0.0):
+        self.env, self.shift = env, shift
+    def getBeamForcesEnvelopeTable(self, num, stationsMode, loadcases=None):
+        rows = ["Station;Envelope;" + ";".join(BEAM_COMPONENTS)]
+        for st in (1, 2):
+            for g in BEAM_COMPONENTS:
+                for sense in ("max", "min"):
+                    v = getattr(self.env, sense).sel(elems=num, stations=st, governing=g).values + self.shift
+                    rows.append(str(st) + ";" + g + " " + sense + ";" + ";".join(str(x) for x in v))
+        return rows
+
+def test_validate_envelope_by_station_and_component():
+    forces = _forces()
+    env = concurrentEnvelope(forces)
+    assert all(d < 1e-9 for d in validateEnvelope(_Server(env), forces, env).values())
+    # the same numbers in the wrong places do not match
+    swapped = concurrentEnvelope(forces)
+    swapped.max, swapped.min = env.min, env.max
+    assert all(d > 1e-3 for d in validateEnvelope(_Server(swapped), forces, env).values())
+    assert all(d > 1e-3 for d in validateEnvelope(_Server(env, 0.5), forces, env).values())
+
+def test_validate_envelope_without_table():
+    class Empty(_Server):
+        def getBeamForcesEnvelopeTable(self, num, stationsMode, loadcases=None):
+            return "Error"
+    forces = _forces()
+    assert validateEnvelope(Empty(None), forces) == {1: float("inf"), 2: float("inf")}
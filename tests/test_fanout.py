@@ -0,0 +1,33 @@
+import threading
+import pytest
+import requests
+
+def test_order_and_stats(nf):
+    ids = nf.addNodes([[x, 0, 0] for x in range(20)])
+    coords = nf.map("getNodeCoordinates", ids.tolist(), workers=8)
+    assert coords == [[float(x), 0.0, 0.0] for x in range(20)]
+    assert nf.mapStats.calls == 20 and nf.mapStats.retries == 0 and nf.mapStats.callsPerSecond > 0
+    assert nf.map(nf.getConnectedElements, [(1, -1), {"node": 2}]) == [[], []]
+
+def _flaky(failures):
+    # callable failing with a connection error the given number of times per argument
+    seen, lock = {}, threading.Lock()
+    def fn(x):
+        with lock:
+            seen[x] = seen.get(x, 0) + 1
+            if seen[x] <= failures: raise requests.exceptions.ConnectionError("down")
+        return 2 * x
+    return fn
+
+def test_retries(nf):
+    assert nf.map(_flaky(1), range(5), workers=3, backoff=0) == [0, 2, 4, 6, 8]
+    assert nf.mapStats.retries == 5 and nf.mapStats.failures == 0
+
+def test_failures(nf):
+    assert nf.map(_flaky(5), [1, 2], retries=1, backoff=0, default=None) == [None, None]
+    assert nf.mapStats.failures == 2
+    with pytest.raises(requests.exceptions.ConnectionError):
+        nf.map(_flaky(5), [1], retries=0)
+    # other errors are not retried
+    with pytest.raises(ZeroDivisionError):
+        nf.map(lambda x: 1 / x, [1, 0], backoff=0)
@@ -0,0 +1,34 @@
+import time
+from nextfempy import Job, JobScheduler
+
+def _slowCollect(nf, lc):
+    time.sleep(0.2)
+    return "collected " + lc
+
+def test_gather_returns_collected_results(nf):
+    for lc in ("a", "b"): nf.addLoadCase(lc)
+    sched = JobScheduler(nf, maxConcurrent=2, collect=_slowCollect, minInterval=0.01)
+    assert sched.run(["a", "b"], timeout=10) == {"a": "collected a", "b": "collected b"}
+
+def test_callbacks_run_before_wait_returns(nf):
+    seen = []
+    job = Job(nf, minInterval=0.01)
+    job.addDoneCallback(lambda j: time.sleep(0.2) or seen.append(j.loadcase))
+    job.start()
+    assert job.wait(10)
+    assert seen == [""]
+    assert job.ok
+
+def test_rerun_with_the_same_log(nf):
+    nf.addLoadCase("a")
+    nf.RunModel()
+    nf.getLastRunLog = lambda: ["Analysis of a completed"]
+    job = Job(nf, "a", minInterval=0.01).start()
+    assert job.wait(5) and job.ok
+    assert job.log == ["Analysis of a completed"]
+
+def test_timeout(nf):
+    nf.hasResults = lambda loadcase="": False
+    job = Job(nf, minInterval=0.01, timeout=0.2).start()
+    assert job.wait(5)
+    assert not job.ok and job.error.startswith("Timed out")
@@ -0,0 +1,34 @@
+import json
+import numpy as np
+import pytest
+from nextfempy.jsonstream import iterItems, iterResultBlocks
+
+DOC = {"nodes": [{"num": "1", "X": 0.5, "Y": -12345.678, "Z": 1e-3}, {"num": "2", "X": 10, "Y": 0, "Z": 3}],
+       "groups": {"città": ["1", "2"], "empty": []}, "flag": True, "none": None, "n": 1234567}
+
+def _chunks(data, size):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+@pytest.mark.parametrize("size", [1, 2, 7, 1 << 20])
+def test_items_at_any_chunk_size(size):
+    data = json.dumps(DOC, ensure_ascii=False).encode()
+    assert dict((p[0], v) for p, v in iterItems(_chunks(data, size), 1)) == DOC
+    items = list(iterItems(_chunks(data, size), 2))
+    assert (("nodes", 1), DOC["nodes"][1]) in items
+    assert (("groups", "città"), ["1", "2"]) in items
+    assert (("flag",), True) in items and (("n",), 1234567) in items
+    assert (("groups", "empty"), []) in items
+
+def test_invalid_document():
+    with pytest.raises(ValueError):
+        list(iterItems([b'{"a": 1 "b": 2}'], 1))
+
+def test_result_blocks():
+    res = {"sw": {"1": {"disp": dict((str(n), [n, 0, 0, 0, 0, 0]) for n in range(1, 6)), "react": {"1": [1, 2, 3, 4, 5, 6]}}}}
+    data = json.dumps(res).encode()
+    blocks = list(iterResultBlocks(_chunks(data, 5), blockSize=2))
+    assert [(lc, t, q, ids.tolist()) for lc, t, q, ids, v in blocks] == [
+        ("sw", "1", "disp", [1, 2]), ("sw", "1", "disp", [3, 4]), ("sw", "1", "disp", [5]), ("sw", "1", "react", [1])]
+    assert np.array_equal(blocks[1][4][:, 0], [3.0, 4.0])
+    assert [q for lc, t, q, ids, v in iterResultBlocks([data], quantities=["react"])] == ["react"]
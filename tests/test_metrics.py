@@ -0,0 +1,37 @@
+import json
+from nextfempy import Metrics
+
+def test_endpoints(nf):
+    m = nf.enableMetrics()
+    a, b = nf.addNode(0, 0, 0), nf.addNode(1, 0, 0)
+    for n in (a, b): nf.getNodeCoordinates(n)
+    nf.setNodeCoordinates(a, [0, 0, 1])
+    eps = dict(((ep.method, ep.path), ep) for ep in m.sorted())
+    assert eps[("GET", "/node/{}")].count == 2
+    assert eps[("GET", "/node/{}")].status == {200: 2}
+    assert "GET" in m.table() and json.loads(m.toJSON())
+    assert "request_bytes" in m.prometheus()
+
+def test_request_bytes(nf):
+    m = nf.enableMetrics()
+    nf.getNodeCoordinates(1)
+    nf.setNodeCoordinates(1, [0, 0, 1])
+    eps = dict(((ep.method, ep.path), ep) for ep in m.sorted())
+    # request line, and JSON body if any
+    assert eps[("GET", "/node/{}")].requestBytes == len("GET /node/1 HTTP/1.1\r\n")
+    assert eps[("POST", "/node/{}")].requestBytes == len("POST /node/1 HTTP/1.1\r\n") + len(json.dumps([0, 0, 1]))
+
+def test_record():
+    m = Metrics()
+    m.record("GET", "/op/maxnodeid", 0.01, 0, 1, 200)
+    assert m.sorted()[0].requestBytes == len("GET /op/maxnodeid HTTP/1.1\r\n")
+
+def test_routes_table_is_current():
+    import os
+    from nextfempy import routes
+    assert routes.scan(os.path.dirname(routes.__file__)) == sorted(routes.PREFIXES), "run python -m nextfempy.routes"
+
+def test_template():
+    from nextfempy.metrics import template
+    assert template("/res/nodalstress/1/sw/1/2") == "/res/nodalstress/{}/{}/{}/{}"
+    assert template("/load/node/add/bulk/sw/False") == "/load/node/add/bulk/{}/{}"
@@ -0,0 +1,36 @@
+from nextfempy import ModelMirror
+
+def _frame(nf):
+    n = nf.addNodes([[0, 0, 0], [0, 0, 3], [4, 0, 3], [4, 0, 0]])
+    nf.addBeams([(n[0], n[1]), (n[1], n[2]), (n[2], n[3])], sect=[1, 2, 1], mat=1)
+    nf.addQuads([n.tolist()], sect=3, mat=1)
+    return [str(i) for i in n]
+
+def test_same_answers_as_server(nf):
+    nodes = _frame(nf)
+    m = ModelMirror(nf)
+    assert m.nodesList == nodes and m.elemsList == ["1", "2", "3", "4"]
+    for n in nodes:
+        assert m.getNodeCoordinates(n) == nf.getNodeCoordinates(n)
+        assert sorted(m.getConnectedElements(n)) == sorted(nf.getConnectedElements(n))
+        assert m.getConnectedElements(n, 1) == nf.getConnectedElements(n, 1)
+    for e in m.elemsList:
+        assert m.getElementConnectivity(e) == nf.getElementConnectivity(e)
+        assert m.getElementType(e) == nf.getElementType(e)
+    assert m.sect.tolist() == [1, 2, 1, 3]
+
+def test_missing_and_refresh(nf):
+    _frame(nf)
+    m = ModelMirror(nf)
+    assert m.getNodeCoordinates(99) == [] and m.getElementConnectivity(99) == [] and m.getElementType(99) == "0"
+    assert m.getConnectedElements(99) == []
+    nf.addNode(8, 0, 0)
+    assert len(m.nodeIDs) == 4 and len(m.refresh().nodeIDs) == 5
+    assert m.getNodesFromCoords(1, 4.0) == ["3", "4"]
+    assert m.getAlignedNodes([0, 0, 0], [4, 0, 0]) == ["1", "4", "5"]
+
+def test_from_data():
+    m = ModelMirror(data='{"nodes": [{"num": "1", "X": 0, "Y": 0, "Z": 0}, {"num": "2", "X": 1, "Y": 0, "Z": 0}],'
+                         ' "elems": [{"num": "7", "type": 1, "Conn": ["1", "2"], "sect": 1, "mat": 2}]}')
+    assert m.getConnectedElements(2) == ["7"] and m.mat.tolist() == [2]
+    assert len(ModelMirror(data="not json").nodeIDs) == 0
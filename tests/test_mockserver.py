@@ -0,0 +1,16 @@
+import json
+import requests
+
+def test_modeldata_round_trip(nf):
+    a, b = nf.addNode(0, 0, 0), nf.addNode(1, 0, 0)
+    nf.addBeam(a, b, 1, 1)
+    data = nf.modeldata
+    nf.newModel()
+    nf.modeldata = data
+    assert json.loads(nf.modeldata) == json.loads(data)
+    assert nf.getElementConnectivity(1) == ["1", "2"]
+
+def test_modeldata_body_is_a_json_string(server, nf):
+    # a model object instead of the string sent by the modeldata setter is rejected
+    response = requests.post(server[1] + "/model/data", json={"nodes": []})
+    assert response.status_code == 400
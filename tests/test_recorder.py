@@ -0,0 +1,39 @@
+import socket, threading, time
+from nextfempy import NextFEMrest, Recorder, ReplayTransport, readLog, summarize
+
+def test_record_and_replay(tmp_path, nf):
+    path = str(tmp_path / "session.nfrl")
+    with Recorder(nf, path):
+        n = nf.addNode(1, 2, 3)
+        coords = nf.getNodeCoordinates(n)
+        data = b"".join(nf.nfrestStream('GET', '/model/data', chunkSize=16))
+    records = list(readLog(path))
+    assert [r.command for r in records][1:] == ["/node/" + str(n), "/model/data"]
+    assert records[-1].content == data
+    assert summarize(path).sorted()
+    off = NextFEMrest("http://127.0.0.1:9", _msg=False)
+    ReplayTransport(path, strict=True).install(off)
+    assert off.getNodeCoordinates(n) == coords
+    assert b"".join(off.nfrestStream('GET', '/model/data')) == data
+
+def test_stream_is_recorded_as_it_arrives(tmp_path):
+    # answer whose second half comes one second after the first
+    listener = socket.create_server(("127.0.0.1", 0))
+    def serve():
+        conn, addr = listener.accept()
+        conn.recv(65536)
+        conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 8\r\nConnection: close\r\n\r\nabcd")
+        time.sleep(1.0)
+        conn.sendall(b"efgh")
+        conn.close()
+    threading.Thread(target=serve, daemon=True).start()
+    nf = NextFEMrest("http://127.0.0.1:" + str(listener.getsockname()[1]), _msg=False)
+    path = str(tmp_path / "stream.nfrl")
+    with Recorder(nf, path):
+        t0 = time.perf_counter()
+        chunks = nf.nfrestStream('GET', '/model/data', chunkSize=4)
+        assert next(chunks) == b"abcd"
+        assert time.perf_counter() - t0 < 0.8
+        assert b"".join(chunks) == b"efgh"
+    assert [r.content for r in readLog(path)] == [b"abcdefgh"]
+    listener.close()
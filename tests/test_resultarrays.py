@@ -0,0 +1,53 @@
+import numpy as np
+
+def _run(nf):
+    n = [nf.addNode(x, 0, 0) for x in range(3)]
+    nf.addBeam(n[0], n[1], 1, 1)
+    nf.setBC(n[0], True, True, True, True, True, True)
+    nf.addLoadCase("sw")
+    nf.RunModel()
+    return [int(i) for i in n]
+
+def test_nodal_arrays(nf):
+    n = _run(nf)
+    res = nf.resultsData()
+    disp, ids = nf.getNodalDispArray("sw", results=res)
+    assert ids.tolist() == n and disp.shape == (3, 6)
+    assert disp[2, 0] == res["sw"]["1"]["disp"]["3"][0]
+    react, restrained = nf.getNodalReactArray("sw", results=res)
+    assert restrained.tolist() == [1]
+
+def test_missing_nodes_are_nan(nf):
+    n = _run(nf)
+    res = nf.resultsData()
+    del res["sw"]["1"]["disp"]["2"]
+    disp, ids = nf.getNodalDispArray("sw", nodes=n + [99], results=res)
+    assert np.isnan(disp[1]).all() and np.isnan(disp[3]).all()
+    assert not np.isnan(disp[[0, 2]]).any()
+
+def test_beam_forces_array(nf):
+    _run(nf)
+    forces = nf.getBeamForcesArray(loadcases=["sw"], results=nf.resultsData())
+    assert forces.axes == ("elems", "loadcases", "stations", "components")
+    assert forces.sel(elems=1, loadcases="sw", stations=1, components="My").values == 4.0
+
+def test_missing_beam_forces_are_nan(nf):
+    _run(nf)
+    res = nf.resultsData()
+    forces = nf.getBeamForcesArray(elems=[1, 99], loadcases=["sw"], stations=(1, 9), results=res)
+    assert not np.isnan(forces.values[0, 0, 0]).any()
+    assert np.isnan(forces.values[0, 0, 1]).all() and np.isnan(forces.values[1]).all()
+
+def test_iter_results(nf):
+    _run(nf)
+    blocks = list(nf.iterResults(blockSize=2, quantities=["disp"]))
+    assert [len(ids) for lc, t, q, ids, v in blocks] == [2, 1]
+    assert all(q == "disp" and v.shape[1] == 6 for lc, t, q, ids, v in blocks)
+
+def test_result_histories_decimate(nf):
+    n = _run(nf)
+    full, times = nf.getResultHistories("sw", n + [99], 1, resultID1=1)
+    thin, thinTimes = nf.getResultHistories("sw", n + [99], 1, resultID1=1, decimate=3)
+    assert full.shape == (4, len(times))
+    assert np.array_equal(thinTimes, times[::3])
+    assert np.array_equal(thin[0:3], full[0:3, ::3])
@@ -0,0 +1,31 @@
+import numpy as np
+from nextfempy import SpatialIndex
+
+def _index(n=500, seed=2):
+    rng = np.random.default_rng(seed)
+    coords = np.round(rng.uniform(0, 10, size=(n, 3)), 1)
+    return SpatialIndex(coords, np.arange(101, 101 + n)), coords
+
+def test_box_and_plane():
+    idx, c = _index()
+    lo, hi = np.array([2, 3, 4]), np.array([5, 7, 6])
+    expected = 101 + np.flatnonzero(np.all((c >= lo) & (c <= hi), axis=1))
+    assert idx.box(lo, hi).tolist() == expected.tolist()
+    assert idx.plane(2, 5.0).tolist() == (101 + np.flatnonzero(np.abs(c[:, 1] - 5.0) <= 1e-6)).tolist()
+
+def test_radius_and_nearest():
+    idx, c = _index()
+    p = np.array([5.05, 5.05, 5.05])
+    d = np.linalg.norm(c - p, axis=1)
+    assert set(idx.radius(p, 1.5).tolist()) == set((101 + np.flatnonzero(d <= 1.5)).tolist())
+    assert idx.nearest(p, 5).tolist() == (101 + np.argsort(d, kind="stable")[0:5]).tolist()
+    assert len(idx.nearest(p, 10000)) == len(idx)
+
+def test_aligned_sides_duplicates():
+    # 3x3 grid of nodes on the XZ plane, with node 10 on top of node 5
+    coords = [[x, 0, z] for z in (0, 1, 2) for x in (0, 1, 2)] + [[1, 0, 1 + 1e-9]]
+    idx = SpatialIndex(coords)
+    assert idx.aligned([0, 0, 0], [2, 0, 2]).tolist() == [1, 5, 9, 10]
+    bottom, right, top, left = idx.sides(range(1, 10))
+    assert bottom.tolist() == [1, 2, 3] and right.tolist() == [3, 6, 9] and top.tolist() == [7, 8, 9] and left.tolist() == [1, 4, 7]
+    assert [g.tolist() for g in idx.duplicates(1e-6)] == [[5, 10]]
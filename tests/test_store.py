@@ -0,0 +1,36 @@
+from nextfempy import ResultStore
+
+def _run(nf):
+    n = [nf.addNode(x, 0, 0) for x in range(3)]
+    nf.addBeam(n[0], n[1], 1, 1)
+    nf.addBeam(n[1], n[2], 1, 1)
+    nf.addLoadCase("sw")
+    nf.RunModel()
+    return n
+
+def test_fetch(tmp_path, nf):
+    _run(nf)
+    store = ResultStore(str(tmp_path))
+    run = store.fetch(nf)
+    assert "disp" in run.quantities
+    ids, disp = run.block("sw", run.times("sw", "disp")[0], "disp")
+    assert len(ids) == 3 and disp.shape[0] == 3
+    assert store.runs(store.modelKey(nf)) == [store.runKey(nf)]
+
+def test_fetch_after_histories(tmp_path, nf):
+    n = _run(nf)
+    store = ResultStore(str(tmp_path))
+    hist = store.addHistories(nf, "sw", n, 1, 1, name="dz")
+    assert hist.quantities == [] and not store.has(store.modelKey(nf), store.runKey(nf))
+    run = store.fetch(nf)
+    assert "disp" in run.quantities
+    assert run.histories == ["dz"]
+    items, times, values = run.history("dz")
+    assert list(items) == [int(i) for i in n] and values.shape == (3, len(times))
+
+def test_fetch_more_quantities(tmp_path, nf):
+    _run(nf)
+    store = ResultStore(str(tmp_path))
+    assert store.fetch(nf, quantities=["disp"]).quantities == ["disp"]
+    run = store.fetch(nf, quantities=["beamforces"])
+    assert sorted(run.quantities) == ["beamforces", "disp"]
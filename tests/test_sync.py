@@ -0,0 +1,99 @@
+import json
+from nextfempy import ModelSync
+
+def _model(nf):
+    n = [nf.addNode(x, 0, 0) for x in range(4)]
+    nf.addBeam(n[0], n[1], 1, 1)
+    nf.addBeam(n[1], n[2], 1, 1)
+    return ModelSync(nf)
+
+def _edit(sync):
+    # node 4 and element 2 removed, node 5 and element 3 added, node 1 moved
+    sync.local["nodes"] = [n for n in sync.local["nodes"] if n["num"] != "4"]
+    sync.local["nodes"][0]["Z"] = 1.0
+    sync.local["nodes"].append({"num": "5", "X": 5.0, "Y": 0.0, "Z": 0.0})
+    sync.local["elems"] = [e for e in sync.local["elems"] if e["num"] != "2"] + [{"num": "3", "type": 1, "Conn": ["1", "5"], "sect": 1, "mat": 1}]
+    sync.local["other"] = {"a": 1}
+    sync.local = dict(reversed(list(sync.local.items())))
+
+def test_diff_order(nf):
+    sync = _model(nf)
+    _edit(sync)
+    assert list(sync.diff()) == ["nodes", "elems", "other"]
+    del sync.local["other"]
+    calls = [name for name, args in sync._entityCalls(sync.diff())]
+    assert calls == ["addNodeWithID", "setNodeCoordinates", "addBeamWithID", "removeElement", "removeNode"]
+    sync.local["other"] = {"a": 1}
+    ops = sync._mergeFragments(sync.diff())
+    assert [name for name, args in ops] == ["mergeModelData", "mergeModelData", "removeElement", "removeNode", "mergeModelData"]
+    assert [list(json.loads(args[0])) for name, args in ops if name == "mergeModelData"] == [["nodes"], ["elems"], ["other"]]
+
+def test_push_full(nf):
+    sync = _model(nf)
+    nf.enableCache()
+    assert nf.getNodeCoordinates(1) == [0.0, 0.0, 0.0]
+    sync.callCost = 10 ** 9
+    sync.local["nodes"][0]["Z"] = 2.0
+    sync.local["elems"] = []
+    report = sync.push()
+    assert report.mode == "full" and report.ok
+    assert nf.getNodeCoordinates(1) == [0.0, 0.0, 2.0]
+    assert sync.base == sync.local
+
+def test_push_calls(nf):
+    sync = _model(nf)
+    _edit(sync)
+    del sync.local["other"]
+    sync.callCost = 0
+    report = sync.push()
+    assert report.mode == "calls" and report.ok
+    assert sync.diff() == {}
+    assert json.loads(nf.modeldata)["nodes"] == sync.local["nodes"]
+
+def test_failed_push_is_reported(nf):
+    sync = _model(nf)
+    sync.callCost = 0
+    sync.local["nodes"][0]["Z"] = 2.0
+    # removed on the server meanwhile
+    nf.removeElement(2)
+    nf.removeNode(4)
+    sync.local["nodes"] = sync.local["nodes"][0:3]
+    report = sync.push()
+    assert not report.ok and report.failed
+    assert "failed" in repr(report)
+    assert sync.diff() != {}
+
+def test_failed_full_push_is_reported(server, nf):
+    sync = _model(nf)
+    sync.callCost = 10 ** 9
+    sync.local["elems"] = []
+    nf.close()
+    server[0].shutdown()
+    server[0].server_close()
+    report = sync.push()
+    assert report.mode == "full" and not report.ok
+    assert report.failed[0][0] == "modeldata"
+
+def test_merge_all_changed_entries(nf):
+    sync = ModelSync(nf, {"nodes": [], "custom": {"a": 1, "b": 2, "c": 3}})
+    sync.local["custom"].update(a=10, b=20, d=4)
+    ops = sync._mergeFragments(sync.diff())
+    assert [json.loads(args[0]) for name, args in ops] == [{"custom": {"d": 4, "a": 10, "b": 20}}]
+
+def test_removed_entries_push_full(nf):
+    sync = ModelSync(nf, {"nodes": [], "custom": {"a": 1, "b": 2}, "list": [1, 2]})
+    del sync.local["custom"]["a"]
+    assert sync._mergeFragments(sync.diff()) is None and sync.plan()[0] == "full"
+    sync.pull({"nodes": [], "list": [1, 2]})
+    del sync.local["list"]
+    assert sync.plan()[0] == "full"
+
+def test_push_groups(nf):
+    sync = _model(nf)
+    nf.addGroup("g1")
+    nf.addGroup("g2")
+    sync.pull()
+    for g in sync.local["groups"]: g["elems"] = ["1", "2"]
+    report = sync.push()
+    assert report.ok and report.mode == "full"
+    assert [g["elems"] for g in json.loads(nf.modeldata)["groups"]] == [["1", "2"], ["1", "2"]]